@@ -1,8 +1,11 @@
 from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import Iterable, List, Optional
+import asyncio
 import logging
 
+from app.core.config import settings
 from app.db.database import get_db
 from app.core.security import get_role_min_system_admin
 from app.db.models import (
@@ -26,7 +29,11 @@ from app.schemas.models import (
     TeamAccessGroupsUpdateRequest,
     TeamGroupSyncRunResponse,
 )
-from app.services.access_groups import sync_region_teams_task, sync_team_groups_task
+from app.services.access_groups import (
+    claim_interrupted_team_group_sync_runs,
+    sync_region_teams_task,
+    sync_team_groups_task,
+)
 from app.services.model_sync import sync_model_to_region_task
 
 logger = logging.getLogger(__name__)
@@ -400,6 +407,57 @@ async def get_latest_team_group_sync_run(
     )
 
 
+@router.get("/admin/regions/{region_id}/team-group-sync-run/events")
+async def stream_team_group_sync_run(
+    region_id: int,
+    run_id: Optional[int] = None,
+    db: Session = Depends(get_db),
+    current_user: DBUser = Depends(get_role_min_system_admin),
+):
+    """Server-sent events for a fan-out run (default: the region's latest).
+
+    Sends a `progress` event with the run whenever it changes, and a final
+    `end` event once it has finished.
+    """
+    query = db.query(DBTeamGroupSyncRun).filter_by(region_id=region_id)
+    if run_id is not None:
+        query = query.filter_by(id=run_id)
+    run = query.order_by(DBTeamGroupSyncRun.id.desc()).first()
+    if not run:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No team group sync run found for region {region_id}.",
+        )
+    stream_run_id = run.id
+
+    async def events():
+        last_sent = None
+        while True:
+            # Re-read the row the background task commits to, and hand the
+            # connection back to the pool between polls.
+            db.expire_all()
+            run = db.query(DBTeamGroupSyncRun).filter_by(id=stream_run_id).first()
+            if run is None:
+                db.rollback()
+                return
+            payload = TeamGroupSyncRunResponse.model_validate(run).model_dump_json()
+            running = run.status == "running"
+            db.rollback()
+            if payload != last_sent:
+                last_sent = payload
+                yield f"event: progress\ndata: {payload}\n\n"
+            if not running:
+                yield f"event: end\ndata: {payload}\n\n"
+                return
+            await asyncio.sleep(settings.TEAM_GROUP_SYNC_PROGRESS_INTERVAL_SECONDS)
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @router.post(
     "/admin/regions/{region_id}/team-group-sync-run",
     response_model=TeamGroupSyncRunResponse,
@@ -410,7 +468,9 @@ async def retry_team_group_sync_run(
     db: Session = Depends(get_db),
     current_user: DBUser = Depends(get_role_min_system_admin),
 ):
-    """Start a fresh fan-out for the region (retry). Safe to run anytime —
+    """Retry the region's fan-out. An interrupted run (still `running` but
+    not checkpointed for TEAM_GROUP_SYNC_STALE_SECONDS) is resumed from its
+    last checkpoint; otherwise a fresh run starts. Safe to run anytime —
     each team's list is recomputed from the DB."""
     region = db.query(DBRegion).filter(DBRegion.id == region_id, DBRegion.is_active.is_(True)).first()
     if not region:
@@ -418,6 +478,12 @@ async def retry_team_group_sync_run(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Active Region with ID {region_id} not found.",
         )
+    interrupted = claim_interrupted_team_group_sync_runs(db, region.id)
+    if interrupted:
+        for run_id in interrupted:
+            background_tasks.add_task(sync_region_teams_task, run_id)
+        return db.query(DBTeamGroupSyncRun).filter_by(id=interrupted[-1]).first()
+
     run = DBTeamGroupSyncRun(region_id=region.id)
     db.add(run)
     db.commit()
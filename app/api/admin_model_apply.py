@@ -2,10 +2,11 @@
 
 A config repo (CSV files + GitHub Action) POSTs the full desired state of the
 model catalog here. This endpoint diffs it against the DB, upserts access
-groups, models, aliases and per-region deployments, and schedules the existing
-per-(model, region) sync tasks for anything that changed. With dry_run=true it
-reports the diff and rolls back — that powers "what would this PR change"
-comments on config-repo pull requests.
+groups, models, aliases and per-region deployments, and schedules one batched
+sync per region for anything that changed (one proxy model-list read per
+region, then concurrent writes). With dry_run=true it reports the diff and the
+per-region plan of proxy writes, and rolls back — that powers "what would this
+PR change" comments on config-repo pull requests.
 
 Semantics:
 - Everything is keyed by stable strings (model_id, group slug, region name).
@@ -47,9 +48,16 @@ from app.schemas.models import (
     ApplyConfigRequest,
     ApplyConfigResponse,
     ApplyModelSpec,
+    RegionSyncPlanSummary,
     SkippedRegion,
 )
-from app.services.model_sync import sync_model_to_region_task
+from app.services.model_sync import (
+    MODEL_SYNC_CREATE,
+    MODEL_SYNC_DELETE,
+    MODEL_SYNC_UPDATE,
+    plan_model_syncs,
+    sync_models_to_regions_task,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -546,6 +554,9 @@ async def apply_model_config(
     )
 
     if req.dry_run:
+        # The plan reads the session's pending changes, then they are dropped.
+        db.flush()
+        plans = await plan_model_syncs(db, sorted(syncs))
         db.rollback()
         return ApplyConfigResponse(
             dry_run=True,
@@ -554,11 +565,23 @@ async def apply_model_config(
             unmanaged_access_groups=unmanaged_access_groups,
             skipped_regions=skipped_regions,
             syncs_scheduled=len(syncs),
+            sync_plan=[
+                RegionSyncPlanSummary(
+                    region=plan.region_name,
+                    creates=plan.count(MODEL_SYNC_CREATE),
+                    updates=plan.count(MODEL_SYNC_UPDATE),
+                    deletes=plan.count(MODEL_SYNC_DELETE),
+                    unchanged=plan.unchanged,
+                    failed=plan.failed,
+                    error=plan.error,
+                )
+                for plan in plans
+            ],
         )
 
     db.commit()
-    for model_pk, region_id in sorted(syncs):
-        background_tasks.add_task(sync_model_to_region_task, model_pk, region_id)
+    if syncs:
+        background_tasks.add_task(sync_models_to_regions_task, sorted(syncs))
     logger.info(
         f"Applied model config: {len(changes)} changes, {len(syncs)} syncs scheduled"
     )
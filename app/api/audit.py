@@ -1,8 +1,10 @@
+import base64
+import json
 from fastapi import APIRouter, Depends, Query, HTTPException, status
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Query as ORMQuery, Session, joinedload
 from typing import Optional
 from datetime import datetime, UTC
-from sqlalchemy import distinct, or_
+from sqlalchemy import distinct, or_, tuple_
 from app.db.database import get_db
 from app.api.auth import get_current_user_from_auth
 from app.schemas.models import (
@@ -29,12 +31,100 @@ def _as_naive_utc(dt: datetime) -> datetime:
 _status_code_expr = DBAuditLog.details["status_code"].as_string()
 
 
+def encode_audit_cursor(log: DBAuditLog) -> str:
+    """Opaque cursor pointing just past ``log`` in (timestamp, id) order."""
+    raw = f"{log.timestamp.isoformat()}|{log.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_audit_cursor(cursor: str) -> tuple[datetime, int]:
+    """Inverse of encode_audit_cursor; raises ValueError for a malformed cursor."""
+    try:
+        timestamp, log_id = (
+            base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        )
+        return _as_naive_utc(datetime.fromisoformat(timestamp)), int(log_id)
+    except ValueError as e:
+        raise ValueError(f"Invalid cursor: {cursor}") from e
+
+
+def filter_audit_logs(
+    query: ORMQuery,
+    event_type: Optional[str] = None,
+    resource_type: Optional[str] = None,
+    user_id: Optional[int] = None,
+    user_email: Optional[str] = None,
+    from_date: Optional[datetime] = None,
+    to_date: Optional[datetime] = None,
+    status_code: Optional[str] = None,
+    referer: Optional[str] = None,
+) -> ORMQuery:
+    """Apply the /audit/logs filters to a query over DBAuditLog."""
+    # Only join users when filtering by email; an unconditional join
+    # makes counting scan far more than it needs to.
+    if user_email:
+        query = query.join(DBUser, DBAuditLog.user_id == DBUser.id).filter(
+            DBUser.email.ilike(f"%{user_email}%")
+        )
+
+    if event_type:
+        event_types = [et.strip() for et in event_type.split(",")]
+        query = query.filter(DBAuditLog.event_type.in_(event_types))
+    if resource_type:
+        resource_types = [rt.strip() for rt in resource_type.split(",")]
+        query = query.filter(DBAuditLog.resource_type.in_(resource_types))
+    if user_id:
+        query = query.filter(DBAuditLog.user_id == user_id)
+    if from_date:
+        query = query.filter(DBAuditLog.timestamp >= _as_naive_utc(from_date))
+    if to_date:
+        query = query.filter(DBAuditLog.timestamp <= _as_naive_utc(to_date))
+    if status_code:
+        status_codes = [sc.strip() for sc in status_code.split(",")]
+        query = query.filter(_status_code_expr.in_(status_codes))
+    if referer:
+        # Escape LIKE wildcards so a literal % or _ in the search term
+        # doesn't act as a match-all pattern.
+        escaped = referer.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        # Served by the pg_trgm indexes ix_audit_logs_referer_trgm and
+        # ix_audit_logs_origin_trgm.
+        query = query.filter(
+            or_(
+                DBAuditLog.referer.ilike(f"%{escaped}%", escape="\\"),
+                DBAuditLog.origin.ilike(f"%{escaped}%", escape="\\"),
+            )
+        )
+    return query
+
+
+def estimate_row_count(db: Session, query: ORMQuery) -> int:
+    """The planner's estimate of how many rows ``query`` returns.
+
+    Costs one EXPLAIN instead of a scan of every matching row, at the price
+    of accuracy: the figure is only as good as the table statistics.
+    """
+    compiled = query.statement.compile(
+        dialect=db.get_bind().dialect,
+        compile_kwargs={"render_postcompile": True},
+    )
+    plan = (
+        db.connection()
+        .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params)
+        .scalar()
+    )
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
 @router.get("/logs", response_model=PaginatedAuditLogResponse)
 async def get_audit_logs(
     db: Session = Depends(get_db),
     current_user: DBUser = Depends(get_current_user_from_auth),
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[str] = None,
+    count: str = Query("exact", pattern="^(exact|estimated|none)$"),
     event_type: Optional[str] = None,
     resource_type: Optional[str] = None,
     user_id: Optional[int] = None,
@@ -45,10 +135,18 @@ async def get_audit_logs(
     referer: Optional[str] = None,
 ):
     """
-    Retrieve audit logs with optional filtering.
+    Retrieve audit logs with optional filtering, newest first.
     Only accessible by admin users.
     event_type, resource_type, and status_code can be comma-separated lists for multiple values.
     referer matches as a substring against both the referer and origin columns.
+
+    Pagination: pass the previous page's next_cursor as cursor to get the
+    next page (skip is ignored then). Unlike skip, a cursor costs the same
+    however deep the page is. next_cursor is null on the last page.
+
+    count: "exact" (default) counts every matching row, "estimated" returns
+    the query planner's estimate instead, and "none" skips counting
+    (total is null).
     """
     if not current_user.is_admin:
         logger.warning(
@@ -59,56 +157,43 @@ async def get_audit_logs(
             detail="Not authorized to access audit logs",
         )
 
-    try:
-        query = db.query(DBAuditLog)
-        # Only join users when filtering by email; an unconditional join
-        # makes the count() below scan far more than it needs to.
-        if user_email:
-            query = query.join(DBUser, DBAuditLog.user_id == DBUser.id).filter(
-                DBUser.email.ilike(f"%{user_email}%")
-            )
+    after = None
+    if cursor:
+        try:
+            after = decode_audit_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
-        if event_type:
-            event_types = [et.strip() for et in event_type.split(",")]
-            query = query.filter(DBAuditLog.event_type.in_(event_types))
-        if resource_type:
-            resource_types = [rt.strip() for rt in resource_type.split(",")]
-            query = query.filter(DBAuditLog.resource_type.in_(resource_types))
-        if user_id:
-            query = query.filter(DBAuditLog.user_id == user_id)
-        if from_date:
-            query = query.filter(DBAuditLog.timestamp >= _as_naive_utc(from_date))
-        if to_date:
-            query = query.filter(DBAuditLog.timestamp <= _as_naive_utc(to_date))
-        if status_code:
-            status_codes = [sc.strip() for sc in status_code.split(",")]
-            query = query.filter(_status_code_expr.in_(status_codes))
-        if referer:
-            # Escape LIKE wildcards so a literal % or _ in the search term
-            # doesn't act as a match-all pattern.
-            escaped = (
-                referer.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
-            )
-            # ponytail: seq scan; add a pg_trgm index if audit table growth makes this slow
-            query = query.filter(
-                or_(
-                    DBAuditLog.referer.ilike(f"%{escaped}%", escape="\\"),
-                    DBAuditLog.origin.ilike(f"%{escaped}%", escape="\\"),
-                )
-            )
+    try:
+        query = filter_audit_logs(
+            db.query(DBAuditLog),
+            event_type=event_type,
+            resource_type=resource_type,
+            user_id=user_id,
+            user_email=user_email,
+            from_date=from_date,
+            to_date=to_date,
+            status_code=status_code,
+            referer=referer,
+        )
 
-        # Get total count
-        total = query.count()
+        if count == "exact":
+            total = query.count()
+        elif count == "estimated":
+            total = estimate_row_count(db, query)
+        else:
+            total = None
 
-        # Execute the query with pagination; eager-load user to avoid a
-        # lazy-load query per row when building the response.
-        results = (
-            query.options(joinedload(DBAuditLog.user))
-            .order_by(DBAuditLog.timestamp.desc())
-            .offset(skip)
-            .limit(limit)
-            .all()
+        # Eager-load user to avoid a lazy-load query per row when building
+        # the response. id breaks timestamp ties so pages never overlap.
+        page = query.options(joinedload(DBAuditLog.user)).order_by(
+            DBAuditLog.timestamp.desc(), DBAuditLog.id.desc()
         )
+        if after is not None:
+            page = page.filter(tuple_(DBAuditLog.timestamp, DBAuditLog.id) < after)
+        else:
+            page = page.offset(skip)
+        results = page.limit(limit).all()
 
         response_data = [
             AuditLogResponse(
@@ -129,8 +214,16 @@ async def get_audit_logs(
             )
             for log in results
         ]
+        next_cursor = (
+            encode_audit_cursor(results[-1]) if len(results) == limit else None
+        )
 
-        return {"items": response_data, "total": total}
+        return {
+            "items": response_data,
+            "total": total,
+            "total_is_estimate": count == "estimated",
+            "next_cursor": next_cursor,
+        }
 
     except Exception as e:
         logger.error(f"Error fetching audit logs: {str(e)}", exc_info=True)
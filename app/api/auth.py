@@ -21,6 +21,7 @@ from app.core.roles import UserRole
 from app.core.security import (
     create_access_token,
     get_current_user_from_auth,
+    get_current_user_from_auth_async,
     get_password_hash,
     verify_password,
 )
@@ -244,7 +245,9 @@ async def logout(response: Response):
 
 
 @router.get("/me", response_model=User)
-async def read_users_me(current_user: DBUser = Depends(get_current_user_from_auth)):
+async def read_users_me(
+    current_user: DBUser = Depends(get_current_user_from_auth_async),
+):
     return current_user
 
 
@@ -1,5 +1,4 @@
 import logging
-import asyncio
 from datetime import UTC, date, datetime
 
 from app.core.config import settings
@@ -35,7 +34,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import func
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
-from app.services.litellm import LiteLLMService
+from app.services.litellm import KeyUpdate, LiteLLMService
 from app.core.periodic_budget_ledger_service import (
     add_topup_entry,
     compute_active_topup_remaining,
@@ -291,51 +290,32 @@ async def _sync_pool_key_effective_budgets(
     service = LiteLLMService(
         api_url=region.litellm_api_url, api_key=region.litellm_api_key
     )
-    semaphore = asyncio.Semaphore(10)
-
-    async def _sync_key_budget(key: DBPrivateAIKey) -> str | None:
-        try:
-            async with semaphore:
-                configured_cap = cap_map.get(key.id)
-                if configured_cap is None:
-                    # No user-defined key cap — clear both max_budget
-                    # and budget_duration so no stale duration remains.
-                    await service.update_key_budget(
-                        litellm_token=key.litellm_token,
-                        budget_duration=None,
-                        max_budget=None,
-                        clear_max_budget=True,
-                        clear_budget_duration=True,
-                        blocked=False,
-                    )
-                else:
-                    await service.update_key_budget(
-                        litellm_token=key.litellm_token,
-                        budget_duration=MONTHLY_BUDGET_DURATION,
-                        max_budget=configured_cap,
-                        clear_max_budget=False,
-                        blocked=False,
-                    )
-                if purchased_total > 0:
-                    # A purchase extends the key's expiry to match the credit's
-                    # POOL_PURCHASE_EXPIRY_DAYS shelf life. update_key_budget
-                    # deliberately never touches key duration/expiry, so without
-                    # this the key keeps whatever (possibly short) expiry an
-                    # earlier billing/trial path stamped — letting a paid,
-                    # in-credit key expire mid-period while its balance is
-                    # healthy (issue #631).
-                    await service.update_key_duration(
-                        litellm_token=key.litellm_token,
-                        duration=f"{settings.POOL_PURCHASE_EXPIRY_DAYS}d",
-                    )
-            return None
-        except Exception as exc:
-            return f"Key {key.id}: {str(exc)}"
 
+    def _key_update(key: DBPrivateAIKey) -> KeyUpdate:
+        configured_cap = cap_map.get(key.id)
+        if configured_cap is None:
+            # No user-defined key cap — clear both max_budget and
+            # budget_duration (sent as null) so no stale duration remains.
+            fields = {"budget_duration": None, "max_budget": None, "blocked": False}
+        else:
+            fields = {
+                "budget_duration": MONTHLY_BUDGET_DURATION,
+                "max_budget": configured_cap,
+                "blocked": False,
+            }
+        if purchased_total > 0:
+            # A purchase extends the key's expiry to match the credit's
+            # POOL_PURCHASE_EXPIRY_DAYS shelf life. The budget fields alone
+            # never touch key duration/expiry, so without this the key keeps
+            # whatever (possibly short) expiry an earlier billing/trial path
+            # stamped — letting a paid, in-credit key expire mid-period while
+            # its balance is healthy (issue #631).
+            fields["duration"] = f"{settings.POOL_PURCHASE_EXPIRY_DAYS}d"
+        return KeyUpdate(key.litellm_token, fields, key_id=key.id)
+
+    results = await service.bulk_update_keys([_key_update(key) for key in keys])
     return [
-        error
-        for error in await asyncio.gather(*[_sync_key_budget(key) for key in keys])
-        if error is not None
+        f"Key {result.key_id}: {result.error}" for result in results if not result.ok
     ]
 
 
@@ -644,7 +624,7 @@ async def purchase_periodic_topup(
     previous_team_budget_duration: str | None = None
     team_budget_updated = False
     try:
-        team_info_resp = await service.get_team_info(lite_team_id)
+        team_info_resp = await service.get_team_info(lite_team_id, fresh=True)
         team_info = team_info_resp.get("team_info", team_info_resp)
         current_spend = float(team_info.get("spend", 0.0) or 0.0)
         previous_max_budget_raw = team_info.get("max_budget")
@@ -1,4 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from fastapi import status
@@ -6,7 +8,7 @@ import logging
 
 import httpx
 
-from app.db.database import get_db
+from app.db.database import get_async_db, get_db
 from app.core.dependencies import get_limit_service
 from app.schemas.models import (
     PrivateAIKey,
@@ -31,6 +33,7 @@ from app.core.email import normalize_email_for_lookup
 from app.services.litellm import INFERENCE_ONLY_ROUTES, LiteLLMService
 from app.core.security import (
     get_current_user_from_auth,
+    get_current_user_from_auth_async,
     get_role_min_team_admin,
     get_private_ai_access,
     get_private_ai_direct_access,
@@ -639,15 +642,126 @@ async def create_llm_token(
         )
 
 
+# Columns the list endpoints return. Selecting them directly keeps a listing
+# from loading full ORM rows and lazy-loading each key's region.
+_KEY_LIST_COLUMNS = (
+    DBPrivateAIKey.id,
+    DBPrivateAIKey.name,
+    DBPrivateAIKey.database_name,
+    DBPrivateAIKey.database_host,
+    DBPrivateAIKey.database_username,
+    DBPrivateAIKey.database_password,
+    DBPrivateAIKey.litellm_token,
+    DBPrivateAIKey.litellm_api_url,
+    DBRegion.name.label("region"),
+    DBRegion.label.label("region_label"),
+    DBPrivateAIKey.owner_id,
+    DBPrivateAIKey.team_id,
+    DBPrivateAIKey.created_at,
+)
+
+
+def _team_keys_filter(team_id: int):
+    """Keys owned by the team or by any of its users."""
+    return DBPrivateAIKey.owner_id.in_(
+        select(DBUser.id).where(DBUser.team_id == team_id)
+    ) | (DBPrivateAIKey.team_id == team_id)
+
+
+async def _non_admin_keys_filter(db: AsyncSession, current_user):
+    """Keys a caller who is not a system admin may list."""
+    if current_user.team_id is None:
+        # Regular users can only see their own keys
+        return DBPrivateAIKey.owner_id == current_user.id
+
+    if current_user.role == UserRole.TEAM_ADMIN:
+        # Keys owned by any user in the team OR owned by the team
+        return _team_keys_filter(current_user.team_id)
+
+    # Check if team enforces user keys
+    force_user_keys = (
+        await db.execute(
+            select(DBTeam.force_user_keys).where(DBTeam.id == current_user.team_id)
+        )
+    ).scalar()
+    if force_user_keys:
+        # If force_user_keys is enabled, users can only see their own keys
+        return DBPrivateAIKey.owner_id == current_user.id
+    # Otherwise, can see their own keys and team-owned keys.
+    # "Team-owned" means owner_id is NULL — individually-owned
+    # keys are only attributed to a team_id for billing/limits
+    # and must not leak to the rest of the team.
+    return (DBPrivateAIKey.owner_id == current_user.id) | (
+        (DBPrivateAIKey.team_id == current_user.team_id)
+        & (DBPrivateAIKey.owner_id.is_(None))
+    )
+
+
+async def _list_keys(
+    db: AsyncSession,
+    response: Response,
+    filters: list,
+    after: Optional[int],
+    limit: Optional[int],
+    include_total: bool,
+) -> list[dict]:
+    """One page of keys matching ``filters``, ordered by id.
+
+    Keyset pagination: a page holds keys with an id above ``after``, so
+    deep pages cost the same as the first. When the page is full, the id to
+    pass as ``after`` for the next one is returned in ``X-Next-Cursor``. The
+    total match count is only computed when ``include_total`` is set and is
+    returned in ``X-Total-Count``.
+    """
+    # Exclude keys from soft-deleted teams
+    filters = [
+        (DBPrivateAIKey.team_id.is_(None)) | (DBTeam.deleted_at.is_(None)),
+        *filters,
+    ]
+    if include_total:
+        total = (
+            await db.execute(
+                select(func.count())
+                .select_from(DBPrivateAIKey)
+                .outerjoin(DBTeam, DBPrivateAIKey.team_id == DBTeam.id)
+                .where(*filters)
+            )
+        ).scalar()
+        response.headers["X-Total-Count"] = str(total)
+
+    query = (
+        select(*_KEY_LIST_COLUMNS)
+        .outerjoin(DBTeam, DBPrivateAIKey.team_id == DBTeam.id)
+        .outerjoin(DBRegion, DBPrivateAIKey.region_id == DBRegion.id)
+        .where(*filters)
+        .order_by(DBPrivateAIKey.id)
+    )
+    if after is not None:
+        query = query.where(DBPrivateAIKey.id > after)
+    if limit is not None:
+        query = query.limit(limit)
+
+    keys = [dict(row._mapping) for row in await db.execute(query)]
+    for key in keys:
+        key["litellm_api_url"] = key["litellm_api_url"] or ""
+    if limit is not None and len(keys) == limit:
+        response.headers["X-Next-Cursor"] = str(keys[-1]["id"])
+    return keys
+
+
 @router.get("", response_model=List[PrivateAIKey])
 @router.get("/", response_model=List[PrivateAIKey])
 async def list_private_ai_keys(
+    response: Response,
     owner_id: Optional[int] = None,
     team_id: Optional[int] = None,
     search: Optional[str] = None,
     show_all: bool = False,
-    current_user=Depends(get_current_user_from_auth),
-    db: Session = Depends(get_db),
+    after: Optional[int] = Query(None, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    include_total: bool = False,
+    current_user=Depends(get_current_user_from_auth_async),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     List private AI keys.
@@ -665,99 +779,54 @@ async def list_private_ai_keys(
         - Returns their own keys, and keys for their team, ignoring owner_id and team_id parameters
 
     Keys from soft-deleted teams are excluded from the results.
-    """
-    query = db.query(DBPrivateAIKey).outerjoin(
-        DBTeam, DBPrivateAIKey.team_id == DBTeam.id
-    )
 
-    # Exclude keys from soft-deleted teams
-    query = query.filter(
-        (DBPrivateAIKey.team_id.is_(None)) | (DBTeam.deleted_at.is_(None))
-    )
+    Keys are ordered by id. after / limit: keyset pagination (unpaginated
+    when limit is omitted, for backwards compatibility); a full page returns
+    the next ``after`` value in the X-Next-Cursor header. include_total=true
+    adds the total match count in the X-Total-Count header.
+    """
+    filters = []
 
     # Search by database name or database username
     if search:
         search_pattern = f"%{search}%"
-        query = query.filter(
+        filters.append(
             (DBPrivateAIKey.database_name.ilike(search_pattern))
             | (DBPrivateAIKey.database_username.ilike(search_pattern))
         )
 
     if current_user.is_admin:
         if owner_id is not None:
-            query = query.filter(DBPrivateAIKey.owner_id == owner_id)
+            filters.append(DBPrivateAIKey.owner_id == owner_id)
         elif team_id is not None:
-            # Get all users in the team
-            team_users = db.query(DBUser).filter(DBUser.team_id == team_id).all()
-            team_user_ids = [user.id for user in team_users]
-            # Return keys owned by users in the team OR owned by the team
-            query = query.filter(
-                (DBPrivateAIKey.owner_id.in_(team_user_ids))
-                | (DBPrivateAIKey.team_id == team_id)
-            )
+            filters.append(_team_keys_filter(team_id))
         elif not show_all:
             # Safe default: no filters and no explicit opt-in means "my own
             # keys", not "every key in the system".
-            query = query.filter(DBPrivateAIKey.owner_id == current_user.id)
+            filters.append(DBPrivateAIKey.owner_id == current_user.id)
     else:
-        # Check if user is a team admin
-        if current_user.team_id is not None:
-            # Check if team enforces user keys
-            user_team = (
-                db.query(DBTeam).filter(DBTeam.id == current_user.team_id).first()
-            )
-            force_user_keys = user_team.force_user_keys if user_team else False
-
-            if current_user.role == UserRole.TEAM_ADMIN:
-                # Get all users in the team
-                team_users = (
-                    db.query(DBUser)
-                    .filter(DBUser.team_id == current_user.team_id)
-                    .all()
-                )
-                team_user_ids = [user.id for user in team_users]
-                # Return keys owned by any user in the team OR owned by the team
-                query = query.filter(
-                    (DBPrivateAIKey.owner_id.in_(team_user_ids))
-                    | (DBPrivateAIKey.team_id == current_user.team_id)
-                )
-            else:
-                # Non-admin users
-                if force_user_keys:
-                    # If force_user_keys is enabled, users can only see their own keys
-                    query = query.filter(DBPrivateAIKey.owner_id == current_user.id)
-                else:
-                    # Otherwise, can see their own keys and team-owned keys.
-                    # "Team-owned" means owner_id is NULL — individually-owned
-                    # keys are only attributed to a team_id for billing/limits
-                    # and must not leak to the rest of the team.
-                    query = query.filter(
-                        (DBPrivateAIKey.owner_id == current_user.id)
-                        | (
-                            (DBPrivateAIKey.team_id == current_user.team_id)
-                            & (DBPrivateAIKey.owner_id.is_(None))
-                        )
-                    )
-        else:
-            # Regular users can only see their own keys
-            query = query.filter(DBPrivateAIKey.owner_id == current_user.id)
+        filters.append(await _non_admin_keys_filter(db, current_user))
 
-    private_ai_keys = query.all()
-    return [key.to_dict() for key in private_ai_keys]
+    return await _list_keys(db, response, filters, after, limit, include_total)
 
 
 @router.get("/region/{region_id}", response_model=List[PrivateAIKey])
 async def list_private_ai_keys_by_region(
     region_id: int,
+    response: Response,
     team_id: Optional[int] = None,
     user_id: Optional[int] = None,
     show_all: bool = False,
-    current_user=Depends(get_current_user_from_auth),
-    db: Session = Depends(get_db),
+    after: Optional[int] = Query(None, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    include_total: bool = False,
+    current_user=Depends(get_current_user_from_auth_async),
+    db: AsyncSession = Depends(get_async_db),
 ):
     """
     List private AI keys for a specific region.
-    Applies the same access rules as the standard list endpoint.
+    Applies the same access rules, ordering and pagination (after / limit /
+    include_total) as the standard list endpoint.
 
     Keys from soft-deleted teams are excluded from the results.
 
@@ -773,91 +842,39 @@ async def list_private_ai_keys_by_region(
       an admin caller gets only their own keys in this region rather than every
       key in the region.
     """
-    query = db.query(DBPrivateAIKey).outerjoin(
-        DBTeam, DBPrivateAIKey.team_id == DBTeam.id
-    )
-
-    # Exclude keys from soft-deleted teams
-    query = query.filter(
-        (DBPrivateAIKey.team_id.is_(None)) | (DBTeam.deleted_at.is_(None))
-    )
-
-    query = query.filter(DBPrivateAIKey.region_id == region_id)
+    filters = [DBPrivateAIKey.region_id == region_id]
 
     if current_user.is_admin:
         if team_id is not None:
             # Check team exists and is not soft-deleted
-            team = (
-                db.query(DBTeam)
-                .filter(DBTeam.id == team_id, DBTeam.deleted_at.is_(None))
-                .first()
-            )
-            if team is None:
+            team_exists = (
+                await db.execute(
+                    select(DBTeam.id).where(
+                        DBTeam.id == team_id, DBTeam.deleted_at.is_(None)
+                    )
+                )
+            ).first()
+            if team_exists is None:
                 return []
-
-            # Use subquery instead of loading users into memory
-            team_user_ids_subq = db.query(DBUser.id).filter(DBUser.team_id == team_id)
-            query = query.filter(
-                (DBPrivateAIKey.owner_id.in_(team_user_ids_subq))
-                | (DBPrivateAIKey.team_id == team_id)
-            )
+            filters.append(_team_keys_filter(team_id))
 
         if user_id is not None:
             # Verify the user exists; return empty list if not found
-            user = db.query(DBUser).filter(DBUser.id == user_id).first()
-            if user is None:
+            user_exists = (
+                await db.execute(select(DBUser.id).where(DBUser.id == user_id))
+            ).first()
+            if user_exists is None:
                 return []
-            query = query.filter(DBPrivateAIKey.owner_id == user_id)
+            filters.append(DBPrivateAIKey.owner_id == user_id)
 
         if team_id is None and user_id is None and not show_all:
             # Safe default: no filters and no explicit opt-in means "my own
             # keys in this region", not "every key in the region".
-            query = query.filter(DBPrivateAIKey.owner_id == current_user.id)
+            filters.append(DBPrivateAIKey.owner_id == current_user.id)
     else:
-        # Check if user is a team admin
-        if current_user.team_id is not None:
-            # Check if team enforces user keys
-            user_team = (
-                db.query(DBTeam).filter(DBTeam.id == current_user.team_id).first()
-            )
-            force_user_keys = user_team.force_user_keys if user_team else False
-
-            if current_user.role == UserRole.TEAM_ADMIN:
-                # Get all users in the team
-                team_users = (
-                    db.query(DBUser)
-                    .filter(DBUser.team_id == current_user.team_id)
-                    .all()
-                )
-                team_user_ids = [user.id for user in team_users]
-                # Return keys owned by any user in the team OR owned by the team
-                query = query.filter(
-                    (DBPrivateAIKey.owner_id.in_(team_user_ids))
-                    | (DBPrivateAIKey.team_id == current_user.team_id)
-                )
-            else:
-                # Non-admin users
-                if force_user_keys:
-                    # If force_user_keys is enabled, users can only see their own keys
-                    query = query.filter(DBPrivateAIKey.owner_id == current_user.id)
-                else:
-                    # Otherwise, can see their own keys and team-owned keys.
-                    # "Team-owned" means owner_id is NULL — individually-owned
-                    # keys are only attributed to a team_id for billing/limits
-                    # and must not leak to the rest of the team.
-                    query = query.filter(
-                        (DBPrivateAIKey.owner_id == current_user.id)
-                        | (
-                            (DBPrivateAIKey.team_id == current_user.team_id)
-                            & (DBPrivateAIKey.owner_id.is_(None))
-                        )
-                    )
-        else:
-            # Regular users can only see their own keys
-            query = query.filter(DBPrivateAIKey.owner_id == current_user.id)
+        filters.append(await _non_admin_keys_filter(db, current_user))
 
-    private_ai_keys = query.all()
-    return [key.to_dict() for key in private_ai_keys]
+    return await _list_keys(db, response, filters, after, limit, include_total)
 
 
 @router.get(
@@ -1,16 +1,26 @@
 import asyncio
+import gzip
+import hashlib
+import json
 import logging
 import re
+import time
+import uuid
+from collections import OrderedDict
 from datetime import date, datetime, timedelta, UTC
 from typing import Any
 
+import brotli
 import httpx
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from prometheus_client import Counter, Gauge, Histogram
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 
 from app.core.config import catalog_manages, settings
 from app.core.security import get_current_user_from_auth
-from app.db.database import get_db
+from app.core.shared_cache import shared_cache
+from app.db.database import SessionLocal, get_db
 from app.db.models import (
     DBModel,
     DBModelAccessGroupModel,
@@ -38,37 +48,86 @@ router = APIRouter(tags=["public"])
 protected_router = APIRouter(tags=["models"])
 
 _CACHE_TTL = timedelta(hours=1)
+# Entries are refreshed in the background this long before they expire, and
+# served stale for up to _CACHE_STALE_GRACE after expiry while a refresh runs.
+_CACHE_REFRESH_AHEAD = timedelta(minutes=5)
+_CACHE_STALE_GRACE = timedelta(hours=1)
+_CACHE_REFRESHER_INTERVAL = 60.0  # seconds between background refresh passes
+# Entries are shared with other workers and replicas through shared_cache
+# (app/core/shared_cache.py). A process only fans out to the regions while it
+# holds the entry's rebuild lease; the others wait for its result.
+_REBUILD_LEASE_SECONDS = 60.0
+_LEASE_POLL_SECONDS = 0.5
+_SHARED_CHECK_SECONDS = 5.0  # min interval between shared reads per stale entry
+_DEDICATED_CACHE_MAX_ENTRIES = settings.PUBLIC_MODELS_DEDICATED_CACHE_MAX_ENTRIES
 _REGION_TIMEOUT = 10.0  # seconds per-region request
 _REGION_SEMAPHORE = asyncio.Semaphore(10)  # max concurrent region requests
 _DEFAULT_PUBLIC_MODEL_PROFIT_MARGIN = 0.2
-_cache_lock = asyncio.Lock()
-_dedicated_cache_lock = asyncio.Lock()
 _models_cache: dict[str, Any] = {
     "expires_at": datetime.min.replace(tzinfo=UTC),
     "data": [],
+    "generation": "",
 }
 _dedicated_cache: dict[str, Any] = {
     # keyed by team_id (str) → list[PublicRegionModels]
     "by_team": {},
     "team_expires": {},  # team_id → expiry datetime
+    "last_access": {},  # team_id → last time a request was served the entry
 }
 _ADMIN_CACHE_KEY = "__admin__"  # special key for admin all-dedicated-regions cache
+_PUBLIC_CACHE_KEY = "__public__"  # _refresh_tasks key for the public cache
+# One in-flight rebuild per cache key; requests and the refresher share it.
+_refresh_tasks: dict[str, asyncio.Task] = {}
+# cache key → monotonic time of the last shared_cache read from a request
+_shared_checked_at: dict[str, float] = {}
+# Serialized, hashed and precompressed response bodies, one per distinct
+# payload (public view, each team's view, alias filters).
+_RENDERED_CACHE_SIZE = 256
+_rendered_cache: OrderedDict[tuple, dict[str, Any]] = OrderedDict()
+_region_models_adapter = TypeAdapter(list[PublicRegionModels])
+
+public_models_cache_age_seconds = Gauge(
+    "public_models_cache_age_seconds",
+    "Age of the /public/models cache served last (oldest dedicated entry)",
+    ["cache"],
+)
+public_models_cache_refresh_seconds = Histogram(
+    "public_models_cache_refresh_seconds",
+    "Time to rebuild a /public/models cache entry from the regions",
+    ["cache"],
+    buckets=(0.1, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, float("inf")),
+)
+public_models_cache_stale_served_total = Counter(
+    "public_models_cache_stale_served_total",
+    "/public/models responses served from an expired entry during a refresh",
+    ["cache"],
+)
+
+
+def _drop_dedicated_entry(key: str) -> None:
+    _dedicated_cache["by_team"].pop(key, None)
+    _dedicated_cache["team_expires"].pop(key, None)
+    _dedicated_cache["last_access"].pop(key, None)
 
 
 def _evict_stale_dedicated_entries() -> None:
-    """Remove expired entries from ``_dedicated_cache`` to prevent unbounded growth.
+    """Bound ``_dedicated_cache`` by age and by size.
 
-    Must be called while ``_dedicated_cache_lock`` is held.
+    Entries past their stale grace are dropped; expired entries within it are
+    kept so they can be served while refreshing. Beyond
+    ``_DEDICATED_CACHE_MAX_ENTRIES`` the least recently used entries go first
+    (``by_team`` is kept in access order).
     """
-    now = datetime.now(UTC)
+    cutoff = datetime.now(UTC) - _CACHE_STALE_GRACE
     expired_keys = [
         key
         for key, expires_at in _dedicated_cache["team_expires"].items()
-        if expires_at <= now
+        if expires_at <= cutoff
     ]
     for key in expired_keys:
-        _dedicated_cache["by_team"].pop(key, None)
-        _dedicated_cache["team_expires"].pop(key, None)
+        _drop_dedicated_entry(key)
+    while len(_dedicated_cache["by_team"]) > _DEDICATED_CACHE_MAX_ENTRIES:
+        _drop_dedicated_entry(next(iter(_dedicated_cache["by_team"])))
 
 
 def _infer_provider(item: dict[str, Any]) -> str:
@@ -854,6 +913,448 @@ async def _fetch_region_model_group(
             )
 
 
+def _region_services(regions: list[DBRegion]) -> list[tuple[LiteLLMService, str]]:
+    return [
+        (
+            LiteLLMService(
+                api_url=region.litellm_api_url,
+                api_key=region.litellm_api_key,
+            ),
+            region.name,
+        )
+        for region in regions
+    ]
+
+
+async def _fetch_region_groups(
+    services: list[tuple[LiteLLMService, str]],
+) -> list[PublicRegionModels]:
+    return list(
+        await asyncio.gather(
+            *(
+                _fetch_region_model_group(service, region_name)
+                for service, region_name in services
+            )
+        )
+    )
+
+
+def _refresh_in_flight(cache_key: str) -> asyncio.Task | None:
+    task = _refresh_tasks.get(cache_key)
+    if (
+        task is None
+        or task.done()
+        # A task left behind by an event loop that has since closed.
+        or task.get_loop() is not asyncio.get_running_loop()
+    ):
+        return None
+    return task
+
+
+def _log_refresh_failure(task: asyncio.Task) -> None:
+    if not task.cancelled() and task.exception() is not None:
+        logger.warning(
+            "Refreshing the /public/models cache failed: %s", task.exception()
+        )
+
+
+def _start_refresh(cache_key: str, rebuild) -> asyncio.Task:
+    task = asyncio.create_task(rebuild)
+    task.add_done_callback(_log_refresh_failure)
+    _refresh_tasks[cache_key] = task
+    return task
+
+
+def _shared_key(cache_key: str) -> str:
+    return f"public-models:{cache_key}"
+
+
+def _read_shared(cache_key: str) -> dict[str, Any] | None:
+    try:
+        raw = shared_cache.get(_shared_key(cache_key))
+    except Exception as exc:
+        logger.warning("Reading shared /public/models cache failed: %s", exc)
+        return None
+    return json.loads(raw) if raw is not None else None
+
+
+def _write_shared(
+    cache_key: str,
+    groups: list[PublicRegionModels],
+    expires_at: datetime,
+    generation: str,
+    public_names: frozenset[str] | None = None,
+) -> None:
+    payload = {
+        "expires_at": expires_at.isoformat(),
+        "generation": generation,
+        "groups": _region_models_adapter.dump_python(groups, mode="json"),
+        "public_names": sorted(public_names) if public_names is not None else None,
+    }
+    try:
+        shared_cache.set(
+            _shared_key(cache_key),
+            json.dumps(payload).encode("utf-8"),
+            (_CACHE_TTL + _CACHE_STALE_GRACE).total_seconds(),
+        )
+    except Exception as exc:
+        logger.warning("Writing shared /public/models cache failed: %s", exc)
+
+
+def _local_expiry(cache_key: str) -> datetime:
+    if cache_key == _PUBLIC_CACHE_KEY:
+        return _models_cache["expires_at"]
+    return _dedicated_cache["team_expires"].get(
+        cache_key, datetime.min.replace(tzinfo=UTC)
+    )
+
+
+async def _adopt_shared(cache_key: str) -> bool:
+    """Take the shared entry for ``cache_key`` if it is newer than ours."""
+    # shared_cache reads are file or Redis I/O: keep them off the event loop.
+    # The local caches are only ever updated back on the loop, below.
+    payload = await asyncio.to_thread(_read_shared, cache_key)
+    if payload is None:
+        return False
+    expires_at = datetime.fromisoformat(payload["expires_at"])
+    groups = _region_models_adapter.validate_python(payload["groups"])
+    if cache_key == _PUBLIC_CACHE_KEY:
+        if expires_at <= _models_cache["expires_at"]:
+            return False
+        _models_cache["data"] = groups
+        _models_cache["expires_at"] = expires_at
+        _models_cache["generation"] = payload["generation"]
+        return True
+    if expires_at <= _local_expiry(cache_key):
+        return False
+    public_names = payload["public_names"]
+    _dedicated_cache["by_team"].pop(cache_key, None)
+    _dedicated_cache["by_team"][cache_key] = {
+        "dedicated": groups,
+        "public_names": frozenset(public_names) if public_names is not None else None,
+        "generation": payload["generation"],
+    }
+    _dedicated_cache["team_expires"][cache_key] = expires_at
+    return True
+
+
+async def _adopt_shared_throttled(cache_key: str) -> None:
+    # Requests on a stale entry look for another process's rebuild, but not
+    # on every request.
+    now = time.monotonic()
+    if now - _shared_checked_at.get(cache_key, float("-inf")) >= _SHARED_CHECK_SECONDS:
+        _shared_checked_at[cache_key] = now
+        await _adopt_shared(cache_key)
+
+
+async def _rebuild_once_per_cluster(cache_key: str, rebuild) -> None:
+    """Run ``rebuild`` while holding the shared lease for ``cache_key``.
+
+    When another process holds it, wait for its entry to land in the shared
+    cache instead; past the lease lifetime (its holder died), rebuild anyway.
+    """
+    lease = f"{_shared_key(cache_key)}:lease"
+    deadline = time.monotonic() + _REBUILD_LEASE_SECONDS
+    while True:
+        await _adopt_shared(cache_key)
+        if _local_expiry(cache_key) > datetime.now(UTC) + _CACHE_REFRESH_AHEAD:
+            return
+        try:
+            acquired = await asyncio.to_thread(
+                shared_cache.add, lease, b"1", _REBUILD_LEASE_SECONDS
+            )
+        except Exception as exc:
+            logger.warning("Taking the /public/models rebuild lease failed: %s", exc)
+            acquired = True
+        if acquired or time.monotonic() >= deadline:
+            break
+        await asyncio.sleep(_LEASE_POLL_SECONDS)
+    try:
+        await rebuild()
+    finally:
+        if acquired:
+            try:
+                await asyncio.to_thread(shared_cache.delete, lease)
+            except Exception:
+                pass
+
+
+async def _rebuild_public_cache(
+    services: list[tuple[LiteLLMService, str]],
+) -> list[PublicRegionModels]:
+    async def rebuild() -> None:
+        started = time.perf_counter()
+        groups = await _fetch_region_groups(services)
+        _models_cache["data"] = groups
+        _models_cache["expires_at"] = datetime.now(UTC) + _CACHE_TTL
+        _models_cache["generation"] = uuid.uuid4().hex
+        await asyncio.to_thread(
+            _write_shared,
+            _PUBLIC_CACHE_KEY,
+            groups,
+            _models_cache["expires_at"],
+            _models_cache["generation"],
+        )
+        public_models_cache_refresh_seconds.labels(cache="public").observe(
+            time.perf_counter() - started
+        )
+
+    await _rebuild_once_per_cluster(_PUBLIC_CACHE_KEY, rebuild)
+    return _models_cache["data"]
+
+
+def _refresh_public_cache(db: Session) -> asyncio.Task:
+    """Rebuild the public cache, joining a rebuild that is already running.
+
+    Regions and their clients are resolved here, on the caller's session, so
+    the rebuild itself only talks to LiteLLM.
+    """
+    task = _refresh_in_flight(_PUBLIC_CACHE_KEY)
+    if task is None:
+        regions = (
+            db.query(DBRegion)
+            .filter(
+                DBRegion.is_active.is_(True),
+                DBRegion.is_dedicated.is_(False),
+            )
+            .all()
+        )
+        task = _start_refresh(
+            _PUBLIC_CACHE_KEY, _rebuild_public_cache(_region_services(regions))
+        )
+    return task
+
+
+async def _get_public_groups(db: Session) -> list[PublicRegionModels]:
+    """Public region groups, served stale while a background rebuild runs.
+
+    Only a cold cache (never built, or past its stale grace) makes the request
+    wait for the region fan-out.
+    """
+    now = datetime.now(UTC)
+    if _models_cache["expires_at"] <= now + _CACHE_REFRESH_AHEAD:
+        await _adopt_shared_throttled(_PUBLIC_CACHE_KEY)
+    expires_at = _models_cache["expires_at"]
+    if expires_at > now + _CACHE_REFRESH_AHEAD:
+        groups = _models_cache["data"]
+    elif expires_at > now - _CACHE_STALE_GRACE:
+        _refresh_public_cache(db)
+        if expires_at <= now:
+            public_models_cache_stale_served_total.labels(cache="public").inc()
+        groups = _models_cache["data"]
+    else:
+        groups = await asyncio.shield(_refresh_public_cache(db))
+    public_models_cache_age_seconds.labels(cache="public").set(
+        (_CACHE_TTL - (_models_cache["expires_at"] - now)).total_seconds()
+    )
+    return groups
+
+
+async def _rebuild_dedicated_entry(
+    cache_key: str,
+    services: list[tuple[LiteLLMService, str]],
+    public_names: frozenset[str] | None,
+) -> dict[str, Any]:
+    async def rebuild() -> None:
+        started = time.perf_counter()
+        entry = {
+            "dedicated": await _fetch_region_groups(services) if services else [],
+            "public_names": public_names,
+            "generation": uuid.uuid4().hex,
+        }
+        expires_at = datetime.now(UTC) + _CACHE_TTL
+        _dedicated_cache["by_team"].pop(cache_key, None)
+        _dedicated_cache["by_team"][cache_key] = entry
+        _dedicated_cache["team_expires"][cache_key] = expires_at
+        await asyncio.to_thread(
+            _write_shared,
+            cache_key,
+            entry["dedicated"],
+            expires_at,
+            entry["generation"],
+            public_names,
+        )
+        public_models_cache_refresh_seconds.labels(cache="dedicated").observe(
+            time.perf_counter() - started
+        )
+
+    await _rebuild_once_per_cluster(cache_key, rebuild)
+    _evict_stale_dedicated_entries()
+    return _dedicated_cache["by_team"][cache_key]
+
+
+def _refresh_dedicated_entry(db: Session, cache_key: str) -> asyncio.Task:
+    """Rebuild one team's (or the admin) dedicated entry; see _refresh_public_cache."""
+    task = _refresh_in_flight(cache_key)
+    if task is not None:
+        return task
+    # Query only dedicated regions for LiteLLM fetching; also collect assigned
+    # public region names to filter public_groups.
+    if cache_key == _ADMIN_CACHE_KEY:
+        dedicated_to_fetch = (
+            db.query(DBRegion)
+            .filter(
+                DBRegion.is_active.is_(True),
+                DBRegion.is_dedicated.is_(True),
+            )
+            .all()
+        )
+        public_names = None  # admins see all public groups
+    else:
+        assigned = (
+            db.query(DBRegion)
+            .join(DBTeamRegion, DBTeamRegion.region_id == DBRegion.id)
+            .filter(
+                DBTeamRegion.team_id == int(cache_key),
+                DBRegion.is_active.is_(True),
+            )
+            .all()
+        )
+        dedicated_to_fetch = [r for r in assigned if r.is_dedicated]
+        public_names = frozenset(r.name for r in assigned if not r.is_dedicated)
+    return _start_refresh(
+        cache_key,
+        _rebuild_dedicated_entry(
+            cache_key, _region_services(dedicated_to_fetch), public_names
+        ),
+    )
+
+
+async def _get_dedicated_entry(db: Session, cache_key: str) -> dict[str, Any]:
+    """A team's dedicated entry, with the same staleness rules as the public cache."""
+    _evict_stale_dedicated_entries()
+    now = datetime.now(UTC)
+    _dedicated_cache["last_access"][cache_key] = now
+    if _local_expiry(cache_key) <= now + _CACHE_REFRESH_AHEAD:
+        await _adopt_shared_throttled(cache_key)
+    entry = _dedicated_cache["by_team"].pop(cache_key, None)
+    if entry is not None:
+        # Re-inserted to mark it most recently used.
+        _dedicated_cache["by_team"][cache_key] = entry
+    expires_at = _dedicated_cache["team_expires"].get(
+        cache_key, datetime.min.replace(tzinfo=UTC)
+    )
+    if entry is None:
+        entry = await asyncio.shield(_refresh_dedicated_entry(db, cache_key))
+        expires_at = _dedicated_cache["team_expires"][cache_key]
+    elif expires_at <= now + _CACHE_REFRESH_AHEAD:
+        _refresh_dedicated_entry(db, cache_key)
+        if expires_at <= now:
+            public_models_cache_stale_served_total.labels(cache="dedicated").inc()
+    public_models_cache_age_seconds.labels(cache="dedicated").set(
+        (_CACHE_TTL - (expires_at - now)).total_seconds()
+    )
+    return entry
+
+
+async def refresh_public_models_caches() -> None:
+    """Rebuild every cache entry that expires within ``_CACHE_REFRESH_AHEAD``.
+
+    Dedicated entries are only kept warm for teams that requested them within
+    the last ``_CACHE_TTL``; the rest are left to expire.
+    """
+    now = datetime.now(UTC)
+    horizon = now + _CACHE_REFRESH_AHEAD
+    tasks = []
+    db = SessionLocal()
+    try:
+        expires_at = _models_cache["expires_at"]
+        if datetime.min.replace(tzinfo=UTC) < expires_at <= horizon:
+            tasks.append(_refresh_public_cache(db))
+        for cache_key, expires_at in list(_dedicated_cache["team_expires"].items()):
+            last_access = _dedicated_cache["last_access"].get(cache_key)
+            if (
+                expires_at <= horizon
+                and last_access is not None
+                and last_access > now - _CACHE_TTL
+            ):
+                tasks.append(_refresh_dedicated_entry(db, cache_key))
+    finally:
+        db.close()
+    await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def run_public_models_refresher(
+    interval: float = _CACHE_REFRESHER_INTERVAL,
+) -> None:
+    """Keep the /public/models caches warm until cancelled (app lifespan)."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await refresh_public_models_caches()
+        except Exception:
+            logger.exception("Background /public/models refresh failed")
+
+
+def _render_region_groups(groups: list[PublicRegionModels]) -> dict[str, Any]:
+    """Serialize ``groups`` once: JSON body, content hash, gzip and brotli."""
+    body = _region_models_adapter.dump_json(groups)
+    return {
+        "etag": hashlib.sha256(body).hexdigest()[:32],
+        "identity": body,
+        "gzip": gzip.compress(body, compresslevel=6),
+        "br": brotli.compress(body, quality=9),
+    }
+
+
+def _preferred_encoding(accept_encoding: str) -> str:
+    qualities: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        coding, _, params = part.partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    for coding in ("br", "gzip"):
+        if qualities.get(coding, qualities.get("*", 0.0)) > 0:
+            return coding
+    return "identity"
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        # Weak comparison, ignoring the per-encoding suffix: every encoding
+        # of one payload is the same content.
+        tag = candidate.removeprefix("W/").strip('"')
+        if tag.split("-", 1)[0] == etag:
+            return True
+    return False
+
+
+async def _region_groups_response(
+    request: Request, key: tuple, groups: list[PublicRegionModels]
+) -> Response:
+    rendered = _rendered_cache.get(key)
+    if rendered is None:
+        rendered = await asyncio.to_thread(_render_region_groups, groups)
+        _rendered_cache[key] = rendered
+        while len(_rendered_cache) > _RENDERED_CACHE_SIZE:
+            _rendered_cache.popitem(last=False)
+    else:
+        _rendered_cache.move_to_end(key)
+
+    encoding = _preferred_encoding(request.headers.get("accept-encoding", ""))
+    etag = rendered["etag"]
+    if encoding != "identity":
+        etag = f"{etag}-{encoding}"
+    headers = {"ETag": f'"{etag}"', "Vary": "Accept-Encoding"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, rendered["etag"]):
+        return Response(status_code=304, headers=headers)
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+    return Response(
+        content=rendered[encoding], media_type="application/json", headers=headers
+    )
+
+
 @router.get("/models", response_model=list[PublicRegionModels])
 async def list_public_models(
     request: Request,
@@ -866,50 +1367,15 @@ async def list_public_models(
     ),
     db: Session = Depends(get_db),
 ):
-    now = datetime.now(UTC)
     alias_filters = _parse_alias_filters(alias)
 
     # --- Public regions (cached globally) ---
-    if _models_cache["expires_at"] > now:
-        public_groups = _models_cache["data"]
-    else:
-        regions_to_fetch: list | None = None
-        async with _cache_lock:
-            now = datetime.now(UTC)
-            if _models_cache["expires_at"] > now:
-                public_groups = _models_cache["data"]
-            else:
-                regions_to_fetch = (
-                    db.query(DBRegion)
-                    .filter(
-                        DBRegion.is_active.is_(True),
-                        DBRegion.is_dedicated.is_(False),
-                    )
-                    .all()
-                )
-                # Serve stale data to concurrent requests while refresh is in flight.
-                public_groups = list(_models_cache["data"])
-
-        if regions_to_fetch is not None:
-            tasks = [
-                _fetch_region_model_group(
-                    LiteLLMService(
-                        api_url=region.litellm_api_url,
-                        api_key=region.litellm_api_key,
-                    ),
-                    region.name,
-                )
-                for region in regions_to_fetch
-            ]
-            fetched_groups = list(await asyncio.gather(*tasks))
-            async with _cache_lock:
-                _models_cache["data"] = fetched_groups
-                _models_cache["expires_at"] = datetime.now(UTC) + _CACHE_TTL
-            public_groups = fetched_groups
+    public_groups = await _get_public_groups(db)
 
     # --- Dedicated regions (optional, per-user) ---
     user = await _resolve_optional_user(request, db)
     visible_groups = list(public_groups)
+    generations: tuple = (_models_cache["generation"],)
 
     if user:
         is_admin = bool(user.is_admin)
@@ -930,73 +1396,10 @@ async def list_public_models(
             cache_key = None
 
         if cache_key is not None:
-            dedicated_to_fetch: list | None = None
-            public_names_to_cache: frozenset[str] | None = None
-            async with _dedicated_cache_lock:
-                _evict_stale_dedicated_entries()
-                entry = _dedicated_cache["by_team"].get(cache_key)
-                if entry is not None and _dedicated_cache["team_expires"].get(
-                    cache_key, datetime.min.replace(tzinfo=UTC)
-                ) > datetime.now(UTC):
-                    dedicated_groups = entry["dedicated"]
-                    public_names = entry["public_names"]
-                else:
-                    # Query only dedicated regions for LiteLLM fetching; also
-                    # collect assigned public region names to filter public_groups.
-                    if is_admin:
-                        dedicated_to_fetch = (
-                            db.query(DBRegion)
-                            .filter(
-                                DBRegion.is_active.is_(True),
-                                DBRegion.is_dedicated.is_(True),
-                            )
-                            .all()
-                        )
-                        public_names_to_cache = None  # admins see all public groups
-                    else:
-                        assigned = (
-                            db.query(DBRegion)
-                            .join(DBTeamRegion, DBTeamRegion.region_id == DBRegion.id)
-                            .filter(
-                                DBTeamRegion.team_id == team_id,
-                                DBRegion.is_active.is_(True),
-                            )
-                            .all()
-                        )
-                        dedicated_to_fetch = [r for r in assigned if r.is_dedicated]
-                        public_names_to_cache = frozenset(
-                            r.name for r in assigned if not r.is_dedicated
-                        )
-                    # Serve stale data to concurrent requests while refresh is in flight.
-                    stale_entry = _dedicated_cache["by_team"].get(cache_key, {})
-                    dedicated_groups = stale_entry.get("dedicated", [])
-                    public_names = stale_entry.get("public_names")
-
-            if dedicated_to_fetch is not None:
-                if dedicated_to_fetch:
-                    fetch_tasks = [
-                        _fetch_region_model_group(
-                            LiteLLMService(
-                                api_url=region.litellm_api_url,
-                                api_key=region.litellm_api_key,
-                            ),
-                            region.name,
-                        )
-                        for region in dedicated_to_fetch
-                    ]
-                    dedicated_groups = list(await asyncio.gather(*fetch_tasks))
-                else:
-                    dedicated_groups = []
-
-                async with _dedicated_cache_lock:
-                    _dedicated_cache["by_team"][cache_key] = {
-                        "dedicated": dedicated_groups,
-                        "public_names": public_names_to_cache,
-                    }
-                    _dedicated_cache["team_expires"][cache_key] = (
-                        datetime.now(UTC) + _CACHE_TTL
-                    )
-                public_names = public_names_to_cache
+            entry = await _get_dedicated_entry(db, cache_key)
+            dedicated_groups = entry["dedicated"]
+            public_names = entry["public_names"]
+            generations += (entry.get("generation", 0),)
 
             # Combine public groups (filtered by visibility) with dedicated groups.
             if is_admin:
@@ -1012,7 +1415,14 @@ async def list_public_models(
     request.state._public_models_is_authenticated = user is not None
 
     visible_groups = _filter_region_groups_by_access(db, visible_groups, user)
-    return _filter_region_groups_by_alias(visible_groups, alias_filters)
+    visible_groups = _filter_region_groups_by_alias(visible_groups, alias_filters)
+    # Groups only ever narrow the cached entries by model, so the generations
+    # plus the surviving model ids identify the payload without serializing it.
+    key = generations + tuple(
+        (group.region, group.status, tuple(m.model_id for m in group.models))
+        for group in visible_groups
+    )
+    return await _region_groups_response(request, key, visible_groups)
 
 
 # ---------------------------------------------------------------------------
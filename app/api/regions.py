@@ -854,7 +854,8 @@ async def update_team_region_model_aliases(
         )
 
     lite_team_id = LiteLLMService.format_team_id(region.name, team_id)
-    team_info_response = await service.get_team_info(lite_team_id)
+    # Written back below, so read past the memo
+    team_info_response = await service.get_team_info(lite_team_id, fresh=True)
     team_info = team_info_response.get("team_info", team_info_response)
     current_max_budget = team_info.get("max_budget")
     current_budget_duration = team_info.get("budget_duration")
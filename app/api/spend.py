@@ -3,7 +3,8 @@ from datetime import UTC, date, datetime, timedelta
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi import Query
-from sqlalchemy import func
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.orm import aliased
 
@@ -20,14 +21,17 @@ from app.core.pool_budget_service import (
 )
 from app.core.security import (
     get_current_user_from_auth,
+    get_current_user_from_auth_async,
     get_private_ai_access,
+    get_private_ai_access_async,
     get_role_min_team_admin,
 )
 from app.core.spend_period_service import (
     compute_period_start,
     resolve_team_period_window,
 )
-from app.db.database import get_db
+from app.core.team_service import LiteLLMKeyResolver
+from app.db.database import get_async_db, get_db
 from app.db.models import (
     DBPeriodicPayment,
     DBPeriodicBudgetLedgerEntry,
@@ -404,6 +408,19 @@ def _get_region_or_404(db: Session, region_id: int) -> DBRegion:
     return region
 
 
+async def _get_region_or_404_async(db: AsyncSession, region_id: int) -> DBRegion:
+    region = (
+        await db.execute(
+            select(DBRegion).where(
+                DBRegion.id == region_id, DBRegion.is_active.is_(True)
+            )
+        )
+    ).scalar_one_or_none()
+    if not region:
+        raise HTTPException(status_code=404, detail="Region not found")
+    return region
+
+
 def _lock_region_or_404(db: Session, region_id: int) -> DBRegion:
     """Load an active region and hold a row lock on it for this transaction.
 
@@ -497,7 +514,7 @@ def _assert_team_region_association(
         )
 
 
-def _invalidate_team_user_spend_cache(db: Session, team_id: int) -> None:
+async def _invalidate_team_user_spend_cache(db: Session, team_id: int) -> None:
     team_user_emails = (
         db.query(DBUser.email)
         .filter(DBUser.team_id == team_id, DBUser.is_active.is_(True))
@@ -505,16 +522,18 @@ def _invalidate_team_user_spend_cache(db: Session, team_id: int) -> None:
     )
     for (email,) in team_user_emails:
         if email:
-            invalidate_user_spend_cache(db, email)
+            await invalidate_user_spend_cache(db, email)
 
 
-def _invalidate_key_related_user_spend_cache(db: Session, key: DBPrivateAIKey) -> None:
+async def _invalidate_key_related_user_spend_cache(
+    db: Session, key: DBPrivateAIKey
+) -> None:
     if key.owner_id is not None:
         owner = db.query(DBUser).filter(DBUser.id == key.owner_id).first()
         if owner and owner.email:
-            invalidate_user_spend_cache(db, owner.email)
+            await invalidate_user_spend_cache(db, owner.email)
     elif key.team_id is not None:
-        _invalidate_team_user_spend_cache(db, key.team_id)
+        await _invalidate_team_user_spend_cache(db, key.team_id)
 
 
 def _pool_purchased_budget_for_team_region(
@@ -735,26 +754,19 @@ async def _get_key_spend_items(
 
 
 def _find_db_key_id_for_litellm_key(
-    db: Session, region_id: int, litellm_key: dict, fallback_team_id: int | None = None
+    resolver: LiteLLMKeyResolver,
+    region_id: int,
+    litellm_key: dict,
+    fallback_team_id: int | None = None,
 ) -> int | None:
-    metadata = litellm_key.get("metadata") or {}
-    key_name = metadata.get("amazeeai_private_ai_key_name")
-    owner_raw = litellm_key.get("user_id")
-    owner_id = int(owner_raw) if owner_raw and str(owner_raw).isdigit() else None
-    query = db.query(DBPrivateAIKey).filter(DBPrivateAIKey.region_id == region_id)
-    if key_name:
-        query = query.filter(DBPrivateAIKey.name == key_name)
-    if owner_id is not None:
-        query = query.filter(DBPrivateAIKey.owner_id == owner_id)
-    elif fallback_team_id is not None:
-        query = query.filter(DBPrivateAIKey.team_id == fallback_team_id)
-    db_key = query.order_by(DBPrivateAIKey.id.desc()).first()
+    db_key = resolver.resolve(litellm_key, fallback_team_id=fallback_team_id)
     if not db_key:
+        metadata = litellm_key.get("metadata") or {}
         logger.warning(
             "Unable to map LiteLLM key to DB key: region_id=%s key_name=%s owner_id=%s fallback_team_id=%s",
             region_id,
-            key_name,
-            owner_id,
+            metadata.get("amazeeai_private_ai_key_name"),
+            litellm_key.get("user_id"),
             fallback_team_id,
         )
     return db_key.id if db_key else None
@@ -817,9 +829,12 @@ async def get_team_spend(
         max_budget = team_info.get("max_budget")
         if max_budget is not None:
             total_budget = round(float(max_budget or 0.0), 4)
+        resolver = LiteLLMKeyResolver.for_litellm_keys(
+            db, region_id, team_data.get("keys", []), fallback_team_id=team_id
+        )
         for litellm_key in team_data.get("keys", []):
             db_key_id = _find_db_key_id_for_litellm_key(
-                db=db,
+                resolver,
                 region_id=region_id,
                 litellm_key=litellm_key,
                 fallback_team_id=team_id,
@@ -1143,9 +1158,15 @@ async def get_user_spend(
             total_completion_tokens,
             total_tokens,
         ) = _extract_token_usage(user_info)
+        resolver = LiteLLMKeyResolver.for_litellm_keys(
+            db,
+            region_id,
+            user_data.get("keys", []),
+            fallback_team_id=target_user.team_id,
+        )
         for litellm_key in user_data.get("keys", []):
             db_key_id = _find_db_key_id_for_litellm_key(
-                db=db,
+                resolver,
                 region_id=region_id,
                 litellm_key=litellm_key,
                 fallback_team_id=target_user.team_id,
@@ -1599,18 +1620,18 @@ async def get_user_daily_activity(
             "Defaults to false, leaving the flat response unchanged."
         ),
     ),
-    current_user: DBUser = Depends(get_current_user_from_auth),
-    user_role: str = Depends(get_private_ai_access),
-    db: Session = Depends(get_db),
+    current_user: DBUser = Depends(get_current_user_from_auth_async),
+    user_role: str = Depends(get_private_ai_access_async),
+    db: AsyncSession = Depends(get_async_db),
 ):
     start_date, end_date = _resolve_daily_activity_range(start_date, end_date)
 
-    target_user = db.query(DBUser).filter(DBUser.id == user_id).first()
+    target_user = await db.get(DBUser, user_id)
     if not target_user:
         raise HTTPException(status_code=404, detail="User not found")
     _assert_user_access(current_user, user_role, target_user)
 
-    region = _get_region_or_404(db, region_id)
+    region = await _get_region_or_404_async(db, region_id)
     service = LiteLLMService(
         api_url=region.litellm_api_url, api_key=region.litellm_api_key
     )
@@ -1674,22 +1695,22 @@ async def get_team_daily_activity(
             "Defaults to false, leaving the flat response unchanged."
         ),
     ),
-    current_user: DBUser = Depends(get_current_user_from_auth),
-    user_role: str = Depends(get_private_ai_access),
-    db: Session = Depends(get_db),
+    current_user: DBUser = Depends(get_current_user_from_auth_async),
+    user_role: str = Depends(get_private_ai_access_async),
+    db: AsyncSession = Depends(get_async_db),
 ):
     start_date, end_date = _resolve_daily_activity_range(start_date, end_date)
 
-    team = (
-        db.query(DBTeam)
-        .filter(DBTeam.id == team_id, DBTeam.deleted_at.is_(None))
-        .first()
-    )
-    if not team:
+    team_exists = (
+        await db.execute(
+            select(DBTeam.id).where(DBTeam.id == team_id, DBTeam.deleted_at.is_(None))
+        )
+    ).first()
+    if team_exists is None:
         raise HTTPException(status_code=404, detail="Team not found")
     _assert_team_access(current_user, user_role, team_id)
 
-    region = _get_region_or_404(db, region_id)
+    region = await _get_region_or_404_async(db, region_id)
     service = LiteLLMService(
         api_url=region.litellm_api_url, api_key=region.litellm_api_key
     )
@@ -1820,7 +1841,7 @@ async def update_team_budget(
         month_anchor=month_anchor,
         month_start_spend=month_start_spend,
     )
-    _invalidate_team_user_spend_cache(db, team_id)
+    await _invalidate_team_user_spend_cache(db, team_id)
     configured_team_cap = _get_spend_cap_max_budget(
         db, scope="team", region_id=region_id, team_id=team_id
     )
@@ -1914,7 +1935,7 @@ async def update_team_member_budget(
         max_budget=body.max_budget,
         budget_duration=effective_duration,
     )
-    invalidate_user_spend_cache(db, user.email)
+    await invalidate_user_spend_cache(db, user.email)
     db.commit()
     return SpendBudgetUpdateResponse(
         scope="team_member",
@@ -2016,7 +2037,7 @@ async def clear_team_budget(
         budget_duration=budget_duration,
     )
     _delete_spend_cap(db, scope="team", region_id=region_id, team_id=team_id)
-    _invalidate_team_user_spend_cache(db, team_id)
+    await _invalidate_team_user_spend_cache(db, team_id)
     info = await service.get_team_info(lite_team_id)
     db.commit()
     team_info = info.get("team_info", info)
@@ -2104,7 +2125,7 @@ async def clear_team_member_budget(
     _delete_spend_cap(
         db, scope="team_member", region_id=region_id, team_id=team_id, user_id=user_id
     )
-    invalidate_user_spend_cache(db, user.email)
+    await invalidate_user_spend_cache(db, user.email)
     db.commit()
     return SpendBudgetUpdateResponse(
         scope="team_member",
@@ -2229,7 +2250,7 @@ async def update_key_budget(
         max_budget=body.max_budget,
         budget_duration=cap_duration_to_store,
     )
-    _invalidate_key_related_user_spend_cache(db, key)
+    await _invalidate_key_related_user_spend_cache(db, key)
     configured_key_cap = _get_spend_cap_max_budget(
         db,
         scope="key",
@@ -2380,7 +2401,7 @@ async def clear_key_budget(
         user_id=key.owner_id,
         key_id=key_id,
     )
-    _invalidate_key_related_user_spend_cache(db, key)
+    await _invalidate_key_related_user_spend_cache(db, key)
     key_info = await service.get_key_info(key.litellm_token)
     db.commit()
     info = key_info.get("info", {})
@@ -355,7 +355,9 @@ async def subscription_deactivate(
             # Without this, FIFO never runs on the cancel path (no invoice),
             # and consumed_cents stays stale — leaking top-up credits.
             try:
-                team_info_resp = await litellm_service.get_team_info(lite_team_id)
+                team_info_resp = await litellm_service.get_team_info(
+                    lite_team_id, fresh=True
+                )
                 team_info = team_info_resp.get("team_info", team_info_resp)
                 current_team_spend = float(team_info.get("spend", 0.0) or 0.0)
                 current_spend_cents = int(round(current_team_spend * 100))
@@ -411,7 +413,9 @@ async def subscription_deactivate(
         projected_team_max_budget = topup_remaining_dollars
         if current_team_spend is None:
             try:
-                team_info_resp = await litellm_service.get_team_info(lite_team_id)
+                team_info_resp = await litellm_service.get_team_info(
+                    lite_team_id, fresh=True
+                )
                 team_info = team_info_resp.get("team_info", team_info_resp)
                 current_team_spend = float(team_info.get("spend", 0.0) or 0.0)
             except Exception as exc:
@@ -27,11 +27,9 @@ from app.db.database import get_db
 from app.db.models import (
     DBBudgetAlertState,
     DBPrivateAIKey,
-    DBProduct,
     DBRegion,
     DBSpendCap,
     DBTeam,
-    DBTeamMetrics,
     DBTeamProduct,
     DBTeamRegion,
     DBUser,
@@ -51,6 +49,11 @@ from app.schemas.models import (
 from app.services.disposable_domains import assert_email_domain_allowed
 from app.services.access_groups import effective_team_group_slugs
 from app.services.litellm import LiteLLMService
+from app.services.sales_teams import (
+    query_sales_team_rows,
+    sales_team_rows_refreshed_at,
+    trial_status as sales_trial_status,
+)
 from app.services.ses import SESService
 from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import func
@@ -646,186 +649,85 @@ async def manual_soft_delete_team(team_id: int, db: Session = Depends(get_db)):
     response_model=SalesTeamsResponse,
     dependencies=[Depends(check_sales_or_higher)],
 )
-async def list_teams_for_sales(db: Session = Depends(get_db)):
+async def list_teams_for_sales(
+    response: Response,
+    name: Optional[str] = None,
+    admin_email: Optional[str] = None,
+    budget_type: Optional[BudgetType] = None,
+    trial_status: Optional[str] = Query(
+        None, pattern="^(always_free|active_product|trial|expired)$"
+    ),
+    region: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    sort_by: Optional[str] = Query(
+        None, pattern="^(name|admin_email|created_at|last_payment|total_spend)$"
+    ),
+    sort_order: str = Query("asc", pattern="^(asc|desc)$"),
+    db: Session = Depends(get_db),
+):
     """
     Get consolidated team information for sales dashboard.
-    Returns all teams with their products, regions, spend data, and trial status.
+    Returns teams with their products, regions, spend data, and trial status.
     Accessible by system admin and sales users.
-    """
-    try:
-        # Track unreachable endpoints for logging at the end (use set to avoid duplicates)
-        unreachable_endpoints = set()
-
-        # Pre-fetch all regions once to avoid repeated queries
-        all_regions = db.query(DBRegion).filter(DBRegion.is_active.is_(True)).all()
-        regions_map = {r.id: r for r in all_regions}
 
-        # Get all teams with their basic information
-        teams = db.query(DBTeam).all()
-
-        sales_teams = []
-
-        for team in teams:
-            # Get team products
-            team_products = (
-                db.query(DBTeamProduct)
-                .join(DBProduct)
-                .filter(DBTeamProduct.team_id == team.id, DBProduct.active.is_(True))
-                .all()
-            )
-
-            products = [
-                SalesProduct(
-                    id=team_product.product.id,
-                    name=team_product.product.name,
-                    active=team_product.product.active,
-                )
-                for team_product in team_products
-            ]
-
-            # Try to get cached metrics first
-            team_metrics = (
-                db.query(DBTeamMetrics).filter(DBTeamMetrics.team_id == team.id).first()
-            )
-
-            if team_metrics:
-                # Use cached data
-                total_spend = team_metrics.total_spend
-                regions = team_metrics.regions or []
-            else:
-                # Fallback to real-time calculation if no cached data
-                logger.warning(
-                    f"No cached metrics found for team {team.id}, falling back to real-time calculation"
-                )
-                current_time = datetime.now(UTC)
-
-                # Create LiteLLM services only when needed for fallback
-                litellm_services = {}
-                for region in all_regions:
-                    litellm_services[region.id] = LiteLLMService(
-                        api_url=region.litellm_api_url, api_key=region.litellm_api_key
-                    )
-
-                # Get team AI keys (both team-owned and user-owned) and calculate total spend
-                team_users = db.query(DBUser).filter(DBUser.team_id == team.id).all()
-                team_user_ids = [user.id for user in team_users]
-
-                team_keys = (
-                    db.query(DBPrivateAIKey)
-                    .filter(
-                        (DBPrivateAIKey.team_id == team.id)  # Team-owned keys
-                        | (
-                            DBPrivateAIKey.owner_id.in_(team_user_ids)
-                        )  # User-owned keys by team members
-                    )
-                    .all()
-                )
-
-                # Calculate total spend from all AI keys and build regions list as we go
-                total_spend = 0.0
-                regions_set = set()
-
-                for key in team_keys:
-                    if key.litellm_token and key.region_id in regions_map:
-                        try:
-                            # Use pre-fetched region info and pre-created LiteLLM service
-                            region = regions_map[key.region_id]
-                            litellm_service = litellm_services[region.id]
-
-                            # Add region name to our set
-                            regions_set.add(region.name)
-
-                            # Get spend data from LiteLLM
-                            key_data = await litellm_service.get_key_info(
-                                key.litellm_token
-                            )
-                            key_spend = key_data.get("info", {}).get("spend", 0.0)
-                            total_spend += float(key_spend)
-                        except Exception:
-                            # Track unreachable endpoint for logging at the end (only once per region)
-                            region = regions_map[key.region_id]
-                            endpoint_info = f"Region: {region.name}"
-                            unreachable_endpoints.add(endpoint_info)
-
-                # Convert set to list for the response
-                regions = list(regions_set)
-                # Create new metrics record
-                team_metrics = DBTeamMetrics(
-                    team_id=team.id,
-                    total_spend=total_spend,
-                    last_spend_calculation=current_time,
-                    regions=regions,
-                    last_updated=current_time,
-                )
-                db.add(team_metrics)
-
-            # Calculate trial status
-            trial_status = _calculate_trial_status(team, products)
-
-            sales_team = SalesTeam(
-                id=team.id,
-                name=team.name,
-                admin_email=team.admin_email,
-                created_at=team.created_at,
-                last_payment=team.last_payment,
-                is_always_free=team.is_always_free,
-                budget_type=team.budget_type,
-                products=products,
-                regions=regions,
-                total_spend=round(total_spend, 4),
-                trial_status=trial_status,
-            )
-
-            sales_teams.append(sales_team)
-        # Any metrics calculated on-the-fly will be cached
-        db.commit()
-
-        # Log all unreachable endpoints at the end
-        if unreachable_endpoints:
-            logger.warning(
-                f"Unreachable LiteLLM endpoints encountered: {len(unreachable_endpoints)} unique endpoints"
-            )
-            for endpoint in unreachable_endpoints:
-                logger.warning(f"  - {endpoint}")
-
-        return SalesTeamsResponse(teams=sales_teams)
+    Served from the precomputed sales_team_rows table (see
+    app/services/sales_teams.py), never from live LiteLLM calls. Spend is as
+    of each team's metrics_updated_at, the last monitor_teams run that
+    measured it. Read-only: the rows are rebuilt by monitor_teams and the
+    refresh-sales-team-rows cron, never by this request.
 
+    Args:
+        name / admin_email: partial-match filters.
+        budget_type / region: exact-match filters.
+        trial_status: always_free, active_product, trial or expired.
+        skip / limit: pagination (unpaginated when limit is omitted, for
+            backwards compatibility). The total match count is returned in
+            the X-Total-Count response header.
+    """
+    try:
+        refreshed_at = sales_team_rows_refreshed_at(db)
+        rows, total = query_sales_team_rows(
+            db,
+            name=name,
+            admin_email=admin_email,
+            budget_type=budget_type.value if budget_type else None,
+            trial_status_filter=trial_status,
+            region=region,
+            skip=skip,
+            limit=limit,
+            sort_by=sort_by,
+            sort_order=sort_order,
+        )
     except Exception as e:
         logger.error(f"Error in list_teams_for_sales: {str(e)}")
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to retrieve sales data: {str(e)}",
         )
+    response.headers["X-Total-Count"] = str(total)
 
-
-def _calculate_trial_status(team: DBTeam, products: List[SalesProduct]) -> str:
-    """
-    Calculate trial status based on team creation, last payment, and active products.
-    """
-    if team.is_always_free:
-        return "Always Free"
-
-    if len(products) > 0:
-        return "Active Product"
-
-    # Calculate days until expiry
-    trial_period_days = 30
-    if team.last_payment:
-        days_since_last_payment = (
-            datetime.now(UTC) - team.last_payment.replace(tzinfo=UTC)
-        ).days
-        days_remaining = trial_period_days - days_since_last_payment
-    else:
-        days_since_creation = (
-            datetime.now(UTC) - team.created_at.replace(tzinfo=UTC)
-        ).days
-        days_remaining = trial_period_days - days_since_creation
-
-    if days_remaining <= 0:
-        return "Expired"
-    else:
-        # Always show days remaining for active trials
-        return f"{days_remaining} days left"
+    now = datetime.now(UTC)
+    return SalesTeamsResponse(
+        teams=[
+            SalesTeam(
+                id=row.team_id,
+                name=row.name,
+                admin_email=row.admin_email,
+                created_at=row.created_at,
+                last_payment=row.last_payment,
+                is_always_free=row.is_always_free,
+                budget_type=row.budget_type,
+                products=[SalesProduct(**product) for product in row.products],
+                regions=row.regions,
+                total_spend=round(row.total_spend, 4),
+                trial_status=sales_trial_status(row, now),
+                metrics_updated_at=row.metrics_updated_at,
+            )
+            for row in rows
+        ],
+        refreshed_at=refreshed_at,
+    )
 
 
 def _check_key_name_conflicts(
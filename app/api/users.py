@@ -53,6 +53,10 @@ from app.core.roles import UserRole
 from app.services.litellm import LiteLLMService
 from app.services.disposable_domains import assert_email_domain_allowed
 from app.services.hubspot import HubSpotService
+from app.services.team_spend_snapshots import (
+    get_team_region_keys,
+    invalidate_team_spend_snapshots,
+)
 from datetime import datetime, UTC
 import logging
 import asyncio
@@ -100,13 +104,17 @@ def get_user_by_email(db: Session, email: str) -> Optional[DBUser]:
 router = APIRouter(tags=["users"])
 
 
-def invalidate_user_spend_cache(db: Session, email: str) -> None:
+async def invalidate_user_spend_cache(db: Session, email: str) -> None:
     """Delete the cached /users/spend response for *email*.
 
     Call this whenever a write operation (budget set/clear) changes data that
     the cache stores, so the next GET returns fresh values instead of the
     15-minute stale snapshot.
 
+    The team spend snapshots the response is assembled from are retired too,
+    for every team the email belongs to. That part lives in the shared cache
+    and takes effect immediately, not at commit.
+
     This helper intentionally does not commit; callers control the transaction
     boundary so cache invalidation remains atomic with the related write.
     """
@@ -115,9 +123,10 @@ def invalidate_user_spend_cache(db: Session, email: str) -> None:
         DBUserSpendCache.normalized_email == normalized
     ).delete(synchronize_session=False)
     db.flush()
+    await _invalidate_team_spend_snapshots_for_emails(db, [normalized])
 
 
-def invalidate_users_spend_cache_bulk(db: Session, emails: list[str]) -> None:
+async def invalidate_users_spend_cache_bulk(db: Session, emails: list[str]) -> None:
     """Delete cached /users/spend entries for all *emails* in a single query.
 
     Prefer this over calling invalidate_user_spend_cache in a loop when
@@ -133,6 +142,25 @@ def invalidate_users_spend_cache_bulk(db: Session, emails: list[str]) -> None:
         DBUserSpendCache.normalized_email.in_(normalized_emails)
     ).delete(synchronize_session=False)
     db.flush()
+    await _invalidate_team_spend_snapshots_for_emails(db, normalized_emails)
+
+
+async def _invalidate_team_spend_snapshots_for_emails(
+    db: Session, normalized_emails: list[str]
+) -> None:
+    rows = (
+        db.query(DBUser.team_id)
+        .filter(
+            # Must stay the expression ix_users_normalized_email indexes.
+            func.regexp_replace(func.lower(DBUser.email), r"\+[^@]*@", "@").in_(
+                normalized_emails
+            ),
+            DBUser.team_id.isnot(None),
+        )
+        .distinct()
+        .all()
+    )
+    await invalidate_team_spend_snapshots(row.team_id for row in rows)
 
 
 def _is_valid_email_input(email: str) -> bool:
@@ -216,51 +244,49 @@ async def _fetch_region_spend(
         api_url=region.litellm_api_url, api_key=region.litellm_api_key
     )
 
-    async with _USER_SPEND_SEMAPHORE:
-        try:
-            team_info = await asyncio.wait_for(
+    async def fetch_team_info() -> dict:
+        async with _USER_SPEND_SEMAPHORE:
+            return await asyncio.wait_for(
                 service.get_team_info(lite_team_id),
                 timeout=_USER_SPEND_TIMEOUT_SECONDS,
             )
-        except Exception as exc:
-            if _is_litellm_404(exc):
-                return None
-            if _is_litellm_unavailable(exc):
-                logger.warning(
-                    "LiteLLM unavailable for team %s (%s) in region %s: %s",
-                    team_id,
-                    team_name,
-                    region.name,
-                    str(exc),
-                )
-                return UserSpendRegion(
-                    region_id=region.id,
-                    region_name=region.name,
-                    spend=0.0,
-                    status="unavailable",
-                    max_budget=max_budget,
-                )
-            raise
 
-    keys = team_info.get("keys", []) if isinstance(team_info, dict) else []
+    # Every member of the team reads the same /team/info, so it comes from
+    # a snapshot shared across users (and a single in-flight fetch).
+    try:
+        keys = await get_team_region_keys(team_id, region.id, fetch_team_info)
+    except Exception as exc:
+        if _is_litellm_404(exc):
+            return None
+        if _is_litellm_unavailable(exc):
+            logger.warning(
+                "LiteLLM unavailable for team %s (%s) in region %s: %s",
+                team_id,
+                team_name,
+                region.name,
+                str(exc),
+            )
+            return UserSpendRegion(
+                region_id=region.id,
+                region_name=region.name,
+                spend=0.0,
+                status="unavailable",
+                max_budget=max_budget,
+            )
+        raise
+
     spend = 0.0
     user_id_strs = {str(uid) for uid in user_ids}
     for key in keys:
-        if not isinstance(key, dict):
-            continue
-        metadata = key.get("metadata") or {}
-        meta_user_id = metadata.get("amazeeai_user_id")
-        service_account_id = metadata.get("service_account_id")
+        meta_user_id = key["amazeeai_user_id"]
+        service_account_id = key["service_account_id"]
         matches = False
         if meta_user_id is not None:
             matches = str(meta_user_id) in user_id_strs
         if not matches and service_account_id:
             matches = str(service_account_id).lower() in user_emails
         if matches:
-            try:
-                spend += float(key.get("spend") or 0.0)
-            except (TypeError, ValueError):
-                continue
+            spend += key["spend"]
 
     return UserSpendRegion(
         region_id=region.id,
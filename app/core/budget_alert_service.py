@@ -48,6 +48,12 @@ idle keys exist, plus one scoped back-fill for any team whose budget window open
 before the wide request. Sweeping every key instead — the
 shape of the existing hourly reconciler, ~40 min at 13.9k keys — is what does not
 survive 100k.
+
+Between full sweeps a tick is incremental (``ingest_region_activity``): the
+region's day rows are kept in ``budget_alert_spend_days``, only the days since
+the last one seen are fetched, and only teams whose rows changed — plus those
+whose budget moved — are evaluated. A tick then costs O(changes), which is what
+makes a one-minute interval affordable.
 """
 
 from __future__ import annotations
@@ -55,11 +61,13 @@ from __future__ import annotations
 import asyncio
 import hashlib
 import logging
+import time
 from dataclasses import dataclass, field
 from datetime import UTC, date, datetime, timedelta
 
-from prometheus_client import Counter, Gauge, Summary
-from sqlalchemy import func
+from prometheus_client import Counter, Gauge, Histogram, Summary
+from sqlalchemy import func, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
@@ -70,8 +78,11 @@ from app.core.spend_period_service import (
     current_cycle_start,
     resolve_team_period_window,
 )
+from app.db.database import SessionLocal
 from app.db.models import (
     DBAuditLog,
+    DBBudgetAlertActivityCursor,
+    DBBudgetAlertSpendDay,
     DBBudgetAlertState,
     DBLimitedResource,
     DBPeriodicBudgetLedgerEntry,
@@ -119,6 +130,14 @@ budget_alert_run_duration = Summary(
     "Time taken to complete the budget threshold sweep",
 )
 
+budget_alert_region_duration = Histogram(
+    "budget_alert_region_duration_seconds",
+    "Time taken to evaluate and record one region in the budget threshold "
+    "sweep, by outcome (ok, timeout, failed)",
+    ["region_name", "outcome"],
+    buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, float("inf")),
+)
+
 # LiteLLM's own bookkeeping teams show up in the activity breakdown; they are not
 # amazee.ai teams and have no budget of ours.
 _NON_TEAM_ENTITY_IDS = frozenset({"litellm-dashboard"})
@@ -226,6 +245,38 @@ class RegionEvaluation:
         return len(self.subjects)
 
 
+@dataclass
+class RegionActivity:
+    """One region's daily spend, as the evaluation reads it.
+
+    Either built from a full ``/team/daily/activity`` response, or read from
+    ``budget_alert_spend_days`` by ``ingest_region_activity`` (``stored``), in
+    which case the series are only loaded for the teams being evaluated.
+    """
+
+    # Teams worth evaluating on account of their spend
+    team_ids: set[int]
+    # The series are complete from this day on
+    covered_from: date
+    entity_days: dict[str, dict[date, float]] = field(default_factory=dict)
+    key_days: dict[str, dict[date, float]] = field(default_factory=dict)
+    stored: bool = False
+    litellm_calls: int = 0
+
+    @classmethod
+    def from_rows(
+        cls, rows: list[dict], region_name: str, covered_from: date
+    ) -> "RegionActivity":
+        entity_days, key_days = _day_series(rows)
+        return cls(
+            team_ids=_team_ids_for_entities(_active_entity_ids(rows), region_name),
+            covered_from=covered_from,
+            entity_days=entity_days,
+            key_days=key_days,
+            litellm_calls=1,
+        )
+
+
 # --------------------------------------------------------------------------- #
 # Spend collection
 # --------------------------------------------------------------------------- #
@@ -356,6 +407,14 @@ def _amazee_team_id_from_litellm(entity_id: str, region_name: str) -> int | None
     return int(suffix) if suffix.isdigit() else None
 
 
+def _team_ids_for_entities(entity_ids, region_name: str) -> set[int]:
+    return {
+        team_id
+        for entity_id in entity_ids
+        if (team_id := _amazee_team_id_from_litellm(entity_id, region_name)) is not None
+    }
+
+
 async def _exact_team_key_state(
     service: LiteLLMService, lite_team_id: str
 ) -> dict[str, dict]:
@@ -780,14 +839,253 @@ def window_before_sweep_candidates(
     return candidates
 
 
+# --------------------------------------------------------------------------- #
+# Incremental activity
+# --------------------------------------------------------------------------- #
+
+_SPEND_ENTITY = "entity"
+_SPEND_KEY = "key"
+
+# Rows per INSERT when writing a region's spend days (a full sweep can write
+# one per active key per day of the window).
+_SPEND_DAY_WRITE_CHUNK = 5000
+
+
+def budget_increase_candidates(
+    db: Session, region_id: int, now: datetime
+) -> set[int]:
+    """Teams whose budget just rose: a ledger entry added within the grace window.
+
+    The counterpart of ``denominator_change_candidates`` for incremental ticks.
+    A rise never causes a crossing, but it lowers the percentage, and the band
+    has to be re-armed silently *now*: if the team stays idle and is only looked
+    at again once it spends past the same band, the stale band would swallow
+    that second warning.
+    """
+    since = now - timedelta(hours=max(1, settings.BUDGET_ALERT_RECHECK_GRACE_HOURS))
+    return {
+        team_id
+        for (team_id,) in db.query(DBPeriodicBudgetLedgerEntry.team_id)
+        .filter(
+            DBPeriodicBudgetLedgerEntry.region_id == region_id,
+            DBPeriodicBudgetLedgerEntry.is_active.is_(True),
+            DBPeriodicBudgetLedgerEntry.created_at >= since,
+        )
+        .distinct()
+        .all()
+        if team_id is not None
+    }
+
+
+def _spend_day_map(
+    entity_days: dict[str, dict[date, float]], key_days: dict[str, dict[date, float]]
+) -> dict[tuple[str, str, date], float]:
+    spend: dict[tuple[str, str, date], float] = {}
+    for kind, series in ((_SPEND_ENTITY, entity_days), (_SPEND_KEY, key_days)):
+        for litellm_id, days in series.items():
+            for day, value in days.items():
+                spend[(kind, litellm_id, day)] = value
+    return spend
+
+
+def _write_spend_days(
+    db: Session, region_id: int, fetched: dict, since: date
+) -> set[str]:
+    """Make the stored days from ``since`` match ``fetched``.
+
+    Returns the LiteLLM team ids whose spend changed, which is what decides
+    who gets evaluated.
+    """
+    stored = {
+        (kind, litellm_id, day): spend
+        for kind, litellm_id, day, spend in db.query(
+            DBBudgetAlertSpendDay.kind,
+            DBBudgetAlertSpendDay.litellm_id,
+            DBBudgetAlertSpendDay.day,
+            DBBudgetAlertSpendDay.spend,
+        ).filter(
+            DBBudgetAlertSpendDay.region_id == region_id,
+            DBBudgetAlertSpendDay.day >= since,
+        )
+    }
+    changed = [
+        (row_key, spend)
+        for row_key, spend in fetched.items()
+        if abs(stored.get(row_key, 0.0) - spend) > 1e-9 or row_key not in stored
+    ]
+    vanished = [row_key for row_key in stored if row_key not in fetched]
+
+    for start in range(0, len(changed), _SPEND_DAY_WRITE_CHUNK):
+        stmt = pg_insert(DBBudgetAlertSpendDay).values(
+            [
+                {
+                    "region_id": region_id,
+                    "kind": kind,
+                    "litellm_id": litellm_id,
+                    "day": day,
+                    "spend": spend,
+                }
+                for (kind, litellm_id, day), spend in changed[
+                    start : start + _SPEND_DAY_WRITE_CHUNK
+                ]
+            ]
+        )
+        db.execute(
+            stmt.on_conflict_do_update(
+                constraint="uq_budget_alert_spend_days_region_kind_id_day",
+                set_={"spend": stmt.excluded.spend},
+            )
+        )
+    for kind, litellm_id, day in vanished:
+        db.query(DBBudgetAlertSpendDay).filter(
+            DBBudgetAlertSpendDay.region_id == region_id,
+            DBBudgetAlertSpendDay.kind == kind,
+            DBBudgetAlertSpendDay.litellm_id == litellm_id,
+            DBBudgetAlertSpendDay.day == day,
+        ).delete(synchronize_session=False)
+
+    return {
+        litellm_id
+        for (kind, litellm_id, _), _ in changed
+        if kind == _SPEND_ENTITY
+    } | {litellm_id for kind, litellm_id, _ in vanished if kind == _SPEND_ENTITY}
+
+
+async def ingest_region_activity(
+    db: Session, region: DBRegion, now: datetime
+) -> RegionActivity:
+    """Bring the region's stored spend days up to date and say who changed.
+
+    Usually reads only the days since the last one seen (minus a re-fetch
+    margin), so a tick costs O(changes) rather than O(window × teams). The
+    whole window is read again, and every active team evaluated, when there is
+    no cursor yet, when the window now reaches back past what is stored, and
+    every ``BUDGET_ALERT_FULL_SWEEP_INTERVAL_HOURS`` as a backstop for rows
+    LiteLLM amended further back.
+
+    Writes are left uncommitted: they go in with the region's alert state, so a
+    tick that fails after this point re-reads the same changes next time.
+    """
+    sweep_start = region_sweep_start(db, region.id, now)
+    cursor = db.get(DBBudgetAlertActivityCursor, region.id)
+    interval = settings.BUDGET_ALERT_FULL_SWEEP_INTERVAL_HOURS
+    full = (
+        cursor is None
+        or interval <= 0
+        or cursor.covered_from > sweep_start
+        or cursor.full_sweep_at <= now - timedelta(hours=interval)
+    )
+    if full:
+        fetch_from = sweep_start
+    else:
+        refetch = timedelta(days=max(0, settings.BUDGET_ALERT_ACTIVITY_REFETCH_DAYS))
+        fetch_from = max(sweep_start, cursor.last_seen_day - refetch)
+
+    service = LiteLLMService(
+        api_url=region.litellm_api_url, api_key=region.litellm_api_key
+    )
+    rows = await service.get_all_team_daily_activity(
+        fetch_from.isoformat(), now.date().isoformat()
+    )
+    activity = RegionActivity.from_rows(rows, region.name, sweep_start)
+    changed_entities = _write_spend_days(
+        db,
+        region.id,
+        _spend_day_map(activity.entity_days, activity.key_days),
+        fetch_from,
+    )
+    # Days that fell out of every team's window are never read again.
+    db.query(DBBudgetAlertSpendDay).filter(
+        DBBudgetAlertSpendDay.region_id == region.id,
+        DBBudgetAlertSpendDay.day < sweep_start,
+    ).delete(synchronize_session=False)
+
+    seen_days = [day for days in activity.entity_days.values() for day in days]
+    last_seen = max(seen_days, default=fetch_from)
+    if cursor is None:
+        cursor = DBBudgetAlertActivityCursor(
+            region_id=region.id,
+            covered_from=sweep_start,
+            last_seen_day=last_seen,
+            full_sweep_at=now,
+        )
+        db.add(cursor)
+    else:
+        cursor.covered_from = sweep_start
+        cursor.last_seen_day = max(cursor.last_seen_day, last_seen)
+        if full:
+            cursor.full_sweep_at = now
+
+    if full:
+        # The rows hold the whole window: evaluate everyone active in it.
+        return activity
+
+    team_ids = _team_ids_for_entities(changed_entities, region.name)
+    team_ids |= budget_increase_candidates(db, region.id, now)
+    logger.info(
+        "Region %s: incremental tick from %s, %d team(s) with changed spend",
+        region.name,
+        fetch_from,
+        len(team_ids),
+    )
+    return RegionActivity(
+        team_ids=team_ids,
+        covered_from=sweep_start,
+        stored=True,
+        litellm_calls=1,
+    )
+
+
+def _load_spend_days(
+    db: Session, region: DBRegion, activity: RegionActivity, team_ids: list[int]
+) -> None:
+    """Fill ``activity``'s series from the stored days, for these teams only."""
+    if not team_ids:
+        return
+    entity_ids = [LiteLLMService.format_team_id(region.name, tid) for tid in team_ids]
+    hashed_tokens = [
+        LiteLLMService.hash_token(token)
+        for (token,) in db.query(DBPrivateAIKey.litellm_token).filter(
+            DBPrivateAIKey.team_id.in_(team_ids),
+            DBPrivateAIKey.region_id == region.id,
+            DBPrivateAIKey.litellm_token.isnot(None),
+        )
+    ]
+    rows = db.query(
+        DBBudgetAlertSpendDay.kind,
+        DBBudgetAlertSpendDay.litellm_id,
+        DBBudgetAlertSpendDay.day,
+        DBBudgetAlertSpendDay.spend,
+    ).filter(
+        DBBudgetAlertSpendDay.region_id == region.id,
+        DBBudgetAlertSpendDay.day >= activity.covered_from,
+        or_(
+            (DBBudgetAlertSpendDay.kind == _SPEND_ENTITY)
+            & DBBudgetAlertSpendDay.litellm_id.in_(entity_ids),
+            (DBBudgetAlertSpendDay.kind == _SPEND_KEY)
+            & DBBudgetAlertSpendDay.litellm_id.in_(hashed_tokens),
+        ),
+    )
+    for kind, litellm_id, day, spend in rows:
+        series = activity.entity_days if kind == _SPEND_ENTITY else activity.key_days
+        series.setdefault(litellm_id, {})[day] = spend
+
+
 async def evaluate_region(
     db: Session,
     region: DBRegion,
     *,
     thresholds: list[int] | None = None,
     now: datetime | None = None,
+    activity: RegionActivity | None = None,
 ) -> RegionEvaluation:
-    """Evaluate every active subject in one region against the thresholds."""
+    """Evaluate every active subject in one region against the thresholds.
+
+    Without ``activity`` the region's whole window is read from LiteLLM and
+    every team with spend in it is evaluated. The sweep passes the result of
+    ``ingest_region_activity`` instead, which limits that to teams whose spend
+    changed since the last tick.
+    """
     thresholds = thresholds or parse_thresholds()
     now = now or datetime.now(UTC)
     result = RegionEvaluation()
@@ -797,16 +1095,22 @@ async def evaluate_region(
     service = LiteLLMService(
         api_url=region.litellm_api_url, api_key=region.litellm_api_key
     )
-    sweep_start = region_sweep_start(db, region.id, now)
-    start_str = sweep_start.isoformat()
     end_str = now.date().isoformat()
 
-    try:
-        team_rows = await service.get_all_team_daily_activity(start_str, end_str)
-        result.litellm_calls += 1
-    except Exception as exc:
-        logger.error("Budget alert sweep failed for region %s: %s", region.name, exc)
-        return result
+    if activity is None:
+        sweep_start = region_sweep_start(db, region.id, now)
+        try:
+            team_rows = await service.get_all_team_daily_activity(
+                sweep_start.isoformat(), end_str
+            )
+        except Exception as exc:
+            logger.error(
+                "Budget alert sweep failed for region %s: %s", region.name, exc
+            )
+            return result
+        activity = RegionActivity.from_rows(team_rows, region.name, sweep_start)
+    result.litellm_calls += activity.litellm_calls
+    sweep_start = activity.covered_from
 
     subjects: list[_Subject] = []
 
@@ -814,12 +1118,9 @@ async def evaluate_region(
     # Only entities that actually spent appear in the sweep, so this is the
     # working set: on a DEV region with 2,740 keys it was 27 teams. A team with
     # no traffic in the lookback cannot have newly crossed a band, since spend
-    # only rises with traffic and we notify on upward moves only.
-    candidate_team_ids = {
-        team_id
-        for entity_id in _active_entity_ids(team_rows)
-        if (team_id := _amazee_team_id_from_litellm(entity_id, region.name)) is not None
-    }
+    # only rises with traffic and we notify on upward moves only. Between full
+    # sweeps it narrows further, to teams whose spend changed since last tick.
+    candidate_team_ids = set(activity.team_ids)
 
     # Traffic is not the only way to cross a threshold: percent = spend / budget,
     # and the *budget* can fall on its own. These teams therefore have to be
@@ -852,6 +1153,8 @@ async def evaluate_region(
         )
         .all()
     )
+    if activity.stored:
+        _load_spend_days(db, region, activity, [team.id for team in teams])
     for team in teams:
         window = resolve_team_period_window(db, team, region.id, now=now)
         lite_team_id = LiteLLMService.format_team_id(region.name, team.id)
@@ -880,7 +1183,7 @@ async def evaluate_region(
         team_budget = _team_budget(db, team, region.id)
 
         if since >= sweep_start:
-            entity_days, key_days = _day_series(team_rows)
+            entity_days, key_days = activity.entity_days, activity.key_days
         elif not (team_budget or cap_map):
             # Nothing to measure, so nothing to fetch. A POOL team with no valid
             # ledger entry anchors on team.created_at, which is routinely older than
@@ -1280,7 +1583,10 @@ def _upsert_state(
 
 
 def apply_resets(db: Session, region: DBRegion, evaluation: RegionEvaluation) -> None:
-    """Persist silent band/period rewrites. Safe to run before delivery."""
+    """Stage silent band/period rewrites on ``db``. Safe to run before delivery.
+
+    Does not commit: the sweep commits them with the rest of the region.
+    """
     for subject, band in evaluation.resets:
         _upsert_state(
             db,
@@ -1291,8 +1597,6 @@ def apply_resets(db: Session, region: DBRegion, evaluation: RegionEvaluation) ->
             notified_at=None,
             bump_arm=True,
         )
-    if evaluation.resets:
-        db.commit()
 
 
 def mark_notified(
@@ -1302,12 +1606,12 @@ def mark_notified(
     delivered_event_ids: set[str],
     now: datetime | None = None,
 ) -> int:
-    """Advance state for the events that were actually delivered.
+    """Advance state for the events that were handed off for delivery.
 
-    Called *after* delivery on purpose. If the webhook fails, the band is left
-    where it was and the next tick re-detects the same crossing, which gives
-    at-least-once delivery without an outbox table. Consumers de-duplicate on
-    ``event_id``.
+    The sweep queues its events in the outbox on the same transaction and this
+    commit publishes both, so a crossing is never marked without its event
+    being queued, nor queued twice by the next tick. Retries are then the
+    outbox's business; consumers de-duplicate on ``event_id``.
     """
     now = now or datetime.now(UTC)
     by_subject = {
@@ -1350,9 +1654,9 @@ def write_audit_logs(
     absent from the DB) cannot settle. ``delivered`` distinguishes "the customer
     was told" from "we detected it but could not reach the consumer".
 
-    An undelivered crossing is re-detected next tick, so a consumer outage
-    produces one row per attempt. That repetition is the retry record, and it is
-    bounded by the tick interval rather than by traffic.
+    The outbox writes one row per event once its delivery is settled: when the
+    consumer accepts it, or when retries run out. Individual failed attempts
+    are on the outbox row (``attempts``, ``last_error``).
 
     Audit failure must never fail the sweep: alerting is the job, auditing is the
     side effect.
@@ -1440,22 +1744,146 @@ def regions_to_sweep(db: Session) -> list[DBRegion]:
     )
 
 
+def _record_region(
+    db: Session, region: DBRegion, evaluation: RegionEvaluation
+) -> dict[str, int]:
+    """Write one region's evaluation and commit it; returns its counts."""
+    from app.services.budget_alert_webhook import queue_events
+
+    counts = {
+        "subjects": evaluation.subjects_evaluated,
+        "events": len(evaluation.events),
+        "queued": 0,
+        "litellm_calls": evaluation.litellm_calls,
+    }
+    budget_alert_subjects_evaluated.labels(region_name=region.name).set(
+        evaluation.subjects_evaluated
+    )
+    for event in evaluation.events:
+        budget_alerts_fired_total.labels(
+            scope=event.subject_type, threshold=str(event.threshold_pct)
+        ).inc()
+
+    # Silent rewrites are unconditional: they carry no notification, so
+    # holding them back would only cause a stale band to suppress a later
+    # genuine crossing.
+    apply_resets(db, region, evaluation)
+
+    if not evaluation.events:
+        db.commit()
+        return counts
+
+    for event in evaluation.events:
+        logger.info(
+            "Budget threshold crossed: scope=%s subject=%s %.2f%% "
+            "(spend=%.4f budget=%.4f) band=%d%% region=%s",
+            event.subject_type,
+            event.subject_key,
+            event.percent_used,
+            event.spend,
+            event.max_budget,
+            event.threshold_pct,
+            event.region_name,
+        )
+
+    if not settings.BUDGET_ALERT_ENABLED:
+        # Log-only mode: percentages can be validated against the spend API
+        # before any third party is told anything. State is left untouched so
+        # enabling delivery later still sends these crossings.
+        db.commit()
+        return counts
+
+    # One transaction for all of it: the ingested spend days, the resets, the
+    # outbox rows and the advanced bands are committed together by
+    # mark_notified. The delivery worker audits each
+    # event once the consumer has taken it (or retries run out).
+    queue_events(db, evaluation.events)
+    mark_notified(
+        db, region, evaluation, {event.event_id for event in evaluation.events}
+    )
+    counts["queued"] = len(evaluation.events)
+    return counts
+
+
+async def _evaluate_incrementally(
+    db: Session, region: DBRegion, thresholds: list[int]
+) -> RegionEvaluation:
+    now = datetime.now(UTC)
+    activity = await ingest_region_activity(db, region, now)
+    return await evaluate_region(
+        db, region, thresholds=thresholds, now=now, activity=activity
+    )
+
+
+async def sweep_region(
+    region_id: int, thresholds: list[int]
+) -> tuple[str, dict[str, int] | None]:
+    """Evaluate and record one region in its own session.
+
+    Returns ("ok", counts), or ("timeout" | "failed", None). Only the evaluation
+    is bounded by ``BUDGET_ALERT_REGION_TIMEOUT_SECONDS``: it is where the
+    LiteLLM reads are. It does write: ``ingest_region_activity`` adds spend-day
+    rows and moves the activity cursor on this session before the timeout can
+    fire. Cutting it short leaves the region exactly as the last tick did only
+    because the session is then closed without a commit. Never commit on a
+    timeout or failure, or half-ingested activity is stored and the cursor
+    skips the rest. The write phase has no ``await`` and always runs to its
+    commit.
+    """
+    timeout = settings.BUDGET_ALERT_REGION_TIMEOUT_SECONDS
+    with SessionLocal() as db:
+        region = db.get(DBRegion, region_id)
+        if region is None:
+            return "failed", None
+        started = time.perf_counter()
+        outcome, counts = "failed", None
+        try:
+            evaluation = await asyncio.wait_for(
+                _evaluate_incrementally(db, region, thresholds),
+                timeout=timeout if timeout > 0 else None,
+            )
+            # Commits the stored activity together with the alert state.
+            counts = _record_region(db, region, evaluation)
+            outcome = "ok"
+        except asyncio.TimeoutError:
+            outcome = "timeout"
+            logger.error(
+                "Budget threshold evaluation for region %s exceeded %ss; "
+                "skipped until the next tick",
+                region.name,
+                timeout,
+            )
+        except Exception as exc:
+            logger.error(
+                "Budget threshold sweep failed for region %s: %s",
+                region.name,
+                exc,
+                exc_info=True,
+            )
+        finally:
+            budget_alert_region_duration.labels(
+                region_name=region.name, outcome=outcome
+            ).observe(time.perf_counter() - started)
+        return outcome, counts
+
+
 @budget_alert_run_duration.time()
 async def monitor_budget_thresholds(db: Session) -> dict[str, int]:
     """Sweep every active region, notify new crossings, and record what stuck.
 
-    Regions are independent, so their LiteLLM reads are overlapped. They share one
-    Session, so their DB work interleaves at every ``await`` — safe only because
-    each query is synchronous (nothing else can run mid-query) and ``evaluate_region``
-    never writes. Every write happens below, sequentially, after the gather. Adding
-    a write inside ``evaluate_region`` would need a session per region.
-    """
-    from app.services.budget_alert_webhook import deliver_events
+    Each region is evaluated and committed by ``sweep_region`` in its own
+    session, up to ``BUDGET_ALERT_REGION_CONCURRENCY`` at a time, so one
+    region's writes go out while others are still reading from LiteLLM, and a
+    region that fails or runs out of time leaves the others untouched. ``db``
+    only picks the regions.
 
+    Events are queued in the outbox rather than posted here, so a slow or
+    unreachable consumer never holds up the sweep; see ``budget_alert_webhook``.
+    """
     thresholds = parse_thresholds()
     if not thresholds:
         logger.warning("No budget alert thresholds configured; nothing to do")
-        return {"regions": 0, "events": 0, "delivered": 0}
+        return {"regions": 0, "events": 0, "queued": 0}
 
     regions = regions_to_sweep(db)
     logger.info(
@@ -1469,88 +1897,36 @@ async def monitor_budget_thresholds(db: Session) -> dict[str, int]:
         "regions": 0,
         "subjects": 0,
         "events": 0,
-        "delivered": 0,
-        "audited": 0,
+        "queued": 0,
         "litellm_calls": 0,
+        "timed_out": 0,
     }
 
     semaphore = asyncio.Semaphore(max(1, settings.BUDGET_ALERT_REGION_CONCURRENCY))
 
-    async def _evaluate(region: DBRegion) -> tuple[DBRegion, RegionEvaluation | None]:
+    async def _sweep(region_id: int) -> tuple[str, dict[str, int] | None]:
         async with semaphore:
-            try:
-                return region, await evaluate_region(db, region, thresholds=thresholds)
-            except Exception as exc:
-                logger.error(
-                    "Budget threshold evaluation failed for region %s: %s",
-                    region.name,
-                    exc,
-                    exc_info=True,
-                )
-                return region, None
+            return await sweep_region(region_id, thresholds)
 
-    for region, evaluation in await asyncio.gather(
-        *[_evaluate(region) for region in regions]
+    for outcome, counts in await asyncio.gather(
+        *[_sweep(region.id) for region in regions]
     ):
-        if evaluation is None:
+        if outcome == "timeout":
+            totals["timed_out"] += 1
+        if counts is None:
             continue
         totals["regions"] += 1
-        totals["subjects"] += evaluation.subjects_evaluated
-        totals["events"] += len(evaluation.events)
-        totals["litellm_calls"] += evaluation.litellm_calls
-        budget_alert_subjects_evaluated.labels(region_name=region.name).set(
-            evaluation.subjects_evaluated
-        )
-        for event in evaluation.events:
-            budget_alerts_fired_total.labels(
-                scope=event.subject_type, threshold=str(event.threshold_pct)
-            ).inc()
-
-        # Silent rewrites are unconditional: they carry no notification, so
-        # holding them back would only cause a stale band to suppress a later
-        # genuine crossing.
-        apply_resets(db, region, evaluation)
-
-        if not evaluation.events:
-            continue
-
-        for event in evaluation.events:
-            logger.info(
-                "Budget threshold crossed: scope=%s subject=%s %.2f%% "
-                "(spend=%.4f budget=%.4f) band=%d%% region=%s",
-                event.subject_type,
-                event.subject_key,
-                event.percent_used,
-                event.spend,
-                event.max_budget,
-                event.threshold_pct,
-                event.region_name,
-            )
-
-        if not settings.BUDGET_ALERT_ENABLED:
-            # Log-only mode: percentages can be validated against the spend API
-            # before any third party is told anything. State is left untouched so
-            # enabling delivery later still sends these crossings.
-            continue
-
-        delivered = await deliver_events(evaluation.events)
-        totals["delivered"] += len(delivered)
-        undelivered = len(evaluation.events) - len(delivered)
-        if undelivered > 0:
-            budget_alert_delivery_failures_total.inc(undelivered)
-        # Audit before advancing state: if mark_notified were to fail, the record
-        # that we did warn the customer should still survive.
-        totals["audited"] += write_audit_logs(db, evaluation.events, delivered)
-        mark_notified(db, region, evaluation, delivered)
+        for name, value in counts.items():
+            totals[name] += value
 
     logger.info(
         "Budget threshold sweep finished: regions=%d subjects=%d events=%d "
-        "delivered=%d audited=%d litellm_calls=%d",
+        "queued=%d litellm_calls=%d timed_out=%d",
         totals["regions"],
         totals["subjects"],
         totals["events"],
-        totals["delivered"],
-        totals["audited"],
+        totals["queued"],
         totals["litellm_calls"],
+        totals["timed_out"],
     )
     return totals
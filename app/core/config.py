@@ -9,6 +9,10 @@ class Settings(BaseSettings):
     DB_POOL_SIZE: int = int(os.getenv("DB_POOL_SIZE", "50"))
     DB_MAX_OVERFLOW: int = int(os.getenv("DB_MAX_OVERFLOW", "50"))
     DB_POOL_TIMEOUT: int = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+    # Pool of the asyncpg engine (app/db/database.py) that async route handlers
+    # use. It is separate from the pool above, so the two sizes add up.
+    DB_ASYNC_POOL_SIZE: int = int(os.getenv("DB_ASYNC_POOL_SIZE", "20"))
+    DB_ASYNC_MAX_OVERFLOW: int = int(os.getenv("DB_ASYNC_MAX_OVERFLOW", "20"))
 
     # JWT settings
     # Bind ONLY to AMAZEEAI_JWT_SECRET. Using an explicit validation_alias stops
@@ -18,6 +22,20 @@ class Settings(BaseSettings):
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60  # Increase to 60 minutes
 
+    # Authenticated principals are cached per process by token hash (see
+    # app/core/principal_cache.py). Changes made by another process are picked
+    # up within the TTL; 0 disables the cache.
+    PRINCIPAL_CACHE_TTL_SECONDS: int = int(
+        os.getenv("PRINCIPAL_CACHE_TTL_SECONDS", "30")
+    )
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = int(
+        os.getenv("PRINCIPAL_CACHE_MAX_ENTRIES", "10000")
+    )
+    # api_tokens.last_used_at is written in one batch at most this often.
+    API_TOKEN_LAST_USED_FLUSH_SECONDS: int = int(
+        os.getenv("API_TOKEN_LAST_USED_FLUSH_SECONDS", "60")
+    )
+
     # CORS settings
     CORS_ORIGINS: list[str] = [
         "http://localhost:8080",
@@ -134,9 +152,36 @@ class Settings(BaseSettings):
         os.getenv("BUDGET_ALERT_WEBHOOK_TIMEOUT", "30")
     )
     BUDGET_ALERT_BATCH_SIZE: int = int(os.getenv("BUDGET_ALERT_BATCH_SIZE", "200"))
+    # The sweep queues events in budget_alert_outbox; a job queue worker posts
+    # them, BUDGET_ALERT_DELIVERY_CONCURRENCY batches at a time. A failed batch
+    # is retried after BASE * 2**(attempt-1) seconds (capped at MAX, with
+    # jitter), and given up after BUDGET_ALERT_DELIVERY_MAX_ATTEMPTS. Delivered
+    # rows are kept BUDGET_ALERT_OUTBOX_RETENTION_DAYS as a record.
+    BUDGET_ALERT_DELIVERY_CONCURRENCY: int = int(
+        os.getenv("BUDGET_ALERT_DELIVERY_CONCURRENCY", "4")
+    )
+    BUDGET_ALERT_DELIVERY_MAX_ATTEMPTS: int = int(
+        os.getenv("BUDGET_ALERT_DELIVERY_MAX_ATTEMPTS", "20")
+    )
+    BUDGET_ALERT_DELIVERY_BACKOFF_BASE_SECONDS: float = float(
+        os.getenv("BUDGET_ALERT_DELIVERY_BACKOFF_BASE_SECONDS", "5")
+    )
+    BUDGET_ALERT_DELIVERY_BACKOFF_MAX_SECONDS: float = float(
+        os.getenv("BUDGET_ALERT_DELIVERY_BACKOFF_MAX_SECONDS", "900")
+    )
+    BUDGET_ALERT_OUTBOX_RETENTION_DAYS: int = int(
+        os.getenv("BUDGET_ALERT_OUTBOX_RETENTION_DAYS", "30")
+    )
+    # Regions swept at once; each holds its own DB connection while it runs.
     BUDGET_ALERT_REGION_CONCURRENCY: int = int(
         os.getenv("BUDGET_ALERT_REGION_CONCURRENCY", "4")
     )
+    # Longest one region's evaluation may take before it is skipped for this tick,
+    # so one slow LiteLLM proxy cannot hold up the sweep (0 = no limit). Kept well
+    # under the job's lock timeout.
+    BUDGET_ALERT_REGION_TIMEOUT_SECONDS: float = float(
+        os.getenv("BUDGET_ALERT_REGION_TIMEOUT_SECONDS", "120")
+    )
     # How far back the daily-activity sweep reaches. It must cover the oldest
     # still-valid ledger entry, because spend is counted from that entry's purchase
     # date — a shorter window understates the percentage. POOL entries live for
@@ -153,6 +198,123 @@ class Settings(BaseSettings):
     BUDGET_ALERT_RECHECK_GRACE_HOURS: int = int(
         os.getenv("BUDGET_ALERT_RECHECK_GRACE_HOURS", "24")
     )
+    # The sweep keeps each region's daily activity in budget_alert_spend_days and
+    # on most ticks fetches only the days from the last one it saw, minus
+    # BUDGET_ALERT_ACTIVITY_REFETCH_DAYS (LiteLLM keeps adding to recent days),
+    # and re-evaluates only the teams whose rows changed. Every
+    # BUDGET_ALERT_FULL_SWEEP_INTERVAL_HOURS it reads the whole window again and
+    # evaluates every active team, which also picks up crossings left unsent
+    # while BUDGET_ALERT_ENABLED was off. 0 makes every tick a full sweep.
+    BUDGET_ALERT_FULL_SWEEP_INTERVAL_HOURS: float = float(
+        os.getenv("BUDGET_ALERT_FULL_SWEEP_INTERVAL_HOURS", "24")
+    )
+    BUDGET_ALERT_ACTIVITY_REFETCH_DAYS: int = int(
+        os.getenv("BUDGET_ALERT_ACTIVITY_REFETCH_DAYS", "1")
+    )
+
+    # Request audit logs are queued in-process and bulk-inserted by a background
+    # flusher every AUDIT_LOG_FLUSH_INTERVAL_MS or AUDIT_LOG_BATCH_SIZE rows,
+    # whichever comes first. AUDIT_LOG_QUEUE_SIZE bounds the rows held in memory;
+    # past it, requests write their own row synchronously until the flusher
+    # catches up, so audit rows are delayed under load but never dropped.
+    AUDIT_LOG_FLUSH_INTERVAL_MS: int = int(
+        os.getenv("AUDIT_LOG_FLUSH_INTERVAL_MS", "250")
+    )
+    AUDIT_LOG_BATCH_SIZE: int = int(os.getenv("AUDIT_LOG_BATCH_SIZE", "500"))
+    AUDIT_LOG_QUEUE_SIZE: int = int(os.getenv("AUDIT_LOG_QUEUE_SIZE", "10000"))
+    # audit_logs is partitioned by month. The daily partition cron keeps this
+    # many months of partitions ready ahead of the current one, and drops
+    # whole partitions once all their rows are older than
+    # AUDIT_LOG_RETENTION_DAYS. 0 keeps audit logs forever: deleting audit
+    # history must be an explicit per-environment decision.
+    AUDIT_LOG_PARTITIONS_AHEAD: int = int(os.getenv("AUDIT_LOG_PARTITIONS_AHEAD", "3"))
+    AUDIT_LOG_RETENTION_DAYS: int = int(os.getenv("AUDIT_LOG_RETENTION_DAYS", "0"))
+
+    # Cache shared by all workers and replicas (app/core/shared_cache.py):
+    # "memory" (per process), "file" (a shared directory) or "redis".
+    SHARED_CACHE_BACKEND: str = os.getenv("SHARED_CACHE_BACKEND", "memory")
+    SHARED_CACHE_DIR: str = os.getenv("SHARED_CACHE_DIR", "/tmp/amazee-ai-cache")
+    SHARED_CACHE_REDIS_URL: str = os.getenv(
+        "SHARED_CACHE_REDIS_URL", "redis://localhost:6379/0"
+    )
+    SHARED_CACHE_MAX_ENTRIES: int = int(os.getenv("SHARED_CACHE_MAX_ENTRIES", "10000"))
+    # Per-team /public/models entries kept in each process, least recently
+    # used evicted first.
+    PUBLIC_MODELS_DEDICATED_CACHE_MAX_ENTRIES: int = int(
+        os.getenv("PUBLIC_MODELS_DEDICATED_CACHE_MAX_ENTRIES", "1000")
+    )
+
+    # Identical LiteLLM reads (LiteLLMService.get_team_info, get_key_info,
+    # get_team_daily_activity, get_model_info) share one in-flight call, and
+    # their result is reused for this many seconds. Any write through
+    # LiteLLMService drops the region's memoized reads. 0 keeps the
+    # coalescing but memoizes nothing.
+    LITELLM_READ_TTL_TEAM_INFO_SECONDS: float = float(
+        os.getenv("LITELLM_READ_TTL_TEAM_INFO_SECONDS", "2")
+    )
+    LITELLM_READ_TTL_KEY_INFO_SECONDS: float = float(
+        os.getenv("LITELLM_READ_TTL_KEY_INFO_SECONDS", "2")
+    )
+    LITELLM_READ_TTL_DAILY_ACTIVITY_SECONDS: float = float(
+        os.getenv("LITELLM_READ_TTL_DAILY_ACTIVITY_SECONDS", "30")
+    )
+    LITELLM_READ_TTL_MODEL_INFO_SECONDS: float = float(
+        os.getenv("LITELLM_READ_TTL_MODEL_INFO_SECONDS", "10")
+    )
+    LITELLM_READ_CACHE_MAX_ENTRIES: int = int(
+        os.getenv("LITELLM_READ_CACHE_MAX_ENTRIES", "5000")
+    )
+
+    # Catalog applies sync each region as one batch (app/services/model_sync.py):
+    # one /model/info read, then up to MODEL_SYNC_CONCURRENCY model writes in
+    # flight per region, all regions at once.
+    MODEL_SYNC_CONCURRENCY: int = int(os.getenv("MODEL_SYNC_CONCURRENCY", "8"))
+
+    # Team access-group fan-out runs (app/services/access_groups.py) push teams
+    # in batches of TEAM_GROUP_SYNC_BATCH_SIZE and checkpoint after each one,
+    # with a heartbeat every third of TEAM_GROUP_SYNC_STALE_SECONDS in between.
+    # A running run whose heartbeat is older than TEAM_GROUP_SYNC_STALE_SECONDS
+    # was interrupted; the API process looks for such runs every
+    # TEAM_GROUP_SYNC_RESUME_INTERVAL_SECONDS (0 = never) and resumes them.
+    TEAM_GROUP_SYNC_BATCH_SIZE: int = int(os.getenv("TEAM_GROUP_SYNC_BATCH_SIZE", "100"))
+    TEAM_GROUP_SYNC_STALE_SECONDS: int = int(
+        os.getenv("TEAM_GROUP_SYNC_STALE_SECONDS", "300")
+    )
+    TEAM_GROUP_SYNC_RESUME_INTERVAL_SECONDS: float = float(
+        os.getenv("TEAM_GROUP_SYNC_RESUME_INTERVAL_SECONDS", "60")
+    )
+    # How often the progress stream re-reads a run.
+    TEAM_GROUP_SYNC_PROGRESS_INTERVAL_SECONDS: float = float(
+        os.getenv("TEAM_GROUP_SYNC_PROGRESS_INTERVAL_SECONDS", "1")
+    )
+
+    # Background jobs queued in the jobs table (app/core/job_queue.py).
+    # JOB_QUEUE_WORKERS is the number of workers the API process runs; set it
+    # to 0 when scripts/run_job_worker.py runs them in a separate deployment.
+    JOB_QUEUE_WORKERS: int = int(os.getenv("JOB_QUEUE_WORKERS", "2"))
+    JOB_QUEUE_POLL_INTERVAL_SECONDS: float = float(
+        os.getenv("JOB_QUEUE_POLL_INTERVAL_SECONDS", "1")
+    )
+    JOB_QUEUE_MAX_ATTEMPTS: int = int(os.getenv("JOB_QUEUE_MAX_ATTEMPTS", "8"))
+    # Retry n waits JOB_QUEUE_BACKOFF_BASE_SECONDS * 2**(n-1), capped.
+    JOB_QUEUE_BACKOFF_BASE_SECONDS: float = float(
+        os.getenv("JOB_QUEUE_BACKOFF_BASE_SECONDS", "5")
+    )
+    JOB_QUEUE_BACKOFF_MAX_SECONDS: float = float(
+        os.getenv("JOB_QUEUE_BACKOFF_MAX_SECONDS", "900")
+    )
+    # A running job whose worker has not finished it after this long is
+    # assumed lost (crashed pod) and handed out again.
+    JOB_QUEUE_LOCK_TIMEOUT_SECONDS: int = int(
+        os.getenv("JOB_QUEUE_LOCK_TIMEOUT_SECONDS", "600")
+    )
+
+    # /teams/sales/list-teams reads precomputed rows (sales_team_rows), rebuilt
+    # after every monitor_teams run. The refresh-sales-team-rows cron rebuilds
+    # them once older than this, so new teams and products show up between runs.
+    SALES_TEAM_ROWS_MAX_AGE_SECONDS: int = int(
+        os.getenv("SALES_TEAM_ROWS_MAX_AGE_SECONDS", "300")
+    )
 
     PROMETHEUS_API_KEY: str = os.getenv("PROMETHEUS_API_KEY", "")
     POOL_PURCHASE_EXPIRY_DAYS: int = int(os.getenv("POOL_PURCHASE_EXPIRY_DAYS", "365"))
@@ -0,0 +1,336 @@
+"""
+Background jobs backed by the ``jobs`` table.
+
+A job is inserted on the caller's session, so it commits (or rolls back) with
+the change that caused it, and it survives restarts and deploys. Workers claim
+due jobs with ``SELECT ... FOR UPDATE SKIP LOCKED``: any number of them, in the
+API process or in ``scripts/run_job_worker.py``, share the queue without ever
+handing the same job to two of them.
+
+- Coalescing: enqueueing with a ``dedupe_key`` that already has a pending job
+  replaces that job's payload instead of adding a row, so a burst of updates
+  for one team runs once, with the latest values. Handlers must therefore be
+  idempotent and take everything they need from the payload.
+- Retries: a handler that raises is retried with exponential backoff up to
+  ``max_attempts``; after that the row stays behind with status ``failed``.
+- A job still ``running`` after ``JOB_QUEUE_LOCK_TIMEOUT_SECONDS`` belonged to
+  a worker that died and is claimed again.
+
+Handlers are registered per ``kind`` with ``@job_handler(kind)`` in the module
+that owns the work, and receive a fresh session and the payload.
+"""
+
+import asyncio
+import logging
+import time
+from datetime import timedelta
+from typing import Awaitable, Callable, Optional
+
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import and_, delete, exists, func, or_, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session, aliased
+
+from app.core.config import settings
+from app.db.database import SessionLocal
+from app.db.models import DBJob
+
+logger = logging.getLogger(__name__)
+
+JOB_PENDING = "pending"
+JOB_RUNNING = "running"
+JOB_FAILED = "failed"
+
+# How often a worker pool refreshes the queue depth and lag gauges.
+_METRICS_INTERVAL = 15.0
+
+job_queue_depth = Gauge(
+    "job_queue_depth",
+    "Jobs in the jobs table, by kind and status",
+    ["kind", "status"],
+)
+job_queue_lag_seconds = Gauge(
+    "job_queue_lag_seconds",
+    "How long the oldest due pending job has been waiting, by kind",
+    ["kind"],
+)
+job_processed_total = Counter(
+    "job_processed_total",
+    "Jobs run by a worker, by kind and outcome (done, retry, failed)",
+    ["kind", "outcome"],
+)
+job_duration_seconds = Histogram(
+    "job_duration_seconds",
+    "Time spent running a job's handler, by kind",
+    ["kind"],
+)
+
+JobHandler = Callable[[Session, dict], Awaitable[None]]
+_handlers: dict[str, JobHandler] = {}
+
+
+def job_handler(kind: str) -> Callable[[JobHandler], JobHandler]:
+    """Register the coroutine that runs jobs of ``kind``."""
+
+    def register(handler: JobHandler) -> JobHandler:
+        _handlers[kind] = handler
+        return handler
+
+    return register
+
+
+def enqueue_job(
+    db: Session,
+    kind: str,
+    payload: dict,
+    dedupe_key: Optional[str] = None,
+    delay_seconds: float = 0,
+    max_attempts: int = settings.JOB_QUEUE_MAX_ATTEMPTS,
+) -> None:
+    """Queue a job on ``db``'s transaction; it is visible once the caller commits.
+
+    With a ``dedupe_key``, a pending job for the same key is updated in place:
+    it takes the new payload, runs no later than this job would have, and
+    starts over on its attempts.
+    """
+    run_at = func.now() + timedelta(seconds=delay_seconds)
+    stmt = pg_insert(DBJob).values(
+        kind=kind,
+        dedupe_key=dedupe_key,
+        payload=payload,
+        status=JOB_PENDING,
+        attempts=0,
+        max_attempts=max_attempts,
+        run_at=run_at,
+    )
+    if dedupe_key is not None:
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[DBJob.dedupe_key],
+            index_where=DBJob.status == JOB_PENDING,
+            set_={
+                "kind": stmt.excluded.kind,
+                "payload": stmt.excluded.payload,
+                "max_attempts": stmt.excluded.max_attempts,
+                "attempts": 0,
+                "last_error": None,
+                "run_at": func.least(DBJob.run_at, stmt.excluded.run_at),
+            },
+        )
+    db.execute(stmt)
+
+
+def backoff_seconds(attempts: int) -> float:
+    """Delay before retry number ``attempts`` (1-based)."""
+    delay = settings.JOB_QUEUE_BACKOFF_BASE_SECONDS * 2 ** max(0, attempts - 1)
+    return min(delay, settings.JOB_QUEUE_BACKOFF_MAX_SECONDS)
+
+
+def _claim_job() -> Optional[tuple[int, str, dict]]:
+    """Lock one due job, mark it running and return (id, kind, payload)."""
+    lock_cutoff = func.now() - timedelta(
+        seconds=settings.JOB_QUEUE_LOCK_TIMEOUT_SECONDS
+    )
+    # A job enqueued while an earlier one for the same key is still running
+    # waits for it, so the older payload cannot land last.
+    running = aliased(DBJob)
+    same_key_running = exists().where(
+        running.dedupe_key == DBJob.dedupe_key,
+        running.status == JOB_RUNNING,
+        running.locked_at >= lock_cutoff,
+    )
+    with SessionLocal() as db:
+        job = db.execute(
+            select(DBJob)
+            .where(
+                or_(
+                    and_(
+                        DBJob.status == JOB_PENDING,
+                        DBJob.run_at <= func.now(),
+                        ~same_key_running,
+                    ),
+                    and_(DBJob.status == JOB_RUNNING, DBJob.locked_at < lock_cutoff),
+                )
+            )
+            .order_by(DBJob.run_at)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+        ).scalar_one_or_none()
+        if job is None:
+            return None
+        job.status = JOB_RUNNING
+        job.locked_at = func.now()
+        job.attempts = job.attempts + 1
+        claimed = (job.id, job.kind, dict(job.payload))
+        db.commit()
+        return claimed
+
+
+def _finish_job(job_id: int, error: Optional[str]) -> str:
+    """Record the outcome of a claimed job and return "done", "retry" or "failed"."""
+    with SessionLocal() as db:
+        if error is None:
+            db.execute(delete(DBJob).where(DBJob.id == job_id))
+            db.commit()
+            return "done"
+
+        job = db.get(DBJob, job_id)
+        if job is None:
+            return "failed"
+        if job.attempts >= job.max_attempts:
+            job.status = JOB_FAILED
+            job.last_error = error
+            job.locked_at = None
+            db.commit()
+            return "failed"
+
+        # The retry goes back in as a new pending row. When the same key was
+        # enqueued again while this one ran, that newer job already carries
+        # the latest payload and the retry folds into it.
+        stmt = pg_insert(DBJob).values(
+            kind=job.kind,
+            dedupe_key=job.dedupe_key,
+            payload=job.payload,
+            status=JOB_PENDING,
+            attempts=job.attempts,
+            max_attempts=job.max_attempts,
+            run_at=func.now() + timedelta(seconds=backoff_seconds(job.attempts)),
+            last_error=error,
+            created_at=job.created_at,
+        )
+        if job.dedupe_key is not None:
+            stmt = stmt.on_conflict_do_nothing(
+                index_elements=[DBJob.dedupe_key],
+                index_where=DBJob.status == JOB_PENDING,
+            )
+        db.execute(stmt)
+        db.delete(job)
+        db.commit()
+        return "retry"
+
+
+async def run_next_job() -> bool:
+    """Claim and run one due job. False when there was nothing to run."""
+    claimed = await asyncio.to_thread(_claim_job)
+    if claimed is None:
+        return False
+    job_id, kind, payload = claimed
+
+    error = None
+    handler = _handlers.get(kind)
+    started = time.perf_counter()
+    if handler is None:
+        error = f"No handler registered for job kind {kind!r}"
+    else:
+        db = SessionLocal()
+        try:
+            await handler(db, payload)
+        except Exception as e:
+            db.rollback()
+            error = f"{type(e).__name__}: {e}"
+        finally:
+            db.close()
+    job_duration_seconds.labels(kind=kind).observe(time.perf_counter() - started)
+
+    outcome = await asyncio.to_thread(_finish_job, job_id, error)
+    job_processed_total.labels(kind=kind, outcome=outcome).inc()
+    if outcome == "retry":
+        logger.warning(f"Job {job_id} ({kind}) failed, will retry: {error}")
+    elif outcome == "failed":
+        logger.error(f"Job {job_id} ({kind}) failed permanently: {error}")
+    return True
+
+
+async def run_due_jobs(max_jobs: Optional[int] = None) -> int:
+    """Run due jobs one after another until none are left; returns how many ran."""
+    ran = 0
+    while max_jobs is None or ran < max_jobs:
+        if not await run_next_job():
+            break
+        ran += 1
+    return ran
+
+
+def update_queue_metrics(db: Session) -> None:
+    rows = db.execute(
+        select(DBJob.kind, DBJob.status, func.count()).group_by(
+            DBJob.kind, DBJob.status
+        )
+    ).all()
+    job_queue_depth.clear()
+    for kind, status, count in rows:
+        job_queue_depth.labels(kind=kind, status=status).set(count)
+
+    lags = db.execute(
+        select(
+            DBJob.kind,
+            func.extract("epoch", func.now() - func.min(DBJob.run_at)),
+        )
+        .where(DBJob.status == JOB_PENDING, DBJob.run_at <= func.now())
+        .group_by(DBJob.kind)
+    ).all()
+    job_queue_lag_seconds.clear()
+    for kind, lag in lags:
+        job_queue_lag_seconds.labels(kind=kind).set(float(lag))
+
+
+def _update_queue_metrics() -> None:
+    with SessionLocal() as db:
+        update_queue_metrics(db)
+
+
+class JobWorkerPool:
+    """``concurrency`` asyncio workers draining the jobs table.
+
+    Each worker runs jobs back to back while any are due and sleeps for
+    ``poll_interval`` seconds when the queue is empty. ``stop`` cancels the
+    workers; a job interrupted mid-handler is claimed again once its lock
+    times out.
+    """
+
+    def __init__(
+        self,
+        concurrency: int = settings.JOB_QUEUE_WORKERS,
+        poll_interval: float = settings.JOB_QUEUE_POLL_INTERVAL_SECONDS,
+    ):
+        self.concurrency = max(0, concurrency)
+        self.poll_interval = max(0.05, poll_interval)
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        return any(not task.done() for task in self._tasks)
+
+    async def start(self) -> None:
+        if self.running or self.concurrency == 0:
+            return
+        self._tasks = [
+            asyncio.create_task(self._work()) for _ in range(self.concurrency)
+        ]
+        self._tasks.append(asyncio.create_task(self._report()))
+
+    async def stop(self) -> None:
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _work(self) -> None:
+        while True:
+            try:
+                ran = await run_next_job()
+            except Exception as e:
+                logger.error(f"Job worker error: {str(e)}")
+                ran = False
+            if not ran:
+                await asyncio.sleep(self.poll_interval)
+
+    async def _report(self) -> None:
+        while True:
+            try:
+                await asyncio.to_thread(_update_queue_metrics)
+            except Exception as e:
+                logger.warning(f"Failed to update job queue metrics: {str(e)}")
+            await asyncio.sleep(_METRICS_INTERVAL)
+
+
+job_worker_pool = JobWorkerPool()
@@ -1,10 +1,9 @@
-import asyncio
 import logging
-from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from typing import List, Optional
 
 from app.core.config import settings
+from app.core.job_queue import enqueue_job, job_handler
 from app.db.models import (
     DBLimitedResource,
     DBPrivateAIKey,
@@ -28,22 +27,32 @@ from sqlalchemy import and_, func, or_, select
 from sqlalchemy.orm import Session
 from app.schemas.models import BudgetType
 
-# Shared executor for budget propagation to avoid creating too many threads
-_budget_propagation_executor = None
+logger = logging.getLogger(__name__)
 
+TEAM_BUDGET_PROPAGATION_JOB = "team_budget_propagation"
 
-def _get_budget_propagation_executor():
-    """Get or create the shared executor for budget propagation."""
-    global _budget_propagation_executor
-    if _budget_propagation_executor is None:
-        # Limit to 5 workers to prevent fork-bomb scenarios
-        _budget_propagation_executor = ThreadPoolExecutor(
-            max_workers=5, thread_name_prefix="budget_propagation"
-        )
-    return _budget_propagation_executor
 
+@job_handler(TEAM_BUDGET_PROPAGATION_JOB)
+async def _run_team_budget_propagation(db: Session, payload: dict) -> None:
+    """Push a team budget limit to LiteLLM; raises so failed updates are retried."""
+    # Import here to avoid circular import
+    from app.core.team_service import propagate_team_budget_to_keys
+
+    team_id = payload["team_id"]
+    if db.query(DBTeam.id).filter(DBTeam.id == team_id).first() is None:
+        logger.info(f"Team {team_id} no longer exists, dropping budget propagation")
+        return
+    result = await propagate_team_budget_to_keys(
+        db,
+        team_id,
+        payload["budget_amount"],
+        payload["budget_duration"],
+        update_key_limits=payload["update_key_limits"],
+        apply_to_keys=payload["apply_to_keys"],
+    )
+    if result["errors"]:
+        raise RuntimeError("; ".join(result["errors"]))
 
-logger = logging.getLogger(__name__)
 
 # Metrics to track which route is being followed
 limit_check_route_counter = Counter(
@@ -478,10 +487,6 @@ class LimitService:
             existing_limit.updated_at = datetime.now(UTC)
 
             self.db.add(existing_limit)
-            if commit:
-                self.db.commit()
-            else:
-                self.db.flush()
             result = existing_limit
 
         else:
@@ -502,19 +507,12 @@ class LimitService:
             )
 
             self.db.add(new_limit)
-            if commit:
-                self.db.commit()
-            else:
-                self.db.flush()
             result = new_limit
 
-        # If this is a system limit change, update all default limits for the same resource
-        if limited_resource.owner_type == OwnerType.SYSTEM:
-            self._update_default_limits_for_resource(
-                limited_resource.resource, limited_resource.max_value
-            )
+        self.db.flush()
 
-        # If this is a team budget limit update, propagate to all team keys
+        # If this is a team budget limit update, propagate to all team keys.
+        # The job is queued in this transaction, so it runs iff the limit commits.
         if (
             limited_resource.owner_type == OwnerType.TEAM
             and limited_resource.resource == ResourceType.BUDGET
@@ -524,27 +522,33 @@ class LimitService:
                 limited_resource.owner_id, limited_resource.max_value
             )
 
+        if commit:
+            self.db.commit()
+
+        # If this is a system limit change, update all default limits for the same resource
+        if limited_resource.owner_type == OwnerType.SYSTEM:
+            self._update_default_limits_for_resource(
+                limited_resource.resource, limited_resource.max_value
+            )
+
         return result
 
     def _trigger_team_budget_propagation(
         self, team_id: int, budget_amount: float
     ) -> None:
         """
-        Trigger propagation of team budget limit to keys.
+        Queue propagation of team budget limit to keys.
 
-        This method handles the async nature of propagation from a synchronous context.
-        It uses a shared thread pool executor to prevent creating too many threads,
-        especially when updating budgets for teams with many keys or when multiple
-        updates happen concurrently.
+        The job is added to this service's session and runs once the caller
+        commits, on a job queue worker with its own session (see
+        app/core/job_queue.py). Jobs are coalesced per team: several budget
+        changes in quick succession push only the latest one to LiteLLM, and
+        a failed push is retried with backoff.
 
         Args:
             team_id: ID of the team whose keys should be updated
             budget_amount: New budget amount to set for all keys
         """
-        # Import here to avoid circular import
-        from app.core.team_service import propagate_team_budget_to_keys
-        from app.db.database import get_db
-
         team = self.db.query(DBTeam).filter(DBTeam.id == team_id).first()
         if not team:
             logger.error(f"Team {team_id} not found, skipping budget propagation")
@@ -561,49 +565,25 @@ class LimitService:
             days_left, _, _ = self.get_token_restrictions(team_id)
             budget_duration = f"{days_left}d"
 
-        def run_async_propagation():
-            """Helper to run async propagation in a new event loop with its own session.
-
-            Creates a new database session for this thread because SQLAlchemy sessions
-            are not thread-safe. The request session may be closed or in an inconsistent
-            state by the time this background thread runs.
-            """
-            # Create a new database session for this background thread
-            db = next(get_db())
-            try:
-                # Create a new event loop for this thread
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-                try:
-                    loop.run_until_complete(
-                        propagate_team_budget_to_keys(
-                            db,
-                            team_id,
-                            budget_amount,
-                            budget_duration,
-                            update_key_limits=update_key_limits,
-                            apply_to_keys=apply_to_keys,
-                        )
-                    )
-                finally:
-                    loop.close()
-            except Exception as thread_error:
-                logger.error(
-                    f"Error in async propagation thread for team {team_id}: {str(thread_error)}"
-                )
-            finally:
-                db.close()
-
         try:
-            # Use shared executor to limit concurrent threads and prevent fork-bomb
-            executor = _get_budget_propagation_executor()
-            executor.submit(run_async_propagation)
-            logger.info(
-                f"Triggered async propagation of budget limit for team {team_id}"
-            )
+            # A savepoint, so a failed insert leaves the limit update intact.
+            with self.db.begin_nested():
+                enqueue_job(
+                    self.db,
+                    TEAM_BUDGET_PROPAGATION_JOB,
+                    {
+                        "team_id": team_id,
+                        "budget_amount": budget_amount,
+                        "budget_duration": budget_duration,
+                        "update_key_limits": update_key_limits,
+                        "apply_to_keys": apply_to_keys,
+                    },
+                    dedupe_key=f"{TEAM_BUDGET_PROPAGATION_JOB}:{team_id}",
+                )
+            logger.info(f"Queued propagation of budget limit for team {team_id}")
         except Exception as propagation_error:
             logger.error(
-                f"Error triggering budget limit propagation for team {team_id}: {str(propagation_error)}"
+                f"Error queueing budget limit propagation for team {team_id}: {str(propagation_error)}"
             )
             # Don't raise - allow limit update to succeed even if propagation fails
 
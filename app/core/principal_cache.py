@@ -0,0 +1,269 @@
+"""
+Per-process cache of authenticated principals and coalesced API-token usage.
+
+Every authenticated request used to validate its token against the database
+(an ``api_tokens`` lookup joined to the owner and team, or a JWT decode plus a
+``users`` lookup) and API-token requests also committed a ``last_used_at``
+UPDATE. The cache keeps the resolved identity for ``PRINCIPAL_CACHE_TTL_SECONDS``
+keyed by a hash of the token, and ``last_used_at`` is written in one batch every
+``API_TOKEN_LAST_USED_FLUSH_SECONDS``.
+
+Entries are dropped as soon as this process flushes or commits a change to the
+user, their team or their API tokens (see the session listeners below), so
+role changes, suspensions and revocations apply immediately here. Other
+processes notice within the TTL.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from typing import Optional
+
+from jose import jwt
+from sqlalchemy import bindparam, event, update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.database import engine
+from app.db.models import DBAPIToken, DBTeam, DBUser
+
+logger = logging.getLogger(__name__)
+
+
+def _token_key(token: str) -> str:
+    # Never keep raw bearer tokens in memory longer than the request needs.
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The identity fields AuthMiddleware exposes on ``request.state.user``."""
+
+    id: int
+    email: str
+    is_admin: bool
+    role: Optional[str]
+    team_id: Optional[int]
+    api_token_id: Optional[int] = None
+
+    @classmethod
+    def from_user(cls, user: DBUser, api_token_id: Optional[int] = None) -> "Principal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            is_admin=user.is_admin,
+            role=user.role,
+            team_id=user.team_id,
+            api_token_id=api_token_id,
+        )
+
+    def as_state(self) -> dict:
+        return {
+            "id": self.id,
+            "email": self.email,
+            "is_admin": self.is_admin,
+            "role": self.role,
+            "team_id": self.team_id,
+        }
+
+
+class PrincipalCache:
+    """Thread-safe TTL + LRU map from token hash to :class:`Principal`.
+
+    Sync endpoints run in FastAPI's threadpool and commit there, so
+    invalidation can arrive from any thread.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: int = settings.PRINCIPAL_CACHE_TTL_SECONDS,
+        max_entries: int = settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[str, tuple[float, Principal]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, token: str) -> Optional[Principal]:
+        if self.ttl_seconds <= 0:
+            return None
+        key = _token_key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return principal
+
+    def put(
+        self, token: str, principal: Principal, expires_at: Optional[datetime] = None
+    ) -> None:
+        """Cache ``principal`` for ``token``, never past ``expires_at`` (a JWT exp)."""
+        if self.ttl_seconds <= 0:
+            return
+        ttl = float(self.ttl_seconds)
+        if expires_at is not None:
+            ttl = min(ttl, (expires_at - datetime.now(UTC)).total_seconds())
+            if ttl <= 0:
+                return
+        with self._lock:
+            self._entries[_token_key(token)] = (time.monotonic() + ttl, principal)
+            self._entries.move_to_end(_token_key(token))
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(
+        self, user_ids: set[int] = frozenset(), team_ids: set[int] = frozenset()
+    ) -> None:
+        if not user_ids and not team_ids:
+            return
+        with self._lock:
+            stale = [
+                key
+                for key, (_, principal) in self._entries.items()
+                if principal.id in user_ids or principal.team_id in team_ids
+            ]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class APITokenUsageRecorder:
+    """Coalesces ``api_tokens.last_used_at`` writes into a periodic batch UPDATE.
+
+    Only the latest use per token within an interval is kept, so the write
+    volume is bounded by the number of distinct tokens, not requests.
+    """
+
+    def __init__(
+        self, flush_interval_seconds: int = settings.API_TOKEN_LAST_USED_FLUSH_SECONDS
+    ):
+        self.flush_interval_seconds = flush_interval_seconds
+        self._pending: dict[int, datetime] = {}
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    def record(self, token_id: int, used_at: Optional[datetime] = None) -> None:
+        with self._lock:
+            self._pending[token_id] = used_at or datetime.now(UTC)
+
+    def due(self) -> bool:
+        with self._lock:
+            return bool(self._pending) and (
+                time.monotonic() - self._last_flush >= self.flush_interval_seconds
+            )
+
+    def flush(self) -> int:
+        """Write pending timestamps; returns the number of tokens updated."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._last_flush = time.monotonic()
+        if not pending:
+            return 0
+        # A plain connection rather than a Session: this is not a change to the
+        # token the principal cache needs to hear about.
+        try:
+            with engine.begin() as conn:
+                conn.execute(
+                    update(DBAPIToken)
+                    .where(DBAPIToken.id == bindparam("token_id"))
+                    .values(last_used_at=bindparam("used_at")),
+                    [
+                        {"token_id": token_id, "used_at": used_at}
+                        for token_id, used_at in pending.items()
+                    ],
+                )
+        except Exception as e:
+            logger.error(f"Failed to update API token last_used_at: {str(e)}")
+            with self._lock:
+                for token_id, used_at in pending.items():
+                    self._pending.setdefault(token_id, used_at)
+            return 0
+        return len(pending)
+
+
+principal_cache = PrincipalCache()
+api_token_usage = APITokenUsageRecorder()
+
+
+def jwt_expiry(token: str) -> Optional[datetime]:
+    """``exp`` of an already-verified JWT, used to cap its cache entry."""
+    try:
+        exp = jwt.get_unverified_claims(token).get("exp")
+    except Exception:
+        return None
+    return datetime.fromtimestamp(exp, UTC) if exp else None
+
+
+# --------------------------------------------------------------------------- #
+# Invalidation
+# --------------------------------------------------------------------------- #
+
+_PRINCIPAL_TABLES = {
+    DBUser.__tablename__,
+    DBTeam.__tablename__,
+    DBAPIToken.__tablename__,
+}
+
+
+def _changed_principals(session: Session) -> tuple[set[int], set[int]]:
+    user_ids: set[int] = set()
+    team_ids: set[int] = set()
+    for obj in list(session.dirty) + list(session.deleted):
+        if isinstance(obj, DBUser):
+            user_ids.add(obj.id)
+        elif isinstance(obj, DBTeam):
+            team_ids.add(obj.id)
+        elif isinstance(obj, DBAPIToken) and obj.user_id is not None:
+            user_ids.add(obj.user_id)
+    return user_ids, team_ids
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_after_flush(session, flush_context):
+    user_ids, team_ids = _changed_principals(session)
+    if user_ids or team_ids:
+        principal_cache.invalidate(user_ids, team_ids)
+        # Again at commit: a request in between can re-cache the old rows.
+        session.info.setdefault("principal_user_ids", set()).update(user_ids)
+        session.info.setdefault("principal_team_ids", set()).update(team_ids)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_after_bulk_write(orm_execute_state):
+    # query.update()/delete() bypass the unit of work, so there is no
+    # per-object list to go on; drop everything.
+    if not (orm_execute_state.is_update or orm_execute_state.is_delete):
+        return
+    table = getattr(orm_execute_state.statement, "table", None)
+    if getattr(table, "name", None) in _PRINCIPAL_TABLES:
+        principal_cache.clear()
+        orm_execute_state.session.info["principal_clear"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_after_commit(session):
+    if session.info.pop("principal_clear", False):
+        principal_cache.clear()
+    principal_cache.invalidate(
+        session.info.pop("principal_user_ids", set()),
+        session.info.pop("principal_team_ids", set()),
+    )
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_after_rollback(session):
+    session.info.pop("principal_clear", None)
+    session.info.pop("principal_user_ids", None)
+    session.info.pop("principal_team_ids", None)
@@ -8,9 +8,16 @@ import logging
 
 from app.core.config import settings
 from app.core.email import normalize_email_for_lookup
-from app.db.database import get_db
+from app.core.principal_cache import (
+    Principal,
+    api_token_usage,
+    jwt_expiry,
+    principal_cache,
+)
+from app.db.database import get_async_db, get_db
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, inspect as sa_inspect
+from sqlalchemy import func, inspect as sa_inspect, select
 from app.db.models import DBUser, DBAPIToken
 from app.core.rbac import (
     require_system_admin,
@@ -164,6 +171,17 @@ async def get_current_user_from_auth(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # A recently validated token skips validation; the user is still loaded
+    # so callers get a live object on this session.
+    cached = principal_cache.get(token_to_try)
+    if cached is not None:
+        user = _get_user_with_team(db, cached.id)
+        if user:
+            _check_user_team_not_suspended(user)
+            if cached.api_token_id is not None:
+                api_token_usage.record(cached.api_token_id)
+            return user
+
     # First try API token validation since it's simpler
     try:
         db_token = (
@@ -173,10 +191,13 @@ async def get_current_user_from_auth(
             .first()
         )
         if db_token:
-            # Update last used timestamp
-            db_token.last_used_at = datetime.now(UTC)
             _check_user_team_not_suspended(db_token.owner)
-            db.commit()
+            # last_used_at is written in periodic batches, not per request
+            api_token_usage.record(db_token.id)
+            principal_cache.put(
+                token_to_try,
+                Principal.from_user(db_token.owner, api_token_id=db_token.id),
+            )
             return db_token.owner
     except HTTPException:
         raise
@@ -191,6 +212,9 @@ async def get_current_user_from_auth(
         user = await get_current_user(credentials=credentials, db=db)
         if user:
             _check_user_team_not_suspended(user)
+            principal_cache.put(
+                token_to_try, Principal.from_user(user), jwt_expiry(token_to_try)
+            )
             return user
     except HTTPException:
         raise
@@ -202,6 +226,40 @@ async def get_current_user_from_auth(
         )
 
 
+async def get_current_user_from_auth_async(
+    request: Request,
+    access_token: Optional[str] = Cookie(None, alias="access_token"),
+    authorization: Optional[str] = Header(None),
+    db: AsyncSession = Depends(get_async_db),
+    sync_db: Session = Depends(get_db),
+) -> DBUser:
+    """:func:`get_current_user_from_auth` for handlers on the async session.
+
+    AuthMiddleware has already identified the caller on almost every request,
+    so this only loads the user (and team) on *db* without blocking the event
+    loop. Anything else - no identity from the middleware, a user that has
+    since gone - takes the full sync path, which raises the right 401/403.
+    The returned user belongs to *db*.
+    """
+    state_user = getattr(request.state, "user", None)
+    if isinstance(state_user, dict):
+        user = (
+            await db.execute(
+                select(DBUser)
+                .where(DBUser.id == state_user["id"])
+                .options(joinedload(DBUser.team))
+            )
+        ).scalar_one_or_none()
+        if user:
+            _check_user_team_not_suspended(user)
+            return user
+
+    user = await get_current_user_from_auth(
+        access_token=access_token, authorization=authorization, db=sync_db
+    )
+    return await db.get(DBUser, user.id, options=[joinedload(DBUser.team)])
+
+
 def _check_user_team_not_suspended(user: DBUser) -> None:
     """Raise 403 if the user's team has been soft-deleted.
 
@@ -308,6 +366,14 @@ async def get_private_ai_access(
     return dependency.check_access(current_user)
 
 
+async def get_private_ai_access_async(
+    current_user: DBUser = Depends(get_current_user_from_auth_async),
+):
+    """:func:`get_private_ai_access` for handlers on the async session."""
+    dependency = require_private_ai_access()
+    return dependency.check_access(current_user)
+
+
 async def get_private_ai_direct_access(
     current_user: DBUser = Depends(get_current_user_from_auth),
 ):
@@ -0,0 +1,254 @@
+"""
+Cache backends shared by every worker process and replica.
+
+Caches kept in module-level dicts are per process: every uvicorn worker and
+every pod rebuilds its own copy. A ``CacheBackend`` holds byte values with a
+per-key TTL somewhere all of them can see, so an expensive entry is built once
+and read by the rest. ``add`` (set-if-absent) doubles as a short lease, so
+only one process rebuilds a given entry at a time.
+
+Backends, selected by ``SHARED_CACHE_BACKEND``:
+
+- ``memory``: in-process, for single-worker deployments and tests.
+- ``file``: a directory on a volume the workers share (``SHARED_CACHE_DIR``).
+- ``redis``: any Redis-compatible server (``SHARED_CACHE_REDIS_URL``).
+
+``memory`` and ``file`` evict the least recently used keys beyond
+``SHARED_CACHE_MAX_ENTRIES``; for ``redis`` that bound is the server's
+``maxmemory-policy`` (``allkeys-lru`` or ``volatile-lru``).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+import redis
+
+from app.core.config import settings
+
+
+class CacheBackend:
+    """Byte-valued key/value store with a TTL on every key."""
+
+    def get(self, key: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        raise NotImplementedError
+
+    def add(self, key: str, value: bytes, ttl_seconds: float) -> bool:
+        """Set ``key`` only if it is absent; True when this call set it."""
+        raise NotImplementedError
+
+    def delete(self, key: str) -> None:
+        raise NotImplementedError
+
+
+class InProcessCacheBackend(CacheBackend):
+    def __init__(self, max_entries: int = settings.SHARED_CACHE_MAX_ENTRIES):
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[str, tuple[float, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _live(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            value = self._live(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+            return value
+
+    def _store(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        with self._lock:
+            self._store(key, value, ttl_seconds)
+
+    def add(self, key: str, value: bytes, ttl_seconds: float) -> bool:
+        # Check and insert under one lock hold: callers run in threads
+        # (asyncio.to_thread), and two of them must not both take a lease.
+        with self._lock:
+            if self._live(key) is not None:
+                return False
+            self._store(key, value, ttl_seconds)
+            return True
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class FileCacheBackend(CacheBackend):
+    """One file per key in ``directory``, safe across processes on one host.
+
+    Writes go to a temporary file that is renamed into place, so readers never
+    see a partial value. Each file starts with a JSON header line holding the
+    expiry (wall clock, as it is compared across processes). Reads bump the
+    file's mtime, which is what LRU eviction sorts by.
+    """
+
+    def __init__(
+        self,
+        directory: str = settings.SHARED_CACHE_DIR,
+        max_entries: int = settings.SHARED_CACHE_MAX_ENTRIES,
+    ):
+        self.directory = directory
+        self.max_entries = max(1, max_entries)
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        name = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, f"{name}.cache")
+
+    @staticmethod
+    def _read(path: str) -> Optional[bytes]:
+        try:
+            with open(path, "rb") as f:
+                header = json.loads(f.readline())
+                if header["expires_at"] <= time.time():
+                    return None
+                return f.read()
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        value = self._read(path)
+        if value is None:
+            self._remove(path)
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return value
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        header = json.dumps({"expires_at": time.time() + ttl_seconds}).encode()
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(header + b"\n" + value)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            self._remove(tmp_path)
+            raise
+        self._evict()
+
+    def add(self, key: str, value: bytes, ttl_seconds: float) -> bool:
+        path = self._path(key)
+        if os.path.exists(path) and self._read(path) is None:
+            # Expired leftovers would hold the key forever. Move them aside
+            # first: only one process wins the rename, and if what it moved
+            # turns out to be a live entry added in the meantime, it goes back.
+            stale_path = f"{path}.{os.getpid()}.{threading.get_ident()}.stale"
+            try:
+                os.rename(path, stale_path)
+            except FileNotFoundError:
+                pass
+            else:
+                if self._read(stale_path) is not None:
+                    try:
+                        os.link(stale_path, path)
+                    except FileExistsError:
+                        pass
+                self._remove(stale_path)
+        # The value is written in full before it is linked into place, so a
+        # concurrent ``add`` never sees a half-written file and mistakes it
+        # for an expired one. ``os.link`` fails if the key already exists.
+        header = json.dumps({"expires_at": time.time() + ttl_seconds}).encode()
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(header + b"\n" + value)
+            os.link(tmp_path, path)
+        except FileExistsError:
+            return False
+        finally:
+            self._remove(tmp_path)
+        return True
+
+    def delete(self, key: str) -> None:
+        self._remove(self._path(key))
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    def _evict(self) -> None:
+        try:
+            entries = [
+                e for e in os.scandir(self.directory) if e.name.endswith(".cache")
+            ]
+        except OSError:
+            return
+        if len(entries) <= self.max_entries:
+            return
+        entries.sort(key=lambda e: e.stat().st_mtime)
+        for entry in entries[: len(entries) - self.max_entries]:
+            self._remove(entry.path)
+
+
+class RedisCacheBackend(CacheBackend):
+    """Backed by a redis-py compatible client (``get``/``set``/``delete``)."""
+
+    def __init__(self, client):
+        self.client = client
+
+    @classmethod
+    def from_url(
+        cls, url: str = settings.SHARED_CACHE_REDIS_URL
+    ) -> "RedisCacheBackend":
+        return cls(redis.Redis.from_url(url, socket_timeout=1.0))
+
+    def get(self, key: str) -> Optional[bytes]:
+        return self.client.get(key)
+
+    def set(self, key: str, value: bytes, ttl_seconds: float) -> None:
+        self.client.set(key, value, px=max(1, int(ttl_seconds * 1000)))
+
+    def add(self, key: str, value: bytes, ttl_seconds: float) -> bool:
+        return bool(
+            self.client.set(key, value, px=max(1, int(ttl_seconds * 1000)), nx=True)
+        )
+
+    def delete(self, key: str) -> None:
+        self.client.delete(key)
+
+
+def create_cache_backend(kind: str = settings.SHARED_CACHE_BACKEND) -> CacheBackend:
+    if kind == "memory":
+        return InProcessCacheBackend()
+    if kind == "file":
+        return FileCacheBackend()
+    if kind == "redis":
+        return RedisCacheBackend.from_url()
+    raise ValueError(f"Unknown SHARED_CACHE_BACKEND: {kind}")
+
+
+shared_cache = create_cache_backend()
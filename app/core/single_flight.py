@@ -0,0 +1,150 @@
+"""
+Single-flight request coalescing with a short-lived result memo.
+
+``SingleFlight.run`` answers a read from a fresh memoized result if it has
+one, otherwise joins the identical call already in flight on this event loop,
+and only otherwise calls ``fetch``. Every caller gets its own deep copy of the
+result, so one caller mutating what it got back cannot leak into another.
+
+Results are grouped by *scope* (for LiteLLM: the proxy's ``api_url``).
+``invalidate(scope)`` drops the scope's memoized results and detaches its
+in-flight calls: callers already waiting keep their result, later callers
+fetch again, and a fetch that started before the invalidation never stores
+its result. Exceptions are never memoized.
+"""
+
+import asyncio
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+from prometheus_client import Counter
+
+logger = logging.getLogger(__name__)
+
+single_flight_calls_total = Counter(
+    "single_flight_calls_total",
+    "Coalesced reads by outcome: hit (memoized), coalesced (joined an "
+    "in-flight call) or miss (fetched)",
+    ["flight", "operation", "result"],
+)
+
+
+class SingleFlight:
+    """Per-process memo plus in-flight call table, safe to share across loops.
+
+    In-flight calls belong to the event loop that started them; a caller on
+    another loop (e.g. a propagation thread) starts its own. The memo holds
+    plain data and is shared by all of them.
+    """
+
+    def __init__(self, name: str, max_entries: int = 10000):
+        self.name = name
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        # (scope, generation, key) -> (expires_at, value)
+        self._memo: "OrderedDict[tuple, tuple[float, Any]]" = OrderedDict()
+        self._in_flight: dict[tuple, asyncio.Task] = {}
+        self._generations: dict[Hashable, int] = {}
+
+    def _count(self, operation: str, result: str) -> None:
+        single_flight_calls_total.labels(self.name, operation, result).inc()
+
+    def _lookup(self, entry_key: tuple) -> tuple[bool, Any]:
+        with self._lock:
+            cached = self._memo.get(entry_key)
+            if cached is None:
+                return False, None
+            expires_at, value = cached
+            if expires_at <= time.monotonic():
+                del self._memo[entry_key]
+                return False, None
+            self._memo.move_to_end(entry_key)
+            return True, value
+
+    def _store(self, entry_key: tuple, value: Any, ttl_seconds: float) -> None:
+        scope, generation, _ = entry_key
+        with self._lock:
+            if self._generations.get(scope, 0) != generation:
+                # Invalidated while the fetch ran: the result may predate it.
+                return
+            self._memo[entry_key] = (time.monotonic() + ttl_seconds, value)
+            self._memo.move_to_end(entry_key)
+            while len(self._memo) > self._max_entries:
+                self._memo.popitem(last=False)
+
+    async def run(
+        self,
+        scope: Hashable,
+        key: Hashable,
+        fetch: Callable[[], Awaitable[Any]],
+        ttl_seconds: float,
+        operation: str = "",
+    ) -> Any:
+        """Return ``fetch()``'s result for (scope, key), sharing it if possible.
+
+        ``ttl_seconds`` <= 0 still coalesces concurrent calls but memoizes
+        nothing.
+        """
+        with self._lock:
+            generation = self._generations.get(scope, 0)
+        entry_key = (scope, generation, key)
+
+        found, value = self._lookup(entry_key)
+        if found:
+            self._count(operation, "hit")
+            return copy.deepcopy(value)
+
+        loop = asyncio.get_running_loop()
+        flight_key = (id(loop),) + entry_key
+        with self._lock:
+            task = self._in_flight.get(flight_key)
+            if task is not None and (task.done() or task.get_loop() is not loop):
+                task = None
+            if task is None:
+                task = loop.create_task(fetch())
+                self._in_flight[flight_key] = task
+                task.add_done_callback(
+                    lambda done: self._finish(flight_key, entry_key, done, ttl_seconds)
+                )
+                result = "miss"
+            else:
+                result = "coalesced"
+        self._count(operation, result)
+        # A caller that gives up (timeout, disconnect) must not cancel the
+        # call the other callers are waiting on.
+        value = await asyncio.shield(task)
+        return copy.deepcopy(value)
+
+    def _finish(
+        self,
+        flight_key: tuple,
+        entry_key: tuple,
+        task: asyncio.Task,
+        ttl_seconds: float,
+    ) -> None:
+        with self._lock:
+            if self._in_flight.get(flight_key) is task:
+                del self._in_flight[flight_key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        if ttl_seconds > 0:
+            self._store(entry_key, task.result(), ttl_seconds)
+
+    def invalidate(self, scope: Hashable) -> None:
+        """Forget everything memoized or in flight for *scope*."""
+        with self._lock:
+            generation = self._generations.get(scope, 0) + 1
+            self._generations[scope] = generation
+            for entry_key in [k for k in self._memo if k[0] == scope]:
+                del self._memo[entry_key]
+            for flight_key in [k for k in self._in_flight if k[1] == scope]:
+                del self._in_flight[flight_key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memo.clear()
+            self._in_flight.clear()
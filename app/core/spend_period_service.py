@@ -9,6 +9,7 @@ from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.core.team_service import LiteLLMKeyResolver
 from app.db.models import (
     DBPeriodicBudgetLedgerEntry,
     DBPrivateAIKey,
@@ -396,6 +397,8 @@ async def fetch_team_spend_snapshot_for_region(
         .all()
     )
 
+    resolver = LiteLLMKeyResolver(all_region_team_keys)
+
     keys_payload: list[dict[str, Any]] = []
     for litellm_key in team_data.get("keys", []):
         metadata = litellm_key.get("metadata") or {}
@@ -403,12 +406,7 @@ async def fetch_team_spend_snapshot_for_region(
         owner_raw = litellm_key.get("user_id")
         owner_id = int(owner_raw) if str(owner_raw).isdigit() else None
 
-        candidates = list(all_region_team_keys)
-        if key_name:
-            candidates = [k for k in candidates if k.name == key_name]
-        if owner_id is not None:
-            candidates = [k for k in candidates if k.owner_id == owner_id]
-        db_key = candidates[0] if candidates else None
+        db_key = resolver.resolve(litellm_key)
         key_id = db_key.id if db_key else None
 
         keys_payload.append(
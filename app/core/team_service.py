@@ -5,7 +5,7 @@ Team service for centralized team operations including soft-delete and restore.
 import logging
 from collections import defaultdict
 from datetime import UTC, datetime
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, List, Optional
 
 from app.core.config import settings
 from app.core.limit_service import DEFAULT_KEY_DURATION
@@ -18,7 +18,7 @@ from app.db.models import (
     DBUser,
 )
 from app.services.access_groups import effective_team_group_slugs
-from app.services.litellm import LiteLLMService
+from app.services.litellm import KeyUpdate, LiteLLMService, hash_litellm_token
 from sqlalchemy import or_, select
 from sqlalchemy.orm import Session
 
@@ -70,6 +70,88 @@ def get_team_region_litellm_keys(
     return query.all()
 
 
+class LiteLLMKeyResolver:
+    """Map LiteLLM key objects back to their ``DBPrivateAIKey`` rows in memory.
+
+    Spend views list a team's or user's keys from LiteLLM and need the DB key
+    id for each. Querying per key is one round-trip per key, which dominates
+    the response time for teams with hundreds of keys; this loads the
+    candidate rows once and answers every lookup from indexes.
+
+    A key is matched by hashed token first. Otherwise it falls back to the
+    ``amazeeai_private_ai_key_name`` metadata and owner (or ``fallback_team_id``
+    when LiteLLM has no numeric owner), newest key first.
+    """
+
+    def __init__(self, keys: Iterable[DBPrivateAIKey]):
+        self._keys = sorted(keys, key=lambda key: key.id, reverse=True)
+        self._by_token: Dict[str, DBPrivateAIKey] = {}
+        self._by_name: Dict[str, List[DBPrivateAIKey]] = defaultdict(list)
+        for key in self._keys:
+            if key.litellm_token:
+                self._by_token.setdefault(hash_litellm_token(key.litellm_token), key)
+            self._by_name[key.name].append(key)
+
+    @classmethod
+    def for_litellm_keys(
+        cls,
+        db: Session,
+        region_id: int,
+        litellm_keys: Iterable[dict],
+        fallback_team_id: Optional[int] = None,
+    ) -> "LiteLLMKeyResolver":
+        """Load, in one query, every region key that could match ``litellm_keys``."""
+        names: set[str] = set()
+        owner_ids: set[int] = set()
+        unscoped = False
+        for litellm_key in litellm_keys:
+            key_name, owner_id = cls._identity(litellm_key)
+            if key_name:
+                names.add(key_name)
+            elif owner_id is not None:
+                owner_ids.add(owner_id)
+            elif fallback_team_id is None:
+                # Nothing to narrow by, so any key in the region can match.
+                unscoped = True
+
+        query = db.query(DBPrivateAIKey).filter(DBPrivateAIKey.region_id == region_id)
+        if not unscoped:
+            scopes = []
+            if names:
+                scopes.append(DBPrivateAIKey.name.in_(names))
+            if owner_ids:
+                scopes.append(DBPrivateAIKey.owner_id.in_(owner_ids))
+            if fallback_team_id is not None:
+                scopes.append(DBPrivateAIKey.team_id == fallback_team_id)
+            if not scopes:
+                return cls([])
+            query = query.filter(or_(*scopes))
+        return cls(query.all())
+
+    @staticmethod
+    def _identity(litellm_key: dict) -> tuple[Optional[str], Optional[int]]:
+        metadata = litellm_key.get("metadata") or {}
+        key_name = metadata.get("amazeeai_private_ai_key_name")
+        owner_raw = litellm_key.get("user_id")
+        owner_id = int(owner_raw) if owner_raw and str(owner_raw).isdigit() else None
+        return key_name, owner_id
+
+    def resolve(
+        self, litellm_key: dict, fallback_team_id: Optional[int] = None
+    ) -> Optional[DBPrivateAIKey]:
+        token = litellm_key.get("token")
+        if token and token in self._by_token:
+            return self._by_token[token]
+
+        key_name, owner_id = self._identity(litellm_key)
+        candidates = self._by_name.get(key_name, []) if key_name else self._keys
+        if owner_id is not None:
+            candidates = [key for key in candidates if key.owner_id == owner_id]
+        elif fallback_team_id is not None:
+            candidates = [key for key in candidates if key.team_id == fallback_team_id]
+        return candidates[0] if candidates else None
+
+
 def get_team_keys_by_region(
     db: Session, team_id: int
 ) -> Dict[DBRegion, List[DBPrivateAIKey]]:
@@ -508,22 +590,32 @@ async def propagate_team_budget_to_keys(
                     f"Failed to update team {team_id} budget in region {region_obj.name}: {str(team_error)}"
                 )
 
-            if update_key_limits and apply_to_keys:
-                # Update each key's budget via LiteLLM.
-                for key in keys:
-                    try:
-                        await litellm_service.update_budget(
-                            litellm_token=key.litellm_token,
-                            budget_duration=budget_duration,
-                            budget_amount=budget_amount,
+            if update_key_limits and apply_to_keys and keys:
+                # Same fields update_budget sends: the new budget, and a fresh
+                # 365d duration.
+                results = await litellm_service.bulk_update_keys(
+                    [
+                        KeyUpdate(
+                            key.litellm_token,
+                            {
+                                "budget_duration": budget_duration,
+                                "duration": "365d",
+                                "max_budget": budget_amount,
+                            },
+                            key_id=key.id,
                         )
+                        for key in keys
+                    ]
+                )
+                for result in results:
+                    if result.ok:
                         logger.info(
-                            f"Updated key {key.id} budget to {budget_amount} in LiteLLM after team budget limit change"
+                            f"Updated key {result.key_id} budget to {budget_amount} in LiteLLM after team budget limit change"
                         )
-                    except Exception as key_error:
-                        errors.append(f"Key {key.id}: {str(key_error)}")
+                    else:
+                        errors.append(f"Key {result.key_id}: {result.error}")
                         logger.error(
-                            f"Failed to update key {key.id} budget in LiteLLM: {str(key_error)}"
+                            f"Failed to update key {result.key_id} budget in LiteLLM: {result.error}"
                         )
     except Exception as propagation_error:
         errors.append(str(propagation_error))
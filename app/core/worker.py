@@ -1,9 +1,10 @@
 import asyncio
 import os
+from dataclasses import dataclass
 from datetime import UTC, datetime, timedelta
-from functools import partial
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy import select, func, and_, or_, update as sa_update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from app.db.models import (
     DBTeam,
     DBAuditLog,
@@ -23,6 +24,8 @@ from app.db.models import (
     DBUserAdminRegion,
     DBSpendCap,
     DBUserSpendCache,
+    DBRegionKeySnapshot,
+    DBRegionKeySnapshotState,
 )
 from app.core.trial_cleanup import (
     LiveTrialRegionError,
@@ -32,7 +35,15 @@ from app.core.trial_cleanup import (
 )
 from app.db.postgres import PostgresManager
 from app.schemas.models import BudgetType
-from app.services.litellm import LiteLLMService, hash_litellm_token
+from app.services.litellm import (
+    INFERENCE_ONLY_ROUTES,
+    KEY_UPDATE_APPLIED,
+    KeyUpdate,
+    LiteLLMService,
+    hash_litellm_token,
+    parse_litellm_timestamp,
+)
+from app.services.sales_teams import refresh_sales_team_rows
 from app.services.ses import SESService
 from app.core.team_service import (
     get_team_keys_by_region,
@@ -61,7 +72,7 @@ from app.services.stripe import (
     INVOICE_FAILURE_EVENTS,
 )
 from prometheus_client import Gauge, Counter, Summary
-from typing import Awaitable, Callable, Dict, List, Optional
+from typing import Callable, Dict, List, Optional
 from app.core.security import create_access_token
 from app.core.config import settings
 from urllib.parse import urljoin
@@ -129,6 +140,12 @@ region_key_snapshot_keys = Gauge(
     ["region_name"],
 )
 
+region_key_snapshot_refresh_total = Counter(
+    "region_key_snapshot_refresh_total",
+    "Total number of region key snapshot refreshes, by region and mode (full/delta)",
+    ["region_name", "mode"],
+)
+
 key_state_fallback_total = Counter(
     "key_state_fallback_total",
     "Total number of keys that fell back to a per-key /key/info lookup",
@@ -141,9 +158,19 @@ key_write_failed_total = Counter(
     ["region_name"],
 )
 
-# Concurrent per-key LiteLLM writes during reconciliation. Bounds load on the
-# proxy while keeping the daily expiry run off the ~34 minute sequential path.
-KEY_WRITE_CONCURRENCY = max(1, int(os.getenv("KEY_WRITE_CONCURRENCY", "10")))
+key_write_applied_total = Counter(
+    "key_write_applied_total",
+    "Total number of per-key LiteLLM writes applied during reconciliation",
+    ["region_name"],
+)
+
+# At steady state nearly every key lands here: its LiteLLM state already
+# matches what reconciliation wants, so no write is sent.
+key_write_skipped_total = Counter(
+    "key_write_skipped_total",
+    "Total number of keys reconciliation left alone because they had not drifted",
+    ["region_name"],
+)
 
 # Queued writes are flushed once this many pile up, rather than only at the end
 # of a region. Without a cap, an expiring key stays usable until every key in
@@ -151,6 +178,24 @@ KEY_WRITE_CONCURRENCY = max(1, int(os.getenv("KEY_WRITE_CONCURRENCY", "10")))
 # costs a round-trip, so that wait grows with the region's key count.
 KEY_WRITE_BATCH = max(1, int(os.getenv("KEY_WRITE_BATCH", "500")))
 
+# Persisted key snapshots: a region is re-listed in full at least this often
+# (the only way deleted keys leave the snapshot); in between, runs fetch only
+# keys LiteLLM updated since the stored watermark, minus an overlap that
+# absorbs clock skew between LiteLLM's writes and its batched spend updates.
+REGION_KEY_FULL_SWEEP_HOURS = max(
+    1, int(os.getenv("REGION_KEY_FULL_SWEEP_HOURS", "24"))
+)
+REGION_KEY_DELTA_OVERLAP_SECONDS = max(
+    0, int(os.getenv("REGION_KEY_DELTA_OVERLAP_SECONDS", "300"))
+)
+REGION_KEY_SNAPSHOT_WRITE_BATCH = 1000
+
+# Teams monitor_teams processes at once, each on its own DB session. Per-team
+# work is dominated by LiteLLM and Stripe round-trips, so running them
+# concurrently is what keeps a full run inside its hourly window. Connections
+# come from the shared pool: keep this below DB_POOL_SIZE + DB_MAX_OVERFLOW.
+MONITOR_TEAMS_CONCURRENCY = max(1, int(os.getenv("MONITOR_TEAMS_CONCURRENCY", "8")))
+
 # Retention metrics
 team_retention_warning_sent_total = Counter(
     "team_retention_warning_sent_total",
@@ -1238,7 +1283,7 @@ async def _sync_periodic_ledger_for_period(
             api_url=region.litellm_api_url, api_key=region.litellm_api_key
         )
         lite_team_id = LiteLLMService.format_team_id(region.name, team.id)
-        team_info_resp = await litellm_service.get_team_info(lite_team_id)
+        team_info_resp = await litellm_service.get_team_info(lite_team_id, fresh=True)
         team_info = team_info_resp.get("team_info", team_info_resp)
         snapshot_total_spend = float(team_info.get("spend", 0.0) or 0.0)
     except Exception:
@@ -1315,7 +1360,7 @@ async def reconcile_periodic_team_budget_drift(
         api_url=region.litellm_api_url, api_key=region.litellm_api_key
     )
     lite_team_id = LiteLLMService.format_team_id(region.name, team.id)
-    team_info_resp = await service.get_team_info(lite_team_id)
+    team_info_resp = await service.get_team_info(lite_team_id, fresh=True)
     team_info = team_info_resp.get("team_info", team_info_resp)
     current_spend = float(team_info.get("spend", 0.0) or 0.0)
     actual_max_budget = float(team_info.get("max_budget", 0.0) or 0.0)
@@ -1400,7 +1445,9 @@ async def apply_billing_cycle_for_team(
         team_max_budget = per_region_budget
         current_team_spend = 0.0
         try:
-            team_info_resp = await litellm_service.get_team_info(lite_team_id)
+            team_info_resp = await litellm_service.get_team_info(
+                lite_team_id, fresh=True
+            )
             team_info = team_info_resp.get("team_info", team_info_resp)
             current_team_spend = float(team_info.get("spend", 0.0) or 0.0)
 
@@ -1801,29 +1848,54 @@ class RegionKeyStateCache:
     team in it. Fetching per team would re-paginate the same region up to 1.1k
     times and be far worse than the per-key loop it replaces.
 
+    Given a session factory, snapshots are also persisted in
+    ``region_key_snapshots`` and later runs only fetch the keys LiteLLM changed
+    since the stored watermark, falling back to a full listing every
+    ``REGION_KEY_FULL_SWEEP_HOURS`` (which is also what drops deleted keys) or
+    whenever the delta listing fails. Without one every run is a full listing.
+    Each refresh commits on a session of its own, never on the caller's.
+
     A failed snapshot is cached as an empty mapping so one broken region is
     retried once per run, not once per team.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self, session_factory: Optional[Callable[[], Session]] = None
+    ) -> None:
+        self._session_factory = session_factory
         self._snapshots: Dict[int, Dict[str, dict]] = {}
+        self._locks: Dict[int, asyncio.Lock] = defaultdict(asyncio.Lock)
 
     async def get(
         self, region: DBRegion, litellm_service: LiteLLMService
     ) -> Dict[str, dict]:
         if region.id in self._snapshots:
             return self._snapshots[region.id]
-
+        # Concurrent teams in the same region wait for one listing rather than
+        # each starting their own.
+        async with self._locks[region.id]:
+            if region.id not in self._snapshots:
+                self._snapshots[region.id] = await self._fetch(region, litellm_service)
+        return self._snapshots[region.id]
+
+    async def _fetch(
+        self, region: DBRegion, litellm_service: LiteLLMService
+    ) -> Dict[str, dict]:
         snapshot: Dict[str, dict] = {}
         try:
-            listed = await litellm_service.list_all_keys()
-            # Guard the shape rather than trusting it: anything other than a
-            # mapping must degrade to the per-key path instead of being indexed
-            # into and yielding nonsense spend values.
-            if not isinstance(listed, dict):
-                raise TypeError(
-                    f"expected dict from list_all_keys, got {type(listed).__name__}"
-                )
+            if self._session_factory is not None:
+                db = self._session_factory()
+                try:
+                    listed = await self._refresh_persisted(
+                        db, region, litellm_service
+                    )
+                finally:
+                    db.close()
+            else:
+                listed = await self._list_all(litellm_service)
+                region_key_snapshot_refresh_total.labels(
+                    region_name=region.name, mode="full"
+                ).inc()
             snapshot = listed
             region_key_snapshot_keys.labels(region_name=region.name).set(len(snapshot))
         except Exception as e:
@@ -1837,16 +1909,235 @@ class RegionKeyStateCache:
                 str(e),
             )
             snapshot = {}
-
-        self._snapshots[region.id] = snapshot
         return snapshot
 
+    @staticmethod
+    async def _list_all(litellm_service: LiteLLMService) -> Dict[str, dict]:
+        listed = await litellm_service.list_all_keys()
+        # Guard the shape rather than trusting it: anything other than a
+        # mapping must degrade to the per-key path instead of being indexed
+        # into and yielding nonsense spend values.
+        if not isinstance(listed, dict):
+            raise TypeError(
+                f"expected dict from list_all_keys, got {type(listed).__name__}"
+            )
+        return listed
+
+    async def _refresh_persisted(
+        self, db: Session, region: DBRegion, litellm_service: LiteLLMService
+    ) -> Dict[str, dict]:
+        now = datetime.now(UTC)
+        state = db.get(DBRegionKeySnapshotState, region.id)
+
+        if (
+            state is not None
+            and state.watermark is not None
+            and state.last_full_sweep_at is not None
+            and now - state.last_full_sweep_at
+            < timedelta(hours=REGION_KEY_FULL_SWEEP_HOURS)
+        ):
+            since = state.watermark - timedelta(
+                seconds=REGION_KEY_DELTA_OVERLAP_SECONDS
+            )
+            try:
+                changed = await litellm_service.list_keys_updated_since(since)
+                if not isinstance(changed, dict):
+                    raise TypeError(
+                        "expected dict from list_keys_updated_since, got "
+                        f"{type(changed).__name__}"
+                    )
+            except Exception as e:
+                logger.warning(
+                    "Delta key snapshot failed for region %s, doing a full "
+                    "listing instead: %s",
+                    region.name,
+                    str(e),
+                )
+            else:
+                self._upsert_rows(db, region.id, changed, now)
+                state.watermark = self._watermark(changed, state.watermark)
+                state.last_refresh_at = now
+                # Committed straight away: sharded runs refreshing the same
+                # region would otherwise wait on these row locks until the
+                # other run finishes.
+                db.commit()
+                region_key_snapshot_refresh_total.labels(
+                    region_name=region.name, mode="delta"
+                ).inc()
+                rows = db.query(
+                    DBRegionKeySnapshot.token, DBRegionKeySnapshot.key_data
+                ).filter(DBRegionKeySnapshot.region_id == region.id)
+                return {token: key_data for token, key_data in rows}
+
+        listed = await self._list_all(litellm_service)
+        db.query(DBRegionKeySnapshot).filter(
+            DBRegionKeySnapshot.region_id == region.id
+        ).delete(synchronize_session=False)
+        self._upsert_rows(db, region.id, listed, now)
+        values = {
+            "watermark": self._watermark(listed, None),
+            "last_full_sweep_at": now,
+            "last_refresh_at": now,
+        }
+        db.execute(
+            pg_insert(DBRegionKeySnapshotState)
+            .values(region_id=region.id, **values)
+            .on_conflict_do_update(
+                index_elements=[DBRegionKeySnapshotState.region_id], set_=values
+            )
+        )
+        db.commit()
+        region_key_snapshot_refresh_total.labels(
+            region_name=region.name, mode="full"
+        ).inc()
+        return listed
+
+    @staticmethod
+    def _upsert_rows(
+        db: Session, region_id: int, keys: Dict[str, dict], captured_at: datetime
+    ) -> None:
+        rows = [
+            {
+                "region_id": region_id,
+                "token": token,
+                "key_data": key_data,
+                "litellm_updated_at": parse_litellm_timestamp(
+                    key_data.get("updated_at")
+                ),
+                "captured_at": captured_at,
+            }
+            for token, key_data in keys.items()
+        ]
+        for start in range(0, len(rows), REGION_KEY_SNAPSHOT_WRITE_BATCH):
+            stmt = pg_insert(DBRegionKeySnapshot).values(
+                rows[start : start + REGION_KEY_SNAPSHOT_WRITE_BATCH]
+            )
+            db.execute(
+                stmt.on_conflict_do_update(
+                    index_elements=[
+                        DBRegionKeySnapshot.region_id,
+                        DBRegionKeySnapshot.token,
+                    ],
+                    set_={
+                        "key_data": stmt.excluded.key_data,
+                        "litellm_updated_at": stmt.excluded.litellm_updated_at,
+                        "captured_at": stmt.excluded.captured_at,
+                    },
+                )
+            )
+
+    @staticmethod
+    def _watermark(
+        keys: Dict[str, dict], current: Optional[datetime]
+    ) -> Optional[datetime]:
+        """Newest LiteLLM ``updated_at`` seen, never moving backwards.
+
+        ``None`` when LiteLLM reports no timestamps at all, which keeps the
+        region on full listings.
+        """
+        stamps = [
+            stamp
+            for stamp in (
+                parse_litellm_timestamp(key_data.get("updated_at"))
+                for key_data in keys.values()
+            )
+            if stamp is not None
+        ]
+        if current is not None:
+            stamps.append(current)
+        return max(stamps) if stamps else None
+
+
+@dataclass(frozen=True)
+class DesiredKeyState:
+    """What reconciliation wants a key to look like in LiteLLM.
+
+    ``None`` leaves a field to whoever else manages it. :meth:`diff` compares
+    each field with the key's current state and returns only the ones that
+    differ, as ``/key/update`` fields, so a key that has not drifted costs no
+    write.
+
+    Blocking and a key's ``models`` are not covered: the purchase and budget
+    flows own ``blocked``, and keys inherit their models from the team
+    (``all-team-models``), so reconciliation has nothing to hold them to.
+    """
+
+    # The key must be expired; nothing else is maintained on an expired key.
+    expired: bool = False
+    max_budget: Optional[float] = None
+    # Reset period for keys that have none (or a "0d" one left by an expiry).
+    # A key with another period keeps it.
+    budget_duration: Optional[str] = None
+    allowed_routes: Optional[tuple] = None
+    # A key expiring before this is extended by ``extend_duration``.
+    expires_not_before: Optional[datetime] = None
+    extend_duration: str = "365d"
+
+    def diff(self, current: dict, now: datetime) -> dict:
+        expires = parse_litellm_timestamp(current.get("expires"))
+        if self.expired:
+            if expires is not None and expires <= now:
+                return {}
+            return {"duration": "0d"}
+
+        fields = {}
+        if self.max_budget is not None and current.get("max_budget") != self.max_budget:
+            fields["max_budget"] = self.max_budget
+        if self.budget_duration is not None and current.get("budget_duration") in (
+            None,
+            "0d",
+        ):
+            fields["budget_duration"] = self.budget_duration
+        wanted = self.allowed_routes
+        # Only compared when the state carries the field; an older proxy that
+        # omits it would otherwise be rewritten on every run.
+        if (
+            wanted is not None
+            and "allowed_routes" in current
+            and sorted(current["allowed_routes"] or []) != sorted(wanted)
+        ):
+            fields["allowed_routes"] = list(wanted)
+        if (
+            self.expires_not_before is not None
+            and expires is not None
+            and expires <= self.expires_not_before
+        ):
+            fields["duration"] = self.extend_duration
+        return fields
+
+
+def desired_key_state(
+    team: DBTeam,
+    expire_keys: bool,
+    renewal_period_days: Optional[int],
+    max_budget_amount: Optional[float],
+    now: datetime,
+) -> DesiredKeyState:
+    """The state every key of ``team`` should be in after reconciliation."""
+    if expire_keys:
+        return DesiredKeyState(expired=True)
+    return DesiredKeyState(
+        max_budget=max_budget_amount,
+        budget_duration=(
+            f"{renewal_period_days}d" if renewal_period_days is not None else None
+        ),
+        # Trial keys are shared by strangers and must stay inference-only.
+        allowed_routes=(
+            tuple(INFERENCE_ONLY_ROUTES) if is_anonymous_trial_team(team) else None
+        ),
+        expires_not_before=(
+            now + timedelta(days=30) if renewal_period_days is not None else None
+        ),
+    )
+
 
 async def _run_key_writes(
-    pending_writes: list[tuple[int, Callable[[], Awaitable[None]]]],
+    litellm_service: LiteLLMService,
+    pending_writes: list[KeyUpdate],
     region_name: str,
+    snapshot: Optional[Dict[str, dict]] = None,
 ) -> int:
-    """Run queued per-key LiteLLM writes concurrently, bounded by a semaphore.
+    """Apply queued per-key LiteLLM writes through ``bulk_update_keys``.
 
     Returns the number that failed. A failing write is logged and counted but
     never aborts the region, matching the previous per-key behaviour.
@@ -1854,30 +2145,30 @@ async def _run_key_writes(
     if not pending_writes:
         return 0
 
-    semaphore = asyncio.Semaphore(KEY_WRITE_CONCURRENCY)
-
-    async def _run(key_id: int, write: Callable[[], Awaitable[None]]) -> Optional[str]:
-        try:
-            async with semaphore:
-                await write()
-            return None
-        except Exception as exc:
-            return f"Key {key_id}: {str(exc)}"
-
-    errors = [
-        error
-        for error in await asyncio.gather(
-            *[_run(key_id, write) for key_id, write in pending_writes]
-        )
-        if error is not None
-    ]
+    try:
+        results = await litellm_service.bulk_update_keys(
+            pending_writes, snapshot=snapshot
+        )
+        errors = [
+            f"Key {result.key_id}: {result.error}"
+            for result in results
+            if not result.ok
+        ]
+        applied = sum(1 for result in results if result.status == KEY_UPDATE_APPLIED)
+    except Exception as exc:
+        errors = [f"Key {write.key_id}: {str(exc)}" for write in pending_writes]
+        applied = 0
+    skipped = len(pending_writes) - len(errors) - applied
     for error in errors:
         logger.error("Key write failed in region %s: %s", region_name, error)
     if errors:
         key_write_failed_total.labels(region_name=region_name).inc(len(errors))
+    key_write_applied_total.labels(region_name=region_name).inc(applied)
+    if skipped:
+        key_write_skipped_total.labels(region_name=region_name).inc(skipped)
     logger.info(
         "Applied %d key write(s) in region %s (%d failed)",
-        len(pending_writes) - len(errors),
+        applied,
         region_name,
         len(errors),
     )
@@ -1920,9 +2211,9 @@ async def reconcile_team_keys(
     Monitor spend for all keys in a team across different regions and optionally update keys after renewal period.
 
     Key state is read from a bulk ``/key/list`` snapshot rather than one
-    ``/key/info`` call per key. Every key is still visited and every existing
-    budget/duration/expiry correction still applies - only the reads are
-    batched, and writes are issued exactly as before for keys that drifted.
+    ``/key/info`` call per key. Each key is diffed against the team's
+    :class:`DesiredKeyState` and written only when a field actually differs,
+    so a run over keys that have not drifted issues no writes.
 
     Args:
         team: The team to monitor keys for
@@ -1943,6 +2234,9 @@ async def reconcile_team_keys(
     total_by_user = defaultdict(float)
     service_key_total = 0
     current_time = datetime.now(UTC)
+    desired = desired_key_state(
+        team, expire_keys, renewal_period_days, max_budget_amount, current_time
+    )
 
     # Monitor keys for each region
     for region, keys in keys_by_region.items():
@@ -1959,7 +2253,7 @@ async def reconcile_team_keys(
             # KEY_WRITE_BATCH. Issuing them inline costs one round-trip per key,
             # which is ~34 minutes for the 11.5k-key trial team on the daily
             # expiry run.
-            pending_writes: list[tuple[int, Callable[[], Awaitable[None]]]] = []
+            pending_writes: list[KeyUpdate] = []
 
             # Check spend for each key in this region
             for key in keys:
@@ -1987,122 +2281,20 @@ async def reconcile_team_keys(
                     else:
                         service_key_total += current_spend
 
-                    if expire_keys:
+                    # Only fields that differ from the key's current state
+                    # are sent. The snapshot can be minutes old, so a write
+                    # that also carried unchanged fields could overwrite a
+                    # change made after it was taken.
+                    fields = desired.diff(info, current_time)
+                    if fields:
                         logger.info(
-                            f"Key {key.id} expiring, setting duration to 0 days"
+                            f"Key {key.id} drifted from its desired state, queueing update of {sorted(fields)}"
                         )
                         pending_writes.append(
-                            (
-                                key.id,
-                                partial(
-                                    litellm_service.update_key_duration,
-                                    key.litellm_token,
-                                    "0d",
-                                ),
-                            )
+                            KeyUpdate(key.litellm_token, fields, key_id=key.id)
                         )
                     else:
-                        # Each drifted field is tracked on its own so the write
-                        # carries only what actually drifted. Reads come from a
-                        # snapshot that can be minutes old, so a write that also
-                        # sends unrelated fields could overwrite a change made
-                        # after the snapshot was taken.
-                        needs_update = False
-                        new_budget_amount: Optional[float] = None
-                        new_budget_duration: Optional[str] = None
-                        extend_key_life = False
-
-                        current_max_budget = info.get("max_budget")
-                        # If the budget amount mis-matches, always update that field
-                        if (
-                            max_budget_amount is not None
-                            and current_max_budget != max_budget_amount
-                        ):
-                            new_budget_amount = max_budget_amount
-                            needs_update = True
-                            logger.info(
-                                f"Key {key.id} has incorrect budget of {current_max_budget}, will change to {max_budget_amount}"
-                            )
-
-                        current_budget_duration = info.get("budget_duration")
-                        # If budget_duration is None, always update it
-                        if (
-                            current_budget_duration is None
-                            and renewal_period_days is not None
-                        ):
-                            new_budget_duration = f"{renewal_period_days}d"
-                            needs_update = True
-                            logger.info(
-                                f"Key {key.id} budget update triggered by None budget_duration"
-                            )
-                        # If budget_duration is "0d", always update it (fix for expired keys)
-                        elif (
-                            current_budget_duration == "0d"
-                            and renewal_period_days is not None
-                        ):
-                            new_budget_duration = f"{renewal_period_days}d"
-                            needs_update = True
-                            logger.info(
-                                f"Key {key.id} budget update triggered by 0d duration (expired key fix)"
-                            )
-
-                        expiry_date = info.get("expires")
-                        if expiry_date and renewal_period_days is not None:
-                            parsed_expiry_date = datetime.fromisoformat(
-                                expiry_date.replace("Z", "+00:00")
-                            )
-                            this_month = current_time + timedelta(days=30)
-                            if parsed_expiry_date <= this_month:
-                                new_budget_duration = f"{renewal_period_days}d"
-                                extend_key_life = True
-                                needs_update = True
-                                logger.info(
-                                    f"Key {key.id} expires at {expiry_date}, updating to extend life."
-                                )
-
-                        if needs_update:
-                            logger.info(
-                                f"Key {key.id} budget update triggered: changing from {current_budget_duration}, {current_max_budget} to {new_budget_duration or current_budget_duration}, {max_budget_amount}"
-                            )
-
-                            if extend_key_life:
-                                # update_budget also resets the key's duration to
-                                # 365d, which is the whole point when the key is
-                                # close to expiring. budget_duration is always set
-                                # on this path, so nothing is sent as null.
-                                pending_writes.append(
-                                    (
-                                        key.id,
-                                        partial(
-                                            litellm_service.update_budget,
-                                            key.litellm_token,
-                                            new_budget_duration,
-                                            budget_amount=new_budget_amount,
-                                        ),
-                                    )
-                                )
-                            else:
-                                # Budget-only drift: leave duration/expiry alone and
-                                # send no field we did not mean to change. LiteLLM
-                                # reads a null budget_duration as "clear it", so
-                                # passing None here would wipe the reset period and
-                                # the next run would write it back - a flap.
-                                pending_writes.append(
-                                    (
-                                        key.id,
-                                        partial(
-                                            litellm_service.update_key_budget,
-                                            key.litellm_token,
-                                            budget_duration=new_budget_duration,
-                                            max_budget=new_budget_amount,
-                                        ),
-                                    )
-                                )
-                            logger.info(f"Queued key {key.id} budget update")
-                        else:
-                            logger.info(
-                                f"Key {key.id} budget settings already match the expected values, no update needed"
-                            )
+                        key_write_skipped_total.labels(region_name=region.name).inc()
 
                     # Add to team total
                     team_total += current_spend
@@ -2137,11 +2329,15 @@ async def reconcile_team_keys(
                 # Flush early so an expiring key does not stay usable until the
                 # whole region has been read.
                 if len(pending_writes) >= KEY_WRITE_BATCH:
-                    await _run_key_writes(pending_writes, region.name)
+                    await _run_key_writes(
+                        litellm_service, pending_writes, region.name, snapshot
+                    )
                     pending_writes = []
 
             # Execute any writes left over from the last partial batch
-            await _run_key_writes(pending_writes, region.name)
+            await _run_key_writes(
+                litellm_service, pending_writes, region.name, snapshot
+            )
 
         except Exception as e:
             logger.error(
@@ -2577,23 +2773,251 @@ async def reconcile_team_product_associations(db: Session, team: DBTeam):
         raise e
 
 
+def _record_team_monitoring_failure(team_id: int, team_name: str, error: Exception):
+    logger.error(
+        f"Unable to process team {team_id} due to {str(error)}, continuing with next team."
+    )
+    # Record the monitoring failure metric
+    error_type = type(error).__name__
+    team_monitoring_failed_metric.labels(
+        team_id=str(team_id), team_name=team_name, error_type=error_type
+    ).inc()
+
+
+async def _monitor_team(
+    db: Session,
+    team: DBTeam,
+    current_time: datetime,
+    ses_service: Optional[SESService],
+    limit_service: LimitService,
+    key_state_cache: RegionKeyStateCache,
+) -> None:
+    """Run one team through the ``monitor_teams`` checks. Errors propagate."""
+    # Reconcile product associations with Stripe, skipping only purchase-gated
+    # POOL teams which follow a separate purchase-gated lifecycle.
+    if not team.requires_pool_purchase_gate:
+        await reconcile_team_product_associations(db, team)
+
+    # Check if team has any products
+    has_products = (
+        db.query(DBTeamProduct).filter(DBTeamProduct.team_id == team.id).first()
+        is not None
+    )
+
+    # Check team retention policy first (soft-delete handles key expiration internally)
+    await _check_team_retention_policy(db, team, current_time, ses_service)
+
+    # Now handle trial expiry notifications and key expiry (after retention checks)
+    is_pool_team = team.budget_type == BudgetType.POOL
+
+    # Check if team was monitored within 24 hours
+    should_send_notifications = settings.ENABLE_LIMITS
+    if team.last_monitored:
+        hours_since_monitored = (
+            current_time - team.last_monitored.replace(tzinfo=UTC)
+        ).total_seconds() / 3600
+        should_send_notifications = hours_since_monitored >= 24
+
+    # Always compute freshness to emit team_freshness_days metrics for all teams.
+    # POOL teams have their own lifecycle and are excluded from trial notifications.
+    team_freshness = _monitor_team_freshness(team, db)
+    days_remaining = TRIAL_OVER_DAYS - team_freshness
+    if not is_pool_team and not is_anonymous_trial_team(team):
+        _send_expiry_notification(
+            db,
+            team,
+            has_products,
+            should_send_notifications,
+            days_remaining,
+            ses_service,
+        )
+
+    # Get all keys for the team grouped by region
+    keys_by_region = get_team_keys_by_region(db, team.id)
+    expire_keys = False
+
+    # Expire if team trial has expired (if team has a product, expiry will be handled by Stripe)
+    # POOL teams are always exempt from trial expiration.
+    #
+    # The anonymous-trial team is exempt too. Its freshness ran
+    # out long ago and never renews, so leaving it in scope expires
+    # every trial key in every region on each run. Per-user budget
+    # limits are enforced separately by monitor_trial_users.
+    #
+    # Note the two unrelated meanings of "trial" here:
+    # days_remaining is a real member's 30-day trial.
+    if (
+        not has_products
+        and not is_pool_team
+        and not is_anonymous_trial_team(team)
+        and days_remaining <= 0
+        and should_send_notifications
+    ):
+        logger.info(
+            f"Team {team.id} has {days_remaining} days remaining, expiring keys"
+        )
+        expire_keys = True
+
+    # Determine if we should check for renewal period updates
+    renewal_period_days = None
+    max_budget_amount = None
+    if has_products and team.last_payment:
+        # Get budget from active limits (source of truth)
+        team_limits = limit_service.get_team_limits(team)
+        budget_limit = next(
+            (limit for limit in team_limits if limit.resource == ResourceType.BUDGET),
+            None,
+        )
+        if budget_limit and not team.requires_pool_purchase_gate:
+            max_budget_amount = budget_limit.max_value
+
+        # Get the product with the longest renewal period (renewal period not stored in limits)
+        active_products = (
+            db.query(DBTeamProduct).filter(DBTeamProduct.team_id == team.id).all()
+        )
+        product_ids = [tp.product_id for tp in active_products]
+        products = db.query(DBProduct).filter(DBProduct.id.in_(product_ids)).all()
+
+        if products:
+            max_renewal_product = max(
+                products, key=lambda product: product.renewal_period_days
+            )
+            renewal_period_days = max_renewal_product.renewal_period_days
+
+    # Monitor keys and get total spend (includes renewal period updates if applicable)
+    team_total = await reconcile_team_keys(
+        db,
+        team,
+        keys_by_region,
+        expire_keys,
+        renewal_period_days,
+        max_budget_amount,
+        key_state_cache=key_state_cache,
+    )
+
+    # Set the total spend metric for the team (always emit metrics)
+    team_total_spend.labels(team_id=str(team.id), team_name=team.name).set(team_total)
+
+    # Update or create team metrics record
+    regions_list = list(keys_by_region.keys())
+    region_names = [region.name for region in regions_list]
+
+    # Check if metrics record exists
+    team_metrics = (
+        db.query(DBTeamMetrics).filter(DBTeamMetrics.team_id == team.id).first()
+    )
+
+    if team_metrics:
+        logger.info(
+            f"metrics last updated at {team_metrics.last_updated}, curent time is {current_time}"
+        )
+        # Update existing metrics
+        team_metrics.total_spend = team_total
+        team_metrics.last_spend_calculation = current_time
+        team_metrics.regions = region_names
+        team_metrics.last_updated = current_time
+    else:
+        # Create new metrics record
+        team_metrics = DBTeamMetrics(
+            team_id=team.id,
+            total_spend=team_total,
+            last_spend_calculation=current_time,
+            regions=region_names,
+            last_updated=current_time,
+        )
+        db.add(team_metrics)
+
+    # Ensure all limits are correct - will not override MANUAL limits
+    set_team_and_user_limits(db, team)
+
+    # Update last_monitored timestamp only if notifications were sent
+    if should_send_notifications:
+        team.last_monitored = current_time
+
+
+async def _monitor_teams_concurrently(
+    db: Session,
+    teams: List[DBTeam],
+    current_time: datetime,
+    ses_service: Optional[SESService],
+    key_state_cache: RegionKeyStateCache,
+) -> None:
+    """Monitor ``teams`` with ``MONITOR_TEAMS_CONCURRENCY`` concurrent workers.
+
+    A Session is not safe to share between coroutines that interleave at every
+    LiteLLM/Stripe await, so each worker opens its own on the same engine and
+    commits after every team. A failing team is rolled back on its own
+    instead of sitting in one transaction with every other team's changes.
+    """
+    session_factory = sessionmaker(
+        autocommit=False, autoflush=False, bind=db.get_bind()
+    )
+    pending: asyncio.Queue = asyncio.Queue()
+    for team in teams:
+        pending.put_nowait((team.id, team.name))
+
+    async def _worker() -> None:
+        worker_db = session_factory()
+        limit_service = LimitService(worker_db)
+        try:
+            while True:
+                try:
+                    team_id, team_name = pending.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
+                try:
+                    team = worker_db.get(DBTeam, team_id)
+                    if team is None:
+                        continue
+                    await _monitor_team(
+                        worker_db,
+                        team,
+                        current_time,
+                        ses_service,
+                        limit_service,
+                        key_state_cache,
+                    )
+                    worker_db.commit()
+                except Exception as error:
+                    worker_db.rollback()
+                    _record_team_monitoring_failure(team_id, team_name, error)
+                finally:
+                    # Workers see hundreds of teams; don't keep them all mapped.
+                    worker_db.expunge_all()
+        finally:
+            worker_db.close()
+
+    await asyncio.gather(
+        *[_worker() for _ in range(min(MONITOR_TEAMS_CONCURRENCY, len(teams)))]
+    )
+
+
 @monitor_teams_duration.time()
-async def monitor_teams(db: Session):
+async def monitor_teams(db: Session, shard_index: int = 0, shard_count: int = 1):
     """
     Daily monitoring task for teams that:
     1. Posts age metrics for teams (since creation for teams without products, since last payment for teams with products)
     2. Sends notifications for teams approaching expiration (25-30 days)
     3. Posts metrics for expired teams (>30 days)
     4. Monitors key spend and notifies if approaching limits
+
+    With ``shard_count`` > 1 only teams where ``team.id % shard_count ==
+    shard_index`` are processed, so the run can be split across several
+    processes. Teams are processed ``MONITOR_TEAMS_CONCURRENCY`` at a time.
     """
-    logger.info("Monitoring teams")
+    if not 0 <= shard_index < shard_count:
+        raise ValueError(f"Invalid monitor_teams shard {shard_index} of {shard_count}")
+    logger.info("Monitoring teams (shard %d of %d)", shard_index, shard_count)
     try:
         # Get all non-deleted teams
-        teams = db.query(DBTeam).filter(DBTeam.deleted_at.is_(None)).all()
+        teams_query = db.query(DBTeam).filter(DBTeam.deleted_at.is_(None))
+        if shard_count > 1:
+            teams_query = teams_query.filter(DBTeam.id % shard_count == shard_index)
+        teams = teams_query.all()
         current_time = datetime.now(UTC)
 
         # Track current active team labels
-        current_team_labels = set()
+        current_team_labels = {(str(team.id), team.name) for team in teams}
         try:
             # Initialize SES service
             ses_service = SESService()
@@ -2602,181 +3026,41 @@ async def monitor_teams(db: Session):
             ses_service = None
 
         logger.info(f"Found {len(teams)} teams to track")
-        limit_service = LimitService(db)
-        # Shared across every team so each region is bulk-listed once per run
-        key_state_cache = RegionKeyStateCache()
-        for team in teams:
-            try:
-                team_label = (str(team.id), team.name)
-                current_team_labels.add(team_label)
-
-                # Reconcile product associations with Stripe, skipping only purchase-gated
-                # POOL teams which follow a separate purchase-gated lifecycle.
-                if not team.requires_pool_purchase_gate:
-                    await reconcile_team_product_associations(db, team)
-
-                # Check if team has any products
-                has_products = (
-                    db.query(DBTeamProduct)
-                    .filter(DBTeamProduct.team_id == team.id)
-                    .first()
-                    is not None
-                )
-
-                # Check team retention policy first (soft-delete handles key expiration internally)
-                await _check_team_retention_policy(db, team, current_time, ses_service)
-
-                # Now handle trial expiry notifications and key expiry (after retention checks)
-                is_pool_team = team.budget_type == BudgetType.POOL
-
-                # Check if team was monitored within 24 hours
-                should_send_notifications = settings.ENABLE_LIMITS
-                if team.last_monitored:
-                    hours_since_monitored = (
-                        current_time - team.last_monitored.replace(tzinfo=UTC)
-                    ).total_seconds() / 3600
-                    should_send_notifications = hours_since_monitored >= 24
-
-                # Always compute freshness to emit team_freshness_days metrics for all teams.
-                # POOL teams have their own lifecycle and are excluded from trial notifications.
-                team_freshness = _monitor_team_freshness(team, db)
-                days_remaining = TRIAL_OVER_DAYS - team_freshness
-                if not is_pool_team and not is_anonymous_trial_team(team):
-                    _send_expiry_notification(
+        # Shared across every team so each region is bulk-listed once per run;
+        # backed by the persisted snapshot so most runs only fetch a delta.
+        key_state_cache = RegionKeyStateCache(
+            sessionmaker(autocommit=False, autoflush=False, bind=db.get_bind())
+        )
+        if MONITOR_TEAMS_CONCURRENCY > 1 and len(teams) > 1:
+            await _monitor_teams_concurrently(
+                db, teams, current_time, ses_service, key_state_cache
+            )
+        else:
+            limit_service = LimitService(db)
+            for team in teams:
+                try:
+                    await _monitor_team(
                         db,
                         team,
-                        has_products,
-                        should_send_notifications,
-                        days_remaining,
+                        current_time,
                         ses_service,
+                        limit_service,
+                        key_state_cache,
                     )
-
-                # Get all keys for the team grouped by region
-                keys_by_region = get_team_keys_by_region(db, team.id)
-                expire_keys = False
-
-                # Expire if team trial has expired (if team has a product, expiry will be handled by Stripe)
-                # POOL teams are always exempt from trial expiration.
-                #
-                # The anonymous-trial team is exempt too. Its freshness ran
-                # out long ago and never renews, so leaving it in scope expires
-                # every trial key in every region on each run. Per-user budget
-                # limits are enforced separately by monitor_trial_users.
-                #
-                # Note the two unrelated meanings of "trial" here:
-                # days_remaining is a real member's 30-day trial.
-                if (
-                    not has_products
-                    and not is_pool_team
-                    and not is_anonymous_trial_team(team)
-                    and days_remaining <= 0
-                    and should_send_notifications
-                ):
-                    logger.info(
-                        f"Team {team.id} has {days_remaining} days remaining, expiring keys"
-                    )
-                    expire_keys = True
-
-                # Determine if we should check for renewal period updates
-                renewal_period_days = None
-                max_budget_amount = None
-                if has_products and team.last_payment:
-                    # Get budget from active limits (source of truth)
-                    team_limits = limit_service.get_team_limits(team)
-                    budget_limit = next(
-                        (
-                            limit
-                            for limit in team_limits
-                            if limit.resource == ResourceType.BUDGET
-                        ),
-                        None,
-                    )
-                    if budget_limit and not team.requires_pool_purchase_gate:
-                        max_budget_amount = budget_limit.max_value
-
-                    # Get the product with the longest renewal period (renewal period not stored in limits)
-                    active_products = (
-                        db.query(DBTeamProduct)
-                        .filter(DBTeamProduct.team_id == team.id)
-                        .all()
-                    )
-                    product_ids = [tp.product_id for tp in active_products]
-                    products = (
-                        db.query(DBProduct).filter(DBProduct.id.in_(product_ids)).all()
-                    )
-
-                    if products:
-                        max_renewal_product = max(
-                            products, key=lambda product: product.renewal_period_days
-                        )
-                        renewal_period_days = max_renewal_product.renewal_period_days
-
-                # Monitor keys and get total spend (includes renewal period updates if applicable)
-                team_total = await reconcile_team_keys(
-                    db,
-                    team,
-                    keys_by_region,
-                    expire_keys,
-                    renewal_period_days,
-                    max_budget_amount,
-                    key_state_cache=key_state_cache,
-                )
-
-                # Set the total spend metric for the team (always emit metrics)
-                team_total_spend.labels(team_id=str(team.id), team_name=team.name).set(
-                    team_total
-                )
-
-                # Update or create team metrics record
-                regions_list = list(keys_by_region.keys())
-                region_names = [region.name for region in regions_list]
-
-                # Check if metrics record exists
-                team_metrics = (
-                    db.query(DBTeamMetrics)
-                    .filter(DBTeamMetrics.team_id == team.id)
-                    .first()
-                )
-
-                if team_metrics:
-                    logger.info(
-                        f"metrics last updated at {team_metrics.last_updated}, curent time is {current_time}"
-                    )
-                    # Update existing metrics
-                    team_metrics.total_spend = team_total
-                    team_metrics.last_spend_calculation = current_time
-                    team_metrics.regions = region_names
-                    team_metrics.last_updated = current_time
-                else:
-                    # Create new metrics record
-                    team_metrics = DBTeamMetrics(
-                        team_id=team.id,
-                        total_spend=team_total,
-                        last_spend_calculation=current_time,
-                        regions=region_names,
-                        last_updated=current_time,
-                    )
-                    db.add(team_metrics)
-
-                # Ensure all limits are correct - will not override MANUAL limits
-                set_team_and_user_limits(db, team)
-
-                # Update last_monitored timestamp only if notifications were sent
-                if should_send_notifications:
-                    team.last_monitored = current_time
-            except Exception as error:
-                logger.error(
-                    f"Unable to process team {team.id} due to {str(error)}, continuing with next team."
-                )
-                # Record the monitoring failure metric
-                error_type = type(error).__name__
-                team_monitoring_failed_metric.labels(
-                    team_id=str(team.id), team_name=team.name, error_type=error_type
-                ).inc()
+                except Exception as error:
+                    _record_team_monitoring_failure(team.id, team.name, error)
 
         # Commit the database changes
         db.commit()
 
+        # The sales dashboard reads precomputed rows; rebuild them with the
+        # spend measured above.
+        try:
+            refresh_sales_team_rows(db)
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error refreshing sales team rows: {str(e)}")
+
         # Zero out metrics for teams that are no longer active
         for old_label in active_team_labels - current_team_labels:
             team_freshness_days.labels(
@@ -1,4 +1,6 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 from app.core.config import settings
 
@@ -15,9 +17,44 @@ SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+def async_database_url(url: str) -> str:
+    """The asyncpg form of a postgresql:// (or +psycopg2) DATABASE_URL."""
+    parsed = make_url(url)
+    query = dict(parsed.query)
+    # libpq's sslmode is spelled ssl by asyncpg
+    if "sslmode" in query:
+        query["ssl"] = query.pop("sslmode")
+    return parsed.set(drivername="postgresql+asyncpg", query=query).render_as_string(
+        hide_password=False
+    )
+
+
+# Async route handlers use this engine so their queries do not block the
+# event loop that also serves the LiteLLM fan-out. The sync engine above stays
+# for sync handlers, background threads, scripts and Alembic.
+async_engine = create_async_engine(
+    async_database_url(settings.DATABASE_URL),
+    pool_size=settings.DB_ASYNC_POOL_SIZE,
+    max_overflow=settings.DB_ASYNC_MAX_OVERFLOW,
+    pool_pre_ping=True,
+    pool_recycle=3600,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+)
+# Objects stay readable after commit: response models are built from them
+# after the handler returns, where an async session cannot lazy-load.
+AsyncSessionLocal = async_sessionmaker(
+    async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
+
 def get_db():
     db = SessionLocal()
     try:
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
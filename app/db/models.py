@@ -12,6 +12,8 @@ from sqlalchemy import (
     Date,
     Text,
     text,
+    DDL,
+    event,
 )
 from sqlalchemy.orm import relationship, declarative_base
 from datetime import datetime, UTC
@@ -172,6 +174,15 @@ class DBUser(Base):
     audit_logs = relationship("DBAuditLog", back_populates="user")
     admin_regions = relationship("DBUserAdminRegion", back_populates="user")
 
+    __table_args__ = (
+        # Email in its lookup form (app/core/email.py), which is how the
+        # /users/spend cache invalidation finds a user's team.
+        Index(
+            "ix_users_normalized_email",
+            func.regexp_replace(func.lower(email), r"\+[^@]*@", "@"),
+        ),
+    )
+
 
 class DBTeam(Base):
     __tablename__ = "teams"
@@ -288,6 +299,36 @@ class DBTeamMetrics(Base):
     team = relationship("DBTeam", back_populates="metrics")
 
 
+class DBSalesTeamRow(Base):
+    """
+    One precomputed sales dashboard row per team, rebuilt in a single statement
+    by app/services/sales_teams.py (after each monitor_teams run, and by the
+    refresh-sales-team-rows cron once older than SALES_TEAM_ROWS_MAX_AGE_SECONDS).
+    /teams/sales/list-teams pages, sorts and filters this table instead of
+    assembling rows per team.
+    """
+
+    __tablename__ = "sales_team_rows"
+
+    team_id = Column(
+        Integer, ForeignKey("teams.id", ondelete="CASCADE"), primary_key=True
+    )
+    name = Column(String, nullable=True)
+    admin_email = Column(String, nullable=True)
+    created_at = Column(DateTime(timezone=True), nullable=True)
+    last_payment = Column(DateTime(timezone=True), nullable=True)
+    is_always_free = Column(Boolean, nullable=False, default=False)
+    budget_type = Column(String, nullable=False)
+    # [{"id", "name", "active"}] for the team's active products
+    products = Column(JSON, nullable=False)
+    product_count = Column(Integer, nullable=False, default=0)
+    regions = Column(JSON, nullable=False)  # List of region names
+    total_spend = Column(Float, nullable=False, default=0.0)
+    # team_metrics.last_updated: when monitor_teams last measured the spend
+    metrics_updated_at = Column(DateTime(timezone=True), nullable=True)
+    refreshed_at = Column(DateTime(timezone=True), nullable=False)
+
+
 class DBPoolPurchase(Base):
     """
     Stores pool budget purchases for teams.
@@ -462,11 +503,23 @@ class DBPrivateAIKey(Base):
 
 
 class DBAuditLog(Base):
+    """One row per audited request or event.
+
+    Range-partitioned by month on ``timestamp`` (see
+    app/services/audit_log_partitions.py), so the primary key has to include
+    it. Rows outside every monthly partition land in audit_logs_default.
+    """
+
     __tablename__ = "audit_logs"
+    __table_args__ = {"postgresql_partition_by": "RANGE (timestamp)"}
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
     timestamp = Column(
-        DateTime, nullable=False, default=lambda: datetime.now(UTC), index=True
+        DateTime,
+        primary_key=True,
+        nullable=False,
+        default=lambda: datetime.now(UTC),
+        index=True,
     )
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True, index=True)
     event_type = Column(String, nullable=False, index=True)
@@ -485,6 +538,13 @@ class DBAuditLog(Base):
     user = relationship("DBUser", back_populates="audit_logs")
 
 
+event.listen(
+    DBAuditLog.__table__,
+    "after_create",
+    DDL("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT"),
+)
+
+
 class DBSystemSecret(Base):
     __tablename__ = "system_secrets"
 
@@ -507,6 +567,74 @@ class DBUserSpendCache(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), nullable=True)
 
 
+class DBRegionKeySnapshot(Base):
+    """Last known LiteLLM state of one key, as returned by ``/key/list``.
+
+    Persisted so the hourly reconciliation can refresh a region from the keys
+    LiteLLM changed since the previous run instead of re-listing every key.
+    ``token`` is LiteLLM's hashed token, the same key the in-memory snapshot
+    uses.
+    """
+
+    __tablename__ = "region_key_snapshots"
+
+    region_id = Column(
+        Integer, ForeignKey("regions.id", ondelete="CASCADE"), primary_key=True
+    )
+    token = Column(String, primary_key=True)
+    key_data = Column(JSON, nullable=False)
+    # LiteLLM's own updated_at for the key; the max across a region is the
+    # watermark for the next delta refresh.
+    litellm_updated_at = Column(DateTime(timezone=True), nullable=True)
+    captured_at = Column(DateTime(timezone=True), default=func.now(), nullable=False)
+
+
+class DBRegionKeySnapshotState(Base):
+    """Refresh bookkeeping for a region's persisted key snapshot."""
+
+    __tablename__ = "region_key_snapshot_state"
+
+    region_id = Column(
+        Integer, ForeignKey("regions.id", ondelete="CASCADE"), primary_key=True
+    )
+    watermark = Column(DateTime(timezone=True), nullable=True)
+    last_full_sweep_at = Column(DateTime(timezone=True), nullable=True)
+    last_refresh_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class DBJob(Base):
+    """A unit of background work, claimed by workers in app/core/job_queue.py.
+
+    At most one *pending* job exists per ``dedupe_key``; enqueueing another
+    replaces its payload instead of adding a row. Finished jobs are deleted,
+    so the table only holds pending, running and failed work.
+    """
+
+    __tablename__ = "jobs"
+
+    id = Column(Integer, primary_key=True)
+    kind = Column(String, nullable=False)
+    dedupe_key = Column(String, nullable=True)
+    payload = Column(JSON, nullable=False)
+    status = Column(String, nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False)
+    run_at = Column(DateTime(timezone=True), nullable=False, default=func.now())
+    locked_at = Column(DateTime(timezone=True), nullable=True)
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_jobs_status_run_at", "status", "run_at"),
+        Index(
+            "uq_jobs_pending_dedupe_key",
+            "dedupe_key",
+            unique=True,
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
+
+
 class DBProduct(Base):
     __tablename__ = "products"
 
@@ -808,6 +936,95 @@ class DBBudgetAlertState(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), nullable=True)
 
 
+class DBBudgetAlertOutbox(Base):
+    """A budget alert event waiting to be (or already) posted to the webhook.
+
+    The sweep inserts the event and advances ``budget_alert_state`` in one
+    transaction, so a detected crossing is never lost and never queued twice:
+    ``event_id`` is unique and re-queueing it is a no-op. The delivery worker
+    (app/services/budget_alert_webhook.py) sends due rows and reschedules
+    failures with backoff; ``next_attempt_at`` doubles as its claim lease.
+    """
+
+    __tablename__ = "budget_alert_outbox"
+
+    id = Column(Integer, primary_key=True)
+    event_id = Column(String, unique=True, nullable=False)
+    subject_key = Column(String, nullable=False)
+    region_id = Column(Integer, nullable=False)
+    # The serialized event exactly as it goes on the wire
+    payload = Column(JSON, nullable=False)
+    # pending | delivered | failed
+    status = Column(String, nullable=False, default="pending")
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime(timezone=True), nullable=False, default=func.now())
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime(timezone=True), default=func.now(), nullable=False)
+    delivered_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index(
+            "ix_budget_alert_outbox_status_next_attempt_at",
+            "status",
+            "next_attempt_at",
+        ),
+    )
+
+
+class DBBudgetAlertSpendDay(Base):
+    """One day of LiteLLM spend for a team or key, as last read by the sweep.
+
+    A local copy of ``/team/daily/activity`` so the budget threshold sweep can
+    fetch only the last few days on each tick and compare them with what it
+    saw before: only teams whose rows changed are re-evaluated, and their
+    windowed spend is summed from here. ``kind`` is "entity" (``litellm_id``
+    is LiteLLM's team id) or "key" (``litellm_id`` is the hashed token).
+    """
+
+    __tablename__ = "budget_alert_spend_days"
+
+    id = Column(Integer, primary_key=True)
+    region_id = Column(
+        Integer, ForeignKey("regions.id", ondelete="CASCADE"), nullable=False
+    )
+    kind = Column(String, nullable=False)
+    litellm_id = Column(String, nullable=False)
+    day = Column(Date, nullable=False)
+    spend = Column(Float, nullable=False, default=0.0)
+
+    __table_args__ = (
+        UniqueConstraint(
+            "region_id",
+            "kind",
+            "litellm_id",
+            "day",
+            name="uq_budget_alert_spend_days_region_kind_id_day",
+        ),
+        Index("ix_budget_alert_spend_days_region_day", "region_id", "day"),
+    )
+
+
+class DBBudgetAlertActivityCursor(Base):
+    """How far the budget threshold sweep has read a region's daily activity.
+
+    ``budget_alert_spend_days`` is complete from ``covered_from`` onwards, and
+    ``last_seen_day`` is the newest day LiteLLM had a row for. ``full_sweep_at``
+    is the last time the whole window was read again from LiteLLM.
+    """
+
+    __tablename__ = "budget_alert_activity_cursors"
+
+    region_id = Column(
+        Integer, ForeignKey("regions.id", ondelete="CASCADE"), primary_key=True
+    )
+    covered_from = Column(Date, nullable=False)
+    last_seen_day = Column(Date, nullable=False)
+    full_sweep_at = Column(DateTime(timezone=True), nullable=False)
+    updated_at = Column(
+        DateTime(timezone=True), default=func.now(), onupdate=func.now()
+    )
+
+
 class DBDisposableDomain(Base):
     """Blocklist of disposable / dynamic-DNS email domains (trial-account abuse
     protection, moad #620). Populated by the daily refresh cron from a committed
@@ -969,9 +1186,14 @@ class DBTeamGroupSyncRun(Base):
     status = Column(String, default="running", nullable=False)  # running | done | failed
     total = Column(Integer, default=0, nullable=False)
     done = Column(Integer, default=0, nullable=False)
+    # Of `done`, teams whose LiteLLM models already matched (no write sent)
+    skipped = Column(Integer, default=0, server_default="0", nullable=False)
     failed_team_ids = Column(JSON, nullable=True)
+    # Teams handled so far; an interrupted run resumes after them
+    done_team_ids = Column(JSON, nullable=True)
     error_sample = Column(String, nullable=True)
     started_at = Column(DateTime(timezone=True), default=func.now(), nullable=False)
+    heartbeat_at = Column(DateTime(timezone=True), nullable=True)
     finished_at = Column(DateTime(timezone=True), nullable=True)
 
     region = relationship("DBRegion")
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 import os
 from contextlib import asynccontextmanager
@@ -26,10 +27,18 @@ from app.api import (
     webhooks,
 )
 from app.core.config import settings
-from app.middleware.audit import AuditLogMiddleware
+from app.core.job_queue import job_worker_pool
+from app.core.principal_cache import api_token_usage
+from app.db.database import async_engine
+from app.middleware.audit import AuditLogMiddleware, audit_log_writer
 from app.middleware.auth import AuthMiddleware
 from app.middleware.caching import CacheControlMiddleware
 from app.middleware.prometheus import PrometheusMiddleware
+from app.services.access_groups import run_team_group_sync_resumer
+from app.services.litellm import litellm_client_pool
+
+# Importing the modules that own the work registers their job handlers.
+import app.services.budget_alert_webhook  # noqa: F401
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
@@ -39,7 +48,8 @@ from fastapi.openapi.docs import (
 )
 from fastapi.openapi.utils import get_openapi
 from prometheus_fastapi_instrumentator import Instrumentator, metrics
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 # Set timezone environment variable to prevent tzlocal warning
 if not os.environ.get("TZ"):
@@ -53,16 +63,47 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-class HTTPSRedirectMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request, call_next):
-        if request.headers.get("X-Forwarded-Proto") == "https":
-            request.scope["scheme"] = "https"
-        return await call_next(request)
+class HTTPSRedirectMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] == "http" and (
+            Headers(scope=scope).get("X-Forwarded-Proto") == "https"
+        ):
+            scope["scheme"] = "https"
+        await self.app(scope, receive, send)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    yield
+    # One keep-alive connection pool per regional LiteLLM proxy for the life of
+    # the process, instead of a TCP+TLS handshake on every LiteLLM call.
+    async with litellm_client_pool():
+        # Request audit rows are queued and bulk-inserted in the background;
+        # draining on shutdown keeps the tail of the queue from being lost.
+        await audit_log_writer.start()
+        # Rebuilds the /public/models caches before they expire, so requests
+        # are served from memory instead of waiting on every region.
+        models_refresher = asyncio.create_task(public.run_public_models_refresher())
+        # Background jobs (budget propagation, ...) unless a separate worker
+        # deployment runs them (JOB_QUEUE_WORKERS=0).
+        await job_worker_pool.start()
+        # Picks up team access-group fan-out runs cut off by a restart.
+        sync_resumer = None
+        if settings.TEAM_GROUP_SYNC_RESUME_INTERVAL_SECONDS > 0:
+            sync_resumer = asyncio.create_task(run_team_group_sync_resumer())
+        try:
+            yield
+        finally:
+            models_refresher.cancel()
+            if sync_resumer:
+                sync_resumer.cancel()
+            await job_worker_pool.stop()
+            await audit_log_writer.stop()
+            await asyncio.to_thread(api_token_usage.flush)
+            # asyncpg connections belong to this event loop
+            await async_engine.dispose()
 
 
 app = FastAPI(
@@ -162,7 +203,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
-    expose_headers=["X-Total-Count"],
+    expose_headers=["X-Total-Count", "X-Next-Cursor"],
 )
 
 # Add trusted host middleware
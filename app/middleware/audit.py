@@ -1,10 +1,22 @@
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from sqlalchemy import insert
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 from app.db.models import DBAuditLog
 from app.db.database import get_db
-from app.middleware.prometheus import audit_events_total, audit_event_duration_seconds
+from app.middleware.prometheus import (
+    audit_events_total,
+    audit_event_duration_seconds,
+    audit_log_flush_duration_seconds,
+    audit_log_queue_depth,
+    audit_log_queue_full_total,
+    audit_log_rows_written_total,
+    audit_log_write_failed_total,
+)
+import asyncio
 import logging
 import time
+from datetime import UTC, datetime
+from typing import Optional
 from urllib.parse import urlparse, urlunparse
 from app.core.config import settings
 
@@ -35,31 +47,174 @@ def sanitize_referer(value: str | None) -> str | None:
     return value[:MAX_HEADER_URL_LENGTH]
 
 
-class AuditLogMiddleware(BaseHTTPMiddleware):
-    def __init__(self, app):
-        super().__init__(app)
+def _write_audit_rows(rows: list[dict]) -> None:
+    """Insert audit rows in one statement on a fresh session.
 
-    async def dispatch(self, request: Request, call_next):
+    A list of parameter sets runs as a batched multi-row INSERT rather than a
+    round-trip per row.
+    """
+    db = next(get_db())
+    try:
+        db.execute(insert(DBAuditLog), rows)
+        db.commit()
+    finally:
+        db.close()
+
+
+class AuditLogWriter:
+    """In-process queue of audit rows, bulk-inserted by a background task.
+
+    Inserting and committing inline cost every audited request a DB round-trip,
+    run on the event loop. Requests now enqueue a row and return; the flusher
+    writes whatever has accumulated every ``flush_interval_ms`` or
+    ``batch_size`` rows, in a worker thread.
+
+    The queue is bounded. When it is full the request writes its own row in a
+    thread, so a slow database pushes back on requests instead of growing the
+    queue or dropping rows. ``stop`` drains the queue before returning. While
+    the writer is not running (scripts, tests without the app lifespan),
+    ``submit`` returns False and the caller writes synchronously.
+    """
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        flush_interval_ms: int = settings.AUDIT_LOG_FLUSH_INTERVAL_MS,
+        batch_size: int = settings.AUDIT_LOG_BATCH_SIZE,
+        queue_size: int = settings.AUDIT_LOG_QUEUE_SIZE,
+    ):
+        self.flush_interval = max(1, flush_interval_ms) / 1000
+        self.batch_size = max(1, batch_size)
+        self.queue_size = max(1, queue_size)
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.queue_size)
+        self._task = asyncio.create_task(self._run(self._queue))
+
+    async def stop(self) -> None:
+        """Flush everything queued so far, then stop the flusher."""
+        if not self.running:
+            return
+        queue, task = self._queue, self._task
+        # New rows go the synchronous way from here on; the sentinel lands
+        # behind every row already queued.
+        self._queue = None
+        await queue.put(self._STOP)
+        await task
+        self._task = None
+        audit_log_queue_depth.set(0)
+
+    async def submit(self, row: dict) -> bool:
+        """Queue ``row`` for the flusher. False when the writer is not running."""
+        queue = self._queue
+        if queue is None or not self.running:
+            return False
+        try:
+            queue.put_nowait(row)
+        except asyncio.QueueFull:
+            audit_log_queue_full_total.inc()
+            await asyncio.to_thread(self._write, [row])
+        else:
+            audit_log_queue_depth.set(queue.qsize())
+        return True
+
+    async def _run(self, queue: asyncio.Queue) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            item = await queue.get()
+            if item is self._STOP:
+                break
+            batch = [item]
+            deadline = loop.time() + self.flush_interval
+            while len(batch) < self.batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is self._STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            audit_log_queue_depth.set(queue.qsize())
+            await asyncio.to_thread(self._write, batch)
+
+    @staticmethod
+    def _write(rows: list[dict]) -> None:
+        start = time.perf_counter()
+        try:
+            _write_audit_rows(rows)
+            audit_log_rows_written_total.inc(len(rows))
+        except Exception as e:
+            if len(rows) == 1:
+                audit_log_write_failed_total.inc()
+                logger.error(f"Failed to create audit log: {str(e)}", exc_info=True)
+                return
+            # One bad row (e.g. a user deleted before the flush, failing the
+            # foreign key) must not take the rest of the batch with it.
+            logger.warning(
+                f"Bulk insert of {len(rows)} audit logs failed, retrying row by "
+                f"row: {str(e)}"
+            )
+            for row in rows:
+                AuditLogWriter._write([row])
+        finally:
+            audit_log_flush_duration_seconds.observe(time.perf_counter() - start)
+
+
+# Started and drained by the app lifespan (app.main).
+audit_log_writer = AuditLogWriter()
+
+
+class AuditLogMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
         # Skip audit logging for certain paths
         if request.url.path in {*settings.PUBLIC_PATHS, "/audit/logs", "/auth/me"}:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         start_time = time.time()
+        # Shared with AuthMiddleware, which sets the user on it
+        state = request.state
+        status_code = None
+
+        async def send_and_capture_status(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
 
         # Get the response
-        response = await call_next(request)
+        await self.app(scope, receive, send_and_capture_status)
 
         try:
-            # Get a fresh database session for each request
-            db = next(get_db())
-
             # Get user_id from request state (set by AuthMiddleware)
             user_id = None
-            if hasattr(request.state, "user") and request.state.user:
-                if isinstance(request.state.user, dict):
-                    user_id = request.state.user.get("id")
+            if hasattr(state, "user") and state.user:
+                if isinstance(state.user, dict):
+                    user_id = state.user.get("id")
                 else:
-                    user_id = request.state.user.id
+                    user_id = state.user.id
 
             # Extract path parameters
             path_params = request.path_params
@@ -83,33 +238,35 @@ class AuditLogMiddleware(BaseHTTPMiddleware):
             resource_type = request.url.path.split("/")[1]  # First path segment
 
             # Create audit log entry
-            audit_log = DBAuditLog(
-                user_id=user_id,
-                event_type=request.method,
-                resource_type=resource_type,
-                resource_id=str(resource_id) if resource_id else None,
-                action=f"{request.method} {request.url.path}",
-                details={
+            audit_row = {
+                # Stamped now, not when the flusher gets to it.
+                "timestamp": datetime.now(UTC),
+                "user_id": user_id,
+                "event_type": request.method,
+                "resource_type": resource_type,
+                "resource_id": str(resource_id) if resource_id else None,
+                "action": f"{request.method} {request.url.path}",
+                "details": {
                     "path": request.url.path,
                     "query_params": dict(request.query_params),
-                    "status_code": response.status_code,
+                    "status_code": status_code,
                 },
-                ip_address=request.client.host if request.client else None,
-                user_agent=request.headers.get("user-agent"),
-                request_source=request_source,
-                referer=sanitize_referer(referer),
-                origin=sanitize_referer(origin),
-            )
+                "ip_address": request.client.host if request.client else None,
+                "user_agent": request.headers.get("user-agent"),
+                "request_source": request_source,
+                "referer": sanitize_referer(referer),
+                "origin": sanitize_referer(origin),
+            }
 
-            db.add(audit_log)
-            db.commit()
+            if not await audit_log_writer.submit(audit_row):
+                _write_audit_rows([audit_row])
 
             # Record audit metrics
             audit_events_total.labels(
                 event_type=request.method,
                 resource_type=resource_type,
                 request_source=request_source or "unknown",
-                status_code=response.status_code,
+                status_code=status_code,
             ).inc()
 
             # Record audit event duration
@@ -122,8 +279,3 @@ class AuditLogMiddleware(BaseHTTPMiddleware):
             logger.error(f"Failed to create audit log: {str(e)}", exc_info=True)
             # Don't re-raise the exception - we don't want to break the request if audit logging fails
             pass
-        finally:
-            if "db" in locals():
-                db.close()
-
-        return response
@@ -1,6 +1,9 @@
-from fastapi import Request
+import asyncio
+
 from fastapi.responses import JSONResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
+from app.core.principal_cache import api_token_usage, principal_cache
 from app.core.security import get_current_user_from_auth
 from app.db.database import get_db
 import logging
@@ -9,11 +12,20 @@ from app.core.config import settings
 logger = logging.getLogger(__name__)
 
 
-class AuthMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
+class AuthMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
         # Skip auth for certain paths
         if request.url.path in settings.PUBLIC_PATHS:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Check Bearer token for /metrics endpoint
         if request.url.path == "/metrics":
@@ -25,7 +37,8 @@ class AuthMiddleware(BaseHTTPMiddleware):
                     settings.PROMETHEUS_API_KEY
                     and bearer_token == settings.PROMETHEUS_API_KEY
                 ):
-                    return await call_next(request)
+                    await self.app(scope, receive, send)
+                    return
                 else:
                     logger.info("Metrics Bearer token validation failed")
             else:
@@ -34,7 +47,9 @@ class AuthMiddleware(BaseHTTPMiddleware):
                 )
 
             # If no valid Bearer token, return 404
-            return JSONResponse(status_code=404, content={"detail": "Not Found"})
+            response = JSONResponse(status_code=404, content={"detail": "Not Found"})
+            await response(scope, receive, send)
+            return
 
         # Initialize user as None
         request.state.user = None
@@ -51,7 +66,13 @@ class AuthMiddleware(BaseHTTPMiddleware):
                 if len(parts) == 2 and parts[0].lower() == "bearer":
                     access_token = parts[1]
 
-            if access_token:
+            cached = principal_cache.get(access_token) if access_token else None
+            if cached is not None:
+                # Validated recently; no session needed to identify the caller
+                request.state.user = cached.as_state()
+                if cached.api_token_id is not None:
+                    api_token_usage.record(cached.api_token_id)
+            elif access_token:
                 # Get a fresh database session
                 db = next(get_db())
                 try:
@@ -75,4 +96,6 @@ class AuthMiddleware(BaseHTTPMiddleware):
         except Exception as e:
             logger.debug(f"Error in auth middleware: {str(e)}")
 
-        return await call_next(request)
+        await self.app(scope, receive, send)
+        if api_token_usage.due():
+            await asyncio.to_thread(api_token_usage.flush)
@@ -1,37 +1,54 @@
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.datastructures import MutableHeaders
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 
-class CacheControlMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        response = await call_next(request)
+class CacheControlMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
 
-        # Public models endpoint is intentionally cacheable for 1 hour on success.
-        # When the response includes user-specific dedicated regions, use "private"
-        # to prevent CDNs/proxies from caching per-team data.
-        if request.url.path in {"/public/models", "/public/models/"}:
-            if response.status_code < 400:
-                is_authenticated = getattr(
-                    request.state, "_public_models_is_authenticated", False
-                )
-                if is_authenticated:
-                    response.headers["Cache-Control"] = "private, max-age=3600"
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
+        # Touch state before the endpoint runs so the flag it sets lands in the
+        # dict this middleware reads.
+        state = request.state
+
+        async def send_with_headers(message: Message):
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                status_code = message["status"]
+
+                # Public models endpoint is intentionally cacheable for 1 hour on success.
+                # When the response includes user-specific dedicated regions, use "private"
+                # to prevent CDNs/proxies from caching per-team data.
+                if request.url.path in {"/public/models", "/public/models/"}:
+                    if status_code < 400:
+                        is_authenticated = getattr(
+                            state, "_public_models_is_authenticated", False
+                        )
+                        if is_authenticated:
+                            headers["Cache-Control"] = "private, max-age=3600"
+                        else:
+                            headers["Cache-Control"] = "public, max-age=3600"
+                    else:
+                        headers["Cache-Control"] = "no-store"
                 else:
-                    response.headers["Cache-Control"] = "public, max-age=3600"
-            else:
-                response.headers["Cache-Control"] = "no-store"
-        else:
-            # Add Cache-Control headers to all responses to prevent caching of sensitive data
-            response.headers["Cache-Control"] = (
-                "no-store, no-cache, must-revalidate, private"
-            )
-
-        # Add security headers to all responses
-        response.headers["X-Frame-Options"] = "DENY"
-        response.headers["X-Content-Type-Options"] = "nosniff"
-        response.headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
-        response.headers["Permissions-Policy"] = (
-            "geolocation=(), microphone=(), camera=()"
-        )
-
-        return response
+                    # Add Cache-Control headers to all responses to prevent caching of sensitive data
+                    headers["Cache-Control"] = (
+                        "no-store, no-cache, must-revalidate, private"
+                    )
+
+                # Add security headers to all responses
+                headers["X-Frame-Options"] = "DENY"
+                headers["X-Content-Type-Options"] = "nosniff"
+                headers["Referrer-Policy"] = "strict-origin-when-cross-origin"
+                headers["Permissions-Policy"] = (
+                    "geolocation=(), microphone=(), camera=()"
+                )
+            await send(message)
+
+        await self.app(scope, receive, send_with_headers)
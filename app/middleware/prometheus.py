@@ -1,6 +1,6 @@
-from prometheus_client import Counter, Histogram
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from prometheus_client import Counter, Gauge, Histogram
+from starlette.requests import Request
+from starlette.types import ASGIApp, Receive, Scope, Send
 import logging
 from app.core.config import settings
 
@@ -28,6 +28,34 @@ audit_event_duration_seconds = Histogram(
     buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 2.0, 5.0, float("inf")),
 )
 
+# Audit writer metrics: queue depth and overflow show when the background
+# flusher is falling behind request volume.
+audit_log_queue_depth = Gauge(
+    "audit_log_queue_depth",
+    "Audit log rows waiting for the background flusher",
+)
+
+audit_log_queue_full_total = Counter(
+    "audit_log_queue_full_total",
+    "Audit log rows written synchronously because the queue was full",
+)
+
+audit_log_rows_written_total = Counter(
+    "audit_log_rows_written_total",
+    "Audit log rows bulk-inserted by the background flusher",
+)
+
+audit_log_write_failed_total = Counter(
+    "audit_log_write_failed_total",
+    "Audit log rows lost to failed inserts",
+)
+
+audit_log_flush_duration_seconds = Histogram(
+    "audit_log_flush_duration_seconds",
+    "Duration of one audit log bulk insert in seconds",
+    buckets=(0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, float("inf")),
+)
+
 # User Metrics - grouped by user type and endpoint
 requests_by_user_type = Counter(
     "requests_by_user_type",
@@ -43,15 +71,25 @@ auth_requests_total = Counter(
 )
 
 
-class PrometheusMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
+class PrometheusMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request = Request(scope)
         # Skip metrics for certain paths
         if request.url.path in settings.PUBLIC_PATHS:
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Skip processing for the /metrics endpoint itself
         if request.url.path == "/metrics":
-            return await call_next(request)
+            await self.app(scope, receive, send)
+            return
 
         # Track auth requests for specific endpoints
         is_auth_endpoint = request.url.path in [
@@ -62,7 +100,10 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
             "/auth/generate-trial-access",
         ]
 
-        response = await call_next(request)
+        # Shared with AuthMiddleware, which sets the user on it
+        state = request.state
+
+        await self.app(scope, receive, send)
 
         if is_auth_endpoint:
             auth_requests_total.labels(
@@ -71,13 +112,11 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
 
         # Get user type from request state (set by AuthMiddleware)
         user_type = "anonymous"
-        if hasattr(request.state, "user") and request.state.user:
+        if hasattr(state, "user") and state.user:
             # Group users by their role or type
-            if hasattr(request.state.user, "role"):
-                user_type = request.state.user.role
-            elif (
-                hasattr(request.state.user, "is_admin") and request.state.user.is_admin
-            ):
+            if hasattr(state.user, "role"):
+                user_type = state.user.role
+            elif hasattr(state.user, "is_admin") and state.user.is_admin:
                 user_type = "system_admin"
             else:
                 user_type = "authenticated"
@@ -87,5 +126,3 @@ class PrometheusMiddleware(BaseHTTPMiddleware):
         requests_by_user_type.labels(
             user_type=user_type, endpoint=normalized_path, method=request.method
         ).inc()
-
-        return response
@@ -0,0 +1,48 @@
+"""add region_key_snapshots and region_key_snapshot_state tables
+
+Revision ID: f1a2b3c4d5e6
+Revises: e8f9a0b1c2d3
+Create Date: 2026-08-01 09:00:00.000000+00:00
+
+"""
+
+from typing import Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic (read via module reflection).
+revision: str = "f1a2b3c4d5e6"
+down_revision: Union[str, None] = "e8f9a0b1c2d3"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "region_key_snapshots",
+        sa.Column("region_id", sa.Integer(), nullable=False),
+        sa.Column("token", sa.String(), nullable=False),
+        sa.Column("key_data", sa.JSON(), nullable=False),
+        sa.Column("litellm_updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "captured_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["region_id"], ["regions.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("region_id", "token"),
+    )
+    op.create_table(
+        "region_key_snapshot_state",
+        sa.Column("region_id", sa.Integer(), nullable=False),
+        sa.Column("watermark", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_full_sweep_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_refresh_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["region_id"], ["regions.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("region_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("region_key_snapshot_state")
+    op.drop_table("region_key_snapshots")
@@ -0,0 +1,41 @@
+"""add sales_team_rows table
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-16 10:00:00.000000+00:00
+
+"""
+
+from typing import Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic (read via module reflection).
+revision: str = "b8c9d0e1f2a3"
+down_revision: Union[str, None] = "a7b8c9d0e1f2"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sales_team_rows",
+        sa.Column("team_id", sa.Integer(), nullable=False),
+        sa.Column("name", sa.String(), nullable=True),
+        sa.Column("admin_email", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("last_payment", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("is_always_free", sa.Boolean(), nullable=False),
+        sa.Column("budget_type", sa.String(), nullable=False),
+        sa.Column("products", sa.JSON(), nullable=False),
+        sa.Column("product_count", sa.Integer(), nullable=False),
+        sa.Column("regions", sa.JSON(), nullable=False),
+        sa.Column("total_spend", sa.Float(), nullable=False),
+        sa.Column("metrics_updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("refreshed_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["team_id"], ["teams.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("team_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("sales_team_rows")
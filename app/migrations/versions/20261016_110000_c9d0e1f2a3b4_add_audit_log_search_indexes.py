@@ -0,0 +1,81 @@
+"""add keyset and referer/origin search indexes to audit_logs
+
+/audit/logs pages newest first on (timestamp, id); a composite index lets a
+cursor page start at its position instead of sorting every matching row.
+
+The referer filter is a substring ILIKE on both referer and origin, which no
+btree index can serve. pg_trgm GIN indexes make those matches an index
+lookup (for search terms of three or more characters).
+
+As in e5b8c7d2a941, the indexes are built CONCURRENTLY so inserts on every
+API request are not blocked, and if_not_exists makes a retry after a failed
+build a no-op (drop any INVALID index manually before retrying). Creating
+the pg_trgm extension needs a role allowed to do so; it ships with every
+supported PostgreSQL and with RDS.
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-10-16 11:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "c9d0e1f2a3b4"
+down_revision: Union[str, None] = "b8c9d0e1f2a3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    (
+        "ix_audit_logs_timestamp_id",
+        [sa.text("timestamp DESC"), sa.text("id DESC")],
+        {},
+    ),
+    (
+        "ix_audit_logs_referer_trgm",
+        ["referer"],
+        {
+            "postgresql_using": "gin",
+            "postgresql_ops": {"referer": "gin_trgm_ops"},
+        },
+    ),
+    (
+        "ix_audit_logs_origin_trgm",
+        ["origin"],
+        {
+            "postgresql_using": "gin",
+            "postgresql_ops": {"origin": "gin_trgm_ops"},
+        },
+    ),
+]
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    with op.get_context().autocommit_block():
+        for name, columns, options in INDEXES:
+            op.create_index(
+                name,
+                "audit_logs",
+                columns,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+                **options,
+            )
+
+
+def downgrade() -> None:
+    # The pg_trgm extension is left installed; other objects may use it.
+    with op.get_context().autocommit_block():
+        for name, _, _ in INDEXES:
+            op.drop_index(
+                name,
+                table_name="audit_logs",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
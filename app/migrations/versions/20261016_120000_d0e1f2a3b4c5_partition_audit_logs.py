@@ -0,0 +1,201 @@
+"""partition audit_logs by month on timestamp
+
+audit_logs becomes a table range-partitioned by month, so time-bounded
+queries only scan the months they ask for and retention can drop whole
+partitions (app/services/audit_log_partitions.py) instead of deleting rows.
+
+Copying the existing rows would hold up every insert for as long as the
+copy takes, so the existing table is kept and attached as the partition
+audit_logs_legacy, covering everything before the first monthly partition:
+
+1. Outside a transaction, and without blocking inserts:
+   - build the unique (id, timestamp) index the partitioned primary key
+     needs, CONCURRENTLY;
+   - add a CHECK constraint bounding timestamp, NOT VALID, then VALIDATE it.
+     With a validated constraint, ATTACH does not scan the table.
+2. In one short transaction: rename the table and its indexes, and make
+   the (id, timestamp) index its primary key; create the partitioned audit_logs with the same columns, sequence and
+   index definitions; create the monthly partitions and the default
+   partition; attach the old table.
+
+The first monthly partition starts two months after the current one, so
+the bound checked in step 1 cannot be crossed by rows inserted while the
+migration runs. The partition cron creates later months.
+
+Revision ID: d0e1f2a3b4c5
+Revises: c9d0e1f2a3b4
+Create Date: 2026-10-16 12:00:00.000000+00:00
+
+"""
+
+from datetime import UTC, datetime, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "d0e1f2a3b4c5"
+down_revision: Union[str, None] = "c9d0e1f2a3b4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Monthly partitions created up front, starting at the legacy bound.
+MONTHS_CREATED = 3
+
+
+def _month_start(moment: datetime) -> datetime:
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def _next_month(moment: datetime) -> datetime:
+    return _month_start(_month_start(moment) + timedelta(days=32))
+
+
+def upgrade() -> None:
+    now = datetime.now(UTC).replace(tzinfo=None)
+    legacy_bound = _next_month(_next_month(now))
+    bound = legacy_bound.isoformat()
+    conn = op.get_bind()
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS "
+            "ix_audit_logs_id_timestamp ON audit_logs (id, timestamp)"
+        )
+        op.execute(
+            "ALTER TABLE audit_logs DROP CONSTRAINT IF EXISTS audit_logs_timestamp_bound"
+        )
+        op.execute(
+            "ALTER TABLE audit_logs ADD CONSTRAINT audit_logs_timestamp_bound "
+            f"CHECK (timestamp < '{bound}') NOT VALID"
+        )
+        op.execute(
+            "ALTER TABLE audit_logs VALIDATE CONSTRAINT audit_logs_timestamp_bound"
+        )
+
+    # Index definitions to recreate on the partitioned table. ATTACH pairs
+    # each with the identical index on the old table instead of building it.
+    index_defs = conn.execute(
+        sa.text(
+            """
+            SELECT i.relname, pg_get_indexdef(i.oid)
+            FROM pg_index x
+            JOIN pg_class i ON i.oid = x.indexrelid
+            WHERE x.indrelid = 'audit_logs'::regclass
+              AND NOT x.indisprimary
+              AND i.relname <> 'ix_audit_logs_id_timestamp'
+            """
+        )
+    ).all()
+
+    op.execute("LOCK TABLE audit_logs IN ACCESS EXCLUSIVE MODE")
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_legacy")
+    # A partition's primary key must match the parent's (id, timestamp).
+    op.execute(
+        "ALTER TABLE audit_logs_legacy DROP CONSTRAINT audit_logs_pkey, "
+        "ADD CONSTRAINT audit_logs_legacy_pkey PRIMARY KEY "
+        "USING INDEX ix_audit_logs_id_timestamp"
+    )
+    for name, _ in index_defs:
+        op.execute(f"ALTER INDEX {name} RENAME TO {name}_legacy")
+
+    op.create_table(
+        "audit_logs",
+        sa.Column(
+            "id",
+            sa.Integer(),
+            nullable=False,
+            server_default=sa.text("nextval('audit_logs_id_seq'::regclass)"),
+        ),
+        sa.Column("timestamp", sa.DateTime(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("event_type", sa.String(), nullable=False),
+        sa.Column("resource_type", sa.String(), nullable=False),
+        sa.Column("resource_id", sa.String(), nullable=True),
+        sa.Column("action", sa.String(), nullable=False),
+        sa.Column("details", sa.JSON(), nullable=True),
+        sa.Column("ip_address", sa.String(), nullable=True),
+        sa.Column("user_agent", sa.String(), nullable=True),
+        sa.Column("request_source", sa.String(), nullable=True),
+        sa.Column("referer", sa.String(), nullable=True),
+        sa.Column("origin", sa.String(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id", "timestamp", name="audit_logs_pkey"),
+        postgresql_partition_by="RANGE (timestamp)",
+    )
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id")
+    for _, definition in index_defs:
+        op.execute(definition)
+
+    op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT")
+    lower = legacy_bound
+    for _ in range(MONTHS_CREATED):
+        upper = _next_month(lower)
+        op.execute(
+            f"CREATE TABLE audit_logs_p{lower:%Y%m} PARTITION OF audit_logs "
+            f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+        )
+        lower = upper
+    op.execute(
+        "ALTER TABLE audit_logs ATTACH PARTITION audit_logs_legacy "
+        f"FOR VALUES FROM (MINVALUE) TO ('{bound}')"
+    )
+
+
+def downgrade() -> None:
+    # Copies every row back into a plain table; takes as long as the data.
+    conn = op.get_bind()
+    index_defs = (
+        conn.execute(
+            sa.text(
+                """
+            SELECT pg_get_indexdef(i.oid)
+            FROM pg_index x
+            JOIN pg_class i ON i.oid = x.indexrelid
+            WHERE x.indrelid = 'audit_logs'::regclass AND NOT x.indisprimary
+            """
+            )
+        )
+        .scalars()
+        .all()
+    )
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_partitioned")
+    op.execute(
+        "ALTER TABLE audit_logs_partitioned RENAME CONSTRAINT audit_logs_pkey "
+        "TO audit_logs_partitioned_pkey"
+    )
+
+    op.create_table(
+        "audit_logs",
+        sa.Column(
+            "id",
+            sa.Integer(),
+            nullable=False,
+            server_default=sa.text("nextval('audit_logs_id_seq'::regclass)"),
+        ),
+        sa.Column("timestamp", sa.DateTime(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=True),
+        sa.Column("event_type", sa.String(), nullable=False),
+        sa.Column("resource_type", sa.String(), nullable=False),
+        sa.Column("resource_id", sa.String(), nullable=True),
+        sa.Column("action", sa.String(), nullable=False),
+        sa.Column("details", sa.JSON(), nullable=True),
+        sa.Column("ip_address", sa.String(), nullable=True),
+        sa.Column("user_agent", sa.String(), nullable=True),
+        sa.Column("request_source", sa.String(), nullable=True),
+        sa.Column("referer", sa.String(), nullable=True),
+        sa.Column("origin", sa.String(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id", name="audit_logs_pkey"),
+    )
+    op.execute(
+        "INSERT INTO audit_logs SELECT id, timestamp, user_id, event_type, "
+        "resource_type, resource_id, action, details, ip_address, user_agent, "
+        "request_source, referer, origin FROM audit_logs_partitioned"
+    )
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id")
+    # Dropping the partitioned table frees its index names for the new table.
+    op.execute("DROP TABLE audit_logs_partitioned")
+    for definition in index_defs:
+        op.execute(definition.replace(" ON ONLY ", " ON "))
@@ -0,0 +1,44 @@
+"""checkpoint and resume columns for team_group_sync_runs
+
+done_team_ids lists the teams a run has already handled, so a run cut off by
+a restart resumes where it stopped instead of starting over. skipped counts
+teams whose proxy-side models already matched. heartbeat_at is refreshed at
+every checkpoint; a running run whose heartbeat has gone stale was
+interrupted and may be resumed.
+
+Revision ID: e1f2a3b4c5d6
+Revises: d0e1f2a3b4c5
+Create Date: 2026-10-16 13:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "e1f2a3b4c5d6"
+down_revision: Union[str, None] = "d0e1f2a3b4c5"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "team_group_sync_runs", sa.Column("done_team_ids", sa.JSON(), nullable=True)
+    )
+    op.add_column(
+        "team_group_sync_runs",
+        sa.Column("skipped", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "team_group_sync_runs",
+        sa.Column("heartbeat_at", sa.DateTime(timezone=True), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("team_group_sync_runs", "heartbeat_at")
+    op.drop_column("team_group_sync_runs", "skipped")
+    op.drop_column("team_group_sync_runs", "done_team_ids")
@@ -0,0 +1,67 @@
+"""add budget_alert_spend_days and budget_alert_activity_cursors
+
+A local copy of each region's LiteLLM daily activity, so the budget threshold
+sweep reads only recent days and re-evaluates only teams whose spend changed.
+
+Revision ID: a3b4c5d6e7f8
+Revises: f2a3b4c5d6e7
+Create Date: 2026-10-16 16:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "a3b4c5d6e7f8"
+down_revision: Union[str, None] = "f2a3b4c5d6e7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "budget_alert_spend_days",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("region_id", sa.Integer(), nullable=False),
+        sa.Column("kind", sa.String(), nullable=False),
+        sa.Column("litellm_id", sa.String(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("spend", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(["region_id"], ["regions.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "region_id",
+            "kind",
+            "litellm_id",
+            "day",
+            name="uq_budget_alert_spend_days_region_kind_id_day",
+        ),
+    )
+    op.create_index(
+        "ix_budget_alert_spend_days_region_day",
+        "budget_alert_spend_days",
+        ["region_id", "day"],
+        unique=False,
+    )
+    op.create_table(
+        "budget_alert_activity_cursors",
+        sa.Column("region_id", sa.Integer(), nullable=False),
+        sa.Column("covered_from", sa.Date(), nullable=False),
+        sa.Column("last_seen_day", sa.Date(), nullable=False),
+        sa.Column("full_sweep_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["region_id"], ["regions.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("region_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("budget_alert_activity_cursors")
+    op.drop_index(
+        "ix_budget_alert_spend_days_region_day",
+        table_name="budget_alert_spend_days",
+    )
+    op.drop_table("budget_alert_spend_days")
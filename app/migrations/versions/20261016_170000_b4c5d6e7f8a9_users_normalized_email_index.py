@@ -0,0 +1,34 @@
+"""index users by normalized email
+
+Invalidating /users/spend looks users up by the lookup form of their email
+(lowercased, +tag dropped); without an index on that expression every
+invalidation scans the users table.
+
+Revision ID: b4c5d6e7f8a9
+Revises: a3b4c5d6e7f8
+Create Date: 2026-10-16 17:00:00.000000+00:00
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "b4c5d6e7f8a9"
+down_revision: Union[str, None] = "a3b4c5d6e7f8"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_users_normalized_email",
+        "users",
+        [sa.text(r"regexp_replace(lower(email), '\+[^@]*@', '@')")],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_users_normalized_email", table_name="users")
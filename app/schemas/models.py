@@ -929,7 +929,11 @@ class AuditLogResponse(BaseModel):
 
 class PaginatedAuditLogResponse(BaseModel):
     items: List[AuditLogResponse]
-    total: int
+    # None when the request asked for count=none
+    total: Optional[int]
+    total_is_estimate: bool = False
+    # Pass as cursor to fetch the next page; None on the last page
+    next_cursor: Optional[str] = None
     model_config = ConfigDict(from_attributes=True)
 
 
@@ -1107,11 +1111,15 @@ class SalesTeam(BaseModel):
     regions: List[str]
     total_spend: float
     trial_status: str
+    # When monitor_teams last measured total_spend; None if it has not yet.
+    metrics_updated_at: Optional[datetime] = None
     model_config = ConfigDict(from_attributes=True)
 
 
 class SalesTeamsResponse(BaseModel):
     teams: List[SalesTeam]
+    # When the precomputed rows behind this response were built.
+    refreshed_at: Optional[datetime] = None
     model_config = ConfigDict(from_attributes=True)
 
 
@@ -1374,9 +1382,11 @@ class TeamGroupSyncRunResponse(BaseModel):
     status: str
     total: int
     done: int
+    skipped: int = 0
     failed_team_ids: Optional[List[int]] = None
     error_sample: Optional[str] = None
     started_at: datetime
+    heartbeat_at: Optional[datetime] = None
     finished_at: Optional[datetime] = None
     model_config = ConfigDict(from_attributes=True)
 
@@ -1443,6 +1453,22 @@ class SkippedRegion(BaseModel):
     reason: str  # unknown | inactive | not_catalog_managed
 
 
+class RegionSyncPlanSummary(BaseModel):
+    """Proxy writes a dry run would make in one region."""
+
+    region: str
+    creates: int = 0
+    updates: int = 0
+    deletes: int = 0
+    # deregistrations of models the proxy does not have: no write needed
+    unchanged: int = 0
+    # deployments that would fail before any write (e.g. alias without target)
+    failed: int = 0
+    # set when the region's proxy could not be read; every deployment then
+    # counts as failed
+    error: Optional[str] = None
+
+
 class ApplyConfigResponse(BaseModel):
     dry_run: bool
     changes: List[ApplyChange] = Field(default_factory=list)
@@ -1455,5 +1481,8 @@ class ApplyConfigResponse(BaseModel):
     # (PR comment, Slack) so a typo'd or retired region stays visible.
     skipped_regions: List[SkippedRegion] = Field(default_factory=list)
     syncs_scheduled: int = 0
+    # Dry run only: the per-region plan behind syncs_scheduled, diffed against
+    # each proxy's current model list.
+    sync_plan: List[RegionSyncPlanSummary] = Field(default_factory=list)
 
 
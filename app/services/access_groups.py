@@ -6,14 +6,15 @@ team's `models` list (here). Everything below is a pure function of DB state,
 so every sync is idempotent and safe to re-run.
 """
 
+import asyncio
 import logging
 import traceback
-from datetime import datetime, UTC
+from datetime import datetime, timedelta, UTC
 
-from sqlalchemy import or_
+from sqlalchemy import func, or_, update
 from sqlalchemy.orm import Session
 
-from app.core.config import catalog_manages
+from app.core.config import catalog_manages, settings
 from app.db.database import get_db
 from app.db.models import (
     DBModelAccessGroup,
@@ -25,10 +26,13 @@ from app.db.models import (
     DBTeamModelAccessGroup,
     DBTeamRegion,
 )
-from app.services.litellm import LiteLLMService
+from app.services.litellm import KEY_UPDATE_SKIPPED, LiteLLMService
 
 logger = logging.getLogger(__name__)
 
+# Team ids per opt-in query when computing a whole region's slugs
+_SLUG_QUERY_CHUNK = 1000
+
 
 def model_access_group_slugs(db: Session, model_pk: int, region_id: int) -> list[str]:
     """Slugs for a model deployment in a region: groups that contain the model
@@ -46,6 +50,25 @@ def model_access_group_slugs(db: Session, model_pk: int, region_id: int) -> list
     return sorted(row[0] for row in rows)
 
 
+def region_model_group_slugs(db: Session, model_pks: list[int], region_id: int) -> dict[int, list[str]]:
+    """model_access_group_slugs for many models of one region, in one query."""
+    slugs: dict[int, set[str]] = {model_pk: set() for model_pk in model_pks}
+    if model_pks:
+        rows = (
+            db.query(DBModelAccessGroupModel.model_id, DBModelAccessGroup.slug)
+            .join(DBModelAccessGroup, DBModelAccessGroupModel.group_id == DBModelAccessGroup.id)
+            .join(DBModelAccessGroupRegion, DBModelAccessGroupRegion.group_id == DBModelAccessGroup.id)
+            .filter(
+                DBModelAccessGroupModel.model_id.in_(model_pks),
+                DBModelAccessGroupRegion.region_id == region_id,
+            )
+            .all()
+        )
+        for model_pk, slug in rows:
+            slugs[model_pk].add(slug)
+    return {model_pk: sorted(model_slugs) for model_pk, model_slugs in slugs.items()}
+
+
 def effective_team_group_slugs(db: Session, team_id: int, region: DBRegion) -> list[str] | None:
     """The team's LiteLLM `models` list for a region: region default group +
     the team's opt-in groups that are deployed to that region.
@@ -77,6 +100,37 @@ def effective_team_group_slugs(db: Session, team_id: int, region: DBRegion) -> l
     return sorted(slugs)
 
 
+def region_team_group_slugs(
+    db: Session, region: DBRegion, team_ids: list[int]
+) -> dict[int, list[str]] | None:
+    """effective_team_group_slugs for many teams of one region, in one query
+    per _SLUG_QUERY_CHUNK teams instead of two per team. None when
+    enforcement is off, as there."""
+    if region.default_access_group_id is None or not catalog_manages(region.name):
+        return None
+
+    default_slug = (
+        db.query(DBModelAccessGroup.slug)
+        .filter(DBModelAccessGroup.id == region.default_access_group_id)
+        .scalar()
+    )
+    slugs = {team_id: {default_slug} for team_id in team_ids}
+    for start in range(0, len(team_ids), _SLUG_QUERY_CHUNK):
+        rows = (
+            db.query(DBTeamModelAccessGroup.team_id, DBModelAccessGroup.slug)
+            .join(DBModelAccessGroup, DBTeamModelAccessGroup.group_id == DBModelAccessGroup.id)
+            .join(DBModelAccessGroupRegion, DBModelAccessGroupRegion.group_id == DBModelAccessGroup.id)
+            .filter(
+                DBTeamModelAccessGroup.team_id.in_(team_ids[start : start + _SLUG_QUERY_CHUNK]),
+                DBModelAccessGroupRegion.region_id == region.id,
+            )
+            .all()
+        )
+        for team_id, slug in rows:
+            slugs[team_id].add(slug)
+    return {team_id: sorted(team_slugs) for team_id, team_slugs in slugs.items()}
+
+
 def region_team_ids(db: Session, region_id: int) -> list[int]:
     """Teams belonging to a region: via teams.region_id or team_regions."""
     rows = (
@@ -126,12 +180,62 @@ async def sync_team_groups_task(team_id: int, region_id: int) -> None:
             db.close()
 
 
+def _checkpoint_run(
+    db: Session, run: DBTeamGroupSyncRun, done_ids: list[int], failed: list[int]
+) -> None:
+    run.done = len(done_ids)
+    # JSON columns are only written when assigned a new object
+    run.done_team_ids = list(done_ids)
+    run.failed_team_ids = list(failed)
+    run.heartbeat_at = datetime.now(UTC)
+    db.commit()
+
+
+def _touch_run(run_id: int) -> None:
+    db = next(get_db())
+    try:
+        db.execute(
+            update(DBTeamGroupSyncRun)
+            .where(DBTeamGroupSyncRun.id == run_id, DBTeamGroupSyncRun.status == "running")
+            .values(heartbeat_at=datetime.now(UTC))
+        )
+        db.commit()
+    finally:
+        db.close()
+
+
+async def _heartbeat_run(run_id: int, interval: float) -> None:
+    """Refresh a run's heartbeat every ``interval`` seconds until cancelled.
+
+    Checkpoints only land between batches, and one slow batch can outlast
+    TEAM_GROUP_SYNC_STALE_SECONDS; without this the resumer would claim the
+    run while it is still being worked on.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await asyncio.to_thread(_touch_run, run_id)
+        except Exception as e:
+            logger.warning(f"Team group sync run {run_id}: heartbeat failed: {e}")
+
+
 async def sync_region_teams_task(run_id: int) -> None:
     """Background fan-out: re-write the `models` list of every team in the
-    run's region. Idempotent — each team's list is recomputed from the DB, so
-    a crashed or partially-failed run is fixed by simply starting a new one.
+    run's region.
+
+    Slugs for all teams are computed up front, then teams are pushed in
+    batches of TEAM_GROUP_SYNC_BATCH_SIZE, concurrently within a batch, and
+    the run is checkpointed after each batch; a background heartbeat keeps
+    it from looking interrupted while a batch is slow. Teams whose LiteLLM
+    `models` already match are counted as skipped without a write. A run that
+    already has checkpoints (one being resumed) only handles the teams it has
+    not done yet. Idempotent — each team's list is recomputed from the DB, so a
+    partially-failed run is fixed by simply starting a new one.
     """
     db = None
+    heartbeat = asyncio.create_task(
+        _heartbeat_run(run_id, settings.TEAM_GROUP_SYNC_STALE_SECONDS / 3)
+    )
     try:
         db = next(get_db())
         run = db.query(DBTeamGroupSyncRun).filter_by(id=run_id).first()
@@ -146,34 +250,60 @@ async def sync_region_teams_task(run_id: int) -> None:
             db.commit()
             return
 
-        team_ids = region_team_ids(db, region.id)
-        run.total = len(team_ids)
-        db.commit()
+        done_ids = list(run.done_team_ids or [])
+        failed = list(run.failed_team_ids or [])
+        error_sample = run.error_sample
+        handled = set(done_ids)
+        pending = [team_id for team_id in region_team_ids(db, region.id) if team_id not in handled]
+        run.total = len(done_ids) + len(pending)
+        _checkpoint_run(db, run, done_ids, failed)
+
+        if not catalog_manages(region.name):
+            logger.info(f"Team group sync skipped: region {region.name} is not catalog-managed.")
+            run.skipped = (run.skipped or 0) + len(pending)
+            done_ids.extend(pending)
+            pending = []
 
-        failed: list[int] = []
-        error_sample = None
-        for team_id in team_ids:
+        slugs_by_team = region_team_group_slugs(db, region, pending)
+        service = LiteLLMService(api_url=region.litellm_api_url, api_key=region.litellm_api_key)
+        current = None
+        if pending:
             try:
-                await sync_team_groups(db, team_id, region)
+                current = await service.list_team_models()
             except Exception as e:
-                # A team that was never provisioned on this proxy fails here;
-                # that's expected for stale DB rows — record and continue.
-                failed.append(team_id)
-                error_sample = error_sample or str(e)
-                logger.warning(f"Team group sync run {run_id}: team {team_id} failed: {e}")
-            run.done += 1
-            if run.done % 25 == 0:
-                run.failed_team_ids = list(failed)
-                db.commit()
-
-        run.failed_team_ids = list(failed)
+                # Only costs the skip-if-unchanged shortcut: every team is pushed.
+                logger.warning(f"Team group sync run {run_id}: could not list LiteLLM teams: {e}")
+
+        batch_size = max(1, settings.TEAM_GROUP_SYNC_BATCH_SIZE)
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start : start + batch_size]
+            models_by_team = {
+                LiteLLMService.format_team_id(region.name, team_id): (
+                    slugs_by_team[team_id] if slugs_by_team is not None else []
+                )
+                for team_id in batch
+            }
+            results = await service.bulk_update_team_models(models_by_team, current)
+            for team_id, result in zip(batch, results):
+                if result.status == KEY_UPDATE_SKIPPED:
+                    run.skipped = (run.skipped or 0) + 1
+                elif not result.ok:
+                    # A team that was never provisioned on this proxy fails
+                    # here; that's expected for stale DB rows — record and
+                    # continue.
+                    failed.append(team_id)
+                    error_sample = error_sample or result.error
+                    logger.warning(f"Team group sync run {run_id}: team {team_id} failed: {result.error}")
+            done_ids.extend(batch)
+            _checkpoint_run(db, run, done_ids, failed)
+
         run.error_sample = error_sample
         run.status = "failed" if failed else "done"
         run.finished_at = datetime.now(UTC)
-        db.commit()
+        _checkpoint_run(db, run, done_ids, failed)
         logger.info(
             f"Team group sync run {run_id} for region {region.name} finished: "
-            f"{run.done}/{run.total} done, {len(failed)} failed"
+            f"{run.done}/{run.total} done, {run.skipped} unchanged, {len(failed)} failed"
         )
     except Exception as e:
         logger.error(f"Team group sync run {run_id} crashed: {e}\n{traceback.format_exc()}")
@@ -189,5 +319,50 @@ async def sync_region_teams_task(run_id: int) -> None:
             except Exception as inner_e:
                 logger.error(f"Failed to record sync run failure: {inner_e}")
     finally:
+        heartbeat.cancel()
         if db:
             db.close()
+
+
+def claim_interrupted_team_group_sync_runs(db: Session, region_id: int | None = None) -> list[int]:
+    """Ids of running runs (of one region, if given) with no heartbeat for
+    TEAM_GROUP_SYNC_STALE_SECONDS.
+
+    Their process died mid-run. Claiming refreshes the heartbeat in the same
+    UPDATE that selects them, so when several processes look at once each
+    run is claimed by exactly one.
+    """
+    now = datetime.now(UTC)
+    cutoff = now - timedelta(seconds=settings.TEAM_GROUP_SYNC_STALE_SECONDS)
+    last_seen = func.coalesce(DBTeamGroupSyncRun.heartbeat_at, DBTeamGroupSyncRun.started_at)
+    stmt = update(DBTeamGroupSyncRun).where(DBTeamGroupSyncRun.status == "running", last_seen < cutoff)
+    if region_id is not None:
+        stmt = stmt.where(DBTeamGroupSyncRun.region_id == region_id)
+    run_ids = db.execute(stmt.values(heartbeat_at=now).returning(DBTeamGroupSyncRun.id)).scalars().all()
+    db.commit()
+    return sorted(run_ids)
+
+
+async def resume_interrupted_team_group_sync_runs() -> int:
+    """Resume every interrupted run from its last checkpoint; returns how many."""
+    db = next(get_db())
+    try:
+        run_ids = claim_interrupted_team_group_sync_runs(db)
+    finally:
+        db.close()
+    for run_id in run_ids:
+        logger.info(f"Resuming interrupted team group sync run {run_id}")
+        await sync_region_teams_task(run_id)
+    return len(run_ids)
+
+
+async def run_team_group_sync_resumer(
+    interval: float = settings.TEAM_GROUP_SYNC_RESUME_INTERVAL_SECONDS,
+) -> None:
+    """Resume interrupted fan-out runs until cancelled (app lifespan)."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await resume_interrupted_team_group_sync_runs()
+        except Exception:
+            logger.exception("Resuming interrupted team group sync runs failed")
@@ -0,0 +1,187 @@
+"""Monthly partitions of the audit_logs table.
+
+audit_logs is range-partitioned on ``timestamp``: one partition per calendar
+month (UTC), named ``audit_logs_pYYYYMM``, plus ``audit_logs_default`` for
+anything no monthly partition covers. The table that existed before
+partitioning was attached as ``audit_logs_legacy``, covering everything up to
+its first monthly partition.
+
+``ensure_audit_log_partitions`` creates the partitions for the current month
+and the next AUDIT_LOG_PARTITIONS_AHEAD months, so inserts never fall through
+to the default partition while the cron runs. ``drop_expired_audit_log_partitions``
+removes partitions whose rows are all older than AUDIT_LOG_RETENTION_DAYS by
+detaching and dropping them: no DELETE, nothing left for vacuum.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from datetime import UTC, datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+PARENT_TABLE = "audit_logs"
+DEFAULT_PARTITION = "audit_logs_default"
+
+_BOUND_RE = re.compile(r"FROM \((?:'([^']+)'|MINVALUE)\) TO \((?:'([^']+)'|MAXVALUE)\)")
+
+
+@dataclass(frozen=True)
+class AuditLogPartition:
+    name: str
+    # None for an unbounded end (MINVALUE / MAXVALUE)
+    lower: Optional[datetime]
+    upper: Optional[datetime]
+
+    def covers(self, moment: datetime) -> bool:
+        return (self.lower is None or self.lower <= moment) and (
+            self.upper is None or moment < self.upper
+        )
+
+
+def partition_name(month_start: datetime) -> str:
+    return f"{PARENT_TABLE}_p{month_start:%Y%m}"
+
+
+def month_start(moment: datetime) -> datetime:
+    """First instant of ``moment``'s month, as the naive UTC the table stores."""
+    if moment.tzinfo:
+        moment = moment.astimezone(UTC).replace(tzinfo=None)
+    return moment.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def next_month(moment: datetime) -> datetime:
+    return month_start(month_start(moment) + timedelta(days=32))
+
+
+def list_audit_log_partitions(db: Session) -> list[AuditLogPartition]:
+    """The range partitions of audit_logs; the default partition is left out."""
+    rows = db.execute(
+        text(
+            """
+            SELECT child.relname, pg_get_expr(child.relpartbound, child.oid)
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = :parent
+            """
+        ),
+        {"parent": PARENT_TABLE},
+    ).all()
+    partitions = []
+    for name, bound in rows:
+        match = _BOUND_RE.search(bound or "")
+        if match is None:
+            continue
+        lower, upper = match.groups()
+        partitions.append(
+            AuditLogPartition(
+                name=name,
+                lower=datetime.fromisoformat(lower) if lower else None,
+                upper=datetime.fromisoformat(upper) if upper else None,
+            )
+        )
+    return sorted(partitions, key=lambda p: p.lower or datetime.min)
+
+
+def ensure_audit_log_partitions(
+    db: Session, now: Optional[datetime] = None
+) -> list[str]:
+    """Create any missing monthly partitions from ``now``'s month onwards.
+
+    Rows that already landed in the default partition for a month being
+    created are moved into the new partition. Returns the names created.
+    Commits after each partition.
+    """
+    month = month_start(now or datetime.now(UTC))
+    months = [month]
+    for _ in range(max(0, settings.AUDIT_LOG_PARTITIONS_AHEAD)):
+        months.append(next_month(months[-1]))
+
+    existing = list_audit_log_partitions(db)
+    created = []
+    for lower in months:
+        if any(partition.covers(lower) for partition in existing):
+            continue
+        upper = next_month(lower)
+        name = partition_name(lower)
+        bounds = {"lower": lower, "upper": upper}
+        # Attaching a range checks the default partition holds no rows in it,
+        # so rows that fell through before the partition existed move first.
+        db.execute(
+            text(
+                f"CREATE TABLE {name} "
+                f"(LIKE {PARENT_TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)"
+            )
+        )
+        db.execute(
+            text(
+                f"""
+                WITH moved AS (
+                    DELETE FROM {DEFAULT_PARTITION}
+                    WHERE timestamp >= :lower AND timestamp < :upper
+                    RETURNING *
+                )
+                INSERT INTO {name} SELECT * FROM moved
+                """
+            ),
+            bounds,
+        )
+        db.execute(
+            text(
+                f"ALTER TABLE {PARENT_TABLE} ATTACH PARTITION {name} "
+                f"FOR VALUES FROM ('{lower.isoformat()}') TO ('{upper.isoformat()}')"
+            )
+        )
+        db.commit()
+        existing.append(AuditLogPartition(name=name, lower=lower, upper=upper))
+        created.append(name)
+        logger.info("Created audit log partition %s", name)
+    return created
+
+
+def drop_expired_audit_log_partitions(
+    db: Session, now: Optional[datetime] = None
+) -> list[str]:
+    """Detach and drop partitions holding only rows past the retention window.
+
+    Does nothing while AUDIT_LOG_RETENTION_DAYS is 0. A partition goes once
+    its upper bound is older than the cutoff, so rows are kept for up to a
+    month past the retention window, never less. Returns the names dropped.
+    """
+    if settings.AUDIT_LOG_RETENTION_DAYS <= 0:
+        return []
+    now = now or datetime.now(UTC)
+    if now.tzinfo:
+        now = now.astimezone(UTC).replace(tzinfo=None)
+    cutoff = now - timedelta(days=settings.AUDIT_LOG_RETENTION_DAYS)
+
+    dropped = []
+    for partition in list_audit_log_partitions(db):
+        if partition.upper is None or partition.upper > cutoff:
+            continue
+        db.execute(
+            text(f"ALTER TABLE {PARENT_TABLE} DETACH PARTITION {partition.name}")
+        )
+        db.execute(text(f"DROP TABLE {partition.name}"))
+        db.commit()
+        dropped.append(partition.name)
+        logger.info(
+            "Dropped audit log partition %s (rows before %s)",
+            partition.name,
+            partition.upper,
+        )
+    return dropped
+
+
+def maintain_audit_log_partitions(db: Session) -> tuple[list[str], list[str]]:
+    """Run both maintenance steps; returns (created, dropped) partition names."""
+    created = ensure_audit_log_partitions(db)
+    dropped = drop_expired_audit_log_partitions(db)
+    return created, dropped
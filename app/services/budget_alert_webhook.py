@@ -1,12 +1,19 @@
 """Outbound delivery of budget threshold alerts.
 
-Posts batches of events to a single configured URL (MOAD, in practice). There is
-no retry queue by design: the alert engine only advances its threshold state for
-events this module reports as delivered, so a failed POST is re-detected and
-re-sent on the next tick. Consumers de-duplicate on ``event_id``, which is derived
-from (subject, period, band) rather than randomly generated — a retry therefore
-carries the same id as the attempt it repeats, including when a response is lost
-after the consumer already accepted the batch. See ``event_id_for``.
+Posts batches of events to a single configured URL (MOAD, in practice). The
+sweep does not post anything itself: ``queue_events`` adds its events to the
+``budget_alert_outbox`` table in the same transaction that advances their
+threshold state, and schedules a ``budget_alert_delivery`` job. The job queue
+workers run ``deliver_outbox``, which posts due events in concurrent batches
+over one keep-alive client and reschedules failed batches with exponential
+backoff and jitter. A slow consumer therefore delays its alerts, never the
+sweep, and alerts leave within seconds of being detected.
+
+Delivery is at-least-once: a batch whose response is lost, or a worker that
+dies mid-send, is sent again. Consumers de-duplicate on ``event_id``, which is
+derived from (subject, period, band) rather than randomly generated — a retry
+therefore carries the same id as the attempt it repeats. See ``event_id_for``.
+The outbox holds each ``event_id`` once, so re-queueing a crossing is a no-op.
 
 The destination is a full URL from ``BUDGET_ALERT_WEBHOOK_URL`` rather than a
 base plus a hardcoded path, so the receiving route stays the consumer's choice.
@@ -14,16 +21,33 @@ base plus a hardcoded path, so the receiving route stays the consumer's choice.
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from datetime import UTC, datetime
+import random
+from datetime import UTC, datetime, timedelta
 
 import httpx
+from sqlalchemy import delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
 
-from app.core.budget_alert_service import BudgetAlertEvent
+from app.core.budget_alert_service import (
+    BudgetAlertEvent,
+    budget_alert_delivery_failures_total,
+    write_audit_logs,
+)
 from app.core.config import settings
+from app.core.job_queue import enqueue_job, job_handler
+from app.db.models import DBBudgetAlertOutbox
 
 logger = logging.getLogger(__name__)
 
+BUDGET_ALERT_DELIVERY_JOB = "budget_alert_delivery"
+
+OUTBOX_PENDING = "pending"
+OUTBOX_DELIVERED = "delivered"
+OUTBOX_FAILED = "failed"
+
 # Bumped when the event shape changes in a way consumers must notice.
 BUDGET_ALERT_API_VERSION = "2026-08-01"
 
@@ -87,65 +111,304 @@ def serialize_event(event: BudgetAlertEvent) -> dict:
     }
 
 
-def _chunk(events: list[BudgetAlertEvent], size: int):
+def event_from_payload(subject_key: str, payload: dict) -> BudgetAlertEvent:
+    """Rebuild an event from its serialized form (for the audit log)."""
+    data = payload["data"]
+    team = data.get("team") or {}
+    user = data.get("user") or {}
+    key = data.get("key") or {}
+    period = data.get("period") or {}
+
+    def _parse(value):
+        return datetime.fromisoformat(value) if value else None
+
+    return BudgetAlertEvent(
+        event_id=payload["event_id"],
+        subject_type=data["scope"],
+        subject_key=subject_key,
+        threshold_pct=data["threshold_percent"],
+        percent_used=data["percent_used"],
+        spend=data["spend"],
+        max_budget=data["max_budget"],
+        region_id=data["region"]["id"],
+        region_name=data["region"]["name"],
+        period_key=period.get("key"),
+        period_start=_parse(period.get("start")),
+        period_end=_parse(period.get("end")),
+        budget_duration=data.get("budget_duration"),
+        budget_source=data.get("budget_source", "team_ledger"),
+        team_id=team.get("id"),
+        team_name=team.get("name"),
+        user_id=user.get("id"),
+        user_email=user.get("email"),
+        key_id=key.get("id"),
+        key_name=key.get("name"),
+        is_service_key=bool(key.get("is_service_key", False)),
+    )
+
+
+def _chunk(items: list, size: int):
     size = max(1, size)
-    for start in range(0, len(events), size):
-        yield events[start : start + size]
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _headers() -> dict:
+    headers = {"Content-Type": "application/json"}
+    if settings.BUDGET_ALERT_WEBHOOK_TOKEN:
+        headers["Authorization"] = f"Bearer {settings.BUDGET_ALERT_WEBHOOK_TOKEN}"
+    return headers
+
+
+async def _post_batch(client, url: str, events: list[dict]) -> str | None:
+    """POST one batch of serialized events. None if accepted, else the error."""
+    payload = {"api_version": BUDGET_ALERT_API_VERSION, "events": events}
+    try:
+        response = await client.post(url, json=payload, headers=_headers())
+    except httpx.RequestError as exc:
+        logger.error(
+            "Budget alert webhook unreachable (%d event(s) will retry): %s",
+            len(events),
+            exc,
+        )
+        return f"{type(exc).__name__}: {exc}"
+
+    if 200 <= response.status_code < 300:
+        logger.info(
+            "Delivered %d budget alert(s) (status %s)",
+            len(events),
+            response.status_code,
+        )
+        return None
+    logger.error(
+        "Budget alert webhook returned %s (%d event(s) will retry): %s",
+        response.status_code,
+        len(events),
+        response.text[:500],
+    )
+    return f"Status {response.status_code}: {response.text[:500]}"
+
 
+# --------------------------------------------------------------------------- #
+# Outbox
+# --------------------------------------------------------------------------- #
 
-async def deliver_events(events: list[BudgetAlertEvent]) -> set[str]:
-    """POST events in batches. Returns the ids that were accepted.
 
-    A batch is all-or-nothing: on a non-2xx or a transport error none of its ids
-    are returned, so every event in it is retried next tick.
+def queue_events(db: Session, events: list[BudgetAlertEvent]) -> None:
+    """Add events to the outbox and schedule delivery, on ``db``'s transaction.
+
+    Nothing is visible to the worker until the caller commits, which is what
+    ties the queued event to the threshold state advanced with it. An
+    ``event_id`` already in the outbox is left as it is.
     """
     if not events:
-        return set()
+        return
+    db.execute(
+        pg_insert(DBBudgetAlertOutbox)
+        .values(
+            [
+                {
+                    "event_id": event.event_id,
+                    "subject_key": event.subject_key,
+                    "region_id": event.region_id,
+                    "payload": serialize_event(event),
+                    "status": OUTBOX_PENDING,
+                    "attempts": 0,
+                    "next_attempt_at": func.now(),
+                }
+                for event in events
+            ]
+        )
+        .on_conflict_do_nothing(index_elements=[DBBudgetAlertOutbox.event_id])
+    )
+    enqueue_job(
+        db, BUDGET_ALERT_DELIVERY_JOB, {}, dedupe_key=BUDGET_ALERT_DELIVERY_JOB
+    )
+
+
+def delivery_backoff_seconds(attempts: int) -> float:
+    """Delay before retry number ``attempts`` (1-based), with jitter.
+
+    The jitter spreads retries of batches that failed together, so a consumer
+    coming back from an outage is not hit by all of them at once.
+    """
+    delay = settings.BUDGET_ALERT_DELIVERY_BACKOFF_BASE_SECONDS * 2 ** max(
+        0, attempts - 1
+    )
+    delay = min(delay, settings.BUDGET_ALERT_DELIVERY_BACKOFF_MAX_SECONDS)
+    return delay * random.uniform(0.5, 1.0)
+
 
+def _claim_due(db: Session, limit: int) -> list[tuple[int, str, str, dict, int]]:
+    """Lease up to ``limit`` due rows: (id, event_id, subject_key, payload, attempts).
+
+    The lease pushes ``next_attempt_at`` past the time a send can take, so
+    other workers skip these rows, and a worker that dies mid-send leaves them
+    due again once it runs out.
+    """
+    rows = (
+        db.execute(
+            select(DBBudgetAlertOutbox)
+            .where(
+                DBBudgetAlertOutbox.status == OUTBOX_PENDING,
+                DBBudgetAlertOutbox.next_attempt_at <= func.now(),
+            )
+            .order_by(DBBudgetAlertOutbox.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        .scalars()
+        .all()
+    )
+    lease = timedelta(seconds=settings.BUDGET_ALERT_WEBHOOK_TIMEOUT + 60)
+    claimed = []
+    for row in rows:
+        row.next_attempt_at = func.now() + lease
+        claimed.append(
+            (row.id, row.event_id, row.subject_key, row.payload, row.attempts)
+        )
+    db.commit()
+    return claimed
+
+
+def _record_batch(
+    db: Session, batch: list[tuple[int, str, str, dict, int]], error: str | None
+) -> dict[str, int]:
+    """Store one batch's outcome per row; returns row counts by outcome.
+
+    A batch can mix fresh rows with old retries, so give-up and backoff are
+    decided from each row's own attempt count.
+    """
+    outcomes = {"delivered": 0, "retrying": 0, "failed": 0}
+    if error is None:
+        db.execute(
+            update(DBBudgetAlertOutbox)
+            .where(DBBudgetAlertOutbox.id.in_([row_id for row_id, *_ in batch]))
+            .values(
+                attempts=DBBudgetAlertOutbox.attempts + 1,
+                status=OUTBOX_DELIVERED,
+                delivered_at=func.now(),
+                last_error=None,
+            )
+        )
+        outcomes[OUTBOX_DELIVERED] = len(batch)
+        settled = batch
+    else:
+        ids_by_attempts: dict[int, list[int]] = {}
+        for row_id, _, _, _, attempts in batch:
+            ids_by_attempts.setdefault(attempts + 1, []).append(row_id)
+        given_up: set[int] = set()
+        for attempts, ids in ids_by_attempts.items():
+            if attempts >= settings.BUDGET_ALERT_DELIVERY_MAX_ATTEMPTS:
+                values = {"status": OUTBOX_FAILED}
+                given_up.update(ids)
+            else:
+                values = {
+                    "next_attempt_at": func.now()
+                    + timedelta(seconds=delivery_backoff_seconds(attempts))
+                }
+            db.execute(
+                update(DBBudgetAlertOutbox)
+                .where(DBBudgetAlertOutbox.id.in_(ids))
+                .values(attempts=attempts, last_error=error, **values)
+            )
+        settled = [row for row in batch if row[0] in given_up]
+        outcomes[OUTBOX_FAILED] = len(settled)
+        outcomes["retrying"] = len(batch) - len(settled)
+    db.commit()
+
+    if settled:
+        # The audit log answers "was this customer warned": one row per event,
+        # once its delivery is settled either way.
+        events = [
+            event_from_payload(subject_key, payload)
+            for _, _, subject_key, payload, _ in settled
+        ]
+        delivered = {event.event_id for event in events} if error is None else set()
+        write_audit_logs(db, events, delivered)
+    if outcomes[OUTBOX_FAILED]:
+        budget_alert_delivery_failures_total.inc(outcomes[OUTBOX_FAILED])
+        logger.error(
+            "Giving up on %d budget alert(s) after %d attempts: %s",
+            outcomes[OUTBOX_FAILED],
+            settings.BUDGET_ALERT_DELIVERY_MAX_ATTEMPTS,
+            error,
+        )
+    return outcomes
+
+
+async def deliver_outbox(db: Session) -> dict[str, int]:
+    """Post every due outbox event; returns counts by outcome.
+
+    Claims up to ``BUDGET_ALERT_DELIVERY_CONCURRENCY`` batches at a time and
+    sends them concurrently until nothing is due, then schedules itself again
+    for the earliest pending retry.
+    """
+    totals = {"delivered": 0, "retrying": 0, "failed": 0}
     url = settings.BUDGET_ALERT_WEBHOOK_URL
     if not url:
-        logger.error(
-            "BUDGET_ALERT_WEBHOOK_URL is not set; %d budget alert(s) not delivered",
-            len(events),
+        # Rows stay pending and go out once a URL is configured.
+        logger.error("BUDGET_ALERT_WEBHOOK_URL is not set; budget alerts stay queued")
+        return totals
+
+    batch_size = max(1, settings.BUDGET_ALERT_BATCH_SIZE)
+    concurrency = max(1, settings.BUDGET_ALERT_DELIVERY_CONCURRENCY)
+    limits = httpx.Limits(
+        max_connections=concurrency, max_keepalive_connections=concurrency
+    )
+    async with httpx.AsyncClient(
+        timeout=settings.BUDGET_ALERT_WEBHOOK_TIMEOUT, limits=limits
+    ) as client:
+        while True:
+            claimed = _claim_due(db, batch_size * concurrency)
+            if not claimed:
+                break
+            batches = list(_chunk(claimed, batch_size))
+            errors = await asyncio.gather(
+                *[
+                    _post_batch(client, url, [payload for *_, payload, _ in batch])
+                    for batch in batches
+                ]
+            )
+            for batch, error in zip(batches, errors):
+                for outcome, count in _record_batch(db, batch, error).items():
+                    totals[outcome] += count
+
+    _prune_outbox(db)
+    next_due = (
+        db.query(func.min(DBBudgetAlertOutbox.next_attempt_at))
+        .filter(DBBudgetAlertOutbox.status == OUTBOX_PENDING)
+        .scalar()
+    )
+    if next_due is not None:
+        delay = max(0.0, (next_due - datetime.now(UTC)).total_seconds())
+        enqueue_job(
+            db,
+            BUDGET_ALERT_DELIVERY_JOB,
+            {},
+            dedupe_key=BUDGET_ALERT_DELIVERY_JOB,
+            delay_seconds=delay,
         )
-        return set()
+    db.commit()
+    return totals
 
-    headers = {"Content-Type": "application/json"}
-    if settings.BUDGET_ALERT_WEBHOOK_TOKEN:
-        headers["Authorization"] = f"Bearer {settings.BUDGET_ALERT_WEBHOOK_TOKEN}"
 
-    delivered: set[str] = set()
-    timeout = settings.BUDGET_ALERT_WEBHOOK_TIMEOUT
-
-    async with httpx.AsyncClient(timeout=timeout) as client:
-        for batch in _chunk(events, settings.BUDGET_ALERT_BATCH_SIZE):
-            payload = {
-                "api_version": BUDGET_ALERT_API_VERSION,
-                "events": [serialize_event(event) for event in batch],
-            }
-            try:
-                response = await client.post(url, json=payload, headers=headers)
-            except httpx.RequestError as exc:
-                logger.error(
-                    "Budget alert webhook unreachable (%d event(s) will retry): %s",
-                    len(batch),
-                    exc,
-                )
-                continue
-
-            if 200 <= response.status_code < 300:
-                delivered.update(event.event_id for event in batch)
-                logger.info(
-                    "Delivered %d budget alert(s) (status %s)",
-                    len(batch),
-                    response.status_code,
-                )
-            else:
-                logger.error(
-                    "Budget alert webhook returned %s (%d event(s) will retry): %s",
-                    response.status_code,
-                    len(batch),
-                    response.text[:500],
-                )
-
-    return delivered
+def _prune_outbox(db: Session) -> None:
+    """Drop settled rows past BUDGET_ALERT_OUTBOX_RETENTION_DAYS."""
+    cutoff = datetime.now(UTC) - timedelta(
+        days=settings.BUDGET_ALERT_OUTBOX_RETENTION_DAYS
+    )
+    db.execute(
+        delete(DBBudgetAlertOutbox).where(
+            DBBudgetAlertOutbox.status != OUTBOX_PENDING,
+            DBBudgetAlertOutbox.created_at < cutoff,
+        )
+    )
+    db.commit()
+
+
+@job_handler(BUDGET_ALERT_DELIVERY_JOB)
+async def deliver_outbox_job(db: Session, payload: dict) -> None:
+    totals = await deliver_outbox(db)
+    if any(totals.values()):
+        logger.info("Budget alert outbox: %s", totals)
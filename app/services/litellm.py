@@ -1,17 +1,23 @@
 import asyncio
+import functools
 import hashlib
+import importlib.util
 import httpx
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, timezone
 from fastapi import HTTPException, status
 import logging
 import os
 import re
+import time
+from dataclasses import dataclass, field
 from app.core.limit_service import (
     DEFAULT_KEY_DURATION,
     DEFAULT_MAX_SPEND,
     DEFAULT_RPM_PER_KEY,
 )
 from app.core.config import settings
+from app.core.single_flight import SingleFlight
 from typing import Optional
 
 logger = logging.getLogger(__name__)
@@ -42,6 +48,60 @@ INFERENCE_ONLY_ROUTES = ["llm_api_routes", "/model/info"]
 # with no retry — a hung proxy must not park the task on 'pending' forever.
 MODEL_HTTP_TIMEOUT = 30.0
 
+# Shared connection pool for the regional LiteLLM proxies. Opening a fresh
+# client per call pays a TCP+TLS handshake every time, which is most of the
+# latency of the /spend/* fan-out and of the monitor_teams key-write phase.
+LITELLM_HTTP_MAX_CONNECTIONS = max(
+    1, int(os.getenv("LITELLM_HTTP_MAX_CONNECTIONS", "100"))
+)
+LITELLM_HTTP_MAX_KEEPALIVE = max(0, int(os.getenv("LITELLM_HTTP_MAX_KEEPALIVE", "20")))
+LITELLM_HTTP_KEEPALIVE_EXPIRY = float(os.getenv("LITELLM_HTTP_KEEPALIVE_EXPIRY", "30"))
+# Default request timeout. Matches httpx's own default, which is what every
+# call used before the pool existed; slow endpoints pass their own per request.
+LITELLM_HTTP_TIMEOUT = float(os.getenv("LITELLM_HTTP_TIMEOUT", "5"))
+# HTTP/2 is negotiated via ALPN, so plain-http or HTTP/1.1-only proxies keep
+# working. It needs the optional `h2` package; without it we stay on HTTP/1.1.
+LITELLM_HTTP2 = (
+    os.getenv("LITELLM_HTTP2", "true") == "true"
+    and importlib.util.find_spec("h2") is not None
+)
+
+# Bulk /key/update concurrency (see AIMDConcurrency). A region starts at the
+# initial limit and the limit it settles at is carried into its next bulk call.
+KEY_UPDATE_INITIAL_CONCURRENCY = max(
+    1, int(os.getenv("KEY_UPDATE_INITIAL_CONCURRENCY", "10"))
+)
+KEY_UPDATE_MIN_CONCURRENCY = max(1, int(os.getenv("KEY_UPDATE_MIN_CONCURRENCY", "1")))
+KEY_UPDATE_MAX_CONCURRENCY = max(
+    KEY_UPDATE_MIN_CONCURRENCY, int(os.getenv("KEY_UPDATE_MAX_CONCURRENCY", "50"))
+)
+# A response slower than this multiple of the running average counts as
+# congestion, the same as a 429.
+KEY_UPDATE_LATENCY_FACTOR = float(os.getenv("KEY_UPDATE_LATENCY_FACTOR", "3"))
+# Retries per key after a 429, a 5xx or a transport error, with exponential
+# backoff from the base delay unless the proxy sends Retry-After.
+KEY_UPDATE_MAX_RETRIES = max(0, int(os.getenv("KEY_UPDATE_MAX_RETRIES", "2")))
+KEY_UPDATE_RETRY_BASE_SECONDS = float(os.getenv("KEY_UPDATE_RETRY_BASE_SECONDS", "0.5"))
+
+KEY_UPDATE_APPLIED = "applied"
+KEY_UPDATE_SKIPPED = "skipped"
+KEY_UPDATE_FAILED = "failed"
+
+# /key/update fields whose current value is in a /key/list or /key/info
+# snapshot. An update touching anything else (e.g. ``duration``, which LiteLLM
+# turns into an ``expires`` timestamp) is always sent.
+SNAPSHOT_COMPARABLE_KEY_FIELDS = frozenset(
+    {
+        "max_budget",
+        "budget_duration",
+        "blocked",
+        "rpm_limit",
+        "tpm_limit",
+        "team_id",
+        "allowed_routes",
+    }
+)
+
 
 def hash_litellm_token(litellm_token: str) -> str:
     """Hash a LiteLLM key the way LiteLLM stores it internally.
@@ -61,6 +121,334 @@ def hash_litellm_token(litellm_token: str) -> str:
     return litellm_token
 
 
+def parse_litellm_timestamp(value) -> Optional[datetime]:
+    """Parse a LiteLLM ISO timestamp into an aware UTC datetime.
+
+    LiteLLM returns both ``...Z`` and naive strings depending on the column;
+    naive values are UTC. Returns ``None`` for anything unparseable.
+    """
+    if not value or not isinstance(value, str):
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+def model_deployment_ids(model_info: dict) -> dict[str, list[str]]:
+    """Deployment ids (model_info.id) per model_name in a /model/info payload."""
+    entries = (model_info.get("data") if isinstance(model_info, dict) else None) or []
+    if not isinstance(entries, list):
+        return {}
+    deployments: dict[str, list[str]] = {}
+    for entry in entries:
+        if (
+            isinstance(entry, dict)
+            and entry.get("model_name")
+            and isinstance(entry.get("model_info"), dict)
+            and entry["model_info"].get("id")
+        ):
+            deployments.setdefault(entry["model_name"], []).append(entry["model_info"]["id"])
+    return deployments
+
+
+class LiteLLMClientPool:
+    """Keep-alive ``httpx.AsyncClient`` per LiteLLM ``api_url``.
+
+    One pool is opened per process by :func:`litellm_client_pool` (the app
+    lifespan, or a job script around its run) and every
+    :class:`LiteLLMService` call for a region then reuses the same client and
+    its open connections.
+
+    httpx connections belong to the event loop that opened them, so the pool
+    only hands out clients on that loop. Calls from any other loop - e.g. the
+    limit service's propagation threads - get ``None`` and fall back to a
+    short-lived client.
+    """
+
+    def __init__(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        self._clients: dict[str, httpx.AsyncClient] = {}
+
+    def on_running_loop(self) -> bool:
+        try:
+            return asyncio.get_running_loop() is self._loop
+        except RuntimeError:
+            return False
+
+    def get(self, api_url: str) -> Optional[httpx.AsyncClient]:
+        if not self.on_running_loop():
+            return None
+        client = self._clients.get(api_url)
+        if client is None:
+            client = httpx.AsyncClient(
+                http2=LITELLM_HTTP2,
+                timeout=LITELLM_HTTP_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=LITELLM_HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=LITELLM_HTTP_MAX_KEEPALIVE,
+                    keepalive_expiry=LITELLM_HTTP_KEEPALIVE_EXPIRY,
+                ),
+            )
+            self._clients[api_url] = client
+        return client
+
+    async def aclose(self) -> None:
+        clients = list(self._clients.values())
+        self._clients.clear()
+        for client in clients:
+            try:
+                await client.aclose()
+            except Exception as e:
+                logger.warning("Error closing pooled LiteLLM client: %s", str(e))
+
+
+_client_pool: Optional[LiteLLMClientPool] = None
+
+
+@asynccontextmanager
+async def litellm_client_pool():
+    """Open the process-wide LiteLLM client pool for the duration of the block.
+
+    Used by the app lifespan and by job scripts around their ``asyncio.run``
+    body. Nesting is a no-op: an inner block on the loop that already owns the
+    pool reuses it and leaves closing to the outer one.
+    """
+    global _client_pool
+    if _client_pool is not None and _client_pool.on_running_loop():
+        yield _client_pool
+        return
+
+    pool = LiteLLMClientPool()
+    previous, _client_pool = _client_pool, pool
+    try:
+        yield pool
+    finally:
+        if _client_pool is pool:
+            _client_pool = previous
+        await pool.aclose()
+
+
+async def with_litellm_client_pool(coro):
+    """Await *coro* with the LiteLLM client pool open; for script entry points."""
+    async with litellm_client_pool():
+        return await coro
+
+
+@asynccontextmanager
+async def litellm_http_client(api_url: str):
+    """Yield an ``httpx.AsyncClient`` for requests to the proxy at *api_url*.
+
+    The pooled client when a pool is open on this loop, otherwise a
+    short-lived client closed on exit (tests, ad-hoc calls, foreign loops).
+    """
+    client = _client_pool.get(api_url) if _client_pool is not None else None
+    if client is not None:
+        yield client
+        return
+    async with httpx.AsyncClient(timeout=LITELLM_HTTP_TIMEOUT) as client:
+        yield client
+
+
+@dataclass
+class KeyUpdate:
+    """One ``/key/update`` for :meth:`LiteLLMService.bulk_update_keys`.
+
+    ``fields`` are sent as given next to ``key``; a ``None`` value is sent as
+    null, which LiteLLM reads as "clear it". ``key_id`` is only carried through
+    to the result so callers can report on their own keys.
+    """
+
+    litellm_token: str
+    fields: dict = field(default_factory=dict)
+    key_id: Optional[int] = None
+
+    def is_noop(self, current: Optional[dict]) -> bool:
+        """True when ``current`` (a key snapshot) already holds every field."""
+        if not isinstance(current, dict) or not self.fields:
+            return False
+        for name, value in self.fields.items():
+            if name not in SNAPSHOT_COMPARABLE_KEY_FIELDS or name not in current:
+                return False
+            existing = current[name]
+            if name == "blocked":
+                # LiteLLM reports a key that was never blocked as null
+                existing, value = bool(existing), bool(value)
+            if existing != value:
+                return False
+        return True
+
+
+@dataclass
+class KeyUpdateResult:
+    """Outcome of one :class:`KeyUpdate`: applied, skipped (no-op) or failed."""
+
+    litellm_token: str
+    key_id: Optional[int]
+    status: str
+    error: Optional[str] = None
+    status_code: Optional[int] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status != KEY_UPDATE_FAILED
+
+
+@dataclass
+class TeamModelsUpdateResult:
+    """Outcome of one team in :meth:`LiteLLMService.bulk_update_team_models`."""
+
+    team_id: str
+    status: str
+    error: Optional[str] = None
+    status_code: Optional[int] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status != KEY_UPDATE_FAILED
+
+
+class AIMDConcurrency:
+    """Adaptive cap on in-flight requests to one proxy.
+
+    Additive increase, multiplicative decrease: each success adds
+    ``1 / limit``, about one slot per round of requests, and a congestion
+    signal - a 429, a 5xx, a transport error or a response slower than
+    ``latency_factor`` times the running average - multiplies the limit by
+    ``backoff``. Responses to requests started before the last decrease are not
+    counted again, so one wave of failures shrinks the limit once.
+
+    Bound to the event loop it is first used on; create one per bulk call.
+    """
+
+    # Responses averaged before latency is trusted as a congestion signal
+    _WARMUP_SAMPLES = 5
+
+    def __init__(
+        self,
+        initial: float = KEY_UPDATE_INITIAL_CONCURRENCY,
+        minimum: int = KEY_UPDATE_MIN_CONCURRENCY,
+        maximum: int = KEY_UPDATE_MAX_CONCURRENCY,
+        backoff: float = 0.5,
+        latency_factor: float = KEY_UPDATE_LATENCY_FACTOR,
+    ):
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.limit = float(min(max(initial, self.minimum), self.maximum))
+        self.backoff = backoff
+        self.latency_factor = latency_factor
+        self._in_flight = 0
+        self._latency_avg: Optional[float] = None
+        self._samples = 0
+        self._last_decrease = float("-inf")
+        self._condition = asyncio.Condition()
+
+    @asynccontextmanager
+    async def slot(self):
+        """Hold one slot for a request; yields the time the request starts."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._in_flight < int(self.limit))
+            self._in_flight += 1
+        try:
+            yield time.monotonic()
+        finally:
+            async with self._condition:
+                self._in_flight -= 1
+                self._condition.notify_all()
+
+    def on_success(self, started: float, latency: float) -> None:
+        spike = (
+            self._samples >= self._WARMUP_SAMPLES
+            and latency > self.latency_factor * self._latency_avg
+        )
+        self._latency_avg = (
+            latency
+            if self._latency_avg is None
+            else 0.8 * self._latency_avg + 0.2 * latency
+        )
+        self._samples += 1
+        if spike:
+            self.on_congestion(started)
+        else:
+            self.limit = min(self.maximum, self.limit + 1 / self.limit)
+
+    def on_congestion(self, started: float) -> None:
+        if started < self._last_decrease:
+            return
+        self.limit = max(self.minimum, self.limit * self.backoff)
+        self._last_decrease = time.monotonic()
+
+
+# Limit each proxy's last bulk update settled at, keyed by api_url
+_key_update_limits: dict[str, float] = {}
+
+
+def _retry_after_seconds(response: Optional[httpx.Response], attempt: int) -> float:
+    header = response.headers.get("retry-after") if response is not None else None
+    try:
+        if header is not None:
+            # Never park a whole bulk update on one long Retry-After
+            return min(30.0, max(0.0, float(header)))
+    except ValueError:
+        pass
+    return KEY_UPDATE_RETRY_BASE_SECONDS * 2**attempt
+
+
+# Identical concurrent reads against one proxy share a single request, and
+# the result is reused for a few seconds (LITELLM_READ_TTL_* settings).
+# Dashboards poll the same team, key and model info many times per second.
+litellm_reads = SingleFlight(
+    "litellm", max_entries=settings.LITELLM_READ_CACHE_MAX_ENTRIES
+)
+
+
+def _coalesced_read(ttl_setting: str):
+    """Route a read through :data:`litellm_reads`, keyed by (api_url, method, args).
+
+    ``fresh=True`` skips the memo and reads the proxy directly. Reads that
+    decide a write (create vs update) must use it: the memo is per process, so
+    it does not see another worker's write.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        async def wrapper(self, *args, fresh: bool = False, **kwargs):
+            if fresh:
+                return await method(self, *args, **kwargs)
+            return await litellm_reads.run(
+                self.api_url,
+                (method.__name__, args, tuple(sorted(kwargs.items()))),
+                lambda: method(self, *args, **kwargs),
+                ttl_seconds=getattr(settings, ttl_setting),
+                operation=method.__name__,
+            )
+
+        return wrapper
+
+    return decorator
+
+
+def _invalidates_reads(method):
+    """Drop the region's memoized reads before and after a write.
+
+    Before, so nothing joins a read that started earlier; after, so a read
+    that ran during the write is not reused.
+    """
+
+    @functools.wraps(method)
+    async def wrapper(self, *args, **kwargs):
+        litellm_reads.invalidate(self.api_url)
+        try:
+            return await method(self, *args, **kwargs)
+        finally:
+            litellm_reads.invalidate(self.api_url)
+
+    return wrapper
+
+
 class LiteLLMService:
     def __init__(self, api_url: str, api_key: str):
         self.api_url = api_url
@@ -71,6 +459,10 @@ class LiteLLMService:
         if not self.master_key:
             raise ValueError("LiteLLM API key is required")
 
+    def _client(self):
+        """Pooled (or short-lived) HTTP client for this region's proxy."""
+        return litellm_http_client(self.api_url)
+
     @staticmethod
     def format_team_id(region_name: str, team_id: int) -> str:
         """Generate the correctly formatted team_id for LiteLLM"""
@@ -154,6 +546,7 @@ class LiteLLMService:
         lowered = (response_text or "").lower()
         return any(marker in lowered for marker in allowed_markers)
 
+    @_invalidates_reads
     async def create_key(
         self,
         email: str,
@@ -228,7 +621,7 @@ class LiteLLMService:
             if user_id is not None:
                 request_data["user_id"] = str(user_id)
 
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.api_url}/key/generate",
                     json=request_data,
@@ -258,10 +651,11 @@ class LiteLLMService:
                 detail=f"Failed to create LiteLLM key: {error_msg}",
             )
 
+    @_invalidates_reads
     async def delete_key(self, key: str) -> bool:
         """Delete a LiteLLM API key"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.api_url}/key/delete",
                     json={"keys": [key]},  # API expects an array of keys
@@ -290,10 +684,11 @@ class LiteLLMService:
                 detail=f"Failed to delete LiteLLM key: {error_msg}",
             )
 
+    @_coalesced_read("LITELLM_READ_TTL_KEY_INFO_SECONDS")
     async def get_key_info(self, litellm_token: str) -> dict:
         """Get information about a LiteLLM API key"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.get(
                     f"{self.api_url}/key/info",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -321,7 +716,11 @@ class LiteLLMService:
             )
 
     async def _fetch_key_page(
-        self, client: httpx.AsyncClient, page: int, page_size: int
+        self,
+        client: httpx.AsyncClient,
+        page: int,
+        page_size: int,
+        extra_params: Optional[dict] = None,
     ) -> dict:
         """Fetch a single ``/key/list`` page and return the decoded payload."""
         response = await client.get(
@@ -332,6 +731,7 @@ class LiteLLMService:
                 "size": page_size,
                 "return_full_object": True,
                 "include_team_keys": True,
+                **(extra_params or {}),
             },
             timeout=60.0,
         )
@@ -372,7 +772,7 @@ class LiteLLMService:
         page_size = max(1, min(int(page_size), 100))
         keys: dict[str, dict] = {}
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 first = await self._fetch_key_page(client, 1, page_size)
                 batch = self._collect_key_page(first, keys)
                 pages_fetched = 1
@@ -427,6 +827,78 @@ class LiteLLMService:
                 detail=f"Failed to list LiteLLM keys: {error_msg}",
             )
 
+    async def list_keys_updated_since(
+        self, since: datetime, page_size: int = 100
+    ) -> dict[str, dict]:
+        """Return the keys LiteLLM has touched at or after *since*.
+
+        Delta counterpart of :meth:`list_all_keys`, keyed and shaped the same
+        way. ``/key/list`` is walked newest-first by ``updated_at`` and the walk
+        stops at the first key older than *since*, so a region where little has
+        changed costs one or two requests instead of a full pagination.
+        LiteLLM bumps ``updated_at`` on every write to a key, including its
+        batched spend updates.
+
+        Deleted keys never show up here; only a full listing can drop them.
+
+        Raises ``ValueError`` when the proxy does not honour the ordering (older
+        LiteLLM releases ignore ``sort_by``) or omits ``updated_at``, because
+        stopping early on an unsorted listing would silently miss changes.
+        Callers should fall back to :meth:`list_all_keys`.
+        """
+        page_size = max(1, min(int(page_size), 100))
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        keys: dict[str, dict] = {}
+        page = 1
+        max_pages = 1000
+        previous: Optional[datetime] = None
+        try:
+            async with self._client() as client:
+                while page <= max_pages:
+                    payload = await self._fetch_key_page(
+                        client,
+                        page,
+                        page_size,
+                        {"sort_by": "updated_at", "sort_order": "desc"},
+                    )
+                    batch = payload.get("keys") or []
+                    reached_watermark = False
+                    for entry in batch:
+                        if not isinstance(entry, dict):
+                            continue
+                        updated_at = parse_litellm_timestamp(entry.get("updated_at"))
+                        if updated_at is None:
+                            raise ValueError("key without updated_at in /key/list")
+                        if previous is not None and updated_at > previous:
+                            raise ValueError("/key/list not sorted by updated_at")
+                        previous = updated_at
+                        if updated_at < since:
+                            reached_watermark = True
+                            break
+                        token = entry.get("token")
+                        if token:
+                            keys[token] = entry
+                    if reached_watermark or len(batch) < page_size:
+                        break
+                    page += 1
+
+            logger.info(
+                "Listed %d LiteLLM key(s) updated since %s from %s across %d page(s)",
+                len(keys),
+                since.isoformat(),
+                self.api_url,
+                page,
+            )
+            return keys
+        except httpx.HTTPStatusError as e:
+            status_code, error_msg, _ = self._parse_http_error(e)
+            logger.error("Error listing updated LiteLLM keys: %s", error_msg)
+            raise HTTPException(
+                status_code=status_code,
+                detail=f"Failed to list updated LiteLLM keys: {error_msg}",
+            )
+
     async def get_key_last_used(self, litellm_token: str) -> Optional[datetime]:
         """Return the timestamp a key was last used, or ``None`` if never used.
 
@@ -444,7 +916,7 @@ class LiteLLMService:
             "%Y-%m-%d %H:%M:%S"
         )
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.get(
                     f"{self.api_url}/spend/logs/v2",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -512,7 +984,7 @@ class LiteLLMService:
         page = 1
         max_pages = 100
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 while page <= max_pages:
                     response = await client.get(
                         f"{self.api_url}{endpoint}",
@@ -591,6 +1063,7 @@ class LiteLLMService:
             page_size=page_size,
         )
 
+    @_coalesced_read("LITELLM_READ_TTL_DAILY_ACTIVITY_SECONDS")
     async def get_team_daily_activity(
         self,
         team_id: str,
@@ -655,7 +1128,7 @@ class LiteLLMService:
         page = 1
         max_pages = 1000
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 while page <= max_pages:
                     response = await client.get(
                         f"{self.api_url}/key/list",
@@ -691,6 +1164,7 @@ class LiteLLMService:
                 detail=f"Failed to list LiteLLM keys for team: {error_msg}",
             )
 
+    @_invalidates_reads
     async def update_budget(
         self,
         litellm_token: str,
@@ -709,7 +1183,7 @@ class LiteLLMService:
             if include_max_budget or budget_amount is not None:
                 request_data["max_budget"] = budget_amount
 
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.api_url}/key/update",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -729,6 +1203,7 @@ class LiteLLMService:
                 detail=f"Failed to update LiteLLM budget: {error_msg}",
             )
 
+    @_invalidates_reads
     async def update_key_budget(
         self,
         litellm_token: str,
@@ -755,7 +1230,7 @@ class LiteLLMService:
             if blocked is not None:
                 request_data["blocked"] = blocked
 
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.api_url}/key/update",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -775,10 +1250,11 @@ class LiteLLMService:
                 detail=f"Failed to update LiteLLM key budget: {error_msg}",
             )
 
+    @_invalidates_reads
     async def update_key_duration(self, litellm_token: str, duration: str):
         """Update the duration for a LiteLLM API key"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.api_url}/key/update",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -798,6 +1274,7 @@ class LiteLLMService:
                 detail=f"Failed to update LiteLLM key duration: {error_msg}",
             )
 
+    @_invalidates_reads
     async def set_key_restrictions(
         self,
         litellm_token: str,
@@ -826,7 +1303,7 @@ class LiteLLMService:
                 request_data["spend"] = spend
             if blocked is not None:
                 request_data["blocked"] = blocked
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.api_url}/key/update",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -846,12 +1323,13 @@ class LiteLLMService:
                 detail=f"Failed to set LiteLLM key restrictions: {error_msg}",
             )
 
+    @_invalidates_reads
     async def set_key_allowed_routes(
         self, litellm_token: str, allowed_routes: list[str]
     ) -> None:
         """Scope an existing key to *allowed_routes* (used by the backfill)."""
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.api_url}/key/update",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -865,10 +1343,11 @@ class LiteLLMService:
                 detail=f"Failed to set LiteLLM key allowed_routes: {error_msg}",
             )
 
+    @_invalidates_reads
     async def update_key_team_association(self, litellm_token: str, new_team_id: str):
         """Update the team association for a LiteLLM API key"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.api_url}/key/update",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -888,10 +1367,190 @@ class LiteLLMService:
                 detail=f"Failed to update LiteLLM key team association: {error_msg}",
             )
 
+    async def _adaptive_post(
+        self,
+        client: httpx.AsyncClient,
+        limiter: AIMDConcurrency,
+        path: str,
+        payload: dict,
+    ) -> tuple[Optional[str], Optional[int]]:
+        """POST under ``limiter``, retrying 429s, 5xx and transport errors.
+
+        Returns ``(None, None)`` on success, else LiteLLM's error message and
+        the status code (None for transport errors).
+        """
+        attempt = 0
+        while True:
+            response = None
+            async with limiter.slot() as started:
+                try:
+                    response = await client.post(
+                        f"{self.api_url}{path}",
+                        headers={"Authorization": f"Bearer {self.master_key}"},
+                        json=payload,
+                    )
+                    response.raise_for_status()
+                    limiter.on_success(started, time.monotonic() - started)
+                    return None, None
+                except httpx.HTTPStatusError as e:
+                    status_code, error_msg, _ = self._parse_http_error(e)
+                    retryable = status_code == 429 or status_code >= 500
+                except httpx.HTTPError as e:
+                    status_code, error_msg = None, f"{type(e).__name__}: {e}"
+                    retryable = True
+                if retryable:
+                    limiter.on_congestion(started)
+            if not retryable or attempt >= KEY_UPDATE_MAX_RETRIES:
+                return error_msg, status_code
+            await asyncio.sleep(_retry_after_seconds(response, attempt))
+            attempt += 1
+
+    @_invalidates_reads
+    async def bulk_update_keys(
+        self,
+        updates: list[KeyUpdate],
+        snapshot: Optional[dict[str, dict]] = None,
+    ) -> list[KeyUpdateResult]:
+        """Apply many ``/key/update`` calls; returns one result per update, in order.
+
+        ``snapshot`` maps hashed tokens to key state, as returned by
+        :meth:`list_all_keys`. An update whose fields all already match its
+        key's snapshot entry is skipped without a request. The rest run
+        concurrently under an :class:`AIMDConcurrency` limit that grows while
+        the proxy keeps up and halves on 429s, 5xx responses and latency
+        spikes; those failures are retried up to ``KEY_UPDATE_MAX_RETRIES``
+        times. Never raises for a single key: failures are reported in the
+        results with LiteLLM's error message.
+        """
+        results: list[Optional[KeyUpdateResult]] = [None] * len(updates)
+        pending = []
+        for index, update in enumerate(updates):
+            if snapshot and update.is_noop(
+                snapshot.get(hash_litellm_token(update.litellm_token))
+            ):
+                results[index] = KeyUpdateResult(
+                    update.litellm_token, update.key_id, KEY_UPDATE_SKIPPED
+                )
+            else:
+                pending.append(index)
+        if not pending:
+            return results
+
+        limiter = AIMDConcurrency(
+            initial=_key_update_limits.get(self.api_url, KEY_UPDATE_INITIAL_CONCURRENCY)
+        )
+
+        async def _apply(client: httpx.AsyncClient, update: KeyUpdate):
+            error_msg, status_code = await self._adaptive_post(
+                client,
+                limiter,
+                "/key/update",
+                {"key": update.litellm_token, **update.fields},
+            )
+            if error_msg is None:
+                return KeyUpdateResult(
+                    update.litellm_token, update.key_id, KEY_UPDATE_APPLIED
+                )
+            return KeyUpdateResult(
+                update.litellm_token,
+                update.key_id,
+                KEY_UPDATE_FAILED,
+                error=error_msg,
+                status_code=status_code,
+            )
+
+        async with self._client() as client:
+            applied = await asyncio.gather(
+                *[_apply(client, updates[index]) for index in pending]
+            )
+        for index, result in zip(pending, applied):
+            results[index] = result
+        _key_update_limits[self.api_url] = limiter.limit
+
+        failed = sum(1 for result in applied if not result.ok)
+        logger.info(
+            "Bulk key update on %s: %d applied, %d skipped, %d failed (concurrency %d)",
+            self.api_url,
+            len(applied) - failed,
+            len(updates) - len(pending),
+            failed,
+            int(limiter.limit),
+        )
+        return results
+
+    @_invalidates_reads
+    async def bulk_update_team_models(
+        self,
+        models_by_team: dict[str, list[str]],
+        current: Optional[dict[str, list]] = None,
+    ) -> list[TeamModelsUpdateResult]:
+        """Set many LiteLLM teams' `models` lists; one result per team, in order.
+
+        ``current`` maps team ids to the `models` LiteLLM already has, as
+        returned by :meth:`list_team_models`; a team whose list already
+        matches is skipped without a request. The rest run like
+        :meth:`bulk_update_keys`: concurrently under an adaptive limit, with
+        congestion failures retried. Never raises for a single team.
+        """
+        results: list[TeamModelsUpdateResult] = []
+        pending: list[int] = []
+        for team_id, models in models_by_team.items():
+            existing = current.get(team_id) if current is not None else None
+            if existing is not None and sorted(existing) == sorted(models):
+                results.append(TeamModelsUpdateResult(team_id, KEY_UPDATE_SKIPPED))
+            else:
+                pending.append(len(results))
+                results.append(TeamModelsUpdateResult(team_id, KEY_UPDATE_APPLIED))
+        if not pending:
+            return results
+
+        limiter = AIMDConcurrency(
+            initial=_key_update_limits.get(self.api_url, KEY_UPDATE_INITIAL_CONCURRENCY)
+        )
+
+        async def _apply(client: httpx.AsyncClient, result: TeamModelsUpdateResult):
+            error_msg, status_code = await self._adaptive_post(
+                client,
+                limiter,
+                "/team/update",
+                {"team_id": result.team_id, "models": models_by_team[result.team_id]},
+            )
+            if error_msg is not None:
+                result.status = KEY_UPDATE_FAILED
+                result.error = error_msg
+                result.status_code = status_code
+
+        async with self._client() as client:
+            await asyncio.gather(*[_apply(client, results[index]) for index in pending])
+        _key_update_limits[self.api_url] = limiter.limit
+        return results
+
+    async def list_team_models(self) -> dict[str, list]:
+        """Every LiteLLM team's `models` list, keyed by team id (one request)."""
+        try:
+            async with self._client() as client:
+                response = await client.get(
+                    f"{self.api_url}/team/list",
+                    headers={"Authorization": f"Bearer {self.master_key}"},
+                )
+                response.raise_for_status()
+                return {
+                    team["team_id"]: team.get("models") or []
+                    for team in response.json()
+                    if isinstance(team, dict) and team.get("team_id")
+                }
+        except httpx.HTTPStatusError as e:
+            _, error_msg, _ = self._parse_http_error(e)
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"Failed to list LiteLLM teams: {error_msg}",
+            )
+
+    @_coalesced_read("LITELLM_READ_TTL_TEAM_INFO_SECONDS")
     async def get_team_info(self, team_id: str) -> dict:
         """Get information about a LiteLLM team including budget"""
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.get(
                     f"{self.api_url}/team/info",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -912,10 +1571,11 @@ class LiteLLMService:
                 detail=f"Failed to get LiteLLM team info: {error_msg}",
             )
 
+    @_coalesced_read("LITELLM_READ_TTL_MODEL_INFO_SECONDS")
     async def get_model_info(self) -> dict:
         """Get LiteLLM model info for this region."""
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.get(
                     f"{self.api_url}/model/info",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -938,7 +1598,7 @@ class LiteLLMService:
     async def get_router_settings(self) -> dict:
         """Get LiteLLM router settings (includes model_group_alias)."""
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.get(
                     f"{self.api_url}/router/settings",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -961,7 +1621,7 @@ class LiteLLMService:
     async def get_cost_margin_config(self) -> dict:
         """Get LiteLLM provider margin configuration."""
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.get(
                     f"{self.api_url}/config/cost_margin_config",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -984,7 +1644,7 @@ class LiteLLMService:
     async def get_user_info(self, user_id: str) -> dict:
         """Get information about a LiteLLM user including spend and keys."""
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.get(
                     f"{self.api_url}/user/info",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -1005,6 +1665,7 @@ class LiteLLMService:
                 detail=f"Failed to get LiteLLM user info: {error_msg}",
             )
 
+    @_invalidates_reads
     async def create_team(
         self,
         max_budget: Optional[float] = None,
@@ -1035,7 +1696,7 @@ class LiteLLMService:
             if models is not None:
                 request_data["models"] = models
 
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.api_url}/team/new",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -1058,6 +1719,7 @@ class LiteLLMService:
                 detail=f"Failed to create LiteLLM team: {error_msg}",
             )
 
+    @_invalidates_reads
     async def update_team_budget(
         self,
         team_id: str,
@@ -1089,7 +1751,7 @@ class LiteLLMService:
             if model_aliases is not None:
                 request_data["model_aliases"] = model_aliases
 
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.api_url}/team/update",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -1104,6 +1766,7 @@ class LiteLLMService:
                 detail=f"Failed to update LiteLLM team budget: {error_msg}",
             )
 
+    @_invalidates_reads
     async def update_team_models(self, team_id: str, models: list[str]) -> None:
         """Set a LiteLLM team's `models` list (access-group slugs).
 
@@ -1111,7 +1774,7 @@ class LiteLLMService:
         all-proxy-models) — used when a region's enforcement is turned off.
         """
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.api_url}/team/update",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -1155,7 +1818,7 @@ class LiteLLMService:
 
     async def _fetch_team_model_aliases_from_list(self, team_id: str) -> dict | None:
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.get(
                     f"{self.api_url}/team/list",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -1175,6 +1838,7 @@ class LiteLLMService:
                 detail=f"Failed to list LiteLLM teams: {error_msg}",
             )
 
+    @_invalidates_reads
     async def create_user(
         self,
         user_id: str,
@@ -1192,7 +1856,7 @@ class LiteLLMService:
             request_data["teams"] = teams
 
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.api_url}/user/new",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -1211,11 +1875,12 @@ class LiteLLMService:
                 detail=f"Failed to create LiteLLM user: {error_msg}",
             )
 
+    @_invalidates_reads
     async def update_user(self, user_id: str, updates: dict) -> None:
         """Update a LiteLLM user."""
         request_data = {"user_id": user_id, **updates}
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.api_url}/user/update",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -1229,10 +1894,11 @@ class LiteLLMService:
                 detail=f"Failed to update LiteLLM user: {error_msg}",
             )
 
+    @_invalidates_reads
     async def delete_user(self, user_id: str) -> None:
         """Delete a LiteLLM user. Treat already-deleted users as success."""
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.api_url}/user/delete",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -1251,6 +1917,7 @@ class LiteLLMService:
                 detail=f"Failed to delete LiteLLM user: {error_msg}",
             )
 
+    @_invalidates_reads
     async def add_team_member(
         self, team_id: str, user_id: str, role: str = "user"
     ) -> None:
@@ -1260,7 +1927,7 @@ class LiteLLMService:
             "member": {"user_id": user_id, "role": role},
         }
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.api_url}/team/member_add",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -1281,6 +1948,7 @@ class LiteLLMService:
                 detail=f"Failed to add LiteLLM team member: {error_msg}",
             )
 
+    @_invalidates_reads
     async def update_team_member(
         self,
         team_id: str,
@@ -1300,7 +1968,7 @@ class LiteLLMService:
         if max_budget_in_team is not None:
             payload["max_budget_in_team"] = max_budget_in_team
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.api_url}/team/member_update",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -1354,7 +2022,7 @@ class LiteLLMService:
         via /user/info, then POST it via /budget/update.
         """
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 user_resp = await client.get(
                     f"{self.api_url}/user/info",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -1386,7 +2054,7 @@ class LiteLLMService:
                 )
                 return
 
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 resp = await client.post(
                     f"{self.api_url}/budget/update",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -1416,11 +2084,12 @@ class LiteLLMService:
                 detail=f"Failed to update membership budget duration: {error_msg}",
             )
 
+    @_invalidates_reads
     async def remove_team_member(self, team_id: str, user_id: str) -> None:
         """Remove a user from a LiteLLM team. Treat missing membership as success."""
         payload = {"team_id": team_id, "user_id": user_id}
         try:
-            async with httpx.AsyncClient() as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.api_url}/team/member_delete",
                     headers={"Authorization": f"Bearer {self.master_key}"},
@@ -1443,6 +2112,7 @@ class LiteLLMService:
                 detail=f"Failed to remove LiteLLM team member: {error_msg}",
             )
 
+    @_invalidates_reads
     async def add_model(
         self,
         model_id: str,
@@ -1464,11 +2134,12 @@ class LiteLLMService:
             payload["litellm_params"]["model"] = model_id
 
         try:
-            async with httpx.AsyncClient(timeout=MODEL_HTTP_TIMEOUT) as client:
+            async with self._client() as client:
                 response = await client.post(
                     f"{self.api_url}/model/new",
                     headers={"Authorization": f"Bearer {self.master_key}"},
                     json=payload,
+                    timeout=MODEL_HTTP_TIMEOUT,
                 )
                 response.raise_for_status()
                 return response.json()
@@ -1490,19 +2161,11 @@ class LiteLLMService:
         and /model/new allows duplicate model_names — so callers must resolve
         ids first to upsert/delete correctly.
         """
-        info = await self.get_model_info()
-        entries = info.get("data") or []
-        if not isinstance(entries, list):
-            return []
-        return [
-            entry["model_info"]["id"]
-            for entry in entries
-            if isinstance(entry, dict)
-            and entry.get("model_name") == model_id
-            and isinstance(entry.get("model_info"), dict)
-            and entry["model_info"].get("id")
-        ]
+        # Decides create vs update, so never from a memoized read
+        info = await self.get_model_info(fresh=True)
+        return model_deployment_ids(info).get(model_id, [])
 
+    @_invalidates_reads
     async def update_model(
         self,
         model_id: str,
@@ -1531,7 +2194,7 @@ class LiteLLMService:
 
         result = {}
         try:
-            async with httpx.AsyncClient(timeout=MODEL_HTTP_TIMEOUT) as client:
+            async with self._client() as client:
                 for dep_id in deployment_ids:
                     model_info: dict = {"id": dep_id}
                     if access_groups is not None:
@@ -1544,6 +2207,7 @@ class LiteLLMService:
                             "litellm_params": params,
                             "model_info": model_info,
                         },
+                        timeout=MODEL_HTTP_TIMEOUT,
                     )
                     response.raise_for_status()
                     result = response.json()
@@ -1556,6 +2220,7 @@ class LiteLLMService:
                 detail=f"Failed to update LiteLLM model: {error_msg}",
             )
 
+    @_invalidates_reads
     async def delete_model(self, model_id: str, deployment_ids: Optional[list[str]] = None) -> None:
         """
         Delete/deregister a model in LiteLLM.
@@ -1569,12 +2234,13 @@ class LiteLLMService:
             return
 
         try:
-            async with httpx.AsyncClient(timeout=MODEL_HTTP_TIMEOUT) as client:
+            async with self._client() as client:
                 for dep_id in deployment_ids:
                     response = await client.post(
                         f"{self.api_url}/model/delete",
                         headers={"Authorization": f"Bearer {self.master_key}"},
                         json={"id": dep_id},
+                        timeout=MODEL_HTTP_TIMEOUT,
                     )
                     if response.status_code >= 400 and self._is_idempotent_litellm_error(
                         response.status_code,
@@ -1,15 +1,29 @@
+import asyncio
 import logging
+import time
 import traceback
+from dataclasses import dataclass, field
 from datetime import datetime, UTC
+from typing import Optional
 
-from app.core.config import catalog_manages
+from prometheus_client import Histogram
+from sqlalchemy.orm import Session
+
+from app.core.config import catalog_manages, settings
 from app.db.database import get_db
 from app.db.models import DBModel, DBModelAliasTarget, DBModelRegion, DBRegion
-from app.services.access_groups import model_access_group_slugs
-from app.services.litellm import LiteLLMService
+from app.services.access_groups import model_access_group_slugs, region_model_group_slugs
+from app.services.litellm import LiteLLMService, model_deployment_ids
 
 logger = logging.getLogger(__name__)
 
+model_sync_region_duration_seconds = Histogram(
+    "model_sync_region_duration_seconds",
+    "Time to sync one region's batch of models (read, diff and writes)",
+    ["region"],
+    buckets=(0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, float("inf")),
+)
+
 
 def effective_litellm_params(
     db, model: DBModel, region_id: int
@@ -191,3 +205,267 @@ async def sync_model_to_region_task(model_id: int, region_id: int) -> None:
                 db.commit()
             db.close()
 
+
+
+MODEL_SYNC_CREATE = "create"
+MODEL_SYNC_UPDATE = "update"
+MODEL_SYNC_DELETE = "delete"
+
+
+@dataclass
+class ModelSyncOp:
+    """One write to a proxy: register, update or deregister a model."""
+
+    model_pk: int
+    model_name: str
+    action: str
+    params: Optional[dict] = None
+    access_groups: Optional[list[str]] = None
+    deployment_ids: list[str] = field(default_factory=list)
+
+
+@dataclass
+class RegionSyncPlan:
+    """What syncing a batch of models to one region takes.
+
+    ``ops`` are the proxy writes. ``settled`` holds the models whose outcome
+    is known without a write (model_pk -> (sync_status, sync_error)): a
+    deregistration of a model the proxy does not have, or a deployment that
+    cannot be synced at all.
+    """
+
+    region_id: int
+    region_name: str
+    ops: list[ModelSyncOp] = field(default_factory=list)
+    settled: dict[int, tuple[str, Optional[str]]] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def count(self, action: str) -> int:
+        return sum(1 for op in self.ops if op.action == action)
+
+    @property
+    def unchanged(self) -> int:
+        return sum(1 for status, _ in self.settled.values() if status == "synced")
+
+    @property
+    def failed(self) -> int:
+        return sum(1 for status, _ in self.settled.values() if status != "synced")
+
+
+def _by_region(syncs: list[tuple[int, int]]) -> dict[int, list[int]]:
+    by_region: dict[int, list[int]] = {}
+    for model_pk, region_id in sorted(syncs):
+        by_region.setdefault(region_id, []).append(model_pk)
+    return by_region
+
+
+async def fetch_region_deployments(region: DBRegion) -> dict[str, list[str]]:
+    """The proxy's deployment ids per model name, from one /model/info read.
+
+    Read fresh: the result decides create vs update, and a memoized read can
+    predate another worker's /model/new.
+    """
+    service = LiteLLMService(api_url=region.litellm_api_url, api_key=region.litellm_api_key)
+    return model_deployment_ids(await service.get_model_info(fresh=True))
+
+
+def plan_region_sync(
+    db: Session,
+    region: Optional[DBRegion],
+    region_id: int,
+    model_pks: list[int],
+    deployments: dict[str, list[str]] | Exception | None,
+) -> RegionSyncPlan:
+    """Diff the desired state of ``model_pks`` in a region against the proxy's
+    deployments (or the error reading them). Same decisions as
+    sync_model_to_region_task, for the whole batch at once."""
+    plan = RegionSyncPlan(region_id=region_id, region_name=region.name if region else str(region_id))
+    status = "failed"
+    if region is None:
+        plan.error = f"Region {region_id} not found"
+    elif not region.is_active:
+        plan.error = f"Region {region.name} is inactive and cannot be synchronized."
+    elif not catalog_manages(region.name):
+        # Never touched, exactly like sync_model_to_region_task
+        status = "not_configured"
+        plan.error = f"Region {region.name} is not catalog-managed (CATALOG_MANAGED_REGIONS)."
+    elif isinstance(deployments, Exception):
+        plan.error = f"Failed to list LiteLLM models: {deployments}"
+    if plan.error:
+        plan.settled = {model_pk: (status, plan.error) for model_pk in model_pks}
+        return plan
+
+    models = {m.id: m for m in db.query(DBModel).filter(DBModel.id.in_(model_pks)).all()}
+    assocs = {
+        a.model_id: a
+        for a in db.query(DBModelRegion)
+        .filter(DBModelRegion.region_id == region_id, DBModelRegion.model_id.in_(model_pks))
+        .all()
+    }
+    slugs = region_model_group_slugs(db, model_pks, region_id)
+    for model_pk in model_pks:
+        assoc, model = assocs.get(model_pk), models.get(model_pk)
+        if assoc is None:
+            logger.error(f"Sync skipped: DBModelRegion association not found for model_id={model_pk}, region_id={region_id}")
+            continue
+        if model is None:
+            plan.settled[model_pk] = ("failed", "Model found: False, Region found: True")
+            continue
+        deployment_ids = deployments.get(model.model_id, [])
+        if assoc.is_active and model.is_active_globally:
+            params, resolve_error = effective_litellm_params(db, model, region_id)
+            if resolve_error:
+                plan.settled[model_pk] = ("failed", resolve_error)
+                continue
+            plan.ops.append(
+                ModelSyncOp(
+                    model_pk=model_pk,
+                    model_name=model.model_id,
+                    action=MODEL_SYNC_UPDATE if deployment_ids else MODEL_SYNC_CREATE,
+                    params=params,
+                    access_groups=slugs[model_pk],
+                    deployment_ids=deployment_ids,
+                )
+            )
+        elif deployment_ids:
+            plan.ops.append(
+                ModelSyncOp(
+                    model_pk=model_pk,
+                    model_name=model.model_id,
+                    action=MODEL_SYNC_DELETE,
+                    deployment_ids=deployment_ids,
+                )
+            )
+        else:
+            plan.settled[model_pk] = ("synced", None)
+    return plan
+
+
+async def plan_model_syncs(db: Session, syncs: list[tuple[int, int]]) -> list[RegionSyncPlan]:
+    """Plan (model_pk, region_id) syncs per region without writing anything.
+
+    Reads each region's proxy once, all regions concurrently; used for
+    dry-run reports.
+    """
+    by_region = _by_region(syncs)
+    regions = {r.id: r for r in db.query(DBRegion).filter(DBRegion.id.in_(by_region)).all()}
+    readable = [
+        region for region in regions.values() if region.is_active and catalog_manages(region.name)
+    ]
+    listings = await asyncio.gather(
+        *[fetch_region_deployments(region) for region in readable], return_exceptions=True
+    )
+    deployments = {region.id: listing for region, listing in zip(readable, listings)}
+    return [
+        plan_region_sync(db, regions.get(region_id), region_id, model_pks, deployments.get(region_id))
+        for region_id, model_pks in by_region.items()
+    ]
+
+
+async def _apply_op(service: LiteLLMService, op: ModelSyncOp) -> None:
+    if op.action == MODEL_SYNC_CREATE:
+        await service.add_model(op.model_name, op.params, access_groups=op.access_groups)
+    elif op.action == MODEL_SYNC_UPDATE:
+        await service.update_model(
+            op.model_name, op.params, op.deployment_ids, access_groups=op.access_groups
+        )
+    else:
+        await service.delete_model(op.model_name, op.deployment_ids)
+
+
+async def sync_region_models(region_id: int, model_pks: list[int]) -> RegionSyncPlan:
+    """Sync a batch of models to one region: read the proxy's model list once,
+    diff, then run the writes concurrently (MODEL_SYNC_CONCURRENCY). Every
+    DBModelRegion in the batch ends up synced, failed or not_configured."""
+    started = time.monotonic()
+    db = next(get_db())
+    try:
+        return await _sync_region_models(db, region_id, model_pks, started)
+    except Exception as e:
+        # Leave no deployment of the batch stuck in 'pending'
+        logger.error(f"Model sync for region_id={region_id} crashed: {e}\n{traceback.format_exc()}")
+        db.rollback()
+        for assoc in (
+            db.query(DBModelRegion)
+            .filter(DBModelRegion.region_id == region_id, DBModelRegion.model_id.in_(model_pks))
+            .all()
+        ):
+            assoc.sync_status = "failed"
+            assoc.sync_error = f"Region sync crashed: {type(e).__name__}"
+            assoc.updated_at = datetime.now(UTC)
+        db.commit()
+        raise
+    finally:
+        db.close()
+
+
+async def _sync_region_models(
+    db: Session, region_id: int, model_pks: list[int], started: float
+) -> RegionSyncPlan:
+    region = db.query(DBRegion).filter_by(id=region_id).first()
+    deployments = None
+    if region and region.is_active and catalog_manages(region.name):
+        try:
+            deployments = await fetch_region_deployments(region)
+        except Exception as e:
+            deployments = e
+    plan = plan_region_sync(db, region, region_id, model_pks, deployments)
+
+    outcomes = dict(plan.settled)
+    if plan.ops:
+        service = LiteLLMService(api_url=region.litellm_api_url, api_key=region.litellm_api_key)
+        semaphore = asyncio.Semaphore(max(1, settings.MODEL_SYNC_CONCURRENCY))
+
+        async def _run(op: ModelSyncOp):
+            async with semaphore:
+                await _apply_op(service, op)
+
+        results = await asyncio.gather(*[_run(op) for op in plan.ops], return_exceptions=True)
+        for op, result in zip(plan.ops, results):
+            if isinstance(result, Exception):
+                logger.error(f"Sync failed for model_id={op.model_pk}, region_id={region_id}: {result}")
+                outcomes[op.model_pk] = ("failed", _scrub_secrets(str(result), op.params))
+            else:
+                outcomes[op.model_pk] = ("synced", None)
+
+    now = datetime.now(UTC)
+    for assoc in (
+        db.query(DBModelRegion)
+        .filter(DBModelRegion.region_id == region_id, DBModelRegion.model_id.in_(list(outcomes)))
+        .all()
+    ):
+        sync_status, sync_error = outcomes[assoc.model_id]
+        assoc.sync_status = sync_status
+        if sync_error:
+            # The pushed params can be an alias target's; scrub the
+            # deployment's own sources too.
+            model = db.query(DBModel).filter_by(id=assoc.model_id).first()
+            sync_error = _scrub_secrets(sync_error, model.litellm_params if model else None)
+            sync_error = _scrub_secrets(sync_error, assoc.litellm_params_override)
+        assoc.sync_error = sync_error
+        if sync_status == "synced":
+            assoc.synced_at = now
+        assoc.updated_at = now
+    db.commit()
+
+    elapsed = time.monotonic() - started
+    model_sync_region_duration_seconds.labels(plan.region_name).observe(elapsed)
+    logger.info(
+        f"Model sync for region {plan.region_name}: {plan.count(MODEL_SYNC_CREATE)} created, "
+        f"{plan.count(MODEL_SYNC_UPDATE)} updated, {plan.count(MODEL_SYNC_DELETE)} deleted, "
+        f"{plan.unchanged} already absent, "
+        f"{sum(1 for status, _ in outcomes.values() if status != 'synced')} failed "
+        f"in {elapsed:.2f}s"
+    )
+    return plan
+
+
+async def sync_models_to_regions_task(syncs: list[tuple[int, int]]) -> None:
+    """Background task: sync many (model_pk, region_id) pairs, one
+    sync_region_models batch per region, all regions concurrently."""
+    # A region that crashes has logged it and failed its own batch; the
+    # others carry on.
+    await asyncio.gather(
+        *[sync_region_models(region_id, model_pks) for region_id, model_pks in _by_region(syncs).items()],
+        return_exceptions=True,
+    )
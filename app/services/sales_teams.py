@@ -0,0 +1,249 @@
+"""Precomputed rows for the sales dashboard (/teams/sales/list-teams).
+
+``refresh_sales_team_rows`` rebuilds the ``sales_team_rows`` table from teams,
+their active products, their keys' regions and the spend monitor_teams stores
+in ``team_metrics``, in one INSERT ... SELECT. Reading a page is then a single
+query with the filters, sort and offset applied in SQL. Nothing here calls
+LiteLLM: a team monitor_teams has not measured yet shows 0 spend and a null
+``metrics_updated_at`` until the next run.
+"""
+
+import logging
+from datetime import UTC, datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import String, case, cast, func, literal, select, union
+from sqlalchemy.dialects.postgresql import JSONB, aggregate_order_by
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db.models import (
+    DBPrivateAIKey,
+    DBProduct,
+    DBRegion,
+    DBSalesTeamRow,
+    DBTeam,
+    DBTeamMetrics,
+    DBTeamProduct,
+    DBUser,
+)
+
+logger = logging.getLogger(__name__)
+
+# Teams without a product are trials for this many days after creation or
+# their last payment (see trial_status).
+TRIAL_PERIOD_DAYS = 30
+
+SORT_COLUMNS = {
+    "name": func.lower(DBSalesTeamRow.name),
+    "admin_email": func.lower(DBSalesTeamRow.admin_email),
+    "created_at": DBSalesTeamRow.created_at,
+    "last_payment": DBSalesTeamRow.last_payment,
+    "total_spend": DBSalesTeamRow.total_spend,
+}
+
+
+def refresh_sales_team_rows(db: Session) -> None:
+    """Rebuild every team's row from current DB state. Commits."""
+    products = (
+        select(
+            DBTeamProduct.team_id,
+            func.json_agg(
+                aggregate_order_by(
+                    func.json_build_object(
+                        "id",
+                        DBProduct.id,
+                        "name",
+                        DBProduct.name,
+                        "active",
+                        DBProduct.active,
+                    ),
+                    DBProduct.name,
+                )
+            ).label("products"),
+            func.count().label("product_count"),
+        )
+        .join(DBProduct, DBProduct.id == DBTeamProduct.product_id)
+        .where(DBProduct.active.is_(True))
+        .group_by(DBTeamProduct.team_id)
+        .subquery()
+    )
+
+    # A key belongs to its team and, for user-owned keys, to the owner's team.
+    key_regions = union(
+        select(DBPrivateAIKey.team_id.label("team_id"), DBRegion.name.label("name"))
+        .join(DBRegion, DBRegion.id == DBPrivateAIKey.region_id)
+        .where(
+            DBPrivateAIKey.team_id.isnot(None),
+            DBPrivateAIKey.litellm_token.isnot(None),
+            DBRegion.is_active.is_(True),
+        ),
+        select(DBUser.team_id.label("team_id"), DBRegion.name.label("name"))
+        .join(DBPrivateAIKey, DBPrivateAIKey.owner_id == DBUser.id)
+        .join(DBRegion, DBRegion.id == DBPrivateAIKey.region_id)
+        .where(
+            DBUser.team_id.isnot(None),
+            DBPrivateAIKey.litellm_token.isnot(None),
+            DBRegion.is_active.is_(True),
+        ),
+    ).subquery()
+    regions = (
+        select(
+            key_regions.c.team_id,
+            func.json_agg(
+                aggregate_order_by(key_regions.c.name, key_regions.c.name)
+            ).label("regions"),
+        )
+        .group_by(key_regions.c.team_id)
+        .subquery()
+    )
+
+    rows = (
+        select(
+            DBTeam.id,
+            DBTeam.name,
+            DBTeam.admin_email,
+            DBTeam.created_at,
+            DBTeam.last_payment,
+            func.coalesce(DBTeam.is_always_free, False),
+            cast(DBTeam.budget_type, String),
+            func.coalesce(products.c.products, func.json_build_array()),
+            func.coalesce(products.c.product_count, 0),
+            func.coalesce(regions.c.regions, func.json_build_array()),
+            func.coalesce(DBTeamMetrics.total_spend, 0.0),
+            DBTeamMetrics.last_updated,
+            func.now(),
+        )
+        .outerjoin(products, products.c.team_id == DBTeam.id)
+        .outerjoin(regions, regions.c.team_id == DBTeam.id)
+        .outerjoin(DBTeamMetrics, DBTeamMetrics.team_id == DBTeam.id)
+    )
+    columns = [
+        "team_id",
+        "name",
+        "admin_email",
+        "created_at",
+        "last_payment",
+        "is_always_free",
+        "budget_type",
+        "products",
+        "product_count",
+        "regions",
+        "total_spend",
+        "metrics_updated_at",
+        "refreshed_at",
+    ]
+    stmt = pg_insert(DBSalesTeamRow).from_select(columns, rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[DBSalesTeamRow.team_id],
+        set_={column: stmt.excluded[column] for column in columns[1:]},
+    )
+    db.execute(stmt)
+    # Rows of deleted teams go with them (ON DELETE CASCADE).
+    db.commit()
+
+
+def sales_team_rows_refreshed_at(db: Session) -> Optional[datetime]:
+    return db.execute(select(func.min(DBSalesTeamRow.refreshed_at))).scalar()
+
+
+def refresh_stale_sales_team_rows(db: Session) -> bool:
+    """Rebuild the rows when missing or older than the configured max age.
+
+    Run by the refresh-sales-team-rows cron, so new teams and products show up
+    between monitor_teams runs; readers never rebuild. Returns whether it did.
+    """
+    refreshed_at = sales_team_rows_refreshed_at(db)
+    max_age = timedelta(seconds=settings.SALES_TEAM_ROWS_MAX_AGE_SECONDS)
+    if refreshed_at is not None and datetime.now(UTC) - refreshed_at <= max_age:
+        return False
+    refresh_sales_team_rows(db)
+    return True
+
+
+def trial_status_category():
+    """SQL for the trial status bucket: always_free, active_product, expired or trial."""
+    trial_start = func.coalesce(DBSalesTeamRow.last_payment, DBSalesTeamRow.created_at)
+    return case(
+        (DBSalesTeamRow.is_always_free.is_(True), literal("always_free")),
+        (DBSalesTeamRow.product_count > 0, literal("active_product")),
+        (
+            trial_start <= func.now() - timedelta(days=TRIAL_PERIOD_DAYS),
+            literal("expired"),
+        ),
+        else_=literal("trial"),
+    )
+
+
+def trial_status(row: DBSalesTeamRow, now: Optional[datetime] = None) -> str:
+    """The trial status label shown on the dashboard for ``row``."""
+    if row.is_always_free:
+        return "Always Free"
+    if row.product_count > 0:
+        return "Active Product"
+    now = now or datetime.now(UTC)
+    trial_start = row.last_payment or row.created_at
+    days_remaining = TRIAL_PERIOD_DAYS - (now - trial_start.replace(tzinfo=UTC)).days
+    if days_remaining <= 0:
+        return "Expired"
+    return f"{days_remaining} days left"
+
+
+def query_sales_team_rows(
+    db: Session,
+    name: Optional[str] = None,
+    admin_email: Optional[str] = None,
+    budget_type: Optional[str] = None,
+    trial_status_filter: Optional[str] = None,
+    region: Optional[str] = None,
+    skip: int = 0,
+    limit: Optional[int] = None,
+    sort_by: Optional[str] = None,
+    sort_order: str = "asc",
+) -> tuple[list[DBSalesTeamRow], int]:
+    """One page of rows plus the total number of matching rows, in one query."""
+    query = select(DBSalesTeamRow, func.count().over().label("total"))
+    if name:
+        query = query.where(DBSalesTeamRow.name.ilike(_contains(name), escape="\\"))
+    if admin_email:
+        query = query.where(
+            DBSalesTeamRow.admin_email.ilike(_contains(admin_email), escape="\\")
+        )
+    if budget_type:
+        query = query.where(DBSalesTeamRow.budget_type == budget_type)
+    if trial_status_filter:
+        query = query.where(trial_status_category() == trial_status_filter)
+    if region:
+        query = query.where(cast(DBSalesTeamRow.regions, JSONB).contains([region]))
+
+    order_by = []
+    if sort_by:
+        column = SORT_COLUMNS[sort_by]
+        order_by.append(
+            column.desc().nulls_last() if sort_order == "desc" else column.asc()
+        )
+    # Stable ordering so skip/limit pagination is deterministic
+    order_by.append(DBSalesTeamRow.team_id)
+    query = query.order_by(*order_by).offset(skip)
+    if limit is not None:
+        query = query.limit(limit)
+
+    results = db.execute(query).all()
+    if results:
+        total = results[0].total
+    elif skip:
+        # Past the last page there is no row to carry the window count.
+        total = db.execute(
+            select(func.count()).select_from(
+                query.order_by(None).offset(None).limit(None).subquery()
+            )
+        ).scalar()
+    else:
+        total = 0
+    return [row for row, _ in results], total
+
+
+def _contains(value: str) -> str:
+    escaped = value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
@@ -1,3 +1,4 @@
+import asyncio
 import importlib
 import logging
 import os
@@ -144,8 +145,12 @@ async def get_product_id_from_session(session_id: str) -> str:
 
 async def get_subscribed_products_for_customer(customer_id: str) -> list[(str, str)]:
     try:
-        items = stripe_sdk.Subscription.list(
-            customer=customer_id, expand=["data.plan.product"]
+        # The SDK is blocking; monitor_teams calls this for every team from
+        # concurrent workers, which must not stall the event loop.
+        items = await asyncio.to_thread(
+            stripe_sdk.Subscription.list,
+            customer=customer_id,
+            expand=["data.plan.product"],
         )
     except Exception as e:
         logger.error(
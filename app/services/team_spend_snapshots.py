@@ -0,0 +1,159 @@
+"""Per-(team, region) snapshots of the key spend LiteLLM reports for a team.
+
+/users/spend needs, for every team a user belongs to, the spend of each key
+in each of the team's regions. That comes from one ``/team/info`` call per
+(team, region), and it is the same call for every member of the team, so the
+result is kept here and shared:
+
+- Snapshots live in ``shared_cache`` (app/core/shared_cache.py), so every
+  worker and replica reuses them until they expire. Its calls are blocking
+  file or Redis I/O and run in a worker thread, off the event loop.
+- Concurrent misses for the same (team, region) in one process share a
+  single in-flight fetch.
+- ``invalidate_team_spend_snapshots`` retires every snapshot of a team at
+  once by moving the team to a new generation; the old entries are never
+  read again and age out.
+
+A snapshot holds only what the spend rollup reads from each key: its spend
+and the metadata that ties it to a user.
+"""
+
+import asyncio
+import json
+import logging
+import uuid
+from typing import Awaitable, Callable, Optional
+
+from app.core.shared_cache import shared_cache
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_TTL_SECONDS = 15 * 60
+# Outlives every snapshot written under the generation it names.
+_GENERATION_TTL_SECONDS = 2 * SNAPSHOT_TTL_SECONDS
+
+# One in-flight fetch per (team_id, region_id).
+_fetches: dict[tuple[int, int], asyncio.Task] = {}
+
+
+def _generation_key(team_id: int) -> str:
+    return f"team-spend:{team_id}:generation"
+
+
+def _snapshot_key(team_id: int, region_id: int, generation: str) -> str:
+    return f"team-spend:{team_id}:{generation}:{region_id}"
+
+
+async def _generation(team_id: int) -> str:
+    try:
+        raw = await asyncio.to_thread(shared_cache.get, _generation_key(team_id))
+    except Exception as exc:
+        logger.warning("Reading team spend snapshot generation failed: %s", exc)
+        return "0"
+    return raw.decode() if raw is not None else "0"
+
+
+def snapshot_keys(team_info: dict) -> list[dict]:
+    """Reduce a /team/info response to the per-key fields the rollup reads."""
+    keys = team_info.get("keys", []) if isinstance(team_info, dict) else []
+    snapshot = []
+    for key in keys:
+        if not isinstance(key, dict):
+            continue
+        metadata = key.get("metadata") or {}
+        try:
+            spend = float(key.get("spend") or 0.0)
+        except (TypeError, ValueError):
+            continue
+        snapshot.append(
+            {
+                "spend": spend,
+                "amazeeai_user_id": metadata.get("amazeeai_user_id"),
+                "service_account_id": metadata.get("service_account_id"),
+            }
+        )
+    return snapshot
+
+
+def _in_flight(fetch_key: tuple[int, int]) -> Optional[asyncio.Task]:
+    task = _fetches.get(fetch_key)
+    # A task left behind by an event loop that has since closed never
+    # finishes, so it is never dropped by _forget.
+    if task is None or task.get_loop() is not asyncio.get_running_loop():
+        return None
+    return task
+
+
+def _forget(fetch_key: tuple[int, int], task: asyncio.Task) -> None:
+    # The snapshot lives on in the shared cache; don't keep it here as well.
+    if _fetches.get(fetch_key) is task:
+        del _fetches[fetch_key]
+
+
+async def get_team_region_keys(
+    team_id: int,
+    region_id: int,
+    fetch_team_info: Callable[[], Awaitable[dict]],
+) -> list[dict]:
+    """The key snapshot for (team_id, region_id), fetching it on a miss.
+
+    ``fetch_team_info`` is only called when neither the shared cache nor a
+    fetch already running in this process can answer. Its exceptions reach
+    every caller waiting on it, and nothing is cached for them.
+    """
+    generation = await _generation(team_id)
+    cache_key = _snapshot_key(team_id, region_id, generation)
+    try:
+        raw = await asyncio.to_thread(shared_cache.get, cache_key)
+    except Exception as exc:
+        logger.warning("Reading team spend snapshot failed: %s", exc)
+        raw = None
+    if raw is not None:
+        return json.loads(raw)
+
+    fetch_key = (team_id, region_id)
+    task = _in_flight(fetch_key)
+    if task is None:
+
+        async def fetch() -> list[dict]:
+            snapshot = snapshot_keys(await fetch_team_info())
+            try:
+                await asyncio.to_thread(
+                    shared_cache.set,
+                    cache_key,
+                    json.dumps(snapshot).encode(),
+                    SNAPSHOT_TTL_SECONDS,
+                )
+            except Exception as exc:
+                logger.warning("Writing team spend snapshot failed: %s", exc)
+            return snapshot
+
+        task = asyncio.create_task(fetch())
+        _fetches[fetch_key] = task
+        task.add_done_callback(lambda done, key=fetch_key: _forget(key, done))
+    # A caller that gives up (timeout, disconnect) must not cancel the fetch
+    # the other callers are waiting on.
+    return await asyncio.shield(task)
+
+
+async def invalidate_team_spend_snapshots(team_ids) -> None:
+    """Make the next read for each team fetch fresh snapshots in every region."""
+    team_ids = set(team_ids)
+    for team_id in team_ids:
+        for fetch_key in [key for key in _fetches if key[0] == team_id]:
+            # Waiters keep their result; later callers start a new fetch.
+            _fetches.pop(fetch_key, None)
+    if team_ids:
+        await asyncio.to_thread(_new_generations, team_ids)
+
+
+def _new_generations(team_ids: set[int]) -> None:
+    for team_id in team_ids:
+        try:
+            shared_cache.set(
+                _generation_key(team_id),
+                uuid.uuid4().hex.encode(),
+                _GENERATION_TTL_SECONDS,
+            )
+        except Exception as exc:
+            logger.warning("Invalidating team spend snapshots failed: %s", exc)
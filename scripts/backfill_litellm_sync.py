@@ -63,7 +63,6 @@ import sys
 from dataclasses import dataclass
 from typing import Iterable
 
-import httpx
 from sqlalchemy.orm import Session
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -77,7 +76,11 @@ from app.db.models import (
     DBUser,
 )
 from app.core.config import settings
-from app.services.litellm import LiteLLMService
+from app.services.litellm import (
+    LiteLLMService,
+    litellm_http_client,
+    with_litellm_client_pool,
+)
 
 
 def is_trial_user(email: str | None) -> bool:
@@ -374,7 +377,7 @@ class BackfillRunner:
             "budget_duration": None,
         }
         headers = {"Authorization": f"Bearer {region.litellm_api_key}"}
-        async with httpx.AsyncClient() as client:
+        async with litellm_http_client(region.litellm_api_url) as client:
             resp = await client.post(
                 f"{region.litellm_api_url}/team/update",
                 json=payload,
@@ -498,7 +501,7 @@ class BackfillRunner:
             payload["user_id"] = str(user_id)
 
         headers = {"Authorization": f"Bearer {region.litellm_api_key}"}
-        async with httpx.AsyncClient() as client:
+        async with litellm_http_client(region.litellm_api_url) as client:
             resp = await client.post(
                 f"{region.litellm_api_url}/key/update", json=payload, headers=headers
             )
@@ -672,4 +675,4 @@ async def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(asyncio.run(main()))
+    raise SystemExit(asyncio.run(with_litellm_client_pool(main())))
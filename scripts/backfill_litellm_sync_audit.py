@@ -37,7 +37,7 @@ from app.core.config import settings
 from app.core.team_service import get_team_region_litellm_keys
 from app.db.database import SessionLocal
 from app.db.models import DBPoolPurchase, DBRegion, DBTeam, DBTeamRegion
-from app.services.litellm import LiteLLMService
+from app.services.litellm import LiteLLMService, with_litellm_client_pool
 
 
 def dedupe_regions(regions: Iterable[DBRegion]) -> list[DBRegion]:
@@ -357,4 +357,4 @@ async def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(asyncio.run(main()))
+    raise SystemExit(asyncio.run(with_litellm_client_pool(main())))
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""Measure /audit/logs query latency against a large audit_logs table.
+
+Usage:
+    python scripts/benchmark_audit_logs.py --seed 5000000   # add rows, then measure
+    python scripts/benchmark_audit_logs.py                  # measure existing rows
+    python scripts/benchmark_audit_logs.py --cleanup        # delete seeded rows
+
+Seeded rows are generated server-side with generate_series and marked with
+resource_type "benchmark", so --cleanup removes exactly those. Run it against
+a scratch database, not production: seeding millions of rows takes a while
+and bloats the table until it is vacuumed.
+
+For each page depth it times an OFFSET page against the equivalent cursor
+page, then an exact count against the planner estimate, with and without a
+referer filter.
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy import delete, text, tuple_
+from app.api.audit import estimate_row_count, filter_audit_logs
+from app.db.database import SessionLocal
+from app.db.models import DBAuditLog
+
+BENCHMARK_RESOURCE_TYPE = "benchmark"
+
+SEED_SQL = text(
+    """
+    INSERT INTO audit_logs (
+        timestamp, event_type, resource_type, action, details,
+        request_source, referer, origin
+    )
+    SELECT
+        now() AT TIME ZONE 'UTC' - make_interval(secs => n),
+        (ARRAY['GET', 'POST', 'PUT', 'DELETE'])[1 + n % 4],
+        :resource_type,
+        'GET /benchmark/' || n,
+        json_build_object('status_code', (ARRAY[200, 201, 400, 404, 500])[1 + n % 5]),
+        'api',
+        'https://site-' || (n % 5000) || '.example.com/page/' || (n % 97),
+        'https://site-' || (n % 5000) || '.example.com'
+    FROM generate_series(:start, :stop) AS n
+    """
+)
+
+
+def seed(rows: int, batch_size: int) -> None:
+    with SessionLocal() as db:
+        start = time.perf_counter()
+        for first in range(0, rows, batch_size):
+            db.execute(
+                SEED_SQL,
+                {
+                    "resource_type": BENCHMARK_RESOURCE_TYPE,
+                    "start": first,
+                    "stop": min(first + batch_size, rows) - 1,
+                },
+            )
+            db.commit()
+            print(f"  seeded {min(first + batch_size, rows):,} / {rows:,} rows")
+        db.execute(text("ANALYZE audit_logs"))
+        db.commit()
+        print(f"Seeded {rows:,} rows in {time.perf_counter() - start:.1f}s")
+
+
+def cleanup() -> None:
+    with SessionLocal() as db:
+        result = db.execute(
+            delete(DBAuditLog).where(
+                DBAuditLog.resource_type == BENCHMARK_RESOURCE_TYPE
+            )
+        )
+        db.commit()
+        print(f"Deleted {result.rowcount:,} seeded rows")
+
+
+def timed(fn, repeat: int) -> float:
+    """Median wall time of ``fn`` over ``repeat`` runs, in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def measure(depths: list[int], limit: int, repeat: int, referer: str) -> None:
+    order = (DBAuditLog.timestamp.desc(), DBAuditLog.id.desc())
+    with SessionLocal() as db:
+        print(f"\n{'page depth':>12} {'offset (ms)':>12} {'cursor (ms)':>12}")
+        for depth in depths:
+            # The cursor a client paging from the start would hold at this depth.
+            anchor = (
+                db.query(DBAuditLog.timestamp, DBAuditLog.id)
+                .order_by(*order)
+                .offset(max(0, depth - 1))
+                .limit(1)
+                .first()
+            )
+            if anchor is None:
+                print(f"{depth:>12,} {'(past end)':>12}")
+                continue
+
+            def offset_page():
+                db.query(DBAuditLog).order_by(*order).offset(depth).limit(limit).all()
+
+            def cursor_page():
+                db.query(DBAuditLog).filter(
+                    tuple_(DBAuditLog.timestamp, DBAuditLog.id) < tuple(anchor)
+                ).order_by(*order).limit(limit).all()
+
+            print(
+                f"{depth:>12,} {timed(offset_page, repeat):>12.1f} "
+                f"{timed(cursor_page, repeat):>12.1f}"
+            )
+
+        print(f"\n{'filter':>24} {'exact (ms)':>12} {'estimate (ms)':>14} {'rows':>22}")
+        for label, query in (
+            ("none", filter_audit_logs(db.query(DBAuditLog))),
+            (
+                "status_code=500",
+                filter_audit_logs(db.query(DBAuditLog), status_code="500"),
+            ),
+            (
+                f"referer={referer}",
+                filter_audit_logs(db.query(DBAuditLog), referer=referer),
+            ),
+        ):
+            exact = query.count()
+            estimate = estimate_row_count(db, query)
+            print(
+                f"{label:>24} {timed(query.count, repeat):>12.1f} "
+                f"{timed(lambda: estimate_row_count(db, query), repeat):>14.1f} "
+                f"{f'{exact:,} vs ~{estimate:,}':>22}"
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark /audit/logs queries")
+    parser.add_argument("--seed", type=int, default=0, help="Rows to add first")
+    parser.add_argument("--batch-size", type=int, default=500_000)
+    parser.add_argument("--cleanup", action="store_true", help="Delete seeded rows")
+    parser.add_argument("--limit", type=int, default=100, help="Page size")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument(
+        "--depths",
+        default="0,1000,100000,1000000",
+        help="Comma-separated row offsets to time pages at",
+    )
+    parser.add_argument("--referer", default="site-42.example")
+    args = parser.parse_args()
+
+    if args.cleanup:
+        cleanup()
+        return
+    if args.seed:
+        seed(args.seed, args.batch_size)
+    measure(
+        [int(d) for d in args.depths.split(",")], args.limit, args.repeat, args.referer
+    )
+
+
+if __name__ == "__main__":
+    main()
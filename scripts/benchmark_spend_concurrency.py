@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Load-test spend and key endpoints of a running backend under concurrency.
+
+Usage:
+    python scripts/benchmark_spend_concurrency.py \\
+        --base-url http://localhost:8800 --token "$TOKEN" \\
+        --path /spend/1/team/2/daily-activity --path /spend/1/team/2 \\
+        --concurrency 1,10,50 --requests 500
+
+For each path and concurrency level it sends --requests GETs with that many
+in flight at once and prints throughput and latency percentiles. Handlers on
+the async session keep scaling with concurrency; handlers on the sync session
+flatten out once their blocking queries serialize the event loop. Comparing
+an async path with a sync one on the same build, or the same path on two
+builds, shows the difference.
+
+Run it against a staging backend with one worker (uvicorn --workers 1), so
+the numbers are per event loop. The LiteLLM calls behind the spend endpoints
+are part of what is measured; repeated identical reads are coalesced (see
+LITELLM_READ_TTL_* settings), so this mostly measures the backend itself.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+
+import httpx
+
+
+async def run_level(
+    client: httpx.AsyncClient, path: str, concurrency: int, requests: int
+) -> tuple[float, list[float], int]:
+    """Return (elapsed seconds, per-request latencies in ms, error count)."""
+    latencies: list[float] = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        nonlocal errors
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                response = await client.get(path)
+                if response.status_code >= 400:
+                    errors += 1
+            except httpx.HTTPError:
+                errors += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(requests)))
+    return time.perf_counter() - start, latencies, errors
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def main_async(args) -> None:
+    levels = [int(level) for level in args.concurrency.split(",")]
+    headers = {"Authorization": f"Bearer {args.token}"}
+    limits = httpx.Limits(
+        max_connections=max(levels), max_keepalive_connections=max(levels)
+    )
+    async with httpx.AsyncClient(
+        base_url=args.base_url, headers=headers, limits=limits, timeout=args.timeout
+    ) as client:
+        for path in args.path:
+            # Warm-up: connections, caches, first-request imports
+            await run_level(client, path, min(levels), min(levels))
+            print(f"\n{path}")
+            print(
+                f"{'concurrency':>12} {'req/s':>10} {'p50 (ms)':>10} "
+                f"{'p95 (ms)':>10} {'p99 (ms)':>10} {'errors':>8}"
+            )
+            for level in levels:
+                elapsed, latencies, errors = await run_level(
+                    client, path, level, args.requests
+                )
+                print(
+                    f"{level:>12} {args.requests / elapsed:>10.1f} "
+                    f"{statistics.median(latencies):>10.1f} "
+                    f"{percentile(latencies, 95):>10.1f} "
+                    f"{percentile(latencies, 99):>10.1f} {errors:>8}"
+                )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test spend endpoints")
+    parser.add_argument("--base-url", default="http://localhost:8800")
+    parser.add_argument("--token", required=True, help="API token or JWT")
+    parser.add_argument(
+        "--path",
+        action="append",
+        required=True,
+        help="Endpoint path to GET; repeat to compare several",
+    )
+    parser.add_argument(
+        "--concurrency",
+        default="1,10,50,100",
+        help="Comma-separated numbers of requests in flight",
+    )
+    parser.add_argument("--requests", type=int, default=500, help="Per level")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
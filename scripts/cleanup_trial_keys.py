@@ -55,7 +55,7 @@ from app.core.trial_cleanup import (
 from app.db.database import SessionLocal
 from app.db.models import DBRegion
 from app.db.postgres import PostgresManager
-from app.services.litellm import LiteLLMService
+from app.services.litellm import LiteLLMService, with_litellm_client_pool
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s"
@@ -267,7 +267,7 @@ def main():
         help="Print progress every N keys (default 100).",
     )
     args = parser.parse_args()
-    raise SystemExit(asyncio.run(run(args)))
+    raise SystemExit(asyncio.run(with_litellm_client_pool(run(args))))
 
 
 if __name__ == "__main__":
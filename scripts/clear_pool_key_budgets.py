@@ -22,7 +22,7 @@ from app.core.config import settings
 from app.db.database import SessionLocal
 from app.db.models import DBPrivateAIKey, DBTeam, DBUser, DBRegion
 from app.schemas.models import BudgetType
-from app.services.litellm import LiteLLMService
+from app.services.litellm import LiteLLMService, with_litellm_client_pool
 
 
 def get_pool_keys_grouped_by_region(session):
@@ -112,7 +112,7 @@ def main():
         help="Print planned updates without applying them",
     )
     args = parser.parse_args()
-    raise SystemExit(asyncio.run(run(args.dry_run)))
+    raise SystemExit(asyncio.run(with_litellm_client_pool(run(args.dry_run))))
 
 
 if __name__ == "__main__":
@@ -15,7 +15,6 @@ import time
 from dataclasses import dataclass
 from datetime import datetime, UTC
 
-import httpx
 from sqlalchemy.orm import Session
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -30,7 +29,11 @@ from app.db.models import (
     DBUser,
     DBUserAdminRegion,
 )
-from app.services.litellm import LiteLLMService
+from app.services.litellm import (
+    LiteLLMService,
+    litellm_http_client,
+    with_litellm_client_pool,
+)
 
 
 def parse_status_from_exc(exc: Exception) -> int | None:
@@ -590,7 +593,7 @@ class RegionConversionRunner:
 
         self._log(f"  Processing {len(keys)} keys")
         headers = {"Authorization": f"Bearer {region.litellm_api_key}"}
-        async with httpx.AsyncClient() as client:
+        async with litellm_http_client(region.litellm_api_url) as client:
             for key in keys:
                 counters.processed += 1
                 owner = (
@@ -956,4 +959,4 @@ async def main() -> int:
 
 
 if __name__ == "__main__":
-    raise SystemExit(asyncio.run(main()))
+    raise SystemExit(asyncio.run(with_litellm_client_pool(main())))
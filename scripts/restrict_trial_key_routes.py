@@ -25,7 +25,11 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")
 from app.core.team_service import is_anonymous_trial_team
 from app.db.database import SessionLocal
 from app.db.models import DBPrivateAIKey, DBRegion, DBTeam, DBUser
-from app.services.litellm import INFERENCE_ONLY_ROUTES, LiteLLMService
+from app.services.litellm import (
+    INFERENCE_ONLY_ROUTES,
+    LiteLLMService,
+    with_litellm_client_pool,
+)
 
 
 def get_trial_keys_grouped_by_region(session):
@@ -106,7 +110,7 @@ def main():
         help="Print planned updates without applying them",
     )
     args = parser.parse_args()
-    raise SystemExit(asyncio.run(run(args.dry_run)))
+    raise SystemExit(asyncio.run(with_litellm_client_pool(run(args.dry_run))))
 
 
 if __name__ == "__main__":
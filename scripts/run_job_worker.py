@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Run background job queue workers outside the API process.
+
+Usage:
+    python scripts/run_job_worker.py           # run until SIGTERM/SIGINT
+    python scripts/run_job_worker.py --once    # drain due jobs, then exit
+
+Run it as its own deployment with JOB_QUEUE_WORKERS set to the number of
+workers, and set JOB_QUEUE_WORKERS=0 on the API so only this one runs jobs.
+Any number of replicas can run side by side. Metrics are served on
+JOB_WORKER_METRICS_PORT when it is set.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import sys
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from prometheus_client import start_http_server
+from app.core.config import settings
+from app.core.job_queue import JobWorkerPool, run_due_jobs
+from app.services.litellm import litellm_client_pool
+
+# Importing the modules that own the work registers their job handlers.
+import app.core.limit_service  # noqa: F401
+import app.services.budget_alert_webhook  # noqa: F401
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+
+logger = logging.getLogger(__name__)
+
+METRICS_PORT = os.getenv("JOB_WORKER_METRICS_PORT", "")
+
+
+async def run_workers(once: bool) -> None:
+    async with litellm_client_pool():
+        if once:
+            ran = await run_due_jobs()
+            logger.info(f"Ran {ran} job(s)")
+            return
+
+        pool = JobWorkerPool(concurrency=max(1, settings.JOB_QUEUE_WORKERS))
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, stop.set)
+
+        await pool.start()
+        logger.info(f"Started {pool.concurrency} job worker(s)")
+        try:
+            await stop.wait()
+        finally:
+            await pool.stop()
+            logger.info("Job workers stopped")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run job queue workers")
+    parser.add_argument("--once", action="store_true", help="Run due jobs, then exit")
+    args = parser.parse_args()
+
+    if METRICS_PORT:
+        start_http_server(int(METRICS_PORT))
+
+    try:
+        asyncio.run(run_workers(args.once))
+    except Exception as e:
+        logger.error(f"❌ Job worker failed: {str(e)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
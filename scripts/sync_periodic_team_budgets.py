@@ -25,7 +25,7 @@ from app.db.database import SessionLocal
 from app.db.models import DBTeam, DBRegion, DBLimitedResource
 from app.schemas.models import BudgetType
 from app.schemas.limits import OwnerType, ResourceType
-from app.services.litellm import LiteLLMService
+from app.services.litellm import LiteLLMService, with_litellm_client_pool
 
 
 def get_team_budget_limit(session: Session, team_id: int) -> float | None:
@@ -207,4 +207,4 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
-    asyncio.run(main(dry_run=args.dry_run))
+    asyncio.run(with_litellm_client_pool(main(dry_run=args.dry_run)))
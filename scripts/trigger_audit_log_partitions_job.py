@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import logging
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy.orm import sessionmaker
+from app.db.database import engine
+from app.core.locking import try_acquire_lock, release_lock
+from app.services.audit_log_partitions import maintain_audit_log_partitions
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+LOCK_NAME = "audit_log_partitions"
+
+
+def main():
+    """Create upcoming audit_logs partitions and drop expired ones.
+
+    Runs daily via the Lagoon cron. Uses the shared advisory lock so overlapping
+    runs (or a manual trigger) don't clobber each other.
+    """
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = SessionLocal()
+    try:
+        if not try_acquire_lock(LOCK_NAME, db, lock_timeout=10):
+            logger.warning(
+                "Another process holds the %s lock; skipping this run", LOCK_NAME
+            )
+            sys.exit(0)
+        try:
+            logger.info("Maintaining audit_logs partitions...")
+            created, dropped = maintain_audit_log_partitions(db)
+            logger.info(
+                "✅ Created %d and dropped %d audit_logs partitions",
+                len(created),
+                len(dropped),
+            )
+        finally:
+            release_lock(LOCK_NAME, db)
+    except Exception as e:  # noqa: BLE001
+        logger.error("❌ audit_logs partition maintenance failed: %s", str(e))
+        sys.exit(1)
+    finally:
+        db.close()
+
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ from sqlalchemy.orm import sessionmaker
 from app.db.database import engine
 from app.core.budget_alert_service import monitor_budget_thresholds
 from app.core.locking import try_acquire_lock, release_lock
+from app.services.litellm import litellm_client_pool
 
 # Configure logging
 logging.basicConfig(
@@ -37,7 +38,8 @@ async def trigger_budget_alerts_job():
         if try_acquire_lock(lock_name, db, lock_timeout=5):
             logger.info("Acquired budget_alerts lock, executing sweep")
             try:
-                totals = await monitor_budget_thresholds(db)
+                async with litellm_client_pool():
+                    totals = await monitor_budget_thresholds(db)
                 logger.info("Budget threshold sweep completed: %s", totals)
             except Exception as e:
                 logger.error(f"Error in budget threshold sweep: {str(e)}")
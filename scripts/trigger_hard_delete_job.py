@@ -12,6 +12,7 @@ from sqlalchemy.orm import sessionmaker
 from app.db.database import engine
 from app.core.worker import hard_delete_expired_teams
 from app.core.locking import try_acquire_lock, release_lock
+from app.services.litellm import litellm_client_pool
 
 # Configure logging
 logging.basicConfig(
@@ -37,7 +38,8 @@ async def trigger_hard_delete_job():
         if try_acquire_lock(lock_name, db, lock_timeout=10):
             logger.info("Acquired hard_delete_teams lock, executing hard delete job")
             try:
-                await hard_delete_expired_teams(db)
+                async with litellm_client_pool():
+                    await hard_delete_expired_teams(db)
                 logger.info("Hard delete job completed successfully")
             except Exception as e:
                 logger.error(f"Error in hard delete job execution: {str(e)}")
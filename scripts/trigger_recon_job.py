@@ -12,6 +12,7 @@ from sqlalchemy.orm import sessionmaker
 from app.db.database import engine
 from app.core.worker import monitor_teams
 from app.core.locking import try_acquire_lock, release_lock
+from app.services.litellm import litellm_client_pool
 
 # Configure logging
 logging.basicConfig(
@@ -24,6 +25,12 @@ logger = logging.getLogger(__name__)
 # from a hard failure (1) so an overrunning previous run can be alerted on.
 EXIT_LOCK_CONTENTION = 75
 
+# Optional split of the run across several cron pods: pod i of N sets
+# MONITOR_TEAMS_SHARD_INDEX=i and MONITOR_TEAMS_SHARD_COUNT=N and takes its own
+# lock, so the shards run side by side. Defaults to a single unsharded run.
+SHARD_COUNT = int(os.getenv("MONITOR_TEAMS_SHARD_COUNT", "1"))
+SHARD_INDEX = int(os.getenv("MONITOR_TEAMS_SHARD_INDEX", "0"))
+
 
 async def trigger_recon_job():
     """Manually trigger the recon job (monitor_teams) in the background scheduler thread"""
@@ -33,15 +40,18 @@ async def trigger_recon_job():
     db = SessionLocal()
 
     lock_name = "monitor_teams"
+    if SHARD_COUNT > 1:
+        lock_name = f"monitor_teams_shard_{SHARD_INDEX}_of_{SHARD_COUNT}"
 
     try:
         logger.info("Starting manual recon job trigger...")
 
         # Try to acquire the lock
         if try_acquire_lock(lock_name, db, lock_timeout=10):
-            logger.info("Acquired monitor_teams lock, executing recon job")
+            logger.info(f"Acquired {lock_name} lock, executing recon job")
             try:
-                await monitor_teams(db)
+                async with litellm_client_pool():
+                    await monitor_teams(db, SHARD_INDEX, SHARD_COUNT)
                 logger.info("Recon job completed successfully")
             except Exception as e:
                 logger.error(f"Error in recon job execution: {str(e)}")
@@ -49,14 +59,14 @@ async def trigger_recon_job():
             finally:
                 # Always release the lock when done
                 release_lock(lock_name, db)
-                logger.info("Released monitor_teams lock")
+                logger.info(f"Released {lock_name} lock")
         else:
             # Lock contention on an hourly schedule almost always means the
             # previous run is still going, i.e. monitor_teams is overrunning its
             # window. Log at ERROR (not INFO) so it surfaces, and signal it
             # distinctly via the exit code - see main().
             logger.error(
-                "Another process has the monitor_teams lock, cannot execute recon job. "
+                f"Another process has the {lock_name} lock, cannot execute recon job. "
                 "If this is the scheduled run, the previous run is overrunning its "
                 "interval and monitoring is being skipped."
             )
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import logging
+
+# Add the parent directory to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from sqlalchemy.orm import sessionmaker
+from app.db.database import engine
+from app.core.locking import try_acquire_lock, release_lock
+from app.services.sales_teams import refresh_stale_sales_team_rows
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+)
+logger = logging.getLogger(__name__)
+
+LOCK_NAME = "refresh_sales_team_rows"
+
+
+def main():
+    """Rebuild the sales dashboard rows once they are older than their max age.
+
+    Runs every few minutes via the Lagoon cron, so /teams/sales/list-teams can
+    stay read-only. Uses the shared advisory lock so overlapping runs don't
+    rebuild the table at the same time.
+    """
+    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    db = SessionLocal()
+    try:
+        if not try_acquire_lock(LOCK_NAME, db, lock_timeout=5):
+            logger.warning(
+                "Another process holds the %s lock; skipping this run", LOCK_NAME
+            )
+            sys.exit(0)
+        try:
+            if refresh_stale_sales_team_rows(db):
+                logger.info("✅ Rebuilt sales_team_rows")
+            else:
+                logger.info("sales_team_rows are fresh; nothing to do")
+        finally:
+            release_lock(LOCK_NAME, db)
+    except Exception as e:  # noqa: BLE001
+        logger.error("❌ sales_team_rows refresh failed: %s", str(e))
+        sys.exit(1)
+    finally:
+        db.close()
+
+    sys.exit(0)
+
+
+if __name__ == "__main__":
+    main()
@@ -12,6 +12,7 @@ from sqlalchemy.orm import sessionmaker
 from app.db.database import engine
 from app.api import budgets
 from app.core.locking import try_acquire_lock, release_lock
+from app.services.litellm import litellm_client_pool
 
 # Configure logging
 logging.basicConfig(
@@ -37,7 +38,8 @@ async def trigger_sync_pool_budgets_job():
         if try_acquire_lock(lock_name, db, lock_timeout=10):
             logger.info("Acquired sync_pool_budgets lock, executing job")
             try:
-                result = await budgets.sync_pool_team_budgets(db)
+                async with litellm_client_pool():
+                    result = await budgets.sync_pool_team_budgets(db)
                 logger.info(
                     f"Pool budgets sync complete: {result['teams_updated']} teams updated"
                 )
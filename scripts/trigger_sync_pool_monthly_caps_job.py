@@ -13,6 +13,7 @@ from sqlalchemy.orm import sessionmaker
 from app.api import budgets
 from app.core.locking import release_lock, try_acquire_lock
 from app.db.database import engine
+from app.services.litellm import litellm_client_pool
 
 # Configure logging
 logging.basicConfig(
@@ -37,7 +38,8 @@ async def trigger_sync_pool_monthly_caps_job():
         if try_acquire_lock(lock_name, db, lock_timeout=10):
             logger.info("Acquired sync_pool_monthly_caps lock, executing job")
             try:
-                result = await budgets.sync_pool_team_monthly_caps(db)
+                async with litellm_client_pool():
+                    result = await budgets.sync_pool_team_monthly_caps(db)
                 logger.info(
                     "Pool monthly caps sync complete: %s teams updated",
                     result["teams_updated"],
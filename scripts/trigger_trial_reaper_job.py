@@ -21,6 +21,7 @@ from sqlalchemy.orm import sessionmaker
 from app.core.locking import release_lock, try_acquire_lock
 from app.core.worker import reap_trial_keys
 from app.db.database import engine
+from app.services.litellm import litellm_client_pool
 
 logging.basicConfig(
     level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -43,7 +44,8 @@ async def trigger_trial_reaper_job():
         if try_acquire_lock(lock_name, db, lock_timeout=10):
             logger.info("Acquired reap_trial_keys lock, executing job")
             try:
-                await reap_trial_keys(db)
+                async with litellm_client_pool():
+                    await reap_trial_keys(db)
                 logger.info("Trial reaper job completed successfully")
             except Exception as e:
                 logger.error(f"Error in trial reaper job execution: {str(e)}")
@@ -12,6 +12,7 @@ from sqlalchemy.orm import sessionmaker
 from app.db.database import engine
 from app.core.worker import monitor_trial_users
 from app.core.locking import try_acquire_lock, release_lock
+from app.services.litellm import litellm_client_pool
 
 # Configure logging
 logging.basicConfig(
@@ -37,7 +38,8 @@ async def trigger_trial_recon_job():
         if try_acquire_lock(lock_name, db, lock_timeout=10):
             logger.info("Acquired monitor_trial_users lock, executing job")
             try:
-                await monitor_trial_users(db)
+                async with litellm_client_pool():
+                    await monitor_trial_users(db)
                 logger.info("Trial recon job completed successfully")
             except Exception as e:
                 logger.error(f"Error in trial recon job execution: {str(e)}")
@@ -18,15 +18,31 @@ os.environ["DISPOSABLE_DOMAINS_URL"] = ""
 # suite (like ENABLE_LIMITS) so it can't throttle unrelated tests. Tests that
 # exercise it enable it explicitly via monkeypatch.
 os.environ["ENABLE_SIGNUP_VELOCITY_LIMIT"] = "false"
+# No job queue workers in the app lifespan: they would race the per-test
+# drop_all/create_all. Tests run queued jobs with job_queue.run_due_jobs().
+os.environ["JOB_QUEUE_WORKERS"] = "0"
+# Same for the loop that resumes interrupted team group sync runs.
+os.environ["TEAM_GROUP_SYNC_RESUME_INTERVAL_SECONDS"] = "0"
+# Tests swap LiteLLM mock responses between calls; memoized reads would hide
+# the new ones. Identical concurrent reads are still coalesced.
+os.environ["LITELLM_READ_TTL_TEAM_INFO_SECONDS"] = "0"
+os.environ["LITELLM_READ_TTL_KEY_INFO_SECONDS"] = "0"
+os.environ["LITELLM_READ_TTL_DAILY_ACTIVITY_SECONDS"] = "0"
+os.environ["LITELLM_READ_TTL_MODEL_INFO_SECONDS"] = "0"
 
 import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 from app.main import app
-from app.db.database import get_db
+from app.db.database import async_database_url, get_async_db, get_db
 from app.db.models import Base, DBRegion, DBUser, DBTeam, DBProduct, DBTeamRegion
+from app.core.principal_cache import principal_cache
 from app.core.security import get_password_hash
+from app.core.shared_cache import shared_cache
+from app.services.litellm import litellm_reads
 from datetime import datetime, UTC, timedelta
 from unittest.mock import patch, MagicMock, Mock, AsyncMock
 
@@ -39,6 +55,20 @@ DATABASE_URL = os.getenv(
 # Create test database engine
 engine = create_engine(DATABASE_URL)
 TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Every TestClient runs the app on a new event loop, and asyncpg connections
+# cannot move between loops, so nothing is pooled. Async handlers see what the
+# test committed through `db`, not what it only flushed.
+async_engine = create_async_engine(
+    async_database_url(DATABASE_URL), poolclass=NullPool
+)
+AsyncTestingSessionLocal = async_sessionmaker(
+    async_engine, autoflush=False, expire_on_commit=False
+)
+
+
+async def override_get_async_db():
+    async with AsyncTestingSessionLocal() as session:
+        yield session
 
 
 @pytest.fixture
@@ -52,6 +82,12 @@ def db():
     Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
 
+    # Table ids restart with every test; cached principals and shared cache
+    # entries would not.
+    principal_cache.clear()
+    shared_cache.clear()
+    litellm_reads.clear()
+
     # Create a new session for the test
     db = TestingSessionLocal()
     try:
@@ -71,6 +107,7 @@ def client(db):
         yield db
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     with TestClient(app, headers={"X-Amazee-Source": "frontend"}) as test_client:
         yield test_client
     app.dependency_overrides.clear()
@@ -84,6 +121,7 @@ def drupal_client(db):
         yield db
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_async_db] = override_get_async_db
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.clear()
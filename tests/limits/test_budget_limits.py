@@ -1,13 +1,15 @@
+import asyncio
 import logging
 import threading
-import time
 import pytest
 from datetime import datetime, UTC, timedelta
 from unittest.mock import patch, AsyncMock
 from app.db.models import DBUser, DBProduct, DBTeamProduct, DBPrivateAIKey
+from app.core.job_queue import run_due_jobs
 from app.core.limit_service import LimitService
 from app.schemas.limits import ResourceType, OwnerType, LimitType, UnitType, LimitSource
 from app.core.security import get_password_hash
+from app.services.litellm import KEY_UPDATE_APPLIED, KeyUpdateResult
 from app.core.limit_service import (
     DEFAULT_KEY_DURATION,
     DEFAULT_MAX_SPEND,
@@ -515,15 +517,10 @@ def test_trigger_budget_propagation_uses_pool_duration(
     db.add(test_team)
     db.commit()
 
-    # Avoid background thread timing in test; execute submitted function inline.
-    class InlineExecutor:
-        def submit(self, fn):
-            fn()
-
     limit_service = LimitService(db)
-    with patch("app.core.limit_service._get_budget_propagation_executor") as mock_exec:
-        mock_exec.return_value = InlineExecutor()
-        limit_service._trigger_team_budget_propagation(test_team.id, 42.0)
+    limit_service._trigger_team_budget_propagation(test_team.id, 42.0)
+    db.commit()
+    asyncio.run(run_due_jobs())
 
     assert mock_propagate.called
     args = mock_propagate.call_args[0]
@@ -651,13 +648,17 @@ def test_budget_propagation_session_isolation(
     captured_calls = []
     call_lock = threading.Lock()
 
-    async def mock_update_budget(*args, **kwargs):
+    async def mock_bulk_update_keys(updates, snapshot=None):
         with call_lock:
-            captured_calls.append((args, kwargs))
+            captured_calls.extend((u.litellm_token, u.fields) for u in updates)
+        return [
+            KeyUpdateResult(u.litellm_token, u.key_id, KEY_UPDATE_APPLIED)
+            for u in updates
+        ]
 
     def create_mock_instance(*args, **kwargs):
         mock_instance = AsyncMock()
-        mock_instance.update_budget = mock_update_budget
+        mock_instance.bulk_update_keys = mock_bulk_update_keys
         return mock_instance
 
     mock_litellm_class.side_effect = create_mock_instance
@@ -665,22 +666,16 @@ def test_budget_propagation_session_isolation(
     # Create a LimitService and call the method that triggers background propagation
     limit_service = LimitService(db)
 
-    # Call the actual method that has the bug - it spawns a background thread
+    # Queue the propagation on the request session and commit it
     limit_service._trigger_team_budget_propagation(test_team.id, 100.0)
+    db.commit()
 
     # Simulate what happens in production: close the original session immediately
     # This is what FastAPI does after the request completes
     db.close()
 
-    # Wait for background thread to complete
-    max_wait = 50  # 5 seconds
-    waited = 0
-    while waited < max_wait:
-        time.sleep(0.1)
-        waited += 1
-        with call_lock:
-            if len(captured_calls) >= 1:
-                break
+    # The worker runs the job on its own session
+    assert asyncio.run(run_due_jobs()) == 1
 
     # Verify the call was made successfully
     with call_lock:
@@ -689,8 +684,8 @@ def test_budget_propagation_session_isolation(
         )
 
         # Verify correct parameters
-        args, kwargs = captured_calls[0]
-        assert kwargs.get("budget_amount") == 100.0
+        token, fields = captured_calls[0]
+        assert fields["max_budget"] == 100.0
 
 
 @patch("app.core.team_service.LiteLLMService")
@@ -734,13 +729,17 @@ def test_budget_propagation_works_after_session_close(
     propagation_errors = []
     call_lock = threading.Lock()
 
-    async def mock_update_budget(*args, **kwargs):
+    async def mock_bulk_update_keys(updates, snapshot=None):
         with call_lock:
-            captured_calls.append((args, kwargs))
+            captured_calls.extend((u.litellm_token, u.fields) for u in updates)
+        return [
+            KeyUpdateResult(u.litellm_token, u.key_id, KEY_UPDATE_APPLIED)
+            for u in updates
+        ]
 
     def create_mock_instance(*args, **kwargs):
         mock_instance = AsyncMock()
-        mock_instance.update_budget = mock_update_budget
+        mock_instance.bulk_update_keys = mock_bulk_update_keys
         return mock_instance
 
     mock_litellm_class.side_effect = create_mock_instance
@@ -769,18 +768,10 @@ def test_budget_propagation_works_after_session_close(
         )
 
         # Immediately close the session - this simulates what happens when the request ends
-        # The background thread should still work because it creates its own session
+        # The queued job still runs because the worker uses its own session
         db.close()
 
-        # Wait for background thread to complete
-        max_wait = 50  # 5 seconds
-        waited = 0
-        while waited < max_wait:
-            time.sleep(0.1)
-            waited += 1
-            with call_lock:
-                if len(captured_calls) >= 1 or len(propagation_errors) >= 1:
-                    break
+        asyncio.run(run_due_jobs())
 
     # Verify no errors occurred during propagation
     with call_lock:
@@ -797,8 +788,8 @@ def test_budget_propagation_works_after_session_close(
         )
 
         # Verify correct parameters
-        args, kwargs = captured_calls[0]
-        assert kwargs.get("budget_amount") == 150.0
+        token, fields = captured_calls[0]
+        assert fields["max_budget"] == 150.0
 
 
 @patch("app.core.team_service.LiteLLMService")
@@ -853,13 +844,17 @@ def test_overwrite_team_budget_limit_propagates_to_keys(
     captured_calls = []
     call_lock = threading.Lock()
 
-    async def mock_update_budget(*args, **kwargs):
+    async def mock_bulk_update_keys(updates, snapshot=None):
         with call_lock:
-            captured_calls.append((args, kwargs))
+            captured_calls.extend((u.litellm_token, u.fields) for u in updates)
+        return [
+            KeyUpdateResult(u.litellm_token, u.key_id, KEY_UPDATE_APPLIED)
+            for u in updates
+        ]
 
     def create_mock_instance(*args, **kwargs):
         mock_instance = AsyncMock()
-        mock_instance.update_budget = mock_update_budget
+        mock_instance.bulk_update_keys = mock_bulk_update_keys
         return mock_instance
 
     mock_litellm_class.side_effect = create_mock_instance
@@ -880,18 +875,10 @@ def test_overwrite_team_budget_limit_propagates_to_keys(
 
     assert response.status_code == 200
 
-    # Wait for the background thread to execute (propagation happens in ThreadPoolExecutor)
-    # Wait up to 5 seconds for completion, checking every 100ms
-    max_wait = 50
-    waited = 0
-    while waited < max_wait:
-        time.sleep(0.1)
-        waited += 1
-        with call_lock:
-            if len(captured_calls) >= 2:
-                break
+    # Propagation is queued by the request and run by a job worker
+    asyncio.run(run_due_jobs())
 
-    # Verify that update_budget was called for both keys with the new budget
+    # Verify that both keys were updated with the new budget
     with call_lock:
         assert len(captured_calls) == 2, (
             f"Expected 2 calls but got {len(captured_calls)}. Calls: {captured_calls}"
@@ -900,25 +887,13 @@ def test_overwrite_team_budget_limit_propagates_to_keys(
     # Verify the calls were made with correct parameters
     called_tokens = set()
     with call_lock:
-        for args, kwargs in captured_calls:
-            # update_budget may be called with positional or keyword arguments
-            litellm_token = (
-                args[0] if args and len(args) > 0 else kwargs.get("litellm_token")
-            )
-            budget_duration_arg = (
-                args[1] if args and len(args) > 1 else kwargs.get("budget_duration")
-            )
-            budget_amount = kwargs.get("budget_amount")
-
-            assert litellm_token is not None, (
-                f"Expected litellm_token but got args={args}, kwargs={kwargs}"
-            )
+        for litellm_token, fields in captured_calls:
             called_tokens.add(litellm_token)
-            assert budget_duration_arg == budget_duration, (
-                f"Expected budget_duration {budget_duration} but got {budget_duration_arg}"
+            assert fields["budget_duration"] == budget_duration, (
+                f"Expected budget_duration {budget_duration} but got {fields}"
             )
-            assert budget_amount == 150.0, (
-                f"Expected budget_amount 150.0 but got {budget_amount}"
+            assert fields["max_budget"] == 150.0, (
+                f"Expected max_budget 150.0 but got {fields}"
             )
 
     # Verify both keys were updated
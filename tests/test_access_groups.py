@@ -1,5 +1,7 @@
 from unittest.mock import patch, AsyncMock
 
+from datetime import datetime, timedelta, UTC
+
 from app.db.models import (
     DBModel,
     DBModelAccessGroup,
@@ -7,12 +9,18 @@ from app.db.models import (
     DBModelAccessGroupRegion,
     DBModelRegion,
     DBRegion,
+    DBTeam,
+    DBTeamGroupSyncRun,
     DBTeamModelAccessGroup,
 )
 from app.services.access_groups import (
+    claim_interrupted_team_group_sync_runs,
     effective_team_group_slugs,
     model_access_group_slugs,
+    region_team_group_slugs,
 )
+from app.services.litellm import LiteLLMService
+from tests.conftest import TestingSessionLocal
 
 
 def _make_model(db, model_id="openai/test-model", **kwargs):
@@ -296,6 +304,152 @@ def test_set_and_clear_region_default_starts_fanout(
     assert test_region.default_access_group_id is None
 
 
+def _make_region_teams(db, region, count):
+    teams = [
+        DBTeam(name=f"Fanout Team {i}", admin_email=f"fanout{i}@example.com", region_id=region.id)
+        for i in range(count)
+    ]
+    db.add_all(teams)
+    db.commit()
+    return [team.id for team in teams]
+
+
+def test_region_fanout_resumes_and_skips_unchanged_teams(db, test_region):
+    """Test that a resumed run only handles teams it has not checkpointed and
+    sends no write for teams whose LiteLLM models already match"""
+    from app.services.access_groups import sync_region_teams_task
+    import asyncio
+
+    group = _make_group(db, slug="default-zdr", region_ids=[test_region.id])
+    test_region.default_access_group_id = group.id
+    checkpointed, unchanged, changed = _make_region_teams(db, test_region, 3)
+    run = DBTeamGroupSyncRun(
+        region_id=test_region.id, total=3, done=1, done_team_ids=[checkpointed]
+    )
+    db.add(run)
+    db.commit()
+    run_id, region_name = run.id, test_region.name
+
+    current = {
+        LiteLLMService.format_team_id(region_name, unchanged): ["default-zdr"],
+        LiteLLMService.format_team_id(region_name, changed): [],
+    }
+    with (
+        patch("app.services.access_groups.get_db", lambda: iter([db])),
+        patch.object(LiteLLMService, "list_team_models", AsyncMock(return_value=current)),
+        patch.object(
+            LiteLLMService, "_adaptive_post", AsyncMock(return_value=(None, None))
+        ) as mock_post,
+    ):
+        asyncio.run(sync_region_teams_task(run_id))
+
+    mock_post.assert_called_once()
+    assert mock_post.call_args.args[2:] == (
+        "/team/update",
+        {
+            "team_id": LiteLLMService.format_team_id(region_name, changed),
+            "models": ["default-zdr"],
+        },
+    )
+    run = db.query(DBTeamGroupSyncRun).filter_by(id=run_id).first()
+    assert run.status == "done"
+    assert (run.total, run.done, run.skipped) == (3, 3, 1)
+    assert sorted(run.done_team_ids) == sorted([checkpointed, unchanged, changed])
+    assert run.failed_team_ids == []
+    assert run.heartbeat_at is not None
+
+
+def test_heartbeat_keeps_running_run_from_looking_interrupted(db, test_region):
+    """Test that the heartbeat refreshes a running run between checkpoints and
+    leaves finished runs alone"""
+    from app.services.access_groups import _heartbeat_run
+    import asyncio
+
+    stale = datetime.now(UTC) - timedelta(hours=1)
+    running = DBTeamGroupSyncRun(region_id=test_region.id, started_at=stale, heartbeat_at=stale)
+    finished = DBTeamGroupSyncRun(
+        region_id=test_region.id, status="done", started_at=stale, heartbeat_at=stale
+    )
+    db.add_all([running, finished])
+    db.commit()
+
+    async def beat(run_id):
+        heartbeat = asyncio.create_task(_heartbeat_run(run_id, 0.01))
+        await asyncio.sleep(0.1)
+        heartbeat.cancel()
+
+    with patch("app.services.access_groups.get_db", lambda: iter([TestingSessionLocal()])):
+        asyncio.run(beat(running.id))
+        asyncio.run(beat(finished.id))
+
+    db.refresh(running)
+    db.refresh(finished)
+    assert running.heartbeat_at > stale
+    assert finished.heartbeat_at == stale
+    assert claim_interrupted_team_group_sync_runs(db, test_region.id) == []
+
+
+def test_region_team_group_slugs_matches_per_team(db, test_region, test_team):
+    """Test that the bulk slug computation agrees with the per-team one"""
+    default_group = _make_group(db, slug="default-zdr", region_ids=[test_region.id])
+    opt_in = _make_group(db, slug="extended", region_ids=[test_region.id])
+    db.add(DBTeamModelAccessGroup(team_id=test_team.id, group_id=opt_in.id))
+    db.commit()
+    other_team = _make_region_teams(db, test_region, 1)[0]
+
+    assert region_team_group_slugs(db, test_region, [test_team.id]) is None
+    test_region.default_access_group_id = default_group.id
+    db.commit()
+    slugs = region_team_group_slugs(db, test_region, [test_team.id, other_team])
+    assert slugs == {
+        test_team.id: effective_team_group_slugs(db, test_team.id, test_region),
+        other_team: ["default-zdr"],
+    }
+
+
+def test_retry_resumes_interrupted_run(client, admin_token, db, test_region):
+    """Test that retrying resumes a run whose checkpoint went stale instead of
+    starting over, and that the progress stream reports a finished run"""
+    stale = datetime.now(UTC) - timedelta(hours=1)
+    run = DBTeamGroupSyncRun(
+        region_id=test_region.id, total=10, done=4, started_at=stale, heartbeat_at=stale
+    )
+    db.add(run)
+    db.commit()
+    run_id = run.id
+
+    with patch("app.api.access_groups.sync_region_teams_task") as mock_fanout:
+        response = client.post(
+            f"/admin/regions/{test_region.id}/team-group-sync-run",
+            headers=auth(admin_token),
+        )
+    assert response.status_code == 200
+    assert response.json()["id"] == run_id
+    assert response.json()["done"] == 4
+    mock_fanout.assert_called_once_with(run_id)
+
+    # Freshly claimed: a second retry starts a new run instead
+    with patch("app.api.access_groups.sync_region_teams_task") as mock_fanout:
+        response = client.post(
+            f"/admin/regions/{test_region.id}/team-group-sync-run",
+            headers=auth(admin_token),
+        )
+    assert response.json()["id"] != run_id
+
+    db.query(DBTeamGroupSyncRun).filter_by(id=run_id).update({"status": "done", "done": 10})
+    db.commit()
+    response = client.get(
+        f"/admin/regions/{test_region.id}/team-group-sync-run/events",
+        headers=auth(admin_token),
+        params={"run_id": run_id},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert "event: progress" in response.text
+    assert "event: end" in response.text
+    assert '"done":10' in response.text
+
+
 # ---------------------------------------------------------------------------
 # Team opt-ins (the MOAD endpoint)
 # ---------------------------------------------------------------------------
@@ -408,3 +408,58 @@ def test_admin_get_model_redacts_credentials(client, admin_token, db):
     assert "sk-super-secret" not in response.text
     assert "hdr-secret" not in response.text
     assert "PRIVATE KEY" not in response.text
+
+
+@patch("app.services.model_sync.LiteLLMService")
+def test_region_batch_sync_reads_model_list_once(mock_litellm_class, db, test_region):
+    """Test that a batched region sync reads the proxy's models once and then
+    creates, updates and deletes by diff"""
+    from app.services.model_sync import sync_models_to_regions_task
+
+    mock_instance = MagicMock()
+    mock_instance.get_model_info = AsyncMock(
+        return_value={
+            "data": [
+                {"model_name": "test/existing", "model_info": {"id": "dep-1"}},
+                {"model_name": "test/retired", "model_info": {"id": "dep-2"}},
+            ]
+        }
+    )
+    mock_instance.add_model = AsyncMock(return_value={})
+    mock_instance.update_model = AsyncMock(return_value={})
+    mock_instance.delete_model = AsyncMock()
+    mock_litellm_class.return_value = mock_instance
+
+    models = {}
+    for model_id, active in [
+        ("test/new", True),
+        ("test/existing", True),
+        ("test/retired", False),
+        ("test/gone", False),
+    ]:
+        m = DBModel(model_id=model_id, display_name=model_id, provider="test", type="chat")
+        db.add(m)
+        db.flush()
+        db.add(
+            DBModelRegion(
+                model_id=m.id, region_id=test_region.id, is_active=active, sync_status="pending"
+            )
+        )
+        models[model_id] = m
+    db.commit()
+
+    import asyncio
+    asyncio.run(
+        sync_models_to_regions_task([(m.id, test_region.id) for m in models.values()])
+    )
+
+    mock_instance.get_model_info.assert_called_once()
+    mock_instance.add_model.assert_called_once_with("test/new", {}, access_groups=[])
+    mock_instance.update_model.assert_called_once_with(
+        "test/existing", {}, ["dep-1"], access_groups=[]
+    )
+    mock_instance.delete_model.assert_called_once_with("test/retired", ["dep-2"])
+    for assoc in db.query(DBModelRegion).filter_by(region_id=test_region.id).all():
+        db.refresh(assoc)
+        assert assoc.sync_status == "synced"
+        assert assoc.synced_at is not None
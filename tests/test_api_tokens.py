@@ -1,3 +1,13 @@
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import event
+
+from app.core.principal_cache import (
+    APITokenUsageRecorder,
+    Principal,
+    PrincipalCache,
+    principal_cache,
+)
 from app.db.models import DBAPIToken
 
 
@@ -108,3 +118,110 @@ def test_list_api_tokens_unauthenticated(client):
 
     assert response.status_code == 401
     assert "Could not validate credentials" in response.json()["detail"]
+
+
+def _count_api_token_lookups(db):
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, *args):
+        if "FROM api_tokens" in statement:
+            statements.append(statement)
+
+    event.listen(db.get_bind(), "before_cursor_execute", before_cursor_execute)
+    return statements, before_cursor_execute
+
+
+def test_api_token_auth_is_served_from_principal_cache(client, test_user, db):
+    """Test that a validated API token is not looked up again on the next request"""
+    db.add(DBAPIToken(name="Cached", token="cached-token-123", user_id=test_user.id))
+    db.commit()
+    headers = {"Authorization": "Bearer cached-token-123"}
+
+    assert client.get("/auth/me", headers=headers).status_code == 200
+
+    statements, listener = _count_api_token_lookups(db)
+    try:
+        response = client.get("/auth/me", headers=headers)
+    finally:
+        event.remove(db.get_bind(), "before_cursor_execute", listener)
+
+    assert response.status_code == 200
+    assert response.json()["email"] == test_user.email
+    assert statements == []
+
+
+def test_deleted_api_token_is_evicted_from_principal_cache(client, test_user, db):
+    """Test that deleting a cached API token revokes it immediately"""
+    api_token = DBAPIToken(
+        name="Revoked", token="revoked-token-123", user_id=test_user.id
+    )
+    db.add(api_token)
+    db.commit()
+    headers = {"Authorization": "Bearer revoked-token-123"}
+    assert client.get("/auth/me", headers=headers).status_code == 200
+    assert principal_cache.get("revoked-token-123") is not None
+
+    db.delete(api_token)
+    db.commit()
+
+    assert principal_cache.get("revoked-token-123") is None
+    assert client.get("/auth/me", headers=headers).status_code == 401
+
+
+def test_user_and_team_changes_evict_cached_principals(client, test_team_admin, db):
+    """Test that role changes and team suspension drop cached principals"""
+    db.add(DBAPIToken(name="Team", token="team-token-123", user_id=test_team_admin.id))
+    db.commit()
+    headers = {"Authorization": "Bearer team-token-123"}
+    assert client.get("/auth/me", headers=headers).status_code == 200
+
+    test_team_admin.role = "read_only"
+    db.commit()
+    assert principal_cache.get("team-token-123") is None
+
+    assert client.get("/auth/me", headers=headers).status_code == 200
+    assert principal_cache.get("team-token-123").role == "read_only"
+
+    test_team_admin.team.deleted_at = datetime.now(UTC)
+    db.commit()
+    assert principal_cache.get("team-token-123") is None
+    assert client.get("/auth/me", headers=headers).status_code == 403
+
+
+def test_api_token_last_used_at_is_flushed_in_batch(test_user, db):
+    """Test that recorded token uses are written by a single flush"""
+    tokens = [
+        DBAPIToken(name=f"Token {i}", token=f"usage-token-{i}", user_id=test_user.id)
+        for i in range(3)
+    ]
+    db.add_all(tokens)
+    db.commit()
+
+    recorder = APITokenUsageRecorder(flush_interval_seconds=0)
+    used_at = datetime.now(UTC)
+    for token in tokens:
+        recorder.record(token.id, used_at - timedelta(seconds=5))
+        recorder.record(token.id, used_at)
+
+    assert recorder.due()
+    assert recorder.flush() == 3
+    assert not recorder.due()
+    for token in tokens:
+        db.refresh(token)
+        assert token.last_used_at == used_at
+
+
+def test_principal_cache_respects_jwt_expiry(test_user):
+    """Test that a JWT principal is never cached past the token's exp"""
+    cache = PrincipalCache(ttl_seconds=60, max_entries=2)
+    principal = Principal.from_user(test_user)
+
+    cache.put("expired-jwt", principal, datetime.now(UTC) - timedelta(seconds=1))
+    assert cache.get("expired-jwt") is None
+
+    cache.put("live-jwt", principal, datetime.now(UTC) + timedelta(minutes=5))
+    assert cache.get("live-jwt") == principal
+
+    cache.put("a", principal)
+    cache.put("b", principal)
+    assert cache.get("live-jwt") is None
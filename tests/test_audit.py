@@ -1,8 +1,13 @@
+import asyncio
 from datetime import datetime, UTC, timedelta
 from urllib.parse import urlparse
 from app.db.models import DBAuditLog, DBUser
 from app.core.security import get_password_hash
-from app.middleware.audit import sanitize_referer, MAX_HEADER_URL_LENGTH
+from app.middleware.audit import (
+    AuditLogWriter,
+    sanitize_referer,
+    MAX_HEADER_URL_LENGTH,
+)
 
 
 def test_get_audit_logs_admin_access_success(client, admin_token, db):
@@ -461,6 +466,93 @@ def test_get_audit_logs_with_pagination(client, admin_token, db):
     assert len(data["items"]) == 2
 
 
+def test_get_audit_logs_cursor_pagination(client, admin_token, db):
+    """
+    Given: Audit logs, some sharing a timestamp
+    When: An admin follows next_cursor from the first page
+    Then: Every log is returned once, newest first, and the last page has no cursor
+    """
+    now = datetime.now(UTC)
+    for i in range(5):
+        db.add(
+            DBAuditLog(
+                event_type="GET",
+                resource_type="cursor-test",
+                action=f"GET /cursor/{i}",
+                details={"status_code": 200},
+                # Two pairs of logs share a timestamp; id breaks the tie
+                timestamp=now - timedelta(minutes=i // 2),
+            )
+        )
+    db.commit()
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    seen = []
+    cursor = None
+    while True:
+        url = "/audit/logs?resource_type=cursor-test&limit=2"
+        if cursor:
+            url += f"&cursor={cursor}"
+        response = client.get(url, headers=headers)
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 5
+        seen += data["items"]
+        cursor = data["next_cursor"]
+        if cursor is None:
+            break
+
+    assert sorted(log["action"] for log in seen) == [
+        f"GET /cursor/{i}" for i in range(5)
+    ]
+    keys = [(log["timestamp"], log["id"]) for log in seen]
+    assert keys == sorted(keys, reverse=True)
+
+    response = client.get("/audit/logs?cursor=not-a-cursor", headers=headers)
+    assert response.status_code == 400
+
+
+def test_get_audit_logs_count_modes(client, admin_token, db):
+    """
+    Given: Audit logs
+    When: An admin asks for an estimated count or no count
+    Then: total is the planner estimate or null, flagged accordingly
+    """
+    for i in range(3):
+        db.add(
+            DBAuditLog(
+                event_type="GET",
+                resource_type="count-test",
+                action=f"GET /count/{i}",
+                details={"status_code": 200},
+                timestamp=datetime.now(UTC),
+            )
+        )
+    db.commit()
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    response = client.get(
+        "/audit/logs?resource_type=count-test&count=estimated", headers=headers
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total_is_estimate"] is True
+    assert data["total"] >= 0
+    assert len(data["items"]) == 3
+
+    response = client.get(
+        "/audit/logs?resource_type=count-test&count=none", headers=headers
+    )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["total"] is None
+    assert data["total_is_estimate"] is False
+    assert len(data["items"]) == 3
+
+    response = client.get("/audit/logs?count=approximate", headers=headers)
+    assert response.status_code == 422
+
+
 def test_get_audit_logs_invalid_pagination_parameters(client, admin_token):
     """
     Given: An admin user with valid authentication
@@ -798,3 +890,89 @@ def test_get_audit_logs_with_referer_filter(client, admin_token, db):
     )
     assert response.status_code == 200
     assert response.json()["total"] == 0
+
+
+def _audit_row(action: str, **overrides) -> dict:
+    row = {
+        "timestamp": datetime.now(UTC),
+        "user_id": None,
+        "event_type": "GET",
+        "resource_type": "teams",
+        "action": action,
+        "details": {"path": "/teams", "status_code": 200},
+    }
+    row.update(overrides)
+    return row
+
+
+def test_audit_log_writer_flushes_queued_rows_on_stop(db):
+    """
+    Given: A running writer with a long flush interval
+    When: Rows are submitted and the writer is stopped
+    Then: Every queued row is bulk-inserted before stop returns
+    """
+
+    async def _run():
+        writer = AuditLogWriter(flush_interval_ms=60_000, batch_size=100)
+        await writer.start()
+        for i in range(3):
+            assert await writer.submit(_audit_row(f"GET /teams/{i}"))
+        await writer.stop()
+        assert not writer.running
+
+    asyncio.run(_run())
+
+    actions = {log.action for log in db.query(DBAuditLog).all()}
+    assert actions == {"GET /teams/0", "GET /teams/1", "GET /teams/2"}
+
+
+def test_audit_log_writer_writes_synchronously_when_queue_full(db):
+    """
+    Given: A writer whose queue is full
+    When: Another row is submitted
+    Then: That row is written straight away instead of being dropped
+    """
+
+    async def _run():
+        writer = AuditLogWriter(flush_interval_ms=60_000, batch_size=100, queue_size=1)
+        await writer.start()
+        # Let the flusher take the first row, then fill the queue behind it.
+        assert await writer.submit(_audit_row("GET /first"))
+        await asyncio.sleep(0)
+        assert await writer.submit(_audit_row("GET /queued"))
+        assert await writer.submit(_audit_row("GET /overflow"))
+        db.expire_all()
+        overflow = db.query(DBAuditLog).filter_by(action="GET /overflow").count()
+        await writer.stop()
+        return overflow
+
+    assert asyncio.run(_run()) == 1
+    assert db.query(DBAuditLog).count() == 3
+
+
+def test_audit_log_writer_not_running_rejects_rows():
+    async def _run():
+        return await AuditLogWriter().submit(_audit_row("GET /teams"))
+
+    assert asyncio.run(_run()) is False
+
+
+def test_audit_log_writer_bad_row_does_not_drop_batch(db):
+    """
+    Given: A batch where one row references a missing user
+    When: The batch is flushed
+    Then: The other rows are still written
+    """
+
+    async def _run():
+        writer = AuditLogWriter(flush_interval_ms=60_000, batch_size=100)
+        await writer.start()
+        await writer.submit(_audit_row("GET /ok-1"))
+        await writer.submit(_audit_row("GET /bad", user_id=999_999))
+        await writer.submit(_audit_row("GET /ok-2"))
+        await writer.stop()
+
+    asyncio.run(_run())
+
+    actions = {log.action for log in db.query(DBAuditLog).all()}
+    assert actions == {"GET /ok-1", "GET /ok-2"}
@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta
+
+from sqlalchemy import text
+
+from app.db.models import DBAuditLog
+from app.services import audit_log_partitions
+from app.services.audit_log_partitions import (
+    drop_expired_audit_log_partitions,
+    ensure_audit_log_partitions,
+    list_audit_log_partitions,
+)
+
+
+def _log(timestamp: datetime, action: str) -> DBAuditLog:
+    return DBAuditLog(
+        timestamp=timestamp,
+        event_type="GET",
+        resource_type="users",
+        action=action,
+        details={"status_code": 200},
+    )
+
+
+def _partition_of(db, action: str) -> str:
+    return db.execute(
+        text("SELECT tableoid::regclass::text FROM audit_logs WHERE action = :action"),
+        {"action": action},
+    ).scalar_one()
+
+
+def test_ensure_creates_upcoming_partitions_and_moves_default_rows(db, monkeypatch):
+    """Test that missing monthly partitions are created and rows that fell into
+    the default partition move into them"""
+    monkeypatch.setattr(audit_log_partitions.settings, "AUDIT_LOG_PARTITIONS_AHEAD", 2)
+    now = datetime(2026, 10, 16, 12, 0)
+    db.add(_log(now, "this-month"))
+    db.add(_log(datetime(2030, 1, 1), "far-future"))
+    db.commit()
+    assert _partition_of(db, "this-month") == "audit_logs_default"
+
+    created = ensure_audit_log_partitions(db, now=now)
+
+    assert created == ["audit_logs_p202610", "audit_logs_p202611", "audit_logs_p202612"]
+    assert _partition_of(db, "this-month") == "audit_logs_p202610"
+    assert _partition_of(db, "far-future") == "audit_logs_default"
+    partition = list_audit_log_partitions(db)[0]
+    assert (partition.lower, partition.upper) == (
+        datetime(2026, 10, 1),
+        datetime(2026, 11, 1),
+    )
+
+    # New rows are routed to their month; nothing is created twice
+    db.add(_log(datetime(2026, 11, 30, 23, 59), "next-month"))
+    db.commit()
+    assert _partition_of(db, "next-month") == "audit_logs_p202611"
+    assert ensure_audit_log_partitions(db, now=now) == []
+
+
+def test_drop_expired_partitions_respects_retention(db, monkeypatch):
+    """Test that only partitions entirely past the retention window are dropped,
+    and none while retention is disabled"""
+    monkeypatch.setattr(audit_log_partitions.settings, "AUDIT_LOG_PARTITIONS_AHEAD", 2)
+    ensure_audit_log_partitions(db, now=datetime(2026, 1, 10))
+    for month in (1, 2, 3):
+        db.add(_log(datetime(2026, month, 15), f"month-{month}"))
+    db.commit()
+
+    now = datetime(2026, 3, 20)
+    monkeypatch.setattr(audit_log_partitions.settings, "AUDIT_LOG_RETENTION_DAYS", 0)
+    assert drop_expired_audit_log_partitions(db, now=now) == []
+
+    # Cutoff 2026-02-18: January ended before it, February did not
+    monkeypatch.setattr(audit_log_partitions.settings, "AUDIT_LOG_RETENTION_DAYS", 30)
+    assert drop_expired_audit_log_partitions(db, now=now) == ["audit_logs_p202601"]
+
+    remaining = (
+        db.execute(text("SELECT action FROM audit_logs ORDER BY timestamp"))
+        .scalars()
+        .all()
+    )
+    assert remaining == ["month-2", "month-3"]
+    assert [p.name for p in list_audit_log_partitions(db)] == [
+        "audit_logs_p202602",
+        "audit_logs_p202603",
+    ]
+    assert drop_expired_audit_log_partitions(db, now=now + timedelta(hours=1)) == []
@@ -524,6 +524,7 @@ async def test_new_topup_walks_the_band_back_without_changing_the_period(db, reg
     # $92 of $200 is 46%, below the band already sent -- silent walk-back, no event.
     assert [e for e in second.events if e.subject_type == SUBJECT_TEAM] == []
     apply_resets(db, region, second)
+    db.commit()
     state = (
         db.query(DBBudgetAlertState)
         .filter(DBBudgetAlertState.subject_key == f"team:{team.id}:{region.id}")
@@ -534,6 +535,31 @@ async def test_new_topup_walks_the_band_back_without_changing_the_period(db, reg
     assert state.arm_seq == 1  # re-armed, so a second 90% gets a fresh event_id
 
 
+@pytest.mark.asyncio
+async def test_recording_a_region_with_resets_commits_once(db, region):
+    """Resets are staged, not committed, so a region's stored activity, resets,
+    outbox rows and bands go in with a single commit."""
+    from app.core.budget_alert_service import _record_region
+
+    team = _make_team(db)
+    _add_topup(db, team, region, amount_cents=10_000, purchased_days_ago=5)  # $100
+    _make_key(db, team, region, token="sk-a")
+    lite = f"{region.name}_{team.id}"
+    rows = [_day(lite, 92.0, days_ago=1, keys={"sk-a": 92.0})]
+    with _patch_litellm(rows, [_key_state("sk-a")]):
+        first = await evaluate_region(db, region, thresholds=THRESHOLDS)
+    mark_notified(db, region, first, {e.event_id for e in first.events})
+
+    _add_topup(db, team, region, amount_cents=10_000, purchased_days_ago=0)  # +$100
+    with _patch_litellm(rows, [_key_state("sk-a")]):
+        second = await evaluate_region(db, region, thresholds=THRESHOLDS)
+    assert second.resets
+
+    with patch.object(db, "commit", wraps=db.commit) as commit:
+        _record_region(db, region, second)
+    assert commit.call_count == 1
+
+
 # --------------------------------------------------------------------------- #
 # Budget decreases with no recent traffic
 # --------------------------------------------------------------------------- #
@@ -790,7 +816,7 @@ async def test_new_period_re_arms_the_same_band(db, region):
 
 @pytest.mark.asyncio
 async def test_failed_delivery_leaves_state_unadvanced_and_retries(db, region):
-    """No outbox: an undelivered event must be re-detected next tick."""
+    """An event that was never queued must be re-detected next tick."""
     team = _make_team(db)
     _add_subscription(db, team, region, amount_cents=10_000)
     _make_key(db, team, region, token="sk-a")
@@ -1176,13 +1202,110 @@ async def test_webhook_payload_excludes_the_litellm_token(db, region):
 
 
 @pytest.mark.asyncio
-async def test_delivery_failure_returns_no_delivered_ids(db, region):
-    """A non-2xx must not be reported as delivered, or the alert is lost."""
+async def test_slow_region_times_out_without_holding_up_the_others(db, region):
+    """Each region runs in its own session under a time budget: one that does
+    not finish is skipped for the tick and the rest are still recorded."""
+    import asyncio
+
+    from app.core.budget_alert_service import (
+        RegionEvaluation,
+        monitor_budget_thresholds,
+    )
+
+    slow = DBRegion(
+        name="slow-region",
+        postgres_host="localhost",
+        postgres_port=5432,
+        postgres_admin_user="postgres",
+        postgres_admin_password="postgres",
+        litellm_api_url="http://slow.litellm.test",
+        litellm_api_key="sk-test",
+        is_active=True,
+    )
+    db.add(slow)
+    db.commit()
+    team = _make_team(db)
+    _make_key(db, team, region, token="sk-a")
+    _make_key(db, team, slow, name="k2", token="sk-b")
+
+    async def evaluate(region_db, swept_region, **kwargs):
+        if swept_region.name == "slow-region":
+            await asyncio.sleep(5)
+        return RegionEvaluation(litellm_calls=1)
+
+    with (
+        patch.object(settings, "BUDGET_ALERT_REGION_TIMEOUT_SECONDS", 0.05),
+        patch(
+            "app.core.budget_alert_service.ingest_region_activity",
+            AsyncMock(return_value=None),
+        ),
+        patch(
+            "app.core.budget_alert_service.evaluate_region",
+            AsyncMock(side_effect=evaluate),
+        ),
+    ):
+        totals = await monitor_budget_thresholds(db)
+
+    assert totals["regions"] == 1
+    assert totals["timed_out"] == 1
+    assert totals["litellm_calls"] == 1
+
+
+@pytest.mark.asyncio
+async def test_incremental_tick_evaluates_only_teams_whose_spend_changed(db, region):
+    """After the first (full) tick, only recent days are fetched and a team is
+    re-evaluated only when its stored spend changes."""
+    from app.core.budget_alert_service import ingest_region_activity
+
+    team = _make_team(db)
+    entry = _add_subscription(db, team, region, amount_cents=10_000)  # $100
+    # Bought at the start of the cycle, not just now (that is a budget change)
+    entry.created_at = entry.purchased_at
+    db.commit()
+    _make_key(db, team, region, token="sk-a")
+    lite = f"{region.name}_{team.id}"
+    now = datetime.now(UTC)
+
+    async def tick(rows):
+        with _patch_litellm(rows, [_key_state("sk-a")]):
+            fetch = LiteLLMService.get_all_team_daily_activity
+            activity = await ingest_region_activity(db, region, now)
+            result = await evaluate_region(
+                db, region, thresholds=THRESHOLDS, now=now, activity=activity
+            )
+            start = fetch.await_args.args[0]
+        db.commit()
+        return result, start
+
+    earlier = _day(lite, 40.0, days_ago=5, keys={"sk-a": 40.0})
+    today = _active(lite, 52.0, keys={"sk-a": 52.0})
+    first, first_start = await tick([earlier] + today)
+    assert first_start < (now - timedelta(days=5)).date().isoformat()
+    team_event = next(e for e in first.events if e.subject_type == SUBJECT_TEAM)
+    assert team_event.spend == 92.0
+
+    # Same rows: nothing changed, so nobody is evaluated and only the last
+    # seen day (minus the re-fetch margin) is asked for.
+    second, second_start = await tick(_active(lite, 52.0, keys={"sk-a": 52.0}))
+    assert second.subjects == []
+    assert second_start == (now - timedelta(days=1)).date().isoformat()
+
+    # Today's spend grows: the team is back, with the older days from storage.
+    third, _ = await tick(_active(lite, 55.0, keys={"sk-a": 55.0}))
+    team_subject = next(s for s in third.subjects if s.subject_type == SUBJECT_TEAM)
+    assert team_subject.spend == 95.0
+
+
+# --------------------------------------------------------------------------- #
+# Outbox
+# --------------------------------------------------------------------------- #
+
+
+def _outbox_event(region, event_id):
     from app.core.budget_alert_service import BudgetAlertEvent
-    from app.services.budget_alert_webhook import deliver_events
 
-    event = BudgetAlertEvent(
-        event_id="evt_test",
+    return BudgetAlertEvent(
+        event_id=event_id,
         subject_type=SUBJECT_TEAM,
         subject_key="team:1:1",
         threshold_pct=90,
@@ -1192,16 +1315,19 @@ async def test_delivery_failure_returns_no_delivered_ids(db, region):
         region_id=region.id,
         region_name=region.name,
         period_key="subscription_ledger:x",
-        period_start=None,
+        period_start=datetime(2026, 7, 1, tzinfo=UTC),
         period_end=None,
         budget_duration="31d",
         team_id=1,
     )
 
+
+def _webhook_client(status_code, posts):
     class _Resp:
-        status_code = 500
         text = "boom"
 
+    _Resp.status_code = status_code
+
     class _Client:
         def __init__(self, *args, **kwargs):
             pass
@@ -1212,38 +1338,181 @@ async def test_delivery_failure_returns_no_delivered_ids(db, region):
         async def __aexit__(self, *args):
             return False
 
-        async def post(self, *args, **kwargs):
+        async def post(self, url, json=None, **kwargs):
+            posts.append(json)
             return _Resp()
 
+    return _Client
+
+
+@pytest.mark.asyncio
+async def test_queued_event_is_delivered_once_and_audited(db, region):
+    """Queueing the same crossing twice leaves one outbox row, which the worker
+    posts, marks delivered and records in the audit log."""
+    from app.db.models import DBAuditLog, DBBudgetAlertOutbox, DBJob
+    from app.services.budget_alert_webhook import (
+        BUDGET_ALERT_DELIVERY_JOB,
+        deliver_outbox,
+        queue_events,
+    )
+
+    event = _outbox_event(region, "evt_outbox")
+    queue_events(db, [event])
+    queue_events(db, [event])
+    db.commit()
+    assert db.query(DBBudgetAlertOutbox).count() == 1
+    jobs = db.query(DBJob).filter(DBJob.kind == BUDGET_ALERT_DELIVERY_JOB)
+    assert jobs.count() == 1
+
+    posts = []
     with patch.object(settings, "BUDGET_ALERT_WEBHOOK_URL", "http://moad.test/hook"):
-        with patch("app.services.budget_alert_webhook.httpx.AsyncClient", _Client):
-            delivered = await deliver_events([event])
+        with patch(
+            "app.services.budget_alert_webhook.httpx.AsyncClient",
+            _webhook_client(202, posts),
+        ):
+            totals = await deliver_outbox(db)
+
+    assert totals == {"delivered": 1, "retrying": 0, "failed": 0}
+    assert [e["event_id"] for post in posts for e in post["events"]] == ["evt_outbox"]
+    row = db.query(DBBudgetAlertOutbox).one()
+    assert row.status == "delivered"
+    assert row.delivered_at is not None
+    audit = (
+        db.query(DBAuditLog)
+        .filter(DBAuditLog.action == "budget.threshold_reached")
+        .one()
+    )
+    assert audit.details["delivered"] is True
+    assert audit.details["event_id"] == "evt_outbox"
 
-    assert delivered == set()
+    # Nothing left to send: a second run posts nothing.
+    posts.clear()
+    with patch.object(settings, "BUDGET_ALERT_WEBHOOK_URL", "http://moad.test/hook"):
+        with patch(
+            "app.services.budget_alert_webhook.httpx.AsyncClient",
+            _webhook_client(202, posts),
+        ):
+            await deliver_outbox(db)
+    assert posts == []
 
 
 @pytest.mark.asyncio
-async def test_delivery_without_url_configured_is_a_no_op(db, region):
-    from app.core.budget_alert_service import BudgetAlertEvent
-    from app.services.budget_alert_webhook import deliver_events
+async def test_failed_outbox_delivery_backs_off_then_gives_up(db, region):
+    """A failed batch is rescheduled with backoff, not re-sent in a tight loop,
+    and after the last attempt is recorded as undelivered."""
+    from app.core.job_queue import run_due_jobs
+    from app.db.models import DBAuditLog, DBBudgetAlertOutbox, DBJob
+    from app.services.budget_alert_webhook import (
+        BUDGET_ALERT_DELIVERY_JOB,
+        deliver_outbox,
+        queue_events,
+    )
 
-    event = BudgetAlertEvent(
-        event_id="evt_test2",
-        subject_type=SUBJECT_TEAM,
-        subject_key="team:1:1",
-        threshold_pct=50,
-        percent_used=55.0,
-        spend=55.0,
-        max_budget=100.0,
-        region_id=region.id,
-        region_name=region.name,
-        period_key="k",
-        period_start=None,
-        period_end=None,
-        budget_duration=None,
+    queue_events(db, [_outbox_event(region, "evt_retry")])
+    db.commit()
+
+    posts = []
+    with (
+        patch.object(settings, "BUDGET_ALERT_WEBHOOK_URL", "http://moad.test/hook"),
+        patch.object(settings, "BUDGET_ALERT_DELIVERY_MAX_ATTEMPTS", 2),
+        patch(
+            "app.services.budget_alert_webhook.httpx.AsyncClient",
+            _webhook_client(500, posts),
+        ),
+    ):
+        # The queued job runs as the worker would run it; the retry it
+        # schedules is not due yet, so it does not run here.
+        assert await run_due_jobs() == 1
+        assert len(posts) == 1
+
+        db.expire_all()
+        row = db.query(DBBudgetAlertOutbox).one()
+        assert row.status == "pending"
+        assert row.attempts == 1
+        assert row.last_error.startswith("Status 500")
+        assert row.next_attempt_at > datetime.now(UTC)
+        # The worker is scheduled again for the retry.
+        job = db.query(DBJob).filter(DBJob.kind == BUDGET_ALERT_DELIVERY_JOB).one()
+        assert job.status == "pending"
+        assert job.run_at > datetime.now(UTC)
+
+        row.next_attempt_at = datetime.now(UTC) - timedelta(seconds=1)
+        db.commit()
+        second = await deliver_outbox(db)
+
+    assert second == {"delivered": 0, "retrying": 0, "failed": 1}
+    assert len(posts) == 2
+    db.refresh(row)
+    assert row.status == "failed"
+    assert row.attempts == 2
+    audit = (
+        db.query(DBAuditLog)
+        .filter(DBAuditLog.action == "budget.threshold_reached")
+        .one()
     )
+    assert audit.details["delivered"] is False
+
+
+@pytest.mark.asyncio
+async def test_outbox_without_url_configured_keeps_events_queued(db, region):
+    from app.db.models import DBBudgetAlertOutbox
+    from app.services.budget_alert_webhook import deliver_outbox, queue_events
+
+    queue_events(db, [_outbox_event(region, "evt_no_url")])
+    db.commit()
     with patch.object(settings, "BUDGET_ALERT_WEBHOOK_URL", ""):
-        assert await deliver_events([event]) == set()
+        totals = await deliver_outbox(db)
+
+    assert totals == {"delivered": 0, "retrying": 0, "failed": 0}
+    row = db.query(DBBudgetAlertOutbox).one()
+    assert row.status == "pending"
+    assert row.attempts == 0
+
+
+@pytest.mark.asyncio
+async def test_give_up_is_decided_per_row_in_a_mixed_batch(db, region):
+    """A fresh event sharing a failed batch with an old retry keeps its own
+    attempts: only the retry that ran out is given up on."""
+    from app.db.models import DBBudgetAlertOutbox
+    from app.services.budget_alert_webhook import deliver_outbox, queue_events
+
+    queue_events(
+        db, [_outbox_event(region, "evt_old"), _outbox_event(region, "evt_new")]
+    )
+    db.commit()
+    db.query(DBBudgetAlertOutbox).filter(
+        DBBudgetAlertOutbox.event_id == "evt_old"
+    ).update({"attempts": 2})
+    db.commit()
+
+    posts = []
+    with (
+        patch.object(settings, "BUDGET_ALERT_WEBHOOK_URL", "http://moad.test/hook"),
+        patch.object(settings, "BUDGET_ALERT_DELIVERY_MAX_ATTEMPTS", 3),
+        patch(
+            "app.services.budget_alert_webhook.httpx.AsyncClient",
+            _webhook_client(500, posts),
+        ),
+    ):
+        totals = await deliver_outbox(db)
+
+    assert len(posts) == 1
+    assert totals == {"delivered": 0, "retrying": 1, "failed": 1}
+    rows = {row.event_id: row for row in db.query(DBBudgetAlertOutbox).all()}
+    assert (rows["evt_old"].status, rows["evt_old"].attempts) == ("failed", 3)
+    assert (rows["evt_new"].status, rows["evt_new"].attempts) == ("pending", 1)
+
+
+def test_delivery_backoff_grows_and_is_capped():
+    from app.services.budget_alert_webhook import delivery_backoff_seconds
+
+    with (
+        patch.object(settings, "BUDGET_ALERT_DELIVERY_BACKOFF_BASE_SECONDS", 5),
+        patch.object(settings, "BUDGET_ALERT_DELIVERY_BACKOFF_MAX_SECONDS", 60),
+    ):
+        assert 2.5 <= delivery_backoff_seconds(1) <= 5
+        assert 10 <= delivery_backoff_seconds(3) <= 20
+        assert 30 <= delivery_backoff_seconds(10) <= 60
 
 
 # --------------------------------------------------------------------------- #
@@ -1519,6 +1788,7 @@ async def test_re_crossing_a_band_in_one_period_gets_a_new_event_id(db, region):
         second = await evaluate_region(db, region, thresholds=THRESHOLDS)
     assert [e for e in second.events if e.subject_type == SUBJECT_TEAM] == []
     apply_resets(db, region, second)
+    db.commit()
 
     state = (
         db.query(DBBudgetAlertState)
@@ -0,0 +1,207 @@
+import asyncio
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy import select, update
+
+from app.core import job_queue
+from app.core.job_queue import (
+    JOB_FAILED,
+    JOB_PENDING,
+    JOB_RUNNING,
+    enqueue_job,
+    job_handler,
+    run_due_jobs,
+)
+from app.core.limit_service import TEAM_BUDGET_PROPAGATION_JOB, LimitService
+from app.db.database import SessionLocal
+from app.db.models import DBJob
+from app.schemas.limits import LimitSource, LimitType, OwnerType, ResourceType, UnitType
+
+calls = []
+
+
+@job_handler("test_record")
+async def _record(db, payload):
+    calls.append(payload)
+
+
+@job_handler("test_fail")
+async def _fail(db, payload):
+    raise RuntimeError("upstream down")
+
+
+def _jobs(db):
+    db.expire_all()
+    return db.execute(select(DBJob).order_by(DBJob.id)).scalars().all()
+
+
+def test_enqueue_coalesces_pending_jobs_with_the_same_key(db):
+    """Test that a second job for a pending key replaces its payload"""
+    enqueue_job(db, "test_record", {"value": 1}, dedupe_key="k")
+    enqueue_job(db, "test_record", {"value": 2}, dedupe_key="k")
+    enqueue_job(db, "test_record", {"value": 3}, dedupe_key="other")
+    db.commit()
+
+    jobs = _jobs(db)
+    assert [(j.dedupe_key, j.payload) for j in jobs] == [
+        ("k", {"value": 2}),
+        ("other", {"value": 3}),
+    ]
+
+    calls.clear()
+    assert asyncio.run(run_due_jobs()) == 2
+    assert sorted(c["value"] for c in calls) == [2, 3]
+    # Finished jobs are deleted
+    assert _jobs(db) == []
+
+
+def test_rolled_back_enqueue_leaves_no_job(db):
+    """Test that a job only exists once the enqueueing transaction commits"""
+    enqueue_job(db, "test_record", {"value": 1})
+    db.rollback()
+    assert _jobs(db) == []
+
+
+def test_claim_skips_jobs_locked_by_another_worker(db):
+    """Test that a row locked by one worker is not handed to another"""
+    enqueue_job(db, "test_record", {"value": 1})
+    db.commit()
+
+    with SessionLocal() as other:
+        other.execute(select(DBJob).with_for_update()).scalars().all()
+        assert job_queue._claim_job() is None
+        other.rollback()
+
+    claimed = job_queue._claim_job()
+    assert claimed is not None
+    assert claimed[1:] == ("test_record", {"value": 1})
+    [job] = _jobs(db)
+    assert job.status == JOB_RUNNING
+    assert job.attempts == 1
+    assert job_queue._claim_job() is None
+
+
+def test_pending_job_waits_for_running_job_with_the_same_key(db):
+    """Test that a newer job for a key does not run alongside the older one"""
+    enqueue_job(db, "test_record", {"value": 1}, dedupe_key="k")
+    db.commit()
+    first = job_queue._claim_job()
+
+    enqueue_job(db, "test_record", {"value": 2}, dedupe_key="k")
+    db.commit()
+    assert job_queue._claim_job() is None
+
+    job_queue._finish_job(first[0], None)
+    assert job_queue._claim_job()[2] == {"value": 2}
+
+
+def test_stale_running_job_is_claimed_again(db):
+    """Test that a job whose worker died is handed out after the lock timeout"""
+    enqueue_job(db, "test_record", {"value": 1})
+    db.commit()
+    job_queue._claim_job()
+    db.execute(update(DBJob).values(locked_at=datetime.now(UTC) - timedelta(hours=1)))
+    db.commit()
+
+    claimed = job_queue._claim_job()
+    assert claimed is not None
+    assert _jobs(db)[0].attempts == 2
+
+
+def test_failed_job_is_retried_with_backoff(db):
+    """Test that a failing handler reschedules the job with a growing delay"""
+    enqueue_job(db, "test_fail", {}, max_attempts=2)
+    db.commit()
+
+    assert asyncio.run(run_due_jobs()) == 1
+    [job] = _jobs(db)
+    assert job.status == JOB_PENDING
+    assert job.attempts == 1
+    assert "upstream down" in job.last_error
+    assert job.run_at > datetime.now(UTC)
+    # Not due yet
+    assert asyncio.run(run_due_jobs()) == 0
+
+    db.execute(update(DBJob).values(run_at=datetime.now(UTC)))
+    db.commit()
+    assert asyncio.run(run_due_jobs()) == 1
+    [job] = _jobs(db)
+    assert job.status == JOB_FAILED
+    assert job.attempts == 2
+
+    assert job_queue.backoff_seconds(1) < job_queue.backoff_seconds(3)
+    assert (
+        job_queue.backoff_seconds(100)
+        == job_queue.settings.JOB_QUEUE_BACKOFF_MAX_SECONDS
+    )
+
+
+def test_retry_folds_into_a_newer_pending_job(db):
+    """Test that a failed job is dropped when its key was enqueued again meanwhile"""
+    enqueue_job(db, "test_fail", {"value": 1}, dedupe_key="k")
+    db.commit()
+    job_id = job_queue._claim_job()[0]
+
+    enqueue_job(db, "test_fail", {"value": 2}, dedupe_key="k")
+    db.commit()
+    assert job_queue._finish_job(job_id, "boom") == "retry"
+
+    [job] = _jobs(db)
+    assert job.payload == {"value": 2}
+    assert job.attempts == 0
+
+
+def test_queue_metrics_report_depth_and_lag(db):
+    """Test that depth and lag gauges reflect the jobs table"""
+    enqueue_job(db, "test_record", {})
+    enqueue_job(db, "test_record", {}, delay_seconds=3600)
+    db.commit()
+    db.execute(
+        update(DBJob)
+        .where(DBJob.run_at <= datetime.now(UTC))
+        .values(run_at=datetime.now(UTC) - timedelta(seconds=30))
+    )
+    db.commit()
+
+    job_queue.update_queue_metrics(db)
+    depth = job_queue.job_queue_depth.labels(kind="test_record", status=JOB_PENDING)
+    lag = job_queue.job_queue_lag_seconds.labels(kind="test_record")
+    assert depth._value.get() == 2
+    assert 30 <= lag._value.get() < 60
+
+
+def test_team_budget_updates_coalesce_into_one_propagation_job(db, test_team):
+    """Test that several budget changes for a team queue a single job with the latest budget"""
+    limit_service = LimitService(db)
+    for budget in (50.0, 75.0, 120.0):
+        limit_service.set_limit(
+            owner_type=OwnerType.TEAM,
+            owner_id=test_team.id,
+            resource_type=ResourceType.BUDGET,
+            limit_type=LimitType.DATA_PLANE,
+            unit=UnitType.DOLLAR,
+            max_value=budget,
+            limited_by=LimitSource.DEFAULT,
+        )
+
+    [job] = _jobs(db)
+    assert job.kind == TEAM_BUDGET_PROPAGATION_JOB
+    assert job.dedupe_key == f"{TEAM_BUDGET_PROPAGATION_JOB}:{test_team.id}"
+    assert job.payload["budget_amount"] == 120.0
+    assert job.payload["apply_to_keys"] is True
+
+
+def test_uncommitted_budget_update_queues_nothing(db, test_team):
+    """Test that a rolled back limit change does not leave a propagation job"""
+    LimitService(db).set_limit(
+        owner_type=OwnerType.TEAM,
+        owner_id=test_team.id,
+        resource_type=ResourceType.BUDGET,
+        limit_type=LimitType.DATA_PLANE,
+        unit=UnitType.DOLLAR,
+        max_value=80.0,
+        limited_by=LimitSource.DEFAULT,
+        commit=False,
+    )
+    db.rollback()
+    assert _jobs(db) == []
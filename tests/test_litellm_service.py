@@ -1,7 +1,7 @@
 import pytest
 import asyncio
 import hashlib
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from unittest.mock import patch, AsyncMock, Mock
 from fastapi import HTTPException
 from app.services.litellm import LiteLLMService
@@ -1325,6 +1325,65 @@ def test_list_all_keys_skips_non_dict_entries(mock_client_class, test_region):
     assert result == {"hash-1": {"token": "hash-1", "spend": 1.0}}
 
 
+@patch("httpx.AsyncClient")
+def test_list_keys_updated_since_stops_at_watermark(mock_client_class, test_region):
+    """The newest-first walk stops at the first key older than ``since``."""
+    delta = timedelta(seconds=30)
+    newest = datetime(2026, 8, 1, 12, 0, tzinfo=timezone.utc)
+    page_1 = {
+        "keys": [
+            {"token": f"hash-{i}", "updated_at": (newest - i * delta).isoformat()}
+            for i in range(100)
+        ]
+    }
+    page_2 = {
+        "keys": [
+            {"token": "hash-new", "updated_at": "2026-08-01T10:30:00Z"},
+            {"token": "hash-old", "updated_at": "2026-08-01T09:00:00"},
+        ]
+    }
+    mock_client = _key_list_client([page_1, page_2])
+    mock_client_class.return_value = mock_client
+
+    service = LiteLLMService(
+        api_url=test_region.litellm_api_url, api_key=test_region.litellm_api_key
+    )
+
+    result = asyncio.run(service.list_keys_updated_since(datetime(2026, 8, 1, 10, 0)))
+
+    assert len(result) == 101
+    assert "hash-new" in result
+    assert "hash-old" not in result
+    params = mock_client.get.call_args_list[0].kwargs["params"]
+    assert params["sort_by"] == "updated_at"
+    assert params["sort_order"] == "desc"
+
+
+@patch("httpx.AsyncClient")
+def test_list_keys_updated_since_rejects_unsorted_listing(
+    mock_client_class, test_region
+):
+    """A proxy that ignores sort_by must fail loudly, not silently miss changes."""
+    page_1 = {
+        "keys": [
+            {"token": "hash-1", "updated_at": "2026-08-01T10:00:00Z"},
+            {"token": "hash-2", "updated_at": "2026-08-01T11:00:00Z"},
+        ]
+    }
+    mock_client_class.return_value = _key_list_client([page_1])
+
+    service = LiteLLMService(
+        api_url=test_region.litellm_api_url, api_key=test_region.litellm_api_key
+    )
+
+    with pytest.raises(ValueError):
+        asyncio.run(
+            service.list_keys_updated_since(
+                datetime(2026, 8, 1, 9, 0, tzinfo=timezone.utc)
+            )
+        )
+
+
 @patch("httpx.AsyncClient")
 def test_list_all_keys_failure_raises(mock_client_class, test_region):
     """A non-2xx response surfaces as an HTTPException."""
@@ -1448,3 +1507,257 @@ def test_list_all_keys_concurrency_is_bounded(mock_client_class, test_region):
 
     assert len(result) == 29 * 100 + 5
     assert peak <= litellm_module.LIST_KEYS_PAGE_CONCURRENCY
+
+
+def _ok_client():
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = {"info": {"spend": 1.0}}
+    mock_response.raise_for_status.return_value = None
+
+    mock_client = AsyncMock()
+    mock_client.get.return_value = mock_response
+    mock_client.post.return_value = mock_response
+    mock_client.__aenter__.return_value = mock_client
+    mock_client.__aexit__.return_value = None
+    return mock_client
+
+
+@patch("httpx.AsyncClient")
+def test_client_pool_reuses_one_client_per_api_url(mock_client_class):
+    """With the pool open, calls to one region share a single client."""
+    from app.services.litellm import litellm_client_pool
+
+    clients = {}
+
+    def _make_client(*args, **kwargs):
+        client = _ok_client()
+        clients[len(clients)] = (client, kwargs)
+        return client
+
+    mock_client_class.side_effect = _make_client
+
+    region_a = LiteLLMService(api_url="https://a.example", api_key="k")
+    region_b = LiteLLMService(api_url="https://b.example", api_key="k")
+
+    async def _run():
+        async with litellm_client_pool():
+            await region_a.get_key_info("sk-1")
+            await region_a.get_key_info("sk-2")
+            await region_a.update_key_duration("sk-1", "0d")
+            await region_b.get_key_info("sk-3")
+
+    asyncio.run(_run())
+
+    # One client per api_url, never entered as a context manager (so never
+    # closed between calls), and closed once when the pool shuts down.
+    assert len(clients) == 2
+    client_a, kwargs_a = clients[0]
+    assert client_a.get.await_count == 2
+    assert client_a.post.await_count == 1
+    client_a.__aenter__.assert_not_called()
+    client_a.aclose.assert_awaited_once()
+    assert isinstance(kwargs_a["limits"], httpx.Limits)
+
+
+@patch("httpx.AsyncClient")
+def test_client_pool_falls_back_outside_pool(mock_client_class):
+    """Without an open pool each call uses a short-lived client, as before."""
+    mock_client = _ok_client()
+    mock_client_class.return_value = mock_client
+
+    service = LiteLLMService(api_url="https://a.example", api_key="k")
+    asyncio.run(service.get_key_info("sk-1"))
+    asyncio.run(service.get_key_info("sk-2"))
+
+    assert mock_client_class.call_count == 2
+    assert mock_client.__aenter__.await_count == 2
+
+
+@patch("httpx.AsyncClient")
+def test_client_pool_ignored_on_foreign_event_loop(mock_client_class):
+    """A pool opened on one loop is never handed to a call on another loop."""
+    from app.services import litellm as litellm_module
+
+    pooled = _ok_client()
+    short_lived = _ok_client()
+    mock_client_class.side_effect = [pooled, short_lived]
+
+    service = LiteLLMService(api_url="https://a.example", api_key="k")
+
+    async def _run():
+        async with litellm_module.litellm_client_pool():
+            await service.get_key_info("sk-1")
+            # Simulates the limit service's propagation thread: its own loop
+            # must not reuse connections owned by this one.
+            await asyncio.to_thread(
+                lambda: asyncio.run(service.get_key_info("sk-2"))
+            )
+
+    asyncio.run(_run())
+
+    assert pooled.get.await_count == 1
+    assert short_lived.get.await_count == 1
+    short_lived.__aenter__.assert_awaited_once()
+    assert litellm_module._client_pool is None
+
+
+def test_client_pool_nested_blocks_share_the_outer_pool():
+    from app.services.litellm import litellm_client_pool
+
+    async def _run():
+        async with litellm_client_pool() as outer:
+            async with litellm_client_pool() as inner:
+                assert inner is outer
+
+    asyncio.run(_run())
+
+
+def _key_update_client(responses):
+    """Client whose /key/update returns ``responses[token]`` (a status or a list)."""
+    calls = []
+
+    async def _post(url, headers=None, json=None):
+        calls.append(json)
+        outcome = responses.get(json["key"], 200)
+        if isinstance(outcome, list):
+            outcome = outcome.pop(0)
+        return httpx.Response(
+            outcome,
+            json={"detail": "nope"} if outcome >= 400 else {},
+            request=httpx.Request("POST", url),
+        )
+
+    mock_client = AsyncMock()
+    mock_client.post.side_effect = _post
+    mock_client.__aenter__.return_value = mock_client
+    mock_client.__aexit__.return_value = None
+    return mock_client, calls
+
+
+@patch("app.services.litellm.KEY_UPDATE_RETRY_BASE_SECONDS", 0)
+@patch("httpx.AsyncClient")
+def test_bulk_update_keys_skips_noops_and_reports_per_key(mock_client_class):
+    """Writes matching the snapshot are skipped; the rest report their own outcome"""
+    from app.services.litellm import (
+        KEY_UPDATE_APPLIED,
+        KEY_UPDATE_FAILED,
+        KEY_UPDATE_SKIPPED,
+        KeyUpdate,
+        hash_litellm_token,
+    )
+
+    mock_client, calls = _key_update_client({"sk-bad": 400, "sk-flaky": [503, 200]})
+    mock_client_class.return_value = mock_client
+    service = LiteLLMService(api_url="https://bulk.example", api_key="k")
+    snapshot = {
+        hash_litellm_token("sk-same"): {"max_budget": 50.0, "blocked": None},
+        hash_litellm_token("sk-drift"): {"max_budget": 20.0},
+    }
+
+    results = asyncio.run(
+        service.bulk_update_keys(
+            [
+                KeyUpdate("sk-same", {"max_budget": 50, "blocked": False}, key_id=1),
+                KeyUpdate("sk-drift", {"max_budget": 50.0}, key_id=2),
+                # duration is not in the snapshot, so it is always sent
+                KeyUpdate("sk-same", {"duration": "0d"}, key_id=3),
+                KeyUpdate("sk-bad", {"max_budget": 1.0}, key_id=4),
+                KeyUpdate("sk-flaky", {"max_budget": 1.0}, key_id=5),
+            ],
+            snapshot=snapshot,
+        )
+    )
+
+    assert [(r.key_id, r.status) for r in results] == [
+        (1, KEY_UPDATE_SKIPPED),
+        (2, KEY_UPDATE_APPLIED),
+        (3, KEY_UPDATE_APPLIED),
+        (4, KEY_UPDATE_FAILED),
+        (5, KEY_UPDATE_APPLIED),
+    ]
+    # A 400 is not retried; the 503 is retried once
+    assert [c["key"] for c in calls].count("sk-bad") == 1
+    assert [c["key"] for c in calls].count("sk-flaky") == 2
+    assert results[3].status_code == 400
+    assert "Status 400" in results[3].error
+    assert {"key": "sk-drift", "max_budget": 50.0} in calls
+
+
+@patch("app.services.litellm.KEY_UPDATE_MAX_RETRIES", 1)
+@patch("app.services.litellm.KEY_UPDATE_RETRY_BASE_SECONDS", 0)
+@patch("httpx.AsyncClient")
+def test_bulk_update_keys_backs_off_on_429(mock_client_class):
+    """Rate limiting shrinks the region's concurrency, remembered for the next call"""
+    from app.services.litellm import (
+        KEY_UPDATE_INITIAL_CONCURRENCY,
+        KeyUpdate,
+        _key_update_limits,
+    )
+
+    mock_client, _ = _key_update_client(
+        {f"sk-{i}": [429, 429] for i in range(KEY_UPDATE_INITIAL_CONCURRENCY)}
+    )
+    mock_client_class.return_value = mock_client
+    service = LiteLLMService(api_url="https://throttled.example", api_key="k")
+
+    results = asyncio.run(
+        service.bulk_update_keys(
+            [
+                KeyUpdate(f"sk-{i}", {"duration": "0d"}, key_id=i)
+                for i in range(KEY_UPDATE_INITIAL_CONCURRENCY)
+            ]
+        )
+    )
+
+    assert all(not r.ok and r.status_code == 429 for r in results)
+    assert _key_update_limits["https://throttled.example"] < (
+        KEY_UPDATE_INITIAL_CONCURRENCY
+    )
+
+
+def test_aimd_concurrency_grows_and_backs_off_once_per_wave():
+    """Successes add about one slot per round; one wave of failures halves once"""
+    from app.services.litellm import AIMDConcurrency
+
+    limiter = AIMDConcurrency(initial=4, minimum=1, maximum=8, latency_factor=3)
+    for _ in range(4):
+        limiter.on_success(started=0.0, latency=0.1)
+    assert 4.9 < limiter.limit < 5.1
+
+    wave_started = -1.0
+    limiter.on_congestion(wave_started)
+    after_first = limiter.limit
+    limiter.on_congestion(wave_started)
+    assert after_first == pytest.approx(limiter.limit)
+    assert after_first < 3
+
+    # A response far slower than the running average counts as congestion
+    limiter = AIMDConcurrency(initial=8, minimum=1, maximum=8, latency_factor=3)
+    for _ in range(10):
+        limiter.on_success(started=0.0, latency=0.1)
+    limiter.on_success(started=float("inf"), latency=1.0)
+    assert limiter.limit == 4
+
+
+def test_aimd_concurrency_bounds_in_flight_requests():
+    """Never more requests in flight than the current limit"""
+    from app.services.litellm import AIMDConcurrency
+
+    limiter = AIMDConcurrency(initial=3, minimum=1, maximum=3)
+    in_flight = 0
+    peak = 0
+
+    async def _request():
+        nonlocal in_flight, peak
+        async with limiter.slot():
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+
+    async def _run():
+        await asyncio.gather(*[_request() for _ in range(20)])
+
+    asyncio.run(_run())
+    assert peak == 3
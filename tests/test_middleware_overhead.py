@@ -0,0 +1,162 @@
+"""Per-request cost of the app's middleware stack.
+
+The middlewares used to be ``BaseHTTPMiddleware`` subclasses, which run every
+downstream call in a separate task and relay the response body through a
+memory stream. They are plain ASGI callables now. Rather than timing the two
+(too noisy for CI), the tests check what that cost came from: no middleware
+of the app is a ``BaseHTTPMiddleware``, and a request through the real stack
+starts no tasks, where the same number of pass-through ``BaseHTTPMiddleware``
+layers starts at least one per layer.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+from starlette.applications import Starlette
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+from app.main import HTTPSRedirectMiddleware, app as main_app
+from app.middleware.audit import AuditLogMiddleware
+from app.middleware.auth import AuthMiddleware
+from app.middleware.caching import CacheControlMiddleware
+from app.middleware.prometheus import PrometheusMiddleware
+
+LAYERS = 5
+
+
+class _PassThroughMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request, call_next):
+        return await call_next(request)
+
+
+async def _health(request):
+    return PlainTextResponse("ok")
+
+
+async def _stream(request):
+    async def chunks():
+        for chunk in (b"a", b"b", b"c"):
+            yield chunk
+
+    return StreamingResponse(chunks())
+
+
+def _endpoint():
+    return Starlette(routes=[Route("/health", _health), Route("/stream", _stream)])
+
+
+def _base_http_stack():
+    app = _endpoint()
+    for _ in range(LAYERS):
+        app = _PassThroughMiddleware(app)
+    return app
+
+
+def _asgi_stack():
+    # Same order as app.main: the last added middleware is the outermost.
+    app = _endpoint()
+    for middleware in (
+        HTTPSRedirectMiddleware,
+        AuthMiddleware,
+        PrometheusMiddleware,
+        AuditLogMiddleware,
+        CacheControlMiddleware,
+    ):
+        app = middleware(app)
+    return app
+
+
+async def _request(app, path="/health"):
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"host", b"testserver"), (b"x-forwarded-proto", b"https")],
+        "client": ("127.0.0.1", 12345),
+        "server": ("testserver", 80),
+    }
+    messages = []
+    requested = False
+    response_complete = asyncio.Event()
+
+    async def receive():
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await response_complete.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+        if message["type"] == "http.response.body" and not message.get(
+            "more_body", False
+        ):
+            response_complete.set()
+
+    await app(scope, receive, send)
+    return scope, messages
+
+
+async def _tasks_started(app):
+    """How many tasks one request through ``app`` starts."""
+    loop = asyncio.get_running_loop()
+    started = 0
+
+    def factory(loop, coro, **kwargs):
+        nonlocal started
+        started += 1
+        return asyncio.Task(coro, loop=loop, **kwargs)
+
+    loop.set_task_factory(factory)
+    try:
+        await _request(app)
+    finally:
+        loop.set_task_factory(None)
+    return started
+
+
+def test_app_middlewares_are_pure_asgi():
+    """Test that no middleware of the app is a BaseHTTPMiddleware"""
+    assert main_app.user_middleware
+    for middleware in main_app.user_middleware:
+        assert not issubclass(middleware.cls, BaseHTTPMiddleware), middleware.cls
+
+
+def test_asgi_middleware_stack_starts_no_tasks_per_request():
+    """Test that the real stack runs a request inline, unlike BaseHTTPMiddleware"""
+
+    async def run():
+        return (
+            await _tasks_started(_base_http_stack()),
+            await _tasks_started(_asgi_stack()),
+        )
+
+    before, after = asyncio.run(run())
+    assert before >= LAYERS
+    assert after == 0
+
+
+def test_asgi_middleware_stack_streams_and_sets_headers():
+    """Test that a streamed body passes through untouched with headers added"""
+    with patch("app.middleware.audit._write_audit_rows") as write_audit_rows:
+        scope, messages = asyncio.run(_request(_asgi_stack(), "/stream"))
+
+    start = messages[0]
+    headers = {key.decode(): value.decode() for key, value in start["headers"]}
+    assert start["status"] == 200
+    assert headers["cache-control"] == "no-store, no-cache, must-revalidate, private"
+    assert headers["x-frame-options"] == "DENY"
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    assert body == b"abc"
+    assert scope["scheme"] == "https"
+    [[audit_row]] = write_audit_rows.call_args.args
+    assert audit_row["details"]["status_code"] == 200
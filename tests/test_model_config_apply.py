@@ -1,4 +1,4 @@
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 from app.db.models import (
     DBModel,
@@ -95,7 +95,12 @@ def test_apply_is_idempotent(mock_svc, client, admin_token, db, test_region):
     assert data["syncs_scheduled"] == 0
 
 
-def test_apply_dry_run_writes_nothing(client, admin_token, db, test_region):
+@patch("app.services.model_sync.LiteLLMService")
+def test_apply_dry_run_writes_nothing(mock_svc, client, admin_token, db, test_region):
+    # The proxy already serves the target model: one update, one create.
+    mock_svc.return_value.get_model_info = AsyncMock(
+        return_value={"data": [{"model_name": "claude-sonnet", "model_info": {"id": "dep-1"}}]}
+    )
     payload = _payload(test_region.name)
     payload["dry_run"] = True
     res = _apply(client, admin_token, payload)
@@ -104,6 +109,19 @@ def test_apply_dry_run_writes_nothing(client, admin_token, db, test_region):
     assert data["dry_run"] is True
     assert data["syncs_scheduled"] == 2
     assert len(data["changes"]) > 0
+    assert data["sync_plan"] == [
+        {
+            "region": test_region.name,
+            "creates": 1,
+            "updates": 1,
+            "deletes": 0,
+            "unchanged": 0,
+            "failed": 0,
+            "error": None,
+        }
+    ]
+    mock_svc.return_value.get_model_info.assert_called_once()
+    mock_svc.return_value.add_model.assert_not_called()
     assert db.query(DBModel).filter_by(model_id="claude-sonnet").count() == 0
     assert db.query(DBModelAccessGroup).filter_by(slug="default-models").count() == 0
 
@@ -14,6 +14,7 @@ from datetime import datetime, UTC, timedelta
 import pytest
 from sqlalchemy.exc import IntegrityError
 from unittest.mock import patch, AsyncMock
+from app.services.litellm import KEY_UPDATE_FAILED, KeyUpdateResult
 from app.api.budgets import (
     sync_pool_team_budgets,
     sync_pool_team_monthly_caps,
@@ -883,8 +884,16 @@ def test_pool_purchase_rolls_back_team_budget_when_key_sync_fails(
             }
         )
         mock_instance.update_team_budget = AsyncMock()
-        mock_instance.update_key_budget = AsyncMock(
-            side_effect=RuntimeError("key sync failed")
+        mock_instance.bulk_update_keys = AsyncMock(
+            side_effect=lambda updates, snapshot=None: [
+                KeyUpdateResult(
+                    u.litellm_token,
+                    u.key_id,
+                    KEY_UPDATE_FAILED,
+                    error="key sync failed",
+                )
+                for u in updates
+            ]
         )
 
         response = client.post(
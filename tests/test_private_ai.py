@@ -3503,6 +3503,102 @@ def test_list_private_ai_keys_show_all(
     assert all(k["owner_id"] == test_user.id for k in response.json())
 
 
+def test_list_private_ai_keys_keyset_pagination(
+    client, test_token, test_region, test_user, db
+):
+    """after/limit page through the caller's keys by id, with the next cursor
+    in X-Next-Cursor and the total in X-Total-Count on request"""
+    for i in range(5):
+        db.add(
+            DBPrivateAIKey(
+                database_name=f"page-db-{i}",
+                database_host="test-host",
+                database_username="test-user",
+                database_password="test-pass",
+                litellm_token=f"page-token-{i}",
+                owner_id=test_user.id,
+                region_id=test_region.id,
+            )
+        )
+    db.commit()
+    headers = {"Authorization": f"Bearer {test_token}"}
+
+    response = client.get(
+        "/private-ai-keys/?limit=2&include_total=true", headers=headers
+    )
+    assert response.status_code == 200
+    first_page = response.json()
+    assert [k["database_name"] for k in first_page] == ["page-db-0", "page-db-1"]
+    assert first_page[0]["region"] == test_region.name
+    assert response.headers["X-Total-Count"] == "5"
+    cursor = response.headers["X-Next-Cursor"]
+    assert cursor == str(first_page[-1]["id"])
+
+    seen = [k["database_name"] for k in first_page]
+    while cursor:
+        response = client.get(
+            f"/private-ai-keys/?limit=2&after={cursor}", headers=headers
+        )
+        assert response.status_code == 200
+        assert "X-Total-Count" not in response.headers
+        seen += [k["database_name"] for k in response.json()]
+        cursor = response.headers.get("X-Next-Cursor")
+    assert seen == [f"page-db-{i}" for i in range(5)]
+
+    # Without limit every key is returned, as before
+    response = client.get("/private-ai-keys/", headers=headers)
+    assert len(response.json()) == 5
+    assert "X-Next-Cursor" not in response.headers
+
+
+def test_list_private_ai_keys_by_region_keyset_pagination(
+    client, admin_token, test_region, test_team, test_team_user, db
+):
+    """The region listing pages the team filter's results the same way"""
+    for i in range(3):
+        db.add(
+            DBPrivateAIKey(
+                database_name=f"region-page-user-db-{i}",
+                database_host="test-host",
+                database_username="test-user",
+                database_password="test-pass",
+                litellm_token=f"region-page-user-token-{i}",
+                owner_id=test_team_user.id,
+                region_id=test_region.id,
+            )
+        )
+    db.add(
+        DBPrivateAIKey(
+            database_name="region-page-team-db",
+            database_host="test-host",
+            database_username="test-user",
+            database_password="test-pass",
+            litellm_token="region-page-team-token",
+            team_id=test_team.id,
+            region_id=test_region.id,
+        )
+    )
+    db.commit()
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    response = client.get(
+        f"/private-ai-keys/region/{test_region.id}"
+        f"?team_id={test_team.id}&limit=3&include_total=true",
+        headers=headers,
+    )
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+    assert response.headers["X-Total-Count"] == "4"
+
+    response = client.get(
+        f"/private-ai-keys/region/{test_region.id}?team_id={test_team.id}"
+        f"&limit=3&after={response.headers['X-Next-Cursor']}",
+        headers=headers,
+    )
+    assert [k["database_name"] for k in response.json()] == ["region-page-team-db"]
+    assert "X-Next-Cursor" not in response.headers
+
+
 # ---------------------------------------------------------------------------
 # Issue #600 — declared `team_id` scope (defence in depth) on key-by-id
 # endpoints. A caller authenticating with a shared system-admin token (the moad
@@ -16,6 +16,9 @@ def _clear_public_models_cache():
     )
     public_api._dedicated_cache["by_team"] = {}
     public_api._dedicated_cache["team_expires"] = {}
+    public_api._rendered_cache.clear()
+    public_api._shared_checked_at.clear()
+    public_api.shared_cache.clear()
 
 
 @pytest.fixture(autouse=True)
@@ -972,6 +975,253 @@ def _models_by_id(response):
     return {m["model_id"]: m for m in response.json()[0]["models"]}
 
 
+@pytest.mark.asyncio
+async def test_public_models_cache_is_built_once_across_processes(db):
+    """A process with a cold cache takes the entry another process built."""
+    _clear_public_models_cache()
+    _make_public_region(db, "shared-region")
+
+    async def fetch_group(service, region_name):
+        return _region_group(region_name)
+
+    with patch.object(
+        public_api, "_fetch_region_model_group", side_effect=fetch_group
+    ) as fetch:
+        built = await public_api._get_public_groups(db)
+        generation = public_api._models_cache["generation"]
+
+        # Another worker: same shared cache, nothing in its own memory.
+        public_api._models_cache["data"] = []
+        public_api._models_cache["expires_at"] = public_api.datetime.min.replace(
+            tzinfo=public_api.UTC
+        )
+        adopted = await public_api._get_public_groups(db)
+
+    assert fetch.call_count == 1
+    assert adopted == built
+    assert public_api._models_cache["generation"] == generation
+
+
+@pytest.mark.asyncio
+async def test_public_models_waits_for_rebuild_lease_holder(db):
+    """While another process holds the lease, its result is awaited, not rebuilt."""
+    _clear_public_models_cache()
+    _make_public_region(db, "leased-region")
+    lease = f"{public_api._shared_key(public_api._PUBLIC_CACHE_KEY)}:lease"
+    public_api.shared_cache.add(lease, b"1", 60)
+    expires_at = public_api.datetime.now(public_api.UTC) + public_api._CACHE_TTL
+
+    async def other_process_finishes():
+        await asyncio.sleep(0.05)
+        public_api._write_shared(
+            public_api._PUBLIC_CACHE_KEY,
+            [_region_group("leased-region")],
+            expires_at,
+            "other-process",
+        )
+
+    with (
+        patch.object(public_api, "_LEASE_POLL_SECONDS", 0.01),
+        patch.object(public_api, "_fetch_region_model_group") as fetch,
+    ):
+        groups, _ = await asyncio.gather(
+            public_api._get_public_groups(db), other_process_finishes()
+        )
+
+    fetch.assert_not_called()
+    assert [g.region for g in groups] == ["leased-region"]
+    assert public_api._models_cache["generation"] == "other-process"
+
+
+@pytest.mark.asyncio
+async def test_dedicated_cache_evicts_least_recently_used_team(db):
+    """Per-team entries are bounded by count, evicting the least recently used."""
+    _clear_public_models_cache()
+    teams = []
+    for i in range(3):
+        team = DBTeam(
+            name=f"LRU Team {i}",
+            admin_email=f"lru{i}@example.com",
+            phone="0000000000",
+            billing_address="1 Test St",
+            is_active=True,
+        )
+        db.add(team)
+        teams.append(team)
+    db.commit()
+    keys = [str(team.id) for team in teams]
+
+    with patch.object(public_api, "_DEDICATED_CACHE_MAX_ENTRIES", 2):
+        await public_api._get_dedicated_entry(db, keys[0])
+        await public_api._get_dedicated_entry(db, keys[1])
+        await public_api._get_dedicated_entry(db, keys[0])
+        await public_api._get_dedicated_entry(db, keys[2])
+
+    assert list(public_api._dedicated_cache["by_team"]) == [keys[0], keys[2]]
+    assert keys[1] not in public_api._dedicated_cache["team_expires"]
+
+
+def test_public_models_etag_answers_if_none_match_with_304(client, db):
+    """The payload is hashed once per rebuild and revalidated without a body."""
+    _clear_public_models_cache()
+    _make_public_region(db, "etag-region")
+
+    with (
+        patch("app.api.public.LiteLLMService") as mock_cls,
+        patch.object(
+            public_api,
+            "_render_region_groups",
+            wraps=public_api._render_region_groups,
+        ) as render,
+    ):
+        mock_cls.return_value.get_model_info = AsyncMock(
+            return_value=_model_info_response()
+        )
+        first = client.get("/public/models", headers={"Accept-Encoding": "identity"})
+        etag = first.headers["ETag"]
+        revalidated = client.get(
+            "/public/models",
+            headers={"Accept-Encoding": "identity", "If-None-Match": etag},
+        )
+        changed = client.get(
+            "/public/models",
+            headers={"Accept-Encoding": "identity", "If-None-Match": '"other"'},
+        )
+
+    assert first.status_code == 200
+    assert etag.startswith('"') and etag.endswith('"')
+    assert "Accept-Encoding" in first.headers["Vary"]
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+    assert revalidated.headers["ETag"] == etag
+    assert revalidated.headers["Cache-Control"] == "public, max-age=3600"
+    assert changed.status_code == 200
+    assert changed.json() == first.json()
+    assert render.call_count == 1
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, content_encoding",
+    [("gzip", "gzip"), ("gzip, br", "br"), ("br;q=0, gzip", "gzip")],
+)
+def test_public_models_serves_precompressed_bodies(
+    client, db, accept_encoding, content_encoding
+):
+    """Compressed bodies are negotiated and carry their own ETag variant."""
+    _clear_public_models_cache()
+    _make_public_region(db, "compressed-region")
+
+    with patch("app.api.public.LiteLLMService") as mock_cls:
+        mock_cls.return_value.get_model_info = AsyncMock(
+            return_value=_model_info_response()
+        )
+        response = client.get(
+            "/public/models", headers={"Accept-Encoding": accept_encoding}
+        )
+        revalidated = client.get(
+            "/public/models",
+            headers={
+                "Accept-Encoding": accept_encoding,
+                "If-None-Match": response.headers["ETag"],
+            },
+        )
+
+    assert response.status_code == 200
+    assert response.headers["Content-Encoding"] == content_encoding
+    assert response.headers["ETag"].endswith(f'-{content_encoding}"')
+    assert response.json()[0]["region"] == "compressed-region"
+    assert revalidated.status_code == 304
+
+
+def _region_group(name, status="ga"):
+    return public_api.PublicRegionModels(region=name, status=status, models=[])
+
+
+@pytest.mark.asyncio
+async def test_public_models_serves_stale_cache_while_refreshing(db):
+    """An expired cache is served as-is while one background rebuild runs."""
+    _clear_public_models_cache()
+    _make_public_region(db, "stale-region")
+    public_api._models_cache["data"] = [_region_group("stale-region", "unavailable")]
+    public_api._models_cache["expires_at"] = public_api.datetime.now(
+        public_api.UTC
+    ) - public_api.timedelta(minutes=1)
+    release = asyncio.Event()
+
+    async def slow_fetch(service, region_name):
+        await release.wait()
+        return _region_group(region_name)
+
+    with patch.object(
+        public_api, "_fetch_region_model_group", side_effect=slow_fetch
+    ) as fetch:
+        first = await public_api._get_public_groups(db)
+        second = await public_api._get_public_groups(db)
+        assert [g.status for g in first] == ["unavailable"]
+        assert [g.status for g in second] == ["unavailable"]
+
+        release.set()
+        await public_api._refresh_tasks[public_api._PUBLIC_CACHE_KEY]
+
+    assert fetch.call_count == 1
+    assert [g.status for g in public_api._models_cache["data"]] == ["ga"]
+    assert (
+        public_api._models_cache["expires_at"]
+        > public_api.datetime.now(public_api.UTC) + public_api._CACHE_REFRESH_AHEAD
+    )
+
+
+@pytest.mark.asyncio
+async def test_public_models_cold_cache_is_built_once_for_concurrent_requests(db):
+    """Concurrent requests on a cold cache share a single region fan-out."""
+    _clear_public_models_cache()
+    _make_public_region(db, "cold-region")
+
+    async def fetch_group(service, region_name):
+        await asyncio.sleep(0)
+        return _region_group(region_name)
+
+    with patch.object(
+        public_api, "_fetch_region_model_group", side_effect=fetch_group
+    ) as fetch:
+        results = await asyncio.gather(
+            *(public_api._get_public_groups(db) for _ in range(5))
+        )
+
+    assert fetch.call_count == 1
+    assert all([g.region for g in groups] == ["cold-region"] for groups in results)
+
+
+@pytest.mark.asyncio
+async def test_refresher_rebuilds_entries_close_to_expiry(db):
+    """The background pass rebuilds expiring entries and skips idle teams."""
+    _clear_public_models_cache()
+    _make_public_region(db, "refresher-region")
+    now = public_api.datetime.now(public_api.UTC)
+    public_api._models_cache["expires_at"] = now + public_api.timedelta(minutes=1)
+    for key in ("1", "2"):
+        public_api._dedicated_cache["by_team"][key] = {
+            "dedicated": [],
+            "public_names": frozenset(),
+        }
+        public_api._dedicated_cache["team_expires"][key] = now
+    public_api._dedicated_cache["last_access"]["1"] = now
+    public_api._dedicated_cache["last_access"]["2"] = now - public_api.timedelta(
+        hours=2
+    )
+
+    async def fetch_group(service, region_name):
+        return _region_group(region_name)
+
+    with patch.object(public_api, "_fetch_region_model_group", side_effect=fetch_group):
+        await public_api.refresh_public_models_caches()
+
+    assert [g.region for g in public_api._models_cache["data"]] == ["refresher-region"]
+    assert public_api._models_cache["expires_at"] > now + public_api._CACHE_TTL
+    assert public_api._dedicated_cache["team_expires"]["1"] > now
+    assert public_api._dedicated_cache["team_expires"]["2"] == now
+
+
 def test_public_models_marks_aliases_and_canonical_models(client, db):
     """Aliases point at the canonical model; the canonical one reports null."""
     _clear_public_models_cache()
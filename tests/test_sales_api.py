@@ -4,9 +4,12 @@ Tests for the consolidated sales API endpoint.
 
 import pytest
 from datetime import datetime, UTC, timedelta
-from unittest.mock import patch, AsyncMock
+from unittest.mock import patch
+from sqlalchemy import update
 from sqlalchemy.orm import Session
+from app.core.config import settings
 from app.db.models import (
+    DBSalesTeamRow,
     DBTeam,
     DBTeamMetrics,
     DBTeamProduct,
@@ -14,7 +17,11 @@ from app.db.models import (
     DBRegion,
     DBUser,
 )
-from app.api.teams import list_teams_for_sales
+from app.services.sales_teams import (
+    refresh_sales_team_rows,
+    refresh_stale_sales_team_rows,
+)
+from tests.conftest import TestingSessionLocal
 
 
 @pytest.fixture
@@ -74,22 +81,6 @@ def test_paid_team(db: Session) -> DBTeam:
     return team
 
 
-@pytest.fixture
-def mock_litellm_response():
-    """Mock LiteLLM API response."""
-    return {
-        "info": {
-            "spend": 25.50,
-            "expires": "2024-12-31T23:59:59Z",
-            "created_at": "2024-01-01T00:00:00Z",
-            "updated_at": "2024-01-02T00:00:00Z",
-            "max_budget": 100.0,
-            "budget_duration": "monthly",
-            "budget_reset_at": "2024-02-01T00:00:00Z",
-        }
-    }
-
-
 @pytest.fixture
 def test_user_owned_ai_key(
     db: Session, test_team_user: DBUser, test_region: DBRegion
@@ -113,29 +104,63 @@ def test_user_owned_ai_key(
     return ai_key
 
 
+def _add_metrics(db: Session, team: DBTeam, total_spend: float) -> DBTeamMetrics:
+    """Spend as monitor_teams records it."""
+    metrics = DBTeamMetrics(
+        team_id=team.id,
+        total_spend=total_spend,
+        last_spend_calculation=datetime.now(UTC),
+        regions=[],
+        last_updated=datetime.now(UTC),
+    )
+    db.add(metrics)
+    db.commit()
+    return metrics
+
+
+def _list_teams(client, admin_token, refresh=True, **params):
+    """GET the sales list, first rebuilding the rows as monitor_teams would."""
+    if refresh:
+        with TestingSessionLocal() as session:
+            refresh_sales_team_rows(session)
+    response = client.get(
+        "/teams/sales/list-teams",
+        headers={"Authorization": f"Bearer {admin_token}"},
+        params=params,
+    )
+    assert response.status_code == 200, response.text
+    return response
+
+
+def _make_team(db: Session, name: str, **fields) -> DBTeam:
+    fields.setdefault("created_at", datetime.now(UTC))
+    team = DBTeam(
+        name=name,
+        admin_email=f"{name.lower().replace(' ', '-')}@example.com",
+        is_active=True,
+        **fields,
+    )
+    db.add(team)
+    db.commit()
+    db.refresh(team)
+    return team
+
+
 def test_list_teams_for_sales_requires_admin(client, test_team):
     """Test that only system admins can access the sales endpoint."""
     response = client.get("/teams/sales/list-teams")
     assert response.status_code == 401  # Unauthorized
 
 
-@patch("app.services.litellm.LiteLLMService.get_key_info", new_callable=AsyncMock)
 def test_list_teams_for_sales_success(
-    mock_get_info,
-    client,
-    admin_token,
-    test_team,
-    test_product,
-    test_region,
-    test_ai_key,
-    mock_litellm_response,
-    db,
+    client, admin_token, test_team, test_product, test_region, test_ai_key, db
 ):
     """Test successful retrieval of sales data."""
     # Create team-product association
     team_product = DBTeamProduct(team_id=test_team.id, product_id=test_product.id)
     db.add(team_product)
     db.commit()
+    metrics = _add_metrics(db, test_team, 25.50)
 
     validation_data = {
         "id": test_team.id,
@@ -152,33 +177,20 @@ def test_list_teams_for_sales_success(
         "last_payment": None,
     }
 
-    # Mock LiteLLM service
-    mock_get_info.return_value = mock_litellm_response
-
-    response = client.get(
-        "/teams/sales/list-teams", headers={"Authorization": f"Bearer {admin_token}"}
-    )
-
-    assert response.status_code == 200
-    data = response.json()
+    data = _list_teams(client, admin_token).json()
     assert "teams" in data
+    assert data["refreshed_at"] is not None
     assert len(data["teams"]) == 1
 
     team_data = data["teams"][0]
     team_data.pop("created_at", None)
+    metrics_updated_at = team_data.pop("metrics_updated_at")
+    assert datetime.fromisoformat(metrics_updated_at) == metrics.last_updated
     assert team_data == validation_data
 
 
-@patch("app.services.litellm.LiteLLMService.get_key_info", new_callable=AsyncMock)
 def test_always_free_team_trial_status(
-    mock_get_info,
-    client,
-    admin_token,
-    test_always_free_team,
-    test_product,
-    test_region,
-    test_ai_key,
-    db,
+    client, admin_token, test_always_free_team, test_product, db
 ):
     """Test that always-free teams show correct trial status."""
     # Create team-product association
@@ -188,357 +200,72 @@ def test_always_free_team_trial_status(
     db.add(team_product)
     db.commit()
 
-    # Mock LiteLLM service
-    mock_get_info.return_value = {"info": {"spend": 0.0}}
-
-    response = client.get(
-        "/teams/sales/list-teams", headers={"Authorization": f"Bearer {admin_token}"}
-    )
-
-    assert response.status_code == 200
-    data = response.json()
-    team_data = data["teams"][0]
+    team_data = _list_teams(client, admin_token).json()["teams"][0]
     assert team_data["trial_status"] == "Always Free"
 
 
-@patch("app.services.litellm.LiteLLMService.get_key_info", new_callable=AsyncMock)
-def test_paid_team_trial_status(
-    mock_get_info,
-    client,
-    admin_token,
-    test_paid_team,
-    test_product,
-    test_region,
-    test_ai_key,
-    db,
-):
+def test_paid_team_trial_status(client, admin_token, test_paid_team, test_product, db):
     """Test that teams with payment history show correct trial status."""
     # Create team-product association
     team_product = DBTeamProduct(team_id=test_paid_team.id, product_id=test_product.id)
     db.add(team_product)
     db.commit()
 
-    # Mock LiteLLM service
-    mock_get_info.return_value = {"info": {"spend": 0.0}}
-
-    response = client.get(
-        "/teams/sales/list-teams", headers={"Authorization": f"Bearer {admin_token}"}
-    )
-
-    assert response.status_code == 200
-    data = response.json()
-    assert "teams" in data
-    team_data = data["teams"][0]
+    team_data = _list_teams(client, admin_token).json()["teams"][0]
     assert team_data["trial_status"] == "Active Product"
 
 
-@patch("app.services.litellm.LiteLLMService.get_key_info", new_callable=AsyncMock)
-def test_team_without_products(
-    mock_get_info, client, admin_token, test_team, test_region, test_ai_key, db
-):
+def test_team_without_products(client, admin_token, test_team, test_ai_key):
     """Test team without any products shows trial status based on creation date."""
-    # Mock LiteLLM service
-    mock_get_info.return_value = {"info": {"spend": 0.0}}
-
-    response = client.get(
-        "/teams/sales/list-teams", headers={"Authorization": f"Bearer {admin_token}"}
-    )
-
-    assert response.status_code == 200
-    data = response.json()
-    assert "teams" in data
-    team_data = data["teams"][0]
+    team_data = _list_teams(client, admin_token).json()["teams"][0]
     # Team without products should show trial status based on creation date
     assert team_data["trial_status"] == "30 days left"
     assert len(team_data["products"]) == 0
 
 
-@patch("app.services.litellm.LiteLLMService.get_key_info", new_callable=AsyncMock)
-def test_team_with_multiple_ai_keys(
-    mock_get_info,
-    client,
-    admin_token,
-    test_team,
-    test_product,
-    test_region,
-    test_ai_key,
-    db,
-):
-    """Test team with multiple AI keys aggregates spend correctly."""
-    # Create second AI key
-    ai_key2 = DBPrivateAIKey(
-        database_name="test-db-2",
-        name="Test Key 2",
-        database_host="test-host",
-        database_username="test-user",
-        database_password="test-pass",
-        litellm_token="test-token-2",
-        litellm_api_url="https://test-litellm.com",
-        owner_id=None,
-        team_id=test_team.id,
-        region_id=test_region.id,
-    )
-    db.add(ai_key2)
-    db.commit()
-
-    # Create team-product association
-    team_product = DBTeamProduct(team_id=test_team.id, product_id=test_product.id)
-    db.add(team_product)
-    db.commit()
-
-    # Mock LiteLLM service with different spend values
-    mock_get_info.side_effect = [{"info": {"spend": 25.50}}, {"info": {"spend": 15.25}}]
-
-    response = client.get(
-        "/teams/sales/list-teams", headers={"Authorization": f"Bearer {admin_token}"}
-    )
-
-    assert response.status_code == 200
-    data = response.json()
-    team_data = data["teams"][0]
-    assert team_data["total_spend"] == 40.75  # 25.50 + 15.25
-
-
-@patch("app.services.litellm.LiteLLMService.get_key_info", new_callable=AsyncMock)
-def test_litellm_service_error_handling(
-    mock_get_info,
-    client,
-    admin_token,
-    test_team,
-    test_product,
-    test_region,
-    test_ai_key,
-    db,
-):
-    """Test that LiteLLM service errors don't break the entire response."""
-    # Create team-product association
-    team_product = DBTeamProduct(team_id=test_team.id, product_id=test_product.id)
-    db.add(team_product)
-    db.commit()
-
-    # Mock LiteLLM service to raise an exception
-    mock_get_info.side_effect = Exception("LiteLLM service error")
-
-    response = client.get(
-        "/teams/sales/list-teams", headers={"Authorization": f"Bearer {admin_token}"}
-    )
-
-    # Should still succeed but with 0 spend
-    assert response.status_code == 200
-    data = response.json()
-    team_data = data["teams"][0]
-    assert team_data["total_spend"] == 0.0
-
-
-@patch("app.services.litellm.LiteLLMService.get_key_info", new_callable=AsyncMock)
-def test_expired_trial_status(
-    mock_get_info, client, admin_token, test_team, test_region, test_ai_key, db
-):
+def test_expired_trial_status(client, admin_token, test_team, db):
     """Test that expired trials show correct status."""
     # Update team to be older than 30 days (no products, so should show expired)
     test_team.created_at = datetime.now(UTC) - timedelta(days=35)
     db.commit()
 
-    # Mock LiteLLM service
-    mock_get_info.return_value = {"info": {"spend": 0.0}}
-
-    response = client.get(
-        "/teams/sales/list-teams", headers={"Authorization": f"Bearer {admin_token}"}
-    )
-
-    assert response.status_code == 200
-    data = response.json()
-    team_data = data["teams"][0]
+    team_data = _list_teams(client, admin_token).json()["teams"][0]
     assert team_data["trial_status"] == "Expired"
 
 
-@patch("app.services.litellm.LiteLLMService.get_key_info", new_callable=AsyncMock)
-def test_list_teams_for_sales_includes_user_owned_keys(
-    mock_get_info,
-    client,
-    admin_token,
-    test_team,
-    test_product,
-    test_region,
-    test_ai_key,
-    test_team_user,
-    test_user_owned_ai_key,
-    mock_litellm_response,
-    db,
-):
-    """Test that sales data includes both team-owned and user-owned AI keys."""
-    # Create team-product association
-    team_product = DBTeamProduct(team_id=test_team.id, product_id=test_product.id)
-    db.add(team_product)
-    db.commit()
-    team_id = test_team.id
-    region_name = test_region.name
-
-    # Mock LiteLLM service to return different spend for each key
-    # Return different spend values for team key vs user key
-    mock_get_info.side_effect = [
-        {"info": {"spend": 25.50}},  # Team key spend
-        {"info": {"spend": 15.25}},  # User key spend
-    ]
-
-    response = client.get(
-        "/teams/sales/list-teams", headers={"Authorization": f"Bearer {admin_token}"}
-    )
-
-    assert response.status_code == 200
-    data = response.json()
-    assert "teams" in data
-    assert len(data["teams"]) == 1
-
-    team_data = data["teams"][0]
-    assert team_data["id"] == team_id
-
-    # Should include both keys in total spend (25.50 + 15.25 = 40.75)
-    assert team_data["total_spend"] == 40.75
-
-    # Should include region from both keys
-    assert len(team_data["regions"]) == 1
-    assert team_data["regions"][0] == region_name
-
-
-@patch("app.services.litellm.LiteLLMService.get_key_info", new_callable=AsyncMock)
-def test_team_with_15_days_remaining(
-    mock_get_info, client, admin_token, test_team, test_region, test_ai_key, db
-):
-    """Test that teams with 15 days remaining show correct format."""
-    # Update team to be 15 days old
-    test_team.created_at = datetime.now(UTC) - timedelta(days=15)
-    db.commit()
-
-    # Mock LiteLLM service
-    mock_get_info.return_value = {"info": {"spend": 0.0}}
-
-    response = client.get(
-        "/teams/sales/list-teams", headers={"Authorization": f"Bearer {admin_token}"}
-    )
-
-    assert response.status_code == 200
-    data = response.json()
-    team_data = data["teams"][0]
-    # Should show exact days remaining, not "In Progress"
-    assert team_data["trial_status"] == "15 days left"
-
-
-@patch("app.services.litellm.LiteLLMService.get_key_info", new_callable=AsyncMock)
-def test_team_with_7_days_remaining(
-    mock_get_info, client, admin_token, test_team, test_region, test_ai_key, db
-):
-    """Test that teams with 7 days remaining show correct format."""
-    # Update team to be 23 days old (7 days remaining)
-    test_team.created_at = datetime.now(UTC) - timedelta(days=23)
+@pytest.mark.parametrize(
+    "age_days, expected", [(15, "15 days left"), (23, "7 days left")]
+)
+def test_team_days_remaining(client, admin_token, test_team, db, age_days, expected):
+    """Test that trial teams show the exact number of days remaining."""
+    test_team.created_at = datetime.now(UTC) - timedelta(days=age_days)
     db.commit()
 
-    # Mock LiteLLM service
-    mock_get_info.return_value = {"info": {"spend": 0.0}}
-
-    response = client.get(
-        "/teams/sales/list-teams", headers={"Authorization": f"Bearer {admin_token}"}
-    )
-
-    assert response.status_code == 200
-    data = response.json()
-    team_data = data["teams"][0]
-    # Should show exact days remaining
-    assert team_data["trial_status"] == "7 days left"
+    team_data = _list_teams(client, admin_token).json()["teams"][0]
+    assert team_data["trial_status"] == expected
 
 
-@patch("app.services.litellm.LiteLLMService.get_key_info", new_callable=AsyncMock)
-def test_team_with_last_payment_days_calculation(
-    mock_get_info, client, admin_token, test_team, test_region, test_ai_key, db
-):
+def test_team_with_last_payment_days_calculation(client, admin_token, test_team, db):
     """Test that teams with last_payment calculate days remaining from payment date."""
     # Set last_payment to 10 days ago (so 20 days remaining from payment)
     test_team.last_payment = datetime.now(UTC) - timedelta(days=10)
     db.commit()
 
-    # Mock LiteLLM service
-    mock_get_info.return_value = {"info": {"spend": 0.0}}
-
-    response = client.get(
-        "/teams/sales/list-teams", headers={"Authorization": f"Bearer {admin_token}"}
-    )
-
-    assert response.status_code == 200
-    data = response.json()
-    team_data = data["teams"][0]
+    team_data = _list_teams(client, admin_token).json()["teams"][0]
     # Should calculate from last_payment date (30 - 10 = 20 days remaining)
     assert team_data["trial_status"] == "20 days left"
 
 
-@patch("app.services.litellm.LiteLLMService.get_key_info", new_callable=AsyncMock)
-def test_list_teams_for_sales_unreachable_endpoints_logging(
-    mock_get_info,
-    client,
-    admin_token,
-    test_team,
-    test_product,
-    test_region,
-    test_ai_key,
-    db,
-):
-    """
-    Given a team with AI keys in a region where LiteLLM endpoint is unreachable
-    When calling list_teams_for_sales
-    Then the function should default spend to 0 and still return successful response
-    """
-    # Create team-product association
-    team_product = DBTeamProduct(team_id=test_team.id, product_id=test_product.id)
-    db.add(team_product)
-
-    # Create a second AI key in the same region to test multiple keys
-    ai_key2 = DBPrivateAIKey(
-        database_name="test-db-2",
-        name="Test Key 2",
-        database_host="test-host",
-        database_username="test-user",
-        database_password="test-pass",
-        litellm_token="test-token-2",
-        litellm_api_url="https://test-litellm.com",
-        owner_id=None,
-        team_id=test_team.id,
-        region_id=test_region.id,
-    )
-    db.add(ai_key2)
-    db.commit()
-
-    # Mock LiteLLM service to raise an exception (simulating unreachable endpoint)
-    mock_get_info.side_effect = Exception("Connection timeout")
-
-    response = client.get(
-        "/teams/sales/list-teams", headers={"Authorization": f"Bearer {admin_token}"}
-    )
-
-    # Should still succeed despite LiteLLM errors
-    assert response.status_code == 200
-    data = response.json()
-    team_data = data["teams"][0]
-
-    # Spend should default to 0 for failed litellm calls
-    assert team_data["total_spend"] == 0.0
-
-
-@patch("app.services.litellm.LiteLLMService.get_key_info", new_callable=AsyncMock)
-def test_list_teams_for_sales_multiple_unreachable_regions(
-    mock_get_info,
+def test_list_teams_for_sales_includes_user_owned_keys(
     client,
     admin_token,
     test_team,
-    test_product,
     test_region,
     test_ai_key,
+    test_user_owned_ai_key,
     db,
 ):
-    """
-    Given a team with AI keys in multiple regions where some endpoints are unreachable
-    When calling list_teams_for_sales
-    Then the function should default spend to 0 and include all regions in response
-    """
-    # Create a second region
+    """Test that regions include both team-owned and user-owned AI keys, once each."""
     region_two = DBRegion(
         name="Test Region 2",
         postgres_host="test-host-2",
@@ -551,147 +278,136 @@ def test_list_teams_for_sales_multiple_unreachable_regions(
     )
     db.add(region_two)
     db.commit()
-
-    # Create team-product association
-    team_product = DBTeamProduct(team_id=test_team.id, product_id=test_product.id)
-    db.add(team_product)
-
-    # Create AI key in second region
-    ai_key2 = DBPrivateAIKey(
-        database_name="test-db-2",
-        name="Test Key 2",
-        database_host="test-host-2",
-        database_username="test-user-2",
-        database_password="test-pass-2",
-        litellm_token="test-token-2",
-        litellm_api_url="https://test-litellm-2.com",
-        owner_id=None,
-        team_id=test_team.id,
-        region_id=region_two.id,
+    test_user_owned_ai_key.region_id = region_two.id
+    db.add(
+        DBPrivateAIKey(
+            name="Second team key",
+            litellm_token="test-token-2",
+            team_id=test_team.id,
+            region_id=test_region.id,
+        )
     )
-    db.add(ai_key2)
     db.commit()
-    region_name = test_region.name
-    region_two_name = region_two.name
 
-    # Mock LiteLLM service to raise different exceptions for different regions
-    mock_get_info.side_effect = [
-        Exception("Connection timeout"),  # First region fails
-        Exception("Service unavailable"),  # Second region fails
-    ]
+    team_data = _list_teams(client, admin_token).json()["teams"][0]
+    assert team_data["regions"] == sorted([test_region.name, region_two.name])
 
-    response = client.get(
-        "/teams/sales/list-teams", headers={"Authorization": f"Bearer {admin_token}"}
-    )
 
-    # Should still succeed despite LiteLLM errors
-    assert response.status_code == 200
-    data = response.json()
-    team_data = data["teams"][0]
+@patch("app.services.litellm.LiteLLMService.get_key_info")
+def test_list_teams_for_sales_never_calls_litellm(
+    mock_get_info, client, admin_token, test_team, test_region, test_ai_key
+):
+    """
+    GIVEN: A team with keys but no metrics from monitor_teams yet
+    WHEN: The sales list is requested
+    THEN: It reports 0 spend and no metrics timestamp instead of calling LiteLLM
+    """
+    mock_get_info.side_effect = AssertionError("LiteLLM must not be called")
+
+    team_data = _list_teams(client, admin_token).json()["teams"][0]
 
-    # Spend should default to 0 for failed litellm calls
     assert team_data["total_spend"] == 0.0
+    assert team_data["metrics_updated_at"] is None
+    assert team_data["regions"] == [test_region.name]
+    mock_get_info.assert_not_called()
 
-    # Should include both regions in the response
-    assert len(team_data["regions"]) == 2
-    assert region_name in team_data["regions"]
-    assert region_two_name in team_data["regions"]
 
+def test_list_teams_for_sales_paginates_and_sorts(client, admin_token, db):
+    """Test server-side sorting and skip/limit with the total in X-Total-Count."""
+    for name, spend in [("Alpha", 10.0), ("Bravo", 30.0), ("Charlie", 20.0)]:
+        _add_metrics(db, _make_team(db, name), spend)
 
-@pytest.mark.asyncio
-@patch("app.api.teams.LiteLLMService")
-async def test_list_teams_for_sales_uses_cached_metrics(
-    mock_litellm_class, db, test_team, test_region
-):
-    """
-    Test that list_teams_for_sales API uses cached metrics instead of making API calls.
+    response = _list_teams(
+        client, admin_token, sort_by="total_spend", sort_order="desc", limit=2
+    )
+    assert response.headers["X-Total-Count"] == "3"
+    assert [t["name"] for t in response.json()["teams"]] == ["Bravo", "Charlie"]
 
-    GIVEN: A team with cached metrics in DBTeamMetrics
-    WHEN: list_teams_for_sales API is called
-    THEN: It returns data from cache without making LiteLLM API calls
-    """
-    # Arrange
-    # Create cached metrics
-    cached_metrics = DBTeamMetrics(
-        team_id=test_team.id,
-        total_spend=200.50,
-        last_spend_calculation=datetime.now(UTC),
-        regions=[test_region.name],
-        last_updated=datetime.now(UTC),
+    response = _list_teams(
+        client, admin_token, sort_by="total_spend", sort_order="desc", skip=2, limit=2
     )
-    db.add(cached_metrics)
-    db.commit()
+    assert [t["name"] for t in response.json()["teams"]] == ["Alpha"]
 
-    # Create a test key (but we shouldn't need to call LiteLLM for it)
-    test_key = DBPrivateAIKey(
-        name="test-key",
-        team_id=test_team.id,
-        region_id=test_region.id,
-        litellm_token="test-token-123",
-        created_at=datetime.now(UTC),
+    response = _list_teams(client, admin_token, skip=5, limit=2)
+    assert response.json()["teams"] == []
+    assert response.headers["X-Total-Count"] == "3"
+
+
+def test_list_teams_for_sales_filters(
+    client, admin_token, test_product, test_region, db
+):
+    """Test filtering by name, trial status and region."""
+    product_team = _make_team(db, "Product Team")
+    db.add(DBTeamProduct(team_id=product_team.id, product_id=test_product.id))
+    expired_team = _make_team(
+        db, "Expired Team", created_at=datetime.now(UTC) - timedelta(days=40)
+    )
+    _make_team(db, "Free Team", is_always_free=True)
+    db.add(
+        DBPrivateAIKey(
+            name="Key",
+            litellm_token="token",
+            team_id=expired_team.id,
+            region_id=test_region.id,
+        )
     )
-    db.add(test_key)
     db.commit()
 
-    # Ensure LiteLLM service is never called
-    mock_litellm_class.side_effect = AssertionError(
-        "LiteLLM service should not be called when using cached metrics"
-    )
+    def names(**params):
+        return [
+            t["name"]
+            for t in _list_teams(client, admin_token, **params).json()["teams"]
+        ]
 
-    # Act
-    response = await list_teams_for_sales(db)
+    assert names(name="product") == ["Product Team"]
+    assert names(trial_status="active_product") == ["Product Team"]
+    assert names(trial_status="expired") == ["Expired Team"]
+    assert names(trial_status="always_free") == ["Free Team"]
+    assert names(region=test_region.name) == ["Expired Team"]
 
-    # Assert
-    assert len(response.teams) == 1
-    team_data = response.teams[0]
-    assert team_data.id == test_team.id
-    assert team_data.total_spend == 200.50
-    assert test_region.name in team_data.regions
 
+def test_list_teams_for_sales_does_not_build_rows(client, admin_token, test_team):
+    """Test that the list is read-only: without a refresh there are no rows."""
+    data = _list_teams(client, admin_token, refresh=False).json()
+    assert data["teams"] == []
+    assert data["refreshed_at"] is None
 
-@pytest.mark.asyncio
-@patch("app.api.teams.LiteLLMService")
-async def test_list_teams_for_sales_fallback_to_api_calls(
-    mock_litellm_class, db, test_team, test_region
-):
-    """
-    Test that list_teams_for_sales falls back to API calls when no cached metrics exist.
 
-    GIVEN: A team without cached metrics
-    WHEN: list_teams_for_sales API is called
-    THEN: It makes LiteLLM API calls and returns the data
-    """
-    # Arrange
-    # Create a test key
-    test_key = DBPrivateAIKey(
-        name="test-key",
-        team_id=test_team.id,
-        region_id=test_region.id,
-        litellm_token="test-token-123",
-        created_at=datetime.now(UTC),
-    )
-    db.add(test_key)
-    db.commit()
+def test_sales_rows_are_rebuilt_once_stale(client, admin_token, test_team, db):
+    """Test that the cron refresh rebuilds rows only once they pass the max age."""
+    assert refresh_stale_sales_team_rows(db) is True
+    _add_metrics(db, test_team, 12.5)
 
-    # Mock LiteLLM service responses
-    mock_litellm_service = AsyncMock()
-    mock_litellm_class.return_value = mock_litellm_service
-    mock_litellm_service.get_key_info.return_value = {
-        "info": {"spend": 300.25, "max_budget": 500.0, "key_alias": "test-key"}
-    }
+    # Still within SALES_TEAM_ROWS_MAX_AGE_SECONDS: the precomputed row is served
+    assert refresh_stale_sales_team_rows(db) is False
+    data = _list_teams(client, admin_token, refresh=False).json()
+    assert data["teams"][0]["total_spend"] == 0.0
 
-    # Act
-    response = await list_teams_for_sales(db)
-    updated_metrics = (
-        db.query(DBTeamMetrics).filter(DBTeamMetrics.team_id == test_team.id).first()
+    stale = datetime.now(UTC) - timedelta(
+        seconds=settings.SALES_TEAM_ROWS_MAX_AGE_SECONDS + 1
     )
+    db.execute(update(DBSalesTeamRow).values(refreshed_at=stale))
+    db.commit()
+    # Reading stale rows does not rebuild them; the next cron run does.
+    data = _list_teams(client, admin_token, refresh=False).json()
+    assert data["teams"][0]["total_spend"] == 0.0
+    assert refresh_stale_sales_team_rows(db) is True
+    data = _list_teams(client, admin_token, refresh=False).json()
+    assert data["teams"][0]["total_spend"] == 12.5
+
+
+def test_refresh_sales_team_rows_tracks_team_changes(db, test_team):
+    """Test that a refresh updates changed teams and deleted teams drop out."""
+    other = _make_team(db, "Other Team")
+    refresh_sales_team_rows(db)
+    assert db.query(DBSalesTeamRow).count() == 2
+
+    test_team.name = "Renamed Team"
+    db.delete(other)
+    db.commit()
+    refresh_sales_team_rows(db)
 
-    # Assert
-    assert len(response.teams) == 1
-    team_data = response.teams[0]
-    assert team_data.id == test_team.id
-    assert team_data.total_spend == 300.25
-    assert test_region.name in team_data.regions
-    assert updated_metrics is not None
-    assert updated_metrics.total_spend == 300.25
-    assert test_region.name in updated_metrics.regions
+    [row] = db.query(DBSalesTeamRow).all()
+    db.refresh(row)
+    assert row.team_id == test_team.id
+    assert row.name == "Renamed Team"
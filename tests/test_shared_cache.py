@@ -0,0 +1,161 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app.core.shared_cache import (
+    FileCacheBackend,
+    InProcessCacheBackend,
+    RedisCacheBackend,
+    create_cache_backend,
+)
+
+
+class FakeRedis:
+    """The slice of the redis-py client RedisCacheBackend uses."""
+
+    def __init__(self):
+        self.values: dict[str, tuple[float, bytes]] = {}
+
+    def _live(self, key):
+        entry = self.values.get(key)
+        if entry is not None and entry[0] <= time.monotonic():
+            del self.values[key]
+            return None
+        return entry
+
+    def get(self, key):
+        entry = self._live(key)
+        return entry[1] if entry else None
+
+    def set(self, key, value, px=None, nx=False):
+        if nx and self._live(key) is not None:
+            return None
+        self.values[key] = (time.monotonic() + px / 1000, value)
+        return True
+
+    def delete(self, key):
+        self.values.pop(key, None)
+
+
+@pytest.fixture(params=["memory", "file", "redis"])
+def backend(request, tmp_path):
+    if request.param == "memory":
+        return InProcessCacheBackend(max_entries=3)
+    if request.param == "file":
+        return FileCacheBackend(directory=str(tmp_path), max_entries=3)
+    return RedisCacheBackend(FakeRedis())
+
+
+def test_backend_set_get_delete(backend):
+    assert backend.get("a") is None
+    backend.set("a", b"one", 60)
+    assert backend.get("a") == b"one"
+    backend.set("a", b"two", 60)
+    assert backend.get("a") == b"two"
+    backend.delete("a")
+    assert backend.get("a") is None
+
+
+def test_backend_entries_expire(backend):
+    backend.set("a", b"one", 0.05)
+    time.sleep(0.1)
+    assert backend.get("a") is None
+
+
+def test_backend_add_is_set_if_absent(backend):
+    assert backend.add("lease", b"1", 60) is True
+    assert backend.add("lease", b"2", 60) is False
+    assert backend.get("lease") == b"1"
+    backend.delete("lease")
+    assert backend.add("lease", b"3", 60) is True
+
+
+def test_backend_add_replaces_expired_key(backend):
+    backend.set("lease", b"1", 0.05)
+    time.sleep(0.1)
+    assert backend.add("lease", b"2", 60) is True
+    assert backend.get("lease") == b"2"
+
+
+@pytest.mark.parametrize("kind", ["memory", "file"])
+def test_local_backends_evict_least_recently_used(kind, tmp_path):
+    if kind == "memory":
+        backend = InProcessCacheBackend(max_entries=2)
+    else:
+        backend = FileCacheBackend(directory=str(tmp_path), max_entries=2)
+
+    backend.set("a", b"1", 60)
+    time.sleep(0.01)
+    backend.set("b", b"2", 60)
+    time.sleep(0.01)
+    assert backend.get("a") == b"1"  # "b" is now the least recently used
+    time.sleep(0.01)
+    backend.set("c", b"3", 60)
+
+    assert backend.get("a") == b"1"
+    assert backend.get("b") is None
+    assert backend.get("c") == b"3"
+
+
+def test_file_backend_is_shared_between_instances(tmp_path):
+    writer = FileCacheBackend(directory=str(tmp_path))
+    reader = FileCacheBackend(directory=str(tmp_path))
+
+    writer.set("public-models:__public__", b"payload", 60)
+    assert reader.get("public-models:__public__") == b"payload"
+    assert writer.add("lease", b"1", 60) is True
+    assert reader.add("lease", b"1", 60) is False
+
+
+def test_file_backend_add_has_one_winner_under_contention(tmp_path):
+    backends = [FileCacheBackend(directory=str(tmp_path)) for _ in range(8)]
+    barrier = threading.Barrier(len(backends))
+    results = []
+
+    def take(backend):
+        barrier.wait()
+        results.append(backend.add("lease", b"1", 60))
+
+    threads = [threading.Thread(target=take, args=(b,)) for b in backends]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(results) == [False] * 7 + [True]
+    assert not [p for p in tmp_path.iterdir() if not p.name.endswith(".cache")]
+
+
+def test_in_process_backend_add_has_one_winner_under_contention():
+    backend = InProcessCacheBackend()
+    live = backend._live
+
+    def slow_live(key):
+        # Widen the window between the "is it taken?" check and the insert.
+        value = live(key)
+        time.sleep(0.01)
+        return value
+
+    barrier = threading.Barrier(8)
+    results = []
+
+    def take():
+        barrier.wait()
+        results.append(backend.add("lease", b"1", 60))
+
+    with patch.object(backend, "_live", side_effect=slow_live):
+        threads = [threading.Thread(target=take) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert sorted(results) == [False] * 7 + [True]
+
+
+def test_create_cache_backend_rejects_unknown_kind():
+    assert isinstance(create_cache_backend("memory"), InProcessCacheBackend)
+    with pytest.raises(ValueError):
+        create_cache_backend("memcached")
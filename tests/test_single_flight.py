@@ -0,0 +1,156 @@
+import asyncio
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.single_flight import SingleFlight
+from app.services import litellm as litellm_module
+from app.services.litellm import LiteLLMService, litellm_reads
+
+
+class Upstream:
+    """Counts calls and returns a fresh payload per call."""
+
+    def __init__(self, delay: float = 0.01):
+        self.calls = 0
+        self.delay = delay
+
+    async def fetch(self):
+        self.calls += 1
+        call = self.calls
+        await asyncio.sleep(self.delay)
+        return {"call": call, "keys": []}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_reads_share_one_call():
+    """Test that identical concurrent reads collapse into one fetch and each
+    caller gets its own copy"""
+    flight = SingleFlight("test")
+    upstream = Upstream()
+
+    results = await asyncio.gather(
+        *[
+            flight.run("region", "team-1", upstream.fetch, ttl_seconds=0)
+            for _ in range(5)
+        ]
+    )
+
+    assert upstream.calls == 1
+    assert all(result == {"call": 1, "keys": []} for result in results)
+    results[0]["keys"].append("mutated")
+    assert results[1]["keys"] == []
+
+
+@pytest.mark.asyncio
+async def test_memo_ttl_and_invalidation():
+    """Test that a memoized result is reused within its TTL, not without one,
+    and not after its scope is invalidated"""
+    flight = SingleFlight("test")
+    upstream = Upstream(delay=0)
+
+    async def call(scope, key, ttl_seconds=60):
+        result = await flight.run(scope, key, upstream.fetch, ttl_seconds=ttl_seconds)
+        return result["call"]
+
+    assert await call("region", "team-1") == 1
+    assert await call("region", "team-1") == 1
+    assert await call("region", "team-2") == 2
+
+    flight.invalidate("region")
+    assert await call("region", "team-1") == 3
+
+    assert await call("other", "team-1", ttl_seconds=0) == 4
+    assert await call("other", "team-1", ttl_seconds=0) == 5
+
+
+@pytest.mark.asyncio
+async def test_invalidation_during_fetch_discards_its_result():
+    """Test that a fetch running when its scope is invalidated is neither
+    joined nor memoized"""
+    flight = SingleFlight("test")
+    upstream = Upstream(delay=0.05)
+
+    first = asyncio.create_task(
+        flight.run("region", "k", upstream.fetch, ttl_seconds=60)
+    )
+    await asyncio.sleep(0.01)
+    flight.invalidate("region")
+    second = await flight.run("region", "k", upstream.fetch, ttl_seconds=60)
+
+    assert (await first)["call"] == 1
+    assert second["call"] == 2
+    third = await flight.run("region", "k", upstream.fetch, ttl_seconds=60)
+    assert third["call"] == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_but_not_memoized():
+    """Test that waiters all see the failure and the next call retries"""
+    flight = SingleFlight("test")
+    calls = 0
+
+    async def failing():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        raise RuntimeError("upstream down")
+
+    results = await asyncio.gather(
+        *[flight.run("region", "k", failing, ttl_seconds=60) for _ in range(3)],
+        return_exceptions=True,
+    )
+    assert calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    with pytest.raises(RuntimeError):
+        await flight.run("region", "k", failing, ttl_seconds=60)
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_litellm_reads_coalesce_and_writes_invalidate(monkeypatch):
+    """Test that LiteLLMService reads are shared per api_url and that a write
+    through the service drops the region's memoized reads"""
+    litellm_reads.clear()
+    monkeypatch.setattr(
+        litellm_module.settings, "LITELLM_READ_TTL_TEAM_INFO_SECONDS", 60
+    )
+    calls_by_url: dict[str, int] = {}
+
+    def response(payload):
+        resp = MagicMock()
+        resp.json.return_value = payload
+        return resp
+
+    @asynccontextmanager
+    async def fake_http_client(api_url):
+        async def get(url, **kwargs):
+            calls_by_url[api_url] = calls_by_url.get(api_url, 0) + 1
+            await asyncio.sleep(0.01)
+            return response({"call": calls_by_url[api_url]})
+
+        client = MagicMock()
+        client.get = AsyncMock(side_effect=get)
+        client.post = AsyncMock(return_value=response({}))
+        yield client
+
+    monkeypatch.setattr(litellm_module, "litellm_http_client", fake_http_client)
+    region_a = LiteLLMService(api_url="http://a.local", api_key="k")
+    region_b = LiteLLMService(api_url="http://b.local", api_key="k")
+
+    results = await asyncio.gather(*[region_a.get_team_info("t1") for _ in range(5)])
+    assert [r["call"] for r in results] == [1] * 5
+    assert (await region_a.get_team_info("t1"))["call"] == 1
+    assert (await region_b.get_team_info("t1"))["call"] == 1
+    assert calls_by_url == {"http://a.local": 1, "http://b.local": 1}
+
+    await region_a.update_team_models("t1", ["gpt-4o"])
+    assert (await region_a.get_team_info("t1"))["call"] == 2
+    assert (await region_b.get_team_info("t1"))["call"] == 1
+
+    # A read that decides a write skips the memo, and does not replace it.
+    assert (await region_a.get_team_info("t1", fresh=True))["call"] == 3
+    assert (await region_a.get_team_info("t1"))["call"] == 2
+    litellm_reads.clear()
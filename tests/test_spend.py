@@ -3,6 +3,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 from app.core.roles import UserRole
 from datetime import UTC, datetime, timedelta
+from sqlalchemy import event
 from sqlalchemy.exc import IntegrityError
 
 from app.api.spend import _lock_region_or_404
@@ -19,6 +20,7 @@ from app.db.models import (
     DBTeamRegion,
     DBUser,
 )
+from app.services.litellm import hash_litellm_token
 
 
 @patch("app.api.spend.LiteLLMService.get_key_info", new_callable=AsyncMock)
@@ -886,6 +888,75 @@ def test_get_team_spend_uses_configured_caps_for_no_purchase_pool_team(
     assert data["keys"][0]["max_budget"] == 11.0
 
 
+@patch("app.api.spend.LiteLLMService.get_team_info", new_callable=AsyncMock)
+def test_get_team_spend_maps_litellm_keys_in_one_query(
+    mock_get_team_info, client, admin_token, test_team, test_team_user, test_region, db
+):
+    """Every LiteLLM key maps to its DB key with a single key lookup query."""
+    team_key = DBPrivateAIKey(
+        name="shared-name",
+        litellm_token="sk-team-key",
+        region_id=test_region.id,
+        team_id=test_team.id,
+    )
+    user_key = DBPrivateAIKey(
+        name="shared-name",
+        litellm_token="sk-user-key",
+        region_id=test_region.id,
+        owner_id=test_team_user.id,
+    )
+    token_only_key = DBPrivateAIKey(
+        name="renamed-locally",
+        litellm_token="sk-token-only",
+        region_id=test_region.id,
+        team_id=test_team.id,
+    )
+    db.add_all([team_key, user_key, token_only_key])
+    db.commit()
+
+    mock_get_team_info.return_value = {
+        "team_info": {"spend": 3.0, "max_budget": 10.0},
+        "keys": [
+            {
+                "metadata": {"amazeeai_private_ai_key_name": "shared-name"},
+                "user_id": str(test_team_user.id),
+                "spend": 1.0,
+            },
+            {
+                "metadata": {"amazeeai_private_ai_key_name": "shared-name"},
+                "user_id": None,
+                "spend": 1.0,
+            },
+            {
+                "token": hash_litellm_token("sk-token-only"),
+                "metadata": {"amazeeai_private_ai_key_name": "name-in-litellm"},
+                "spend": 1.0,
+            },
+        ],
+    }
+
+    engine = db.get_bind()
+    key_queries = []
+
+    def _count_key_queries(conn, cursor, statement, *args):
+        if statement.lstrip().startswith("SELECT") and "FROM ai_tokens" in statement:
+            key_queries.append(statement)
+
+    event.listen(engine, "before_cursor_execute", _count_key_queries)
+    try:
+        response = client.get(
+            f"/spend/{test_region.id}/team/{test_team.id}",
+            headers={"Authorization": f"Bearer {admin_token}"},
+        )
+    finally:
+        event.remove(engine, "before_cursor_execute", _count_key_queries)
+
+    assert response.status_code == 200
+    key_ids = [item["key_id"] for item in response.json()["keys"]]
+    assert key_ids == [user_key.id, team_key.id, token_only_key.id]
+    assert len(key_queries) == 1
+
+
 @patch("app.api.spend.LiteLLMService.get_user_info", new_callable=AsyncMock)
 def test_get_user_spend_exposes_only_db_key_cap_for_no_purchase_pool_team(
     mock_get_user_info, client, admin_token, test_team, test_region, db
@@ -1039,7 +1110,7 @@ def test_update_team_budget_rejects_manual_cap_for_periodic_team(
     mock_update_team_budget.assert_not_awaited()
 
 
-@patch("app.api.spend.invalidate_user_spend_cache")
+@patch("app.api.spend.invalidate_user_spend_cache", new_callable=AsyncMock)
 @patch("app.api.spend.LiteLLMService.get_team_info", new_callable=AsyncMock)
 @patch("app.api.spend.LiteLLMService.update_team_budget", new_callable=AsyncMock)
 def test_update_team_budget_invalidates_user_spend_cache_for_team_members(
@@ -1672,7 +1743,7 @@ def test_update_key_budget_endpoint_forces_monthly_duration(
     assert cap.budget_duration == "1mo"
 
 
-@patch("app.api.spend.invalidate_user_spend_cache")
+@patch("app.api.spend.invalidate_user_spend_cache", new_callable=AsyncMock)
 @patch("app.api.spend.LiteLLMService.get_key_info", new_callable=AsyncMock)
 @patch("app.api.spend.LiteLLMService.update_key_budget", new_callable=AsyncMock)
 def test_update_key_budget_invalidates_user_spend_cache_for_team_keys(
@@ -1,3 +1,4 @@
+import asyncio
 from app.db.models import (
     DBBudgetAlertState,
     DBRegion,
@@ -12,6 +13,7 @@ from app.db.models import (
     DBUserAdminRegion,
     DBUserSpendCache,
 )
+from app.api.users import invalidate_user_spend_cache
 from app.core.limit_service import LimitService, DEFAULT_KEYS_PER_USER
 from app.schemas.limits import ResourceType, LimitSource, OwnerType, LimitType, UnitType
 from app.core.config import settings
@@ -545,6 +547,100 @@ def test_get_user_spend_success_with_cache_and_normalization(
     assert cache_row is not None
 
 
+@patch("app.api.users.LiteLLMService.get_team_info", new_callable=AsyncMock)
+def test_get_user_spend_shares_team_region_snapshot_between_members(
+    mock_get_team_info, client, admin_token, db
+):
+    """Test that members of one team are served from one /team/info fetch per
+    region, and that invalidating a member's spend cache refetches it"""
+    team = DBTeam(
+        name="Shared Spend Team",
+        admin_email="shared-spend@example.com",
+        is_active=True,
+        created_at=datetime.now(UTC),
+        budget_type="periodic",
+    )
+    region = DBRegion(
+        name="public-region",
+        postgres_host="host",
+        postgres_port=5432,
+        postgres_admin_user="postgres",
+        postgres_admin_password="postgres",
+        litellm_api_url="http://litellm.local",
+        litellm_api_key="k",
+        is_active=True,
+        is_dedicated=False,
+    )
+    alice = DBUser(
+        email="alice@example.com",
+        hashed_password=get_password_hash("pw"),
+        is_active=True,
+        is_admin=False,
+        team=team,
+    )
+    bob = DBUser(
+        email="bob@example.com",
+        hashed_password=get_password_hash("pw"),
+        is_active=True,
+        is_admin=False,
+        team=team,
+    )
+    db.add_all([team, region, alice, bob])
+    db.commit()
+    db.add(DBTeamRegion(team_id=team.id, region_id=region.id))
+    db.add(
+        DBPrivateAIKey(
+            database_name="db1",
+            database_username="u1",
+            team_id=team.id,
+            region_id=region.id,
+        )
+    )
+    db.commit()
+
+    mock_get_team_info.return_value = {
+        "keys": [
+            {"metadata": {"amazeeai_user_id": str(alice.id)}, "spend": 3.0},
+            {"metadata": {"amazeeai_user_id": str(bob.id)}, "spend": 4.0},
+        ]
+    }
+    headers = {"Authorization": f"Bearer {admin_token}"}
+
+    alice_response = client.get("/users/spend?email=alice@example.com", headers=headers)
+    bob_response = client.get("/users/spend?email=bob@example.com", headers=headers)
+    assert alice_response.json()["total_spend"] == 3.0
+    assert bob_response.json()["total_spend"] == 4.0
+    assert mock_get_team_info.await_count == 1
+
+    mock_get_team_info.return_value = {
+        "keys": [
+            {"metadata": {"amazeeai_user_id": str(alice.id)}, "spend": 5.0},
+            {"metadata": {"amazeeai_user_id": str(bob.id)}, "spend": 6.0},
+        ]
+    }
+    asyncio.run(invalidate_user_spend_cache(db, "alice@example.com"))
+    db.commit()
+
+    alice_response = client.get("/users/spend?email=alice@example.com", headers=headers)
+    assert alice_response.json()["total_spend"] == 5.0
+    assert mock_get_team_info.await_count == 2
+
+
+def test_team_spend_fetch_is_forgotten_once_done(db):
+    """Test that a finished fetch is not kept in the in-flight map"""
+    from app.services import team_spend_snapshots
+
+    fetch_team_info = AsyncMock(return_value={"keys": [{"spend": 1.0}]})
+    keys = asyncio.run(
+        team_spend_snapshots.get_team_region_keys(1, 1, fetch_team_info)
+    )
+
+    assert keys == [
+        {"spend": 1.0, "amazeeai_user_id": None, "service_account_id": None}
+    ]
+    assert team_spend_snapshots._fetches == {}
+
+
 @patch("app.api.users.LiteLLMService.get_team_info", new_callable=AsyncMock)
 def test_get_user_spend_skips_regions_without_user_keys(
     mock_get_team_info, client, admin_token, db
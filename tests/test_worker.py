@@ -12,10 +12,13 @@ from app.db.models import (
     DBPoolPurchase,
     DBPeriodicBudgetLedgerEntry,
     DBSpendCap,
+    DBRegionKeySnapshot,
+    DBRegionKeySnapshotState,
 )
 from app.schemas.models import BudgetType
 from datetime import datetime, UTC, timedelta
 from app.core.worker import (
+    DesiredKeyState,
     apply_product_for_team,
     monitor_teams,
     team_freshness_days,
@@ -25,6 +28,9 @@ from app.core.worker import (
     active_team_labels,
     reconcile_team_keys,
     RegionKeyStateCache,
+    MONITOR_TEAMS_CONCURRENCY,
+    REGION_KEY_DELTA_OVERLAP_SECONDS,
+    REGION_KEY_FULL_SWEEP_HOURS,
     _resolve_key_state,
     _sync_periodic_ledger_for_invoice,
     _get_snapshot_remaining_cents,
@@ -42,8 +48,33 @@ from app.schemas.limits import (
     LimitType,
     LimitedResource,
 )
+from app.services.litellm import (
+    KEY_UPDATE_APPLIED,
+    KEY_UPDATE_FAILED,
+    KeyUpdate,
+    KeyUpdateResult,
+)
 from unittest.mock import ANY, AsyncMock, patch, Mock, call
 from types import SimpleNamespace
+from tests.conftest import TestingSessionLocal
+
+
+def _record_key_updates(mock_instance):
+    """Make ``bulk_update_keys`` on a mocked service apply every update.
+
+    Returns the list the updates are recorded in, as (token, fields) pairs.
+    """
+    applied = []
+
+    async def _bulk_update_keys(updates, snapshot=None):
+        applied.extend((update.litellm_token, update.fields) for update in updates)
+        return [
+            KeyUpdateResult(update.litellm_token, update.key_id, KEY_UPDATE_APPLIED)
+            for update in updates
+        ]
+
+    mock_instance.bulk_update_keys = AsyncMock(side_effect=_bulk_update_keys)
+    return applied
 
 
 def test_parse_client_reference_ids():
@@ -770,13 +801,79 @@ async def test_monitor_teams_basic_metrics(
     )
 
     # Verify limit service was called for both teams
-    # Called once at start of monitor_teams, then once per team in set_team_and_user_limits, then once per team in reconcile_team_keys
+    # Called once per monitor_teams worker session, then once per team in set_team_and_user_limits, then once per team in reconcile_team_keys
+    workers = min(MONITOR_TEAMS_CONCURRENCY, 2)
     assert (
-        mock_limit_service.call_count == 5
-    )  # 1 at start + 2 teams (set_team_and_user_limits) + 2 teams (reconcile_team_keys)
+        mock_limit_service.call_count == workers + 4
+    )  # 1 per worker + 2 teams (set_team_and_user_limits) + 2 teams (reconcile_team_keys)
     mock_limit_instance.set_team_limits.assert_called()
 
 
+@pytest.mark.asyncio
+@patch("app.core.worker.SESService")
+@patch("app.core.worker._monitor_team", new_callable=AsyncMock)
+async def test_monitor_teams_shard_only_processes_its_teams(
+    mock_monitor_team, mock_ses, db, test_team
+):
+    """A shard processes exactly the teams with team.id % shard_count == shard_index."""
+    teams = [test_team]
+    for i in range(3):
+        team = DBTeam(name=f"Shard Team {i}", admin_email=f"shard{i}@example.com")
+        db.add(team)
+        teams.append(team)
+    db.commit()
+
+    team_ids = [t.id for t in teams]
+    processed = []
+    mock_monitor_team.side_effect = lambda worker_db, team, *args: processed.append(
+        (shard_index, team.id)
+    )
+
+    for shard_index in range(2):
+        await monitor_teams(db, shard_index=shard_index, shard_count=2)
+
+    assert sorted(processed) == sorted((tid % 2, tid) for tid in team_ids)
+
+
+@pytest.mark.asyncio
+async def test_monitor_teams_rejects_invalid_shard(db):
+    with pytest.raises(ValueError):
+        await monitor_teams(db, shard_index=2, shard_count=2)
+
+
+@pytest.mark.asyncio
+@patch("app.core.worker.MONITOR_TEAMS_CONCURRENCY", 3)
+@patch("app.core.worker.SESService")
+@patch("app.core.worker._monitor_team", new_callable=AsyncMock)
+async def test_monitor_teams_concurrent_failure_is_isolated(
+    mock_monitor_team, mock_ses, db, test_team
+):
+    """Concurrent workers commit per team; a failing team only rolls back itself."""
+    failing = DBTeam(name="Failing Team", admin_email="failing@example.com")
+    other = DBTeam(name="Other Team", admin_email="other@example.com")
+    db.add_all([failing, other])
+    db.commit()
+    marker = datetime(2026, 8, 1, tzinfo=UTC)
+
+    async def _process(worker_db, team, *args):
+        # Each team runs on its worker's own session, not the caller's
+        assert worker_db is not db
+        team.last_monitored = marker
+        await asyncio.sleep(0)
+        if team.name == "Failing Team":
+            raise RuntimeError("stripe down")
+
+    mock_monitor_team.side_effect = _process
+
+    await monitor_teams(db)
+
+    assert mock_monitor_team.call_count == 3
+    db.expire_all()
+    assert db.get(DBTeam, test_team.id).last_monitored == marker
+    assert db.get(DBTeam, other.id).last_monitored == marker
+    assert db.get(DBTeam, failing.id).last_monitored is None
+
+
 @pytest.mark.parametrize(
     "team_age,expected_days_remaining,template_name",
     [
@@ -885,7 +982,7 @@ async def test_monitor_teams_key_expiration(
             "info": {"spend": 40.0, "max_budget": 50.0, "key_alias": "test-key"}
         }
     )
-    mock_litellm_instance.update_key_duration = AsyncMock()
+    key_updates = _record_key_updates(mock_litellm_instance)
 
     # Setup mock limit service
     mock_limit_instance = mock_limit_service.return_value
@@ -895,9 +992,7 @@ async def test_monitor_teams_key_expiration(
     await monitor_teams(db)
 
     # Verify key was expired
-    mock_litellm_instance.update_key_duration.assert_called_once_with(
-        "test_token", "0d"
-    )
+    assert key_updates == [("test_token", {"duration": "0d"})]
 
     # Verify expired metric was incremented
     assert (
@@ -976,7 +1071,7 @@ async def test_monitor_teams_pool_team_with_purchase_not_expired(
             "info": {"spend": 10.0, "max_budget": 50.0, "key_alias": "pool-key"}
         }
     )
-    mock_litellm_instance.update_key_duration = AsyncMock()
+    key_updates = _record_key_updates(mock_litellm_instance)
 
     # Setup mock limit service
     mock_limit_instance = mock_limit_service.return_value
@@ -986,7 +1081,7 @@ async def test_monitor_teams_pool_team_with_purchase_not_expired(
     await monitor_teams(db)
 
     # Key should NOT have been expired
-    mock_litellm_instance.update_key_duration.assert_not_called()
+    assert not any(fields.get("duration") == "0d" for _, fields in key_updates)
 
 
 @pytest.mark.asyncio
@@ -1035,7 +1130,7 @@ async def test_monitor_teams_pool_team_without_purchase_not_expired(
             "info": {"spend": 10.0, "max_budget": 50.0, "key_alias": "pool-key-np"}
         }
     )
-    mock_litellm_instance.update_key_duration = AsyncMock()
+    key_updates = _record_key_updates(mock_litellm_instance)
 
     # Setup mock limit service
     mock_limit_instance = mock_limit_service.return_value
@@ -1045,7 +1140,7 @@ async def test_monitor_teams_pool_team_without_purchase_not_expired(
     await monitor_teams(db)
 
     # Key should NOT have been expired
-    mock_litellm_instance.update_key_duration.assert_not_called()
+    assert not any(fields.get("duration") == "0d" for _, fields in key_updates)
 
 
 @pytest.mark.asyncio
@@ -1087,6 +1182,7 @@ async def test_monitor_teams_key_spend(
             "info": {"spend": 40.0, "max_budget": 50.0, "key_alias": "test-key"}
         }
     )
+    key_updates = _record_key_updates(mock_litellm_instance)
 
     # Setup mock limit service
     mock_limit_instance = mock_limit_service.return_value
@@ -1112,7 +1208,7 @@ async def test_monitor_teams_key_spend(
     )
 
     # Verify key was not expired (team is not expired)
-    mock_litellm_instance.update_key_duration.assert_not_called()
+    assert not any(fields.get("duration") == "0d" for _, fields in key_updates)
 
     # Verify limit service was called
     mock_limit_service.assert_called_with(db)
@@ -1557,8 +1653,7 @@ async def test_reconcile_team_keys_with_renewal_period_updates(
     # Setup mock LiteLLM service
     mock_instance = mock_litellm.return_value
     mock_instance.get_key_info = AsyncMock()
-    mock_instance.update_budget = AsyncMock()
-    mock_instance.update_key_budget = AsyncMock()
+    key_updates = _record_key_updates(mock_instance)
 
     # Mock key info responses - both keys have different budget amounts, triggering updates
     mock_instance.get_key_info.side_effect = [
@@ -1605,28 +1700,12 @@ async def test_reconcile_team_keys_with_renewal_period_updates(
     # Verify get_key_info was called for both keys
     assert mock_instance.get_key_info.call_count == 2
 
-    # Only the budget amount drifted, so the write must go through
-    # update_key_budget, which leaves duration/expiry alone.
-    assert mock_instance.update_key_budget.call_count == 2
-    mock_instance.update_budget.assert_not_called()
-
-    # Check the first call (team key)
-    first_call = mock_instance.update_key_budget.call_args_list[0]
-    assert (
-        first_call[0][0] == "team_token_123"
-    )  # First positional argument should be litellm_token
-    assert first_call[1]["max_budget"] == test_product.max_budget_per_key
-    # budget_duration is not None and nothing else drifted, so it must not be sent
-    assert first_call[1]["budget_duration"] is None
-
-    # Check the second call (user key)
-    second_call = mock_instance.update_key_budget.call_args_list[1]
-    assert (
-        second_call[0][0] == "user_token_456"
-    )  # First positional argument should be litellm_token
-    assert second_call[1]["max_budget"] == test_product.max_budget_per_key
-    # budget_duration is not None and nothing else drifted, so it must not be sent
-    assert second_call[1]["budget_duration"] is None
+    # Only the budget amount drifted, so only max_budget is sent: neither
+    # budget_duration nor the key's duration/expiry may be touched.
+    assert key_updates == [
+        ("team_token_123", {"max_budget": test_product.max_budget_per_key}),
+        ("user_token_456", {"max_budget": test_product.max_budget_per_key}),
+    ]
 
     # Verify team total spend is calculated correctly
     assert team_total == 5.0  # 0.0 + 5.0
@@ -1672,8 +1751,7 @@ async def test_reconcile_team_keys_with_renewal_period_updates_no_products(
     # Setup mock LiteLLM service
     mock_instance = mock_litellm.return_value
     mock_instance.get_key_info = AsyncMock()
-    mock_instance.update_budget = AsyncMock()
-    mock_instance.update_key_budget = AsyncMock()
+    key_updates = _record_key_updates(mock_instance)
 
     # Mock key info responses - both keys have None budget_duration, triggering updates
     mock_instance.get_key_info.side_effect = [
@@ -1715,27 +1793,12 @@ async def test_reconcile_team_keys_with_renewal_period_updates_no_products(
     # Verify get_key_info was called for both keys
     assert mock_instance.get_key_info.call_count == 2
 
-    # Only budget_duration drifted, so the key's expiry must not be touched
-    assert mock_instance.update_key_budget.call_count == 2
-    mock_instance.update_budget.assert_not_called()
-
-    # Check the first call (team key)
-    first_call = mock_instance.update_key_budget.call_args_list[0]
-    assert (
-        first_call[0][0] == "team_token_123"
-    )  # First positional argument should be litellm_token
-    assert first_call[1]["budget_duration"] == "30d"
-    # Should not have a budget amount since no products were found
-    assert first_call[1]["max_budget"] is None
-
-    # Check the second call (user key)
-    second_call = mock_instance.update_key_budget.call_args_list[1]
-    assert (
-        second_call[0][0] == "user_token_456"
-    )  # First positional argument should be litellm_token
-    assert second_call[1]["budget_duration"] == "30d"
-    # Should not have a budget amount since no products were found
-    assert second_call[1]["max_budget"] is None
+    # Only budget_duration drifted, so the key's expiry must not be touched.
+    # No products were found, so no budget amount is sent either.
+    assert key_updates == [
+        ("team_token_123", {"budget_duration": "30d"}),
+        ("user_token_456", {"budget_duration": "30d"}),
+    ]
 
     # Verify team total spend is calculated correctly
     assert team_total == 5.0  # 0.0 + 5.0
@@ -1782,8 +1845,7 @@ async def test_reconcile_team_keys_none_budget_duration_handled(
     # Setup mock LiteLLM service
     mock_instance = mock_litellm.return_value
     mock_instance.get_key_info = AsyncMock()
-    mock_instance.update_budget = AsyncMock()
-    mock_instance.update_key_budget = AsyncMock()
+    key_updates = _record_key_updates(mock_instance)
 
     current_time = datetime.now(UTC)
 
@@ -1812,14 +1874,15 @@ async def test_reconcile_team_keys_none_budget_duration_handled(
     )
 
     # Verify a write was issued because budget_duration is None (forces update)
-    assert mock_instance.update_key_budget.call_count == 1
-    mock_instance.update_budget.assert_not_called()
-    update_call = mock_instance.update_key_budget.call_args
-    assert (
-        update_call[0][0] == "team_token_123"
-    )  # First positional argument should be litellm_token
-    assert update_call[1]["budget_duration"] == f"{test_product.renewal_period_days}d"
-    assert update_call[1]["max_budget"] == test_product.max_budget_per_key
+    assert key_updates == [
+        (
+            "team_token_123",
+            {
+                "budget_duration": f"{test_product.renewal_period_days}d",
+                "max_budget": test_product.max_budget_per_key,
+            },
+        )
+    ]
 
     # Verify team total spend is calculated correctly
     assert team_total == 10.0
@@ -1866,8 +1929,7 @@ async def test_reconcile_team_keys_zero_duration_renewal(
     # Setup mock LiteLLM service
     mock_instance = mock_litellm.return_value
     mock_instance.get_key_info = AsyncMock()
-    mock_instance.update_budget = AsyncMock()
-    mock_instance.update_key_budget = AsyncMock()
+    key_updates = _record_key_updates(mock_instance)
 
     current_time = datetime.now(UTC)
 
@@ -1898,14 +1960,15 @@ async def test_reconcile_team_keys_zero_duration_renewal(
     )
 
     # Verify a write was issued to fix the "0d" duration
-    assert mock_instance.update_key_budget.call_count == 1
-    mock_instance.update_budget.assert_not_called()
-    update_call = mock_instance.update_key_budget.call_args
-    assert (
-        update_call[0][0] == "team_token_123"
-    )  # First positional argument should be litellm_token
-    assert update_call[1]["budget_duration"] == f"{test_product.renewal_period_days}d"
-    assert update_call[1]["max_budget"] == test_product.max_budget_per_key
+    assert key_updates == [
+        (
+            "team_token_123",
+            {
+                "budget_duration": f"{test_product.renewal_period_days}d",
+                "max_budget": test_product.max_budget_per_key,
+            },
+        )
+    ]
 
     # Verify team total spend is calculated correctly
     assert team_total == 10.0
@@ -1946,8 +2009,7 @@ async def test_reconcile_team_keys_update_budget_parameter_issue(
     # Mock LiteLLM service
     mock_instance = mock_litellm.return_value
     mock_instance.get_key_info = AsyncMock()
-    mock_instance.update_budget = AsyncMock()
-    mock_instance.update_key_budget = AsyncMock()
+    key_updates = _record_key_updates(mock_instance)
 
     # Mock key info response - different budget amount triggers update
     mock_instance.get_key_info.return_value = {
@@ -1973,21 +2035,11 @@ async def test_reconcile_team_keys_update_budget_parameter_issue(
         test_product.max_budget_per_key,
     )
 
-    # Only the budget amount drifted, so duration/expiry must be left alone
-    assert mock_instance.update_key_budget.call_count == 1
-    mock_instance.update_budget.assert_not_called()
-
-    # Check that litellm_token is passed as first positional argument, not as keyword
-    call_args = mock_instance.update_key_budget.call_args
-    # After the fix, litellm_token should be the first positional argument
-    assert (
-        call_args[0][0] == "team_token_123"
-    )  # First positional argument should be litellm_token
-    assert (
-        call_args[1]["max_budget"] == test_product.max_budget_per_key
-    )  # max_budget as keyword argument
+    # Only the budget amount drifted, so duration/expiry must be left alone.
     # A healthy budget_duration must not be sent, since null clears it in LiteLLM
-    assert call_args[1]["budget_duration"] is None
+    assert key_updates == [
+        ("team_token_123", {"max_budget": test_product.max_budget_per_key})
+    ]
 
 
 @pytest.mark.asyncio
@@ -2031,8 +2083,7 @@ async def test_reconcile_team_keys_expiry_within_next_month(
     # Setup mock LiteLLM service
     mock_instance = mock_litellm.return_value
     mock_instance.get_key_info = AsyncMock()
-    mock_instance.update_budget = AsyncMock()
-    mock_instance.update_key_budget = AsyncMock()
+    key_updates = _record_key_updates(mock_instance)
 
     current_time = datetime.now(UTC)
     # Set expiry date to 15 days from now (within the 30-day window)
@@ -2063,17 +2114,9 @@ async def test_reconcile_team_keys_expiry_within_next_month(
         test_product.max_budget_per_key,
     )
 
-    # Verify update_budget was called to update the duration for expiring key
-    assert mock_instance.update_budget.call_count == 1
-    update_call = mock_instance.update_budget.call_args
-    assert (
-        update_call[0][0] == "team_token_123"
-    )  # First positional argument should be litellm_token
-    assert (
-        update_call[0][1] == f"{test_product.renewal_period_days}d"
-    )  # Second positional argument should be budget_duration
-    # When updating for expiry reasons, budget_amount should be None since we're only updating duration
-    assert update_call[1]["budget_amount"] is None
+    # Verify the key's duration was reset to extend the expiring key. The budget
+    # amount and reset period already match, so neither is sent.
+    assert key_updates == [("team_token_123", {"duration": "365d"})]
 
     # Verify team total spend is calculated correctly
     assert team_total == 10.0
@@ -2120,8 +2163,7 @@ async def test_reconcile_team_keys_expired_key(
     # Setup mock LiteLLM service
     mock_instance = mock_litellm.return_value
     mock_instance.get_key_info = AsyncMock()
-    mock_instance.update_budget = AsyncMock()
-    mock_instance.update_key_budget = AsyncMock()
+    key_updates = _record_key_updates(mock_instance)
 
     current_time = datetime.now(UTC)
     # Set expiry date to 5 days ago (already expired)
@@ -2152,17 +2194,9 @@ async def test_reconcile_team_keys_expired_key(
         test_product.max_budget_per_key,
     )
 
-    # Verify update_budget was called to update the duration for expired key
-    assert mock_instance.update_budget.call_count == 1
-    update_call = mock_instance.update_budget.call_args
-    assert (
-        update_call[0][0] == "team_token_123"
-    )  # First positional argument should be litellm_token
-    assert (
-        update_call[0][1] == f"{test_product.renewal_period_days}d"
-    )  # Second positional argument should be budget_duration
-    # When updating for expiry reasons, budget_amount should be None since we're only updating duration
-    assert update_call[1]["budget_amount"] is None
+    # Verify the key's duration was reset to extend the expired key. The budget
+    # amount and reset period already match, so neither is sent.
+    assert key_updates == [("team_token_123", {"duration": "365d"})]
 
     # Verify team total spend is calculated correctly
     assert team_total == 10.0
@@ -2209,8 +2243,7 @@ async def test_reconcile_team_keys_expiry_beyond_next_month(
     # Setup mock LiteLLM service
     mock_instance = mock_litellm.return_value
     mock_instance.get_key_info = AsyncMock()
-    mock_instance.update_budget = AsyncMock()
-    mock_instance.update_key_budget = AsyncMock()
+    key_updates = _record_key_updates(mock_instance)
 
     current_time = datetime.now(UTC)
     # Set expiry date to 45 days from now (beyond the 30-day window)
@@ -2241,9 +2274,8 @@ async def test_reconcile_team_keys_expiry_beyond_next_month(
         test_product.max_budget_per_key,
     )
 
-    # Verify no write was issued for expiry reasons, on either path
-    assert mock_instance.update_budget.call_count == 0
-    assert mock_instance.update_key_budget.call_count == 0
+    # Verify no write was issued for expiry reasons
+    assert key_updates == []
 
     # Verify team total spend is calculated correctly
     assert team_total == 10.0
@@ -3695,6 +3727,101 @@ async def test_region_key_state_cache_rejects_non_dict(test_region):
     assert result == {}
 
 
+@pytest.mark.asyncio
+async def test_region_key_state_cache_persists_and_refreshes_delta(db, test_region):
+    """With a session, the first run lists fully and later runs only fetch changes."""
+    service = AsyncMock()
+    service.list_all_keys.return_value = {
+        "hash-1": {"spend": 1.0, "updated_at": "2026-08-01T10:00:00Z"},
+        "hash-2": {"spend": 2.0, "updated_at": "2026-08-01T11:00:00Z"},
+    }
+    first = await RegionKeyStateCache(TestingSessionLocal).get(test_region, service)
+    assert set(first) == {"hash-1", "hash-2"}
+
+    state = db.get(DBRegionKeySnapshotState, test_region.id)
+    assert state.watermark == datetime(2026, 8, 1, 11, 0, tzinfo=UTC)
+
+    service.list_keys_updated_since.return_value = {
+        "hash-2": {"spend": 5.0, "updated_at": "2026-08-01T12:00:00Z"},
+        "hash-3": {"spend": 0.5, "updated_at": "2026-08-01T12:30:00Z"},
+    }
+    second = await RegionKeyStateCache(TestingSessionLocal).get(test_region, service)
+
+    assert service.list_all_keys.call_count == 1
+    since = service.list_keys_updated_since.call_args.args[0]
+    assert since == datetime(2026, 8, 1, 11, 0, tzinfo=UTC) - timedelta(
+        seconds=REGION_KEY_DELTA_OVERLAP_SECONDS
+    )
+    assert second["hash-1"]["spend"] == 1.0
+    assert second["hash-2"]["spend"] == 5.0
+    assert second["hash-3"]["spend"] == 0.5
+    db.refresh(state)
+    assert state.watermark == datetime(2026, 8, 1, 12, 30, tzinfo=UTC)
+
+
+@pytest.mark.asyncio
+async def test_region_key_state_cache_full_sweep_when_delta_fails(db, test_region):
+    """A failing delta listing falls back to a full listing that drops deleted keys."""
+    service = AsyncMock()
+    service.list_all_keys.return_value = {
+        "hash-1": {"spend": 1.0, "updated_at": "2026-08-01T10:00:00Z"},
+        "hash-2": {"spend": 2.0, "updated_at": "2026-08-01T11:00:00Z"},
+    }
+    await RegionKeyStateCache(TestingSessionLocal).get(test_region, service)
+
+    service.list_keys_updated_since.side_effect = ValueError("not sorted")
+    service.list_all_keys.return_value = {
+        "hash-2": {"spend": 3.0, "updated_at": "2026-08-01T12:00:00Z"},
+    }
+    result = await RegionKeyStateCache(TestingSessionLocal).get(test_region, service)
+
+    assert result == {"hash-2": {"spend": 3.0, "updated_at": "2026-08-01T12:00:00Z"}}
+    assert service.list_all_keys.call_count == 2
+    assert (
+        db.query(DBRegionKeySnapshot)
+        .filter(DBRegionKeySnapshot.region_id == test_region.id)
+        .count()
+        == 1
+    )
+
+
+@pytest.mark.asyncio
+async def test_region_key_state_cache_full_sweep_when_stale(db, test_region):
+    """A snapshot older than the full-sweep interval is re-listed in full."""
+    service = AsyncMock()
+    service.list_all_keys.return_value = {
+        "hash-1": {"spend": 1.0, "updated_at": "2026-08-01T10:00:00Z"},
+    }
+    await RegionKeyStateCache(TestingSessionLocal).get(test_region, service)
+    state = db.get(DBRegionKeySnapshotState, test_region.id)
+    state.last_full_sweep_at = datetime.now(UTC) - timedelta(
+        hours=REGION_KEY_FULL_SWEEP_HOURS + 1
+    )
+    db.commit()
+
+    await RegionKeyStateCache(TestingSessionLocal).get(test_region, service)
+
+    assert service.list_all_keys.call_count == 2
+    service.list_keys_updated_since.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_region_key_state_cache_commits_on_its_own_session(db, test_region):
+    """Persisting a snapshot must not commit the caller's pending changes."""
+    service = AsyncMock()
+    service.list_all_keys.return_value = {
+        "hash-1": {"spend": 1.0, "updated_at": "2026-08-01T10:00:00Z"},
+    }
+    test_region.name = "uncommitted-name"
+    db.flush()
+
+    await RegionKeyStateCache(TestingSessionLocal).get(test_region, service)
+    db.rollback()
+
+    assert db.get(DBRegion, test_region.id).name != "uncommitted-name"
+    assert db.get(DBRegionKeySnapshotState, test_region.id) is not None
+
+
 @pytest.mark.asyncio
 async def test_resolve_key_state_prefers_snapshot(test_region):
     """A key present in the snapshot must not trigger a /key/info call."""
@@ -3766,8 +3893,7 @@ async def test_reconcile_team_keys_uses_snapshot_not_per_key_info(
 
     mock_instance = mock_litellm.return_value
     mock_instance.get_key_info = AsyncMock()
-    mock_instance.update_budget = AsyncMock()
-    mock_instance.update_key_budget = AsyncMock()
+    _record_key_updates(mock_instance)
     mock_instance.list_all_keys = AsyncMock(
         return_value={
             _Svc.hash_token("sk-team-1"): {
@@ -3825,8 +3951,7 @@ async def test_reconcile_team_keys_shares_cache_across_teams(
 
     mock_instance = mock_litellm.return_value
     mock_instance.get_key_info = AsyncMock()
-    mock_instance.update_budget = AsyncMock()
-    mock_instance.update_key_budget = AsyncMock()
+    _record_key_updates(mock_instance)
     mock_instance.list_all_keys = AsyncMock(
         return_value={
             _Svc.hash_token("sk-team-1"): {"spend": 1.0, "max_budget": 10.0},
@@ -3878,8 +4003,7 @@ async def test_reconcile_team_keys_still_writes_from_snapshot_state(
 
     mock_instance = mock_litellm.return_value
     mock_instance.get_key_info = AsyncMock()
-    mock_instance.update_budget = AsyncMock()
-    mock_instance.update_key_budget = AsyncMock()
+    key_updates = _record_key_updates(mock_instance)
     mock_instance.list_all_keys = AsyncMock(
         return_value={
             _Svc.hash_token("sk-team-1"): {
@@ -3894,14 +4018,12 @@ async def test_reconcile_team_keys_still_writes_from_snapshot_state(
     keys_by_region = get_team_keys_by_region(db, test_team.id)
     await reconcile_team_keys(db, test_team, keys_by_region, False, 30, 50.0)
 
-    mock_instance.update_key_budget.assert_awaited_once()
-    mock_instance.update_budget.assert_not_awaited()
-    args = mock_instance.update_key_budget.await_args
-    assert args.args[0] == "sk-team-1"
-    assert args.kwargs["max_budget"] == 50.0
     # Only the amount drifted in the snapshot, so the healthy budget_duration
     # must not be sent along - LiteLLM reads a null as "clear it".
-    assert args.kwargs["budget_duration"] is None
+    assert key_updates == [("sk-team-1", {"max_budget": 50.0})]
+    # The snapshot is handed on so no-op writes can be dropped
+    snapshot = mock_instance.bulk_update_keys.await_args.kwargs["snapshot"]
+    assert _Svc.hash_token("sk-team-1") in snapshot
 
 
 @pytest.mark.asyncio
@@ -3912,8 +4034,8 @@ async def test_reconcile_team_keys_near_expiry_still_resets_duration(
     """
     Given: A snapshot key that expires within the next month
     When: reconcile_team_keys runs off the snapshot
-    Then: The write goes through update_budget, which resets the key duration -
-          the narrow write path must not swallow the expiry extension
+    Then: The write resets the key duration - the narrow write path must not
+          swallow the expiry extension
     """
     from app.services.litellm import LiteLLMService as _Svc
 
@@ -3928,8 +4050,7 @@ async def test_reconcile_team_keys_near_expiry_still_resets_duration(
 
     mock_instance = mock_litellm.return_value
     mock_instance.get_key_info = AsyncMock()
-    mock_instance.update_budget = AsyncMock()
-    mock_instance.update_key_budget = AsyncMock()
+    key_updates = _record_key_updates(mock_instance)
     mock_instance.list_all_keys = AsyncMock(
         return_value={
             _Svc.hash_token("sk-team-1"): {
@@ -3945,86 +4066,166 @@ async def test_reconcile_team_keys_near_expiry_still_resets_duration(
     keys_by_region = get_team_keys_by_region(db, test_team.id)
     await reconcile_team_keys(db, test_team, keys_by_region, False, 30, 50.0)
 
-    mock_instance.update_budget.assert_awaited_once()
-    mock_instance.update_key_budget.assert_not_awaited()
-    args = mock_instance.update_budget.await_args
-    assert args.args[0] == "sk-team-1"
-    assert args.args[1] == "30d"
-    # Budget matched, so no amount is sent and the existing one is left in place
-    assert args.kwargs["budget_amount"] is None
+    # Budget and reset period matched, so only the duration is sent
+    assert key_updates == [("sk-team-1", {"duration": "365d"})]
 
 
 # ---------------------------------------------------------------------------
-# Bounded-concurrency key writes
+# Desired key state
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_run_key_writes_executes_all_and_returns_zero_failures():
-    """Every queued write runs; no failures reported on the happy path."""
-    from app.core.worker import _run_key_writes
-
-    called = []
+def test_desired_key_state_diff_returns_only_drifted_fields():
+    """Fields already in the desired state are not written"""
+    now = datetime.now(UTC)
+    desired = DesiredKeyState(
+        max_budget=50.0,
+        budget_duration="30d",
+        allowed_routes=("llm_api_routes",),
+        expires_not_before=now + timedelta(days=30),
+    )
+    healthy = {
+        "max_budget": 50.0,
+        "budget_duration": "15d",  # another period is left alone
+        "blocked": True,  # owned by the purchase flows, never written here
+        "allowed_routes": ["llm_api_routes"],
+        "expires": (now + timedelta(days=200)).isoformat(),
+    }
+    assert desired.diff(healthy, now) == {}
 
-    def _make(i):
-        async def _write():
-            called.append(i)
+    drifted = {
+        "max_budget": 20.0,
+        "budget_duration": "0d",
+        "allowed_routes": [],
+        "expires": (now + timedelta(days=3)).isoformat(),
+    }
+    assert desired.diff(drifted, now) == {
+        "max_budget": 50.0,
+        "budget_duration": "30d",
+        "allowed_routes": ["llm_api_routes"],
+        "duration": "365d",
+    }
 
-        return _write
+    # A proxy that does not report allowed_routes is not rewritten every run
+    assert desired.diff({**healthy, "allowed_routes": None}, now) == {
+        "allowed_routes": ["llm_api_routes"]
+    }
+    del healthy["allowed_routes"]
+    assert desired.diff(healthy, now) == {}
 
-    pending = [(i, _make(i)) for i in range(25)]
-    failures = await _run_key_writes(pending, "test-region")
 
-    assert failures == 0
-    assert sorted(called) == list(range(25))
+def test_desired_key_state_expiry_is_written_once():
+    """A key that has already expired is not expired again"""
+    now = datetime.now(UTC)
+    desired = DesiredKeyState(expired=True)
+    assert desired.diff({"expires": None, "max_budget": 1.0}, now) == {"duration": "0d"}
+    assert desired.diff({"expires": (now + timedelta(days=9)).isoformat()}, now) == {
+        "duration": "0d"
+    }
+    assert desired.diff({"expires": (now - timedelta(hours=1)).isoformat()}, now) == {}
 
 
 @pytest.mark.asyncio
-async def test_run_key_writes_isolates_failures():
-    """A failing write is counted but does not stop the others."""
-    from app.core.worker import _run_key_writes
+@patch("app.core.worker.LiteLLMService")
+async def test_reconcile_team_keys_steady_state_issues_no_writes(
+    mock_litellm, db, test_team, test_region
+):
+    """
+    Given: Keys whose snapshot state already matches the desired state
+    When: reconcile_team_keys runs
+    Then: No write is sent and every key is counted as skipped
+    """
+    from app.core.worker import key_write_skipped_total
+    from app.services.litellm import LiteLLMService as _Svc
+
+    tokens = [f"sk-steady-{i}" for i in range(3)]
+    for i, tok in enumerate(tokens):
+        db.add(
+            DBPrivateAIKey(
+                name=f"Key {i}",
+                litellm_token=tok,
+                region=test_region,
+                team_id=test_team.id,
+            )
+        )
+    db.commit()
+
+    mock_instance = mock_litellm.return_value
+    mock_instance.get_key_info = AsyncMock()
+    key_updates = _record_key_updates(mock_instance)
+    mock_instance.list_all_keys = AsyncMock(
+        return_value={
+            _Svc.hash_token(tok): {
+                "spend": 1.0,
+                "max_budget": 50.0,
+                "budget_duration": "30d",
+                "expires": (datetime.now(UTC) + timedelta(days=300)).isoformat(),
+            }
+            for tok in tokens
+        }
+    )
+    skipped = key_write_skipped_total.labels(region_name=test_region.name)
+    skipped_before = skipped._value.get()
 
-    done = []
+    keys_by_region = get_team_keys_by_region(db, test_team.id)
+    await reconcile_team_keys(db, test_team, keys_by_region, False, 30, 50.0)
+
+    assert key_updates == []
+    mock_instance.bulk_update_keys.assert_not_awaited()
+    assert skipped._value.get() - skipped_before == 3
+
+
+# ---------------------------------------------------------------------------
+# Bulk key writes
+# ---------------------------------------------------------------------------
 
-    def _ok(i):
-        async def _write():
-            done.append(i)
 
-        return _write
+@pytest.mark.asyncio
+async def test_run_key_writes_executes_all_and_returns_zero_failures():
+    """Every queued write is handed to bulk_update_keys along with the snapshot."""
+    from app.core.worker import _run_key_writes
 
-    async def _boom():
-        raise RuntimeError("litellm rejected the update")
+    service = Mock()
+    key_updates = _record_key_updates(service)
+    pending = [KeyUpdate(f"sk-{i}", {"duration": "0d"}, key_id=i) for i in range(25)]
+    snapshot = {"hashed": {"spend": 0.0}}
 
-    pending = [(1, _ok(1)), (2, _boom), (3, _ok(3))]
-    failures = await _run_key_writes(pending, "test-region")
+    failures = await _run_key_writes(service, pending, "test-region", snapshot)
 
-    assert failures == 1
-    assert sorted(done) == [1, 3]
+    assert failures == 0
+    assert [token for token, _ in key_updates] == [f"sk-{i}" for i in range(25)]
+    assert service.bulk_update_keys.await_args.kwargs["snapshot"] is snapshot
 
 
 @pytest.mark.asyncio
-async def test_run_key_writes_is_bounded():
-    """No more than KEY_WRITE_CONCURRENCY writes are in flight at once."""
-    from app.core import worker as worker_module
+async def test_run_key_writes_isolates_failures():
+    """A failed key is counted but does not fail the others."""
     from app.core.worker import _run_key_writes
+    from app.services.litellm import KEY_UPDATE_SKIPPED
+
+    service = Mock()
+    service.bulk_update_keys = AsyncMock(
+        return_value=[
+            KeyUpdateResult("sk-1", 1, KEY_UPDATE_APPLIED),
+            KeyUpdateResult("sk-2", 2, KEY_UPDATE_FAILED, error="Status 500: boom"),
+            KeyUpdateResult("sk-3", 3, KEY_UPDATE_SKIPPED),
+        ]
+    )
+    pending = [KeyUpdate(f"sk-{i}", {"duration": "0d"}, key_id=i) for i in (1, 2, 3)]
 
-    in_flight = 0
-    peak = 0
+    assert await _run_key_writes(service, pending, "test-region") == 1
 
-    def _make():
-        async def _write():
-            nonlocal in_flight, peak
-            in_flight += 1
-            peak = max(peak, in_flight)
-            await asyncio.sleep(0)
-            in_flight -= 1
 
-        return _write
+@pytest.mark.asyncio
+async def test_run_key_writes_counts_every_key_when_the_bulk_call_raises():
+    """An unexpected error from the bulk call fails the batch, not the region."""
+    from app.core.worker import _run_key_writes
 
-    pending = [(i, _make()) for i in range(50)]
-    await _run_key_writes(pending, "test-region")
+    service = Mock()
+    service.bulk_update_keys = AsyncMock(side_effect=RuntimeError("proxy gone"))
+    pending = [KeyUpdate(f"sk-{i}", {"duration": "0d"}, key_id=i) for i in range(3)]
 
-    assert peak <= worker_module.KEY_WRITE_CONCURRENCY
+    assert await _run_key_writes(service, pending, "test-region") == 3
 
 
 @pytest.mark.asyncio
@@ -4032,7 +4233,10 @@ async def test_run_key_writes_empty_is_noop():
     """An empty queue short-circuits."""
     from app.core.worker import _run_key_writes
 
-    assert await _run_key_writes([], "test-region") == 0
+    service = Mock()
+    service.bulk_update_keys = AsyncMock()
+    assert await _run_key_writes(service, [], "test-region") == 0
+    service.bulk_update_keys.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -4061,9 +4265,7 @@ async def test_reconcile_team_keys_expire_writes_are_batched(
 
     mock_instance = mock_litellm.return_value
     mock_instance.get_key_info = AsyncMock()
-    mock_instance.update_budget = AsyncMock()
-    mock_instance.update_key_budget = AsyncMock()
-    mock_instance.update_key_duration = AsyncMock()
+    key_updates = _record_key_updates(mock_instance)
     mock_instance.list_all_keys = AsyncMock(
         return_value={
             _Svc.hash_token(tok): {"spend": 1.0, "max_budget": 10.0} for tok in tokens
@@ -4076,12 +4278,7 @@ async def test_reconcile_team_keys_expire_writes_are_batched(
     # Spend still accumulated for every key
     assert team_total == 5.0
     # One expiry write per key, and no budget writes on the expire path
-    assert mock_instance.update_key_duration.await_count == 5
-    assert mock_instance.update_budget.await_count == 0
-    expired = sorted(
-        c.args[0] for c in mock_instance.update_key_duration.await_args_list
-    )
-    assert expired == sorted(tokens)
+    assert sorted(key_updates) == [(tok, {"duration": "0d"}) for tok in sorted(tokens)]
 
 
 @pytest.mark.asyncio
@@ -4116,14 +4313,16 @@ async def test_reconcile_team_keys_flushes_writes_before_region_ends(
         events.append(("read", token))
         return {"info": {"spend": 1.0, "max_budget": 10.0}}
 
-    async def _write(token, duration):
-        events.append(("write", token))
+    async def _write(updates, snapshot=None):
+        events.extend(("write", update.litellm_token) for update in updates)
+        return [
+            KeyUpdateResult(update.litellm_token, update.key_id, KEY_UPDATE_APPLIED)
+            for update in updates
+        ]
 
     mock_instance = mock_litellm.return_value
     mock_instance.get_key_info = AsyncMock(side_effect=_read)
-    mock_instance.update_budget = AsyncMock()
-    mock_instance.update_key_budget = AsyncMock()
-    mock_instance.update_key_duration = AsyncMock(side_effect=_write)
+    mock_instance.bulk_update_keys = AsyncMock(side_effect=_write)
     # Empty snapshot forces the per-key fallback read for every key
     mock_instance.list_all_keys = AsyncMock(return_value={})
 
@@ -4132,7 +4331,7 @@ async def test_reconcile_team_keys_flushes_writes_before_region_ends(
 
     assert team_total == 5.0
     # Every key still expired, and spend still counted
-    assert mock_instance.update_key_duration.await_count == 5
+    assert [kind for kind, _ in events].count("write") == 5
 
     kinds = [kind for kind, _ in events]
     first_write = kinds.index("write")
@@ -4162,15 +4361,22 @@ async def test_reconcile_team_keys_write_failure_does_not_lose_spend(
         )
     db.commit()
 
-    async def _maybe_fail(token, duration):
-        if token == "sk-b":
-            raise RuntimeError("litellm 500")
+    async def _maybe_fail(updates, snapshot=None):
+        return [
+            KeyUpdateResult(
+                update.litellm_token,
+                update.key_id,
+                KEY_UPDATE_FAILED
+                if update.litellm_token == "sk-b"
+                else KEY_UPDATE_APPLIED,
+                error="Status 500: litellm 500",
+            )
+            for update in updates
+        ]
 
     mock_instance = mock_litellm.return_value
     mock_instance.get_key_info = AsyncMock()
-    mock_instance.update_budget = AsyncMock()
-    mock_instance.update_key_budget = AsyncMock()
-    mock_instance.update_key_duration = AsyncMock(side_effect=_maybe_fail)
+    mock_instance.bulk_update_keys = AsyncMock(side_effect=_maybe_fail)
     mock_instance.list_all_keys = AsyncMock(
         return_value={
             _Svc.hash_token(tok): {"spend": 2.0, "max_budget": 10.0} for tok in tokens
@@ -4181,7 +4387,8 @@ async def test_reconcile_team_keys_write_failure_does_not_lose_spend(
     team_total = await reconcile_team_keys(db, test_team, keys_by_region, True)
 
     # All three attempted, and spend counted for all three
-    assert mock_instance.update_key_duration.await_count == 3
+    [(updates,), _] = mock_instance.bulk_update_keys.await_args
+    assert sorted(update.litellm_token for update in updates) == tokens
     assert team_total == 6.0
 
 
@@ -4245,14 +4452,14 @@ async def test_monitor_teams_does_not_expire_anonymous_trial_team_keys(
             "info": {"spend": 0.0, "max_budget": 2.0, "key_alias": "trial-key"}
         }
     )
-    mock_litellm_instance.update_key_duration = AsyncMock()
+    key_updates = _record_key_updates(mock_litellm_instance)
 
     mock_limit_instance = mock_limit_service.return_value
     mock_limit_instance.set_team_limits = Mock()
 
     await monitor_teams(db)
 
-    mock_litellm_instance.update_key_duration.assert_not_called()
+    assert not any(fields.get("duration") == "0d" for _, fields in key_updates)
 
 
 @pytest.mark.asyncio